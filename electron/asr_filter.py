@@ -0,0 +1,172 @@
+"""
+Post-ASR text filter.
+Flags hallucinated stock phrases, n-gram repetition loops and near-duplicates of
+recent segments so callers can skip paying to translate them.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+import unicodedata
+import zlib
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+
+# Phrases ASR models emit for (near-)silent audio. Matched against the whole
+# normalized segment, so real speech that merely contains them is kept.
+HALLUCINATION_PATTERNS = [
+    r'(thank you|thanks)( (so|very) much)? for (watching|listening)',
+    r'(please )?(like (and|&) )?subscribe( to (my|our|the) channel)?',
+    r'subtitles? (by|created by|provided by) .{0,40}',
+    r'(transcribed|transcription|captions?|translated) by .{0,40}',
+    r'amara org( community)?',
+    r'字幕由amara org社区提供',
+    r'(请不吝)?点赞 ?订阅 ?转发 ?打赏.{0,20}',
+    r'(谢谢|感谢)(大家|您)?(的)?(观看|收看|收听)',
+    r'明镜与点点栏目',
+    r'ご視聴ありがとうございました',
+    r'チャンネル登録(を)?お願いします',
+    r'시청해 ?주셔서 감사합니다',
+    r'mbc 뉴스 .{0,20}',
+    r'продолжение следует',
+    r'untertitel (im auftrag des|von) .{0,40}',
+    r'sous titres (réalisés )?(par|para) .{0,40}',
+]
+
+_HALLUCINATION_RE = re.compile(r'^(?:' + '|'.join(HALLUCINATION_PATTERNS) + r')$')
+
+# Repetition loop thresholds (Whisper-style compression ratio plus n-gram diversity)
+MAX_COMPRESSION_RATIO = 2.4
+MIN_LOOP_CHECK_CHARS = 40
+NGRAM_SIZE = 3
+MIN_DISTINCT_NGRAM_RATIO = 0.35
+
+# Near-duplicate detection over the last few segments
+DUPLICATE_HISTORY = 5
+DUPLICATE_JACCARD_THRESHOLD = 0.85
+MIN_DUPLICATE_CHARS = 12
+SHINGLE_SIZE = 4
+MINHASH_PERMUTATIONS = 32
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+# Fixed coefficients keep signatures stable across runs (no random seeding)
+_MINHASH_COEFFS = [
+    ((i * 0x9E3779B1 + 0x7F4A7C15) % _MERSENNE_PRIME | 1, (i * 0x85EBCA77 + 0xC2B2AE3D) % _MERSENNE_PRIME)
+    for i in range(1, MINHASH_PERMUTATIONS + 1)
+]
+
+_PUNCT_RE = re.compile(r'[\W_]+', re.UNICODE)
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """Lowercase, NFKC-fold and collapse punctuation/whitespace to single spaces."""
+    if not isinstance(text, str):
+        return ''
+    folded = unicodedata.normalize('NFKC', text).lower()
+    return _PUNCT_RE.sub(' ', folded).strip()
+
+
+def _is_cjk(char: str) -> bool:
+    codepoint = ord(char)
+    return (
+        0x3040 <= codepoint <= 0x30FF
+        or 0x3400 <= codepoint <= 0x4DBF
+        or 0x4E00 <= codepoint <= 0x9FFF
+        or 0xAC00 <= codepoint <= 0xD7AF
+    )
+
+
+def tokenize(normalized: str) -> List[str]:
+    """Split into words, treating each CJK character as its own token."""
+    tokens: List[str] = []
+    for word in normalized.split():
+        if any(_is_cjk(ch) for ch in word):
+            tokens.extend(word)
+        else:
+            tokens.append(word)
+    return tokens
+
+
+def is_hallucination(normalized: str) -> bool:
+    return bool(normalized) and bool(_HALLUCINATION_RE.match(normalized))
+
+
+def compression_ratio(text: str) -> float:
+    data = text.encode('utf-8')
+    if not data:
+        return 0.0
+    return len(data) / float(len(zlib.compress(data)))
+
+
+def is_repetition_loop(normalized: str) -> bool:
+    """Detect decoder loops such as 'the the the ...' or a phrase repeated many times."""
+    if len(normalized) < MIN_LOOP_CHECK_CHARS:
+        return False
+    if compression_ratio(normalized) > MAX_COMPRESSION_RATIO:
+        return True
+    tokens = tokenize(normalized)
+    total = len(tokens) - NGRAM_SIZE + 1
+    if total < 8:
+        return False
+    distinct = len({tuple(tokens[i:i + NGRAM_SIZE]) for i in range(total)})
+    return distinct / float(total) < MIN_DISTINCT_NGRAM_RATIO
+
+
+def minhash_signature(normalized: str) -> Tuple[int, ...]:
+    """MinHash signature over character shingles (language agnostic, works for CJK)."""
+    compact = normalized.replace(' ', '')
+    if len(compact) <= SHINGLE_SIZE:
+        shingles = {compact}
+    else:
+        shingles = {compact[i:i + SHINGLE_SIZE] for i in range(len(compact) - SHINGLE_SIZE + 1)}
+    hashes = [zlib.crc32(s.encode('utf-8')) for s in shingles]
+    return tuple(
+        min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+        for a, b in _MINHASH_COEFFS
+    )
+
+
+def estimate_jaccard(sig_a: Tuple[int, ...], sig_b: Tuple[int, ...]) -> float:
+    if not sig_a or len(sig_a) != len(sig_b):
+        return 0.0
+    same = sum(1 for x, y in zip(sig_a, sig_b) if x == y)
+    return same / float(len(sig_a))
+
+
+class TranscriptFilter:
+    """Stateful filter for one recording session or media file.
+
+    check() returns None for text that should be kept, otherwise a short reason:
+    'hallucination', 'repetition' or 'duplicate'. Thread safe, since segments
+    complete out of order on worker threads.
+    """
+
+    def __init__(self, history: int = DUPLICATE_HISTORY, jaccard_threshold: float = DUPLICATE_JACCARD_THRESHOLD):
+        self.jaccard_threshold = jaccard_threshold
+        self._recent: Deque[Tuple[str, Tuple[int, ...]]] = deque(maxlen=max(1, int(history)))
+        self._lock = threading.Lock()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._recent.clear()
+
+    def check(self, text: Optional[str]) -> Optional[str]:
+        normalized = normalize_text(text)
+        if not normalized:
+            return None
+        if is_hallucination(normalized):
+            return 'hallucination'
+        if is_repetition_loop(normalized):
+            return 'repetition'
+        if len(normalized.replace(' ', '')) < MIN_DUPLICATE_CHARS:
+            return None
+        signature = minhash_signature(normalized)
+        with self._lock:
+            for previous, previous_sig in self._recent:
+                if previous == normalized or estimate_jaccard(signature, previous_sig) >= self.jaccard_threshold:
+                    return 'duplicate'
+            self._recent.append((normalized, signature))
+        return None
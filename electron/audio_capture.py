@@ -0,0 +1,246 @@
+"""
+Capture format negotiation for live recording.
+The input stream is opened at the device's native rate and the service
+converts to its fixed processing rate with resampler.StreamingResampler, so
+the host API never resamples and the processing rate never changes at runtime.
+
+Formats are cached per device, in memory and on disk. Probing runs on a
+background thread at service start or after a stream fails to open;
+start_recording only reads the cache (or uses the device's reported default
+rate, which is cached once a stream opens with it).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+import sounddevice as sd
+
+
+# Rates tried after the device default, most common native rates first
+CANDIDATE_RATES = (48000, 44100, 32000, 22050, 16000)
+CACHE_VERSION = 1
+
+
+class CaptureFormat:
+    """Negotiated stream parameters for one input device."""
+
+    __slots__ = ('key', 'device', 'name', 'samplerate', 'channels', 'dtype', 'verified')
+
+    def __init__(self, key: str, device: Optional[int], name: str, samplerate: int, channels: int, dtype: str, verified: bool = False):
+        self.key = key
+        self.device = device
+        self.name = name
+        self.samplerate = int(samplerate)
+        self.channels = int(channels)
+        self.dtype = dtype
+        self.verified = verified
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            'samplerate': self.samplerate,
+            'channels': self.channels,
+            'dtype': self.dtype,
+            'verified_at': time.time(),
+        }
+
+    def __repr__(self) -> str:
+        state = 'verified' if self.verified else 'unverified'
+        return f"CaptureFormat({self.name!r}, {self.samplerate}Hz, ch={self.channels}, {state})"
+
+
+def _default_input_device() -> Dict[str, Any]:
+    """Index, name, cache key and reported default rate of the default input device."""
+    info = sd.query_devices(kind='input')
+    index = info.get('index')
+    if index is None:
+        try:
+            index = sd.default.device[0]
+        except Exception:
+            index = None
+        if isinstance(index, int) and index < 0:
+            index = None
+    hostapi = ''
+    try:
+        hostapi = sd.query_hostapis(info['hostapi'])['name']
+    except Exception:
+        pass
+    name = str(info.get('name') or 'default')
+    return {
+        'index': index,
+        'name': name,
+        'key': f"{hostapi}:{name}" if hostapi else name,
+        'default_samplerate': int(round(float(info.get('default_samplerate') or 0))),
+    }
+
+
+class CaptureNegotiator:
+    """Resolves and caches the capture format of the default input device."""
+
+    def __init__(self, cache_path: Optional[str], channels: int, dtype: str, log: Optional[Callable[[str, str], None]] = None):
+        self.cache_path = cache_path
+        self.channels = int(channels)
+        self.dtype = dtype
+        self._log = log or (lambda level, message: None)
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._loaded = False
+        self._probe_thread: Optional[threading.Thread] = None
+
+    # ---- cache ----
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if isinstance(data, dict) and data.get('version') == CACHE_VERSION:
+                self._entries = dict(data.get('devices') or {})
+        except Exception as e:
+            self._log("warning", f"Device capability cache unreadable, ignoring: {e}")
+
+    def _save(self) -> None:
+        if not self.cache_path:
+            return
+        try:
+            tmp_path = f"{self.cache_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': CACHE_VERSION, 'devices': self._entries}, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.cache_path)
+        except Exception as e:
+            self._log("warning", f"Failed to save device capability cache: {e}")
+
+    def invalidate(self, fmt: CaptureFormat) -> None:
+        """Forget a format that failed to open."""
+        with self._lock:
+            self._load()
+            if self._entries.pop(fmt.key, None) is not None:
+                self._save()
+
+    # ---- resolution ----
+
+    def resolve(self) -> CaptureFormat:
+        """Fast path for start_recording: cached format, else the reported default rate.
+
+        Only queries the device list. An unverified format is cached by
+        confirm() once the stream has opened with it.
+        """
+        device = _default_input_device()
+        with self._lock:
+            self._load()
+            entry = self._entries.get(device['key'])
+        if entry and entry.get('channels') == self.channels and entry.get('dtype') == self.dtype:
+            return CaptureFormat(device['key'], device['index'], device['name'], entry['samplerate'], self.channels, self.dtype, verified=True)
+        rate = device['default_samplerate'] or CANDIDATE_RATES[0]
+        return CaptureFormat(device['key'], device['index'], device['name'], rate, self.channels, self.dtype)
+
+    def confirm(self, fmt: CaptureFormat) -> None:
+        """Cache a format after a stream opened successfully with it."""
+        if fmt.verified:
+            return
+        fmt.verified = True
+        with self._lock:
+            self._load()
+            self._entries[fmt.key] = fmt.to_dict()
+            self._save()
+
+    def is_cached(self) -> bool:
+        try:
+            key = _default_input_device()['key']
+        except Exception:
+            return False
+        with self._lock:
+            self._load()
+            return key in self._entries
+
+    def probe(self, exclude: Iterable[int] = ()) -> Optional[CaptureFormat]:
+        """Find a supported rate for the default input device and cache it (blocking)."""
+        device = _default_input_device()
+        skip = set(int(rate) for rate in exclude)
+        rates: List[int] = []
+        for rate in (device['default_samplerate'],) + CANDIDATE_RATES:
+            if rate and rate not in rates and rate not in skip:
+                rates.append(rate)
+        for rate in rates:
+            try:
+                sd.check_input_settings(device=device['index'], channels=self.channels, dtype=self.dtype, samplerate=rate)
+            except Exception as e:
+                self._log("debug", f"Input device {device['name']} rejects {rate}Hz: {e}")
+                continue
+            fmt = CaptureFormat(device['key'], device['index'], device['name'], rate, self.channels, self.dtype, verified=True)
+            with self._lock:
+                self._load()
+                self._entries[device['key']] = fmt.to_dict()
+                self._save()
+            self._log("info", f"Input device {device['name']} native capture rate: {rate}Hz (cached)")
+            return fmt
+        self._log("error", f"No supported capture rate found for input device {device['name']}")
+        return None
+
+    def probe_async(self) -> None:
+        """Probe on a daemon thread when the default device is not cached yet (service start)."""
+        with self._lock:
+            if self._probe_thread is not None and self._probe_thread.is_alive():
+                return
+            self._probe_thread = threading.Thread(target=self._probe_quietly, name="capture-probe", daemon=True)
+            self._probe_thread.start()
+
+    def _probe_quietly(self) -> None:
+        try:
+            if not self.is_cached():
+                self.probe()
+        except Exception as e:
+            self._log("warning", f"Background audio device probe failed: {e}")
+
+
+class PreRollRing:
+    """Preallocated ring of the most recent frames, written from the audio callback.
+
+    Used by hot mic standby: while idle the open stream only overwrites this
+    buffer, and a recording starts from snapshot() so speech from just before
+    the hotkey is kept.
+    """
+
+    def __init__(self, frames: int, channels: int):
+        self.capacity = max(1, int(frames))
+        self._buf = np.zeros((self.capacity, int(channels)), dtype=np.float32)
+        self._pos = 0
+        self._filled = 0
+
+    def write(self, block: np.ndarray) -> None:
+        n = len(block)
+        if n == 0:
+            return
+        cap = self.capacity
+        if n >= cap:
+            self._buf[:] = block[n - cap:]
+            self._pos = 0
+            self._filled = cap
+            return
+        first = min(n, cap - self._pos)
+        self._buf[self._pos:self._pos + first] = block[:first]
+        if first < n:
+            self._buf[:n - first] = block[first:]
+        self._pos = (self._pos + n) % cap
+        self._filled = min(cap, self._filled + n)
+
+    def snapshot(self) -> np.ndarray:
+        """Buffered frames, oldest first (a copy)."""
+        if self._filled < self.capacity:
+            # Not wrapped yet: frames are [0, pos)
+            return self._buf[:self._pos].copy()
+        return np.concatenate((self._buf[self._pos:], self._buf[:self._pos]), axis=0)
+
+    def clear(self) -> None:
+        self._pos = 0
+        self._filled = 0
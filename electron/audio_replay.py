@@ -0,0 +1,291 @@
+"""
+Replay input for the live pipeline: a WAV file or synthetic audio is fed into
+the same audio callback a microphone stream would call, so segmentation,
+dispatch and translation can run headless (CI, load tests, profiling).
+
+ReplayInputStream mimics the part of sounddevice.InputStream the service uses
+(start/stop/close/active, context manager) and calls
+callback(indata, frames, time_info, status) from its own thread with
+(blocksize, channels) float32 blocks; sources with more channels than the
+stream are downmixed. speed is a multiple of real time; 0 feeds blocks as
+fast as the callback returns. Block boundaries and samples depend only on
+the source, so a replay segments identically every run.
+
+Replay specs (start_recording's "replay" option or --replay):
+    "meeting.wav"                       a 16-bit PCM WAV (other formats need soundfile)
+    "synthetic:bursts:120"              synthetic_audio generator and seconds
+    {"file": "...", "speed": 4, "loop": false, "stop_at_end": true}
+    {"synthetic": "continuous", "seconds": 60, "sample_rate": 48000, "seed": 1}
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+import wave
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+
+import synthetic_audio
+
+
+DEFAULT_SYNTHETIC_SECONDS = 60.0
+DEFAULT_SYNTHETIC_RATE = 48000
+
+
+class ReplaySource(ABC):
+    """Block reader; read() returns fewer frames at the end and an empty array when done."""
+
+    name = 'replay'
+    sample_rate = 0
+    channels = 1
+
+    @abstractmethod
+    def read(self, frames: int) -> np.ndarray:
+        ...
+
+    @abstractmethod
+    def rewind(self) -> None:
+        ...
+
+    def close(self) -> None:
+        pass
+
+
+class ArraySource(ReplaySource):
+    """In-memory audio (frames,) or (frames, channels)."""
+
+    def __init__(self, audio: np.ndarray, sample_rate: int, name: str = 'array'):
+        data = np.asarray(audio, dtype=np.float32)
+        self.audio = data[:, None] if data.ndim == 1 else data
+        self.sample_rate = int(sample_rate)
+        self.channels = self.audio.shape[1]
+        self.name = name
+        self._pos = 0
+
+    def read(self, frames: int) -> np.ndarray:
+        block = self.audio[self._pos:self._pos + frames]
+        self._pos += len(block)
+        return block
+
+    def rewind(self) -> None:
+        self._pos = 0
+
+
+class WavFileSource(ReplaySource):
+    """Streams 16-bit PCM WAV from disk (stdlib wave, no soundfile needed)."""
+
+    def __init__(self, path: str):
+        self.name = os.path.basename(path)
+        self._file = wave.open(path, 'rb')
+        if self._file.getsampwidth() != 2:
+            self._file.close()
+            raise ValueError(f"{path}: only 16-bit PCM WAV can be replayed without soundfile")
+        self.sample_rate = self._file.getframerate()
+        self.channels = self._file.getnchannels()
+
+    def read(self, frames: int) -> np.ndarray:
+        data = np.frombuffer(self._file.readframes(frames), dtype='<i2')
+        return (data.astype(np.float32) / 32768.0).reshape(-1, self.channels)
+
+    def rewind(self) -> None:
+        self._file.rewind()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class SoundFileSource(ReplaySource):
+    """Any format libsndfile reads (FLAC, OGG, float WAV...)."""
+
+    def __init__(self, path: str):
+        import soundfile as sf  # Only needed for formats the wave module cannot read
+
+        self.name = os.path.basename(path)
+        self._file = sf.SoundFile(path)
+        self.sample_rate = int(self._file.samplerate)
+        self.channels = int(self._file.channels)
+
+    def read(self, frames: int) -> np.ndarray:
+        return self._file.read(frames, dtype='float32', always_2d=True)
+
+    def rewind(self) -> None:
+        self._file.seek(0)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def open_file_source(path: str) -> ReplaySource:
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Replay file not found: {path}")
+    try:
+        return WavFileSource(path)
+    except (wave.Error, ValueError, EOFError):
+        return SoundFileSource(path)
+
+
+class ReplaySpec:
+    """Parsed replay option: what to play and how fast."""
+
+    def __init__(
+        self,
+        file: Optional[str] = None,
+        synthetic: Optional[str] = None,
+        seconds: float = DEFAULT_SYNTHETIC_SECONDS,
+        sample_rate: int = DEFAULT_SYNTHETIC_RATE,
+        seed: int = 0,
+        speed: float = 1.0,
+        loop: bool = False,
+        stop_at_end: bool = True,
+    ):
+        if not file and not synthetic:
+            raise ValueError('Replay needs a file or a synthetic generator')
+        self.file = file
+        self.synthetic = synthetic
+        self.seconds = float(seconds)
+        self.sample_rate = int(sample_rate)
+        self.seed = int(seed)
+        self.speed = max(0.0, float(speed))
+        self.loop = bool(loop)
+        self.stop_at_end = bool(stop_at_end) and not self.loop
+
+    def open(self) -> ReplaySource:
+        if self.file:
+            return open_file_source(self.file)
+        audio = synthetic_audio.generate(self.synthetic, self.seconds, self.sample_rate, seed=self.seed)
+        return ArraySource(audio, self.sample_rate, name=f"synthetic:{self.synthetic}")
+
+    def describe(self) -> str:
+        what = self.file or f"synthetic {self.synthetic} {self.seconds:g}s @ {self.sample_rate}Hz (seed {self.seed})"
+        pace = 'unthrottled' if self.speed == 0 else f"{self.speed:g}x real time"
+        return f"{what}, {pace}{', looping' if self.loop else ''}"
+
+
+def parse_replay_spec(value: Any, defaults: Optional[Dict[str, Any]] = None) -> Optional[ReplaySpec]:
+    """ReplaySpec from a string/dict option (None/empty -> None); defaults fill unset keys."""
+    if value is None or value is False or value == '':
+        return None
+    options: Dict[str, Any] = dict(defaults or {})
+    if isinstance(value, str):
+        if value.startswith('synthetic:'):
+            parts = value.split(':')
+            options['synthetic'] = parts[1] if len(parts) > 1 and parts[1] else 'bursts'
+            if len(parts) > 2 and parts[2]:
+                options['seconds'] = float(parts[2])
+        else:
+            options['file'] = value
+    elif isinstance(value, dict):
+        options.update({key: item for key, item in value.items() if item is not None})
+    else:
+        raise ValueError(f"Unsupported replay option: {value!r}")
+    known = ('file', 'synthetic', 'seconds', 'sample_rate', 'seed', 'speed', 'loop', 'stop_at_end')
+    return ReplaySpec(**{key: options[key] for key in known if key in options})
+
+
+class _TimeInfo:
+    """Stand-in for PortAudio's time_info (stream time of the block's first frame)."""
+
+    __slots__ = ('inputBufferAdcTime', 'currentTime')
+
+    def __init__(self, stream_time: float):
+        self.inputBufferAdcTime = stream_time
+        self.currentTime = stream_time
+
+
+class ReplayInputStream:
+    """InputStream look-alike that plays a ReplaySource into callback on a thread.
+
+    on_finished() runs on the replay thread once the source is exhausted
+    (never when looping or after stop()).
+    """
+
+    def __init__(
+        self,
+        source: ReplaySource,
+        callback: Callable[[np.ndarray, int, Any, Any], None],
+        *,
+        blocksize: int = 1024,
+        channels: Optional[int] = None,
+        speed: float = 1.0,
+        loop: bool = False,
+        on_finished: Optional[Callable[[], None]] = None,
+        log: Optional[Callable[[str, str], None]] = None,
+    ):
+        self.source = source
+        self.callback = callback
+        self.blocksize = int(blocksize)
+        self.speed = max(0.0, float(speed))
+        self.loop = loop
+        self.on_finished = on_finished
+        self._log = log or (lambda level, message: None)
+        self.samplerate = source.sample_rate
+        self.channels = int(channels) if channels else source.channels
+        self.frames_played = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def active(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.active:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="audio-replay", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5)
+
+    def close(self) -> None:
+        self.stop()
+        self.source.close()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _run(self) -> None:
+        started = time.perf_counter()
+        finished = False
+        rewound = False
+        try:
+            while not self._stop.is_set():
+                block = self.source.read(self.blocksize)
+                if len(block) == 0:
+                    if rewound:
+                        # Nothing after a rewind: an empty source would loop forever
+                        self._log("warning", f"Replay source {self.source.name} is empty")
+                    if not self.loop or rewound:
+                        finished = True
+                        break
+                    self.source.rewind()
+                    rewound = True
+                    continue
+                rewound = False
+                if block.shape[1] > self.channels:
+                    block = block.mean(axis=1, keepdims=True) if self.channels == 1 else block[:, :self.channels]
+                self.callback(block, len(block), _TimeInfo(self.frames_played / float(self.samplerate)), None)
+                self.frames_played += len(block)
+                if self.speed > 0:
+                    delay = started + self.frames_played / float(self.samplerate) / self.speed - time.perf_counter()
+                    if delay > 0:
+                        self._stop.wait(delay)
+        except Exception as e:
+            self._log("error", f"Audio replay failed: {e}")
+        if finished and self.on_finished is not None:
+            try:
+                self.on_finished()
+            except Exception as e:
+                self._log("warning", f"Replay completion handler failed: {e}")
@@ -0,0 +1,131 @@
+"""
+Script detection microbenchmark: table-driven bulk classification
+(language_id.detect_language_by_charset) vs the former per-character loop
+over codepoint range comparisons, plus the trigram tie-break used for
+same-script language pairs.
+
+Usage:
+    python benchmarks/bench_language_id.py [--chars 20000] [--repeat 50]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import language_id  # noqa: E402
+
+
+def legacy_classify_script(char):
+    codepoint = ord(char)
+    if 0x3400 <= codepoint <= 0x4DBF or 0x4E00 <= codepoint <= 0x9FFF or 0xF900 <= codepoint <= 0xFAFF or 0x20000 <= codepoint <= 0x2CEAF:
+        return 'han'
+    if 0x3040 <= codepoint <= 0x309F:
+        return 'hiragana'
+    if 0x30A0 <= codepoint <= 0x30FF or 0xFF66 <= codepoint <= 0xFF9D:
+        return 'katakana'
+    if 0xAC00 <= codepoint <= 0xD7AF or 0x1100 <= codepoint <= 0x11FF or 0x3130 <= codepoint <= 0x318F:
+        return 'hangul'
+    if 0x0400 <= codepoint <= 0x052F or 0x2DE0 <= codepoint <= 0x2DFF or 0xA640 <= codepoint <= 0xA69F:
+        return 'cyrillic'
+    if 0x0370 <= codepoint <= 0x03FF or 0x1F00 <= codepoint <= 0x1FFF:
+        return 'greek'
+    if 0x0590 <= codepoint <= 0x05FF or 0xFB1D <= codepoint <= 0xFB4F:
+        return 'hebrew'
+    if 0x0600 <= codepoint <= 0x06FF or 0x0750 <= codepoint <= 0x077F or 0x08A0 <= codepoint <= 0x08FF or 0xFB50 <= codepoint <= 0xFDFF or 0xFE70 <= codepoint <= 0xFEFF:
+        return 'arabic'
+    if 0x0900 <= codepoint <= 0x097F:
+        return 'devanagari'
+    if 0x0980 <= codepoint <= 0x09FF:
+        return 'bengali'
+    if 0x0A00 <= codepoint <= 0x0A7F:
+        return 'gurmukhi'
+    if 0x0A80 <= codepoint <= 0x0AFF:
+        return 'gujarati'
+    if 0x0B80 <= codepoint <= 0x0BFF:
+        return 'tamil'
+    if 0x0C00 <= codepoint <= 0x0C7F:
+        return 'telugu'
+    if 0x0C80 <= codepoint <= 0x0CFF:
+        return 'kannada'
+    if 0x0D00 <= codepoint <= 0x0D7F:
+        return 'malayalam'
+    if 0x0E00 <= codepoint <= 0x0E7F:
+        return 'thai'
+    if 0x1780 <= codepoint <= 0x17FF:
+        return 'khmer'
+    if 0x0100 <= codepoint <= 0x024F or 0x00C0 <= codepoint <= 0x00FF or 0x0000 <= codepoint <= 0x007F:
+        return 'latin'
+    return 'other'
+
+
+def legacy_detect(text, language1, language2):
+    lang1_scripts = language_id.language_scripts(language1)
+    lang2_scripts = language_id.language_scripts(language2)
+    score1 = score2 = 0
+    for char in text:
+        if char.isspace():
+            continue
+        script = legacy_classify_script(char)
+        if script in lang1_scripts:
+            score1 += 1
+        if script in lang2_scripts:
+            score2 += 1
+    if score1 > score2:
+        return language_id.normalize_language_name(language1)
+    if score2 > score1:
+        return language_id.normalize_language_name(language2)
+    return None
+
+
+SAMPLES = {
+    'english': "The quick brown fox jumps over the lazy dog while the meeting continues. ",
+    'chinese': "今天的会议主要讨论了下一季度的产品规划和市场策略。",
+    'mixed': "我们明天 meeting 的时候再讨论这个 API 的设计，好吗？ ",
+    'korean': "안녕하세요, 오늘 회의에서 다음 분기 계획을 논의하겠습니다. ",
+}
+
+SAME_SCRIPT_SAMPLES = (
+    (('English', 'Spanish'), "I will call you when I get home from work. "),
+    (('English', 'Spanish'), "Voy a llamarte cuando llegue a casa del trabajo. "),
+    (('Russian', 'Ukrainian'), "У мене сьогодні немає часу, можливо завтра. "),
+)
+
+
+def bench(fn, text, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(text, 'Chinese', 'English')
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Script detection microbenchmark')
+    parser.add_argument('--chars', type=int, default=20000, help='Transcript length in characters')
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'sample':<10}{'chars':>8}{'legacy ms':>12}{'table ms':>12}{'speedup':>10}")
+    for name, unit in SAMPLES.items():
+        for length in (len(unit), args.chars):
+            text = (unit * (length // len(unit) + 1))[:length]
+            assert legacy_detect(text, 'Chinese', 'English') == language_id.detect_language_by_charset(text, 'Chinese', 'English')
+            legacy = bench(legacy_detect, text, args.repeat)
+            table = bench(language_id.detect_language_by_charset, text, args.repeat)
+            print(f"{name:<10}{length:>8}{legacy * 1000:>12.3f}{table * 1000:>12.3f}{legacy / table:>9.1f}x")
+
+    print(f"\n{'trigram pair':<24}{'chars':>8}{'ms':>10}  result")
+    for pair, text in SAME_SCRIPT_SAMPLES:
+        for length in (len(text), args.chars):
+            sample = (text * (length // len(text) + 1))[:length]
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                result = language_id.detect_language_by_charset(sample, *pair)
+            elapsed = (time.perf_counter() - start) / args.repeat
+            print(f"{'/'.join(pair):<24}{length:>8}{elapsed * 1000:>10.3f}  {result}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,301 @@
+"""
+End-to-end pipeline benchmark against local mock providers (no API calls, no
+microphone).
+
+Scenarios:
+    live   start_recording with the audio as replay input (audio_replay), so the
+           same callback, VAD, segment pool, transcription and translation
+           worker as a microphone session run; --speed is the multiple of real
+           time (0 = as fast as the pipeline accepts blocks).
+    batch  Runs MediaProcessor.process_file on the same audio.
+
+Audio is a 16-bit WAV (--wav) or synthetic (--audio bursts|continuous|noise,
+see synthetic_audio.py). Providers are served by mock_provider_server with the
+latency/jitter/error profile given on the command line.
+
+Reports segments per second, time to first text per segment (live: placeholder
+to first transcript text; batch: process_file start to the first in-order
+result), the latency_metrics spans, mock request/failure counts and memory
+(max RSS; tracemalloc peak with --trace-memory, which slows allocation-heavy
+code).
+
+Usage:
+    python benchmarks/bench_pipeline.py live --audio bursts --seconds 120 --speed 4
+    python benchmarks/bench_pipeline.py batch --wav meeting.wav
+    python benchmarks/bench_pipeline.py all --ttfb-ms 800 --error-rate 0.05 --profile chat:ttfb_ms=200
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+import latency_metrics  # noqa: E402
+import mock_provider_server  # noqa: E402
+import synthetic_audio  # noqa: E402
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def percentile(values, pct):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))]
+
+
+def max_rss_mb():
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024.0 * 1024.0) if sys.platform == 'darwin' else rss / 1024.0
+
+
+def load_audio(args):
+    """(frames, 1) float32 audio and its rate, from --wav or a generator."""
+    if args.wav:
+        audio, rate = synthetic_audio.read_wav(args.wav, channels=1)
+        return audio, rate
+    audio = synthetic_audio.generate(args.audio, args.seconds, args.sample_rate, seed=args.seed)
+    return audio.reshape(-1, 1), args.sample_rate
+
+
+def service_config(server, args):
+    config = server.provider_config()
+    config.update({
+        'transcribe_source': args.source,
+        'enable_translation': args.translate,
+        'translation_engine': args.engine,
+        'translation_mode': 'fixed',
+        'translate_language': 'Chinese',
+        'segment_workers': args.workers,
+        'metrics_interval_seconds': 0,
+        'audio_stats_interval_seconds': 0,
+    })
+    return config
+
+
+class MessageRecorder:
+    """Replaces transcribe_service.send_message and timestamps the messages the UI would get."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.placeholder_at = {}
+        self.first_text_at = {}
+        self.finals = 0
+        self.translations = 0
+        self.errors = []
+        self.stopped = threading.Event()
+
+    def __call__(self, message):
+        now = time.perf_counter()
+        kind = message.get('type')
+        result_id = message.get('result_id')
+        with self.lock:
+            if kind == 'result' and message.get('transcription_pending'):
+                self.placeholder_at.setdefault(result_id, now)
+            elif kind == 'transcription_update':
+                if message.get('transcription') and result_id not in self.first_text_at:
+                    self.first_text_at[result_id] = now
+                if message.get('is_final'):
+                    self.finals += 1
+            elif kind == 'translation_update' and not message.get('translation_pending'):
+                self.translations += 1
+            elif kind == 'recording_stopped':
+                self.stopped.set()
+            elif kind == 'log' and message.get('level') == 'error':
+                self.errors.append(message.get('message'))
+
+    def time_to_first_text(self):
+        with self.lock:
+            return [self.first_text_at[rid] - at for rid, at in self.placeholder_at.items() if rid in self.first_text_at]
+
+
+def run_live(args, server, wav_path, audio_seconds):
+    import transcribe_service as ts
+
+    recorder = MessageRecorder()
+    ts.send_message = recorder  # log_message and every emitter look the name up at call time
+    ts.ensure_output_dir()
+    ts.handle_message({'type': 'update_config', 'config': service_config(server, args), 'force': True})
+    ts.start_callback_event_consumer()
+
+    ts.audio_telemetry.take()  # Callback timing covers this run only
+    started = time.perf_counter()
+    # The replay stops the recording itself at the end of the file (sounddevice is never imported)
+    ts.handle_message({'type': 'start_recording', 'replay': {'file': wav_path, 'speed': args.speed}})
+    pool = ts.segment_pool
+    replay_seconds = audio_seconds / args.speed if args.speed > 0 else 0.0
+    if not recorder.stopped.wait(timeout=replay_seconds + args.timeout):
+        print("warning: replay did not finish, stopping")
+        ts.stop_recording()
+    fed = time.perf_counter()
+    callback_stats = ts.audio_telemetry.take()
+
+    # Drain: pool idle and every trace closed (translations close theirs)
+    deadline = time.monotonic() + args.timeout
+    while pool is not None and time.monotonic() < deadline:
+        pool_state = pool.snapshot()
+        if pool_state['queue_depth'] == 0 and pool_state['in_flight'] == 0 and latency_metrics.registry.snapshot()['open_traces'] == 0:
+            break
+        time.sleep(0.05)
+    else:
+        print(f"warning: pipeline did not drain within {args.timeout}s")
+    finished = time.perf_counter()
+    ts.stop_translation_worker()
+    ts.connection_warmup.stop()
+
+    segments = len(recorder.placeholder_at)
+    return {
+        'scenario': 'live',
+        'segments': segments,
+        'elapsed': finished - started,
+        'feed_seconds': fed - started,
+        'drain_seconds': finished - fed,
+        'ttft': recorder.time_to_first_text(),
+        'finals': recorder.finals,
+        'translations': recorder.translations,
+        'errors': recorder.errors,
+        'callback_p99_ms': (callback_stats['callback_us']['p99'] or 0) / 1000.0,
+        'callback_max_ms': callback_stats['callback_us']['max'] / 1000.0,
+        'lock_p99_ms': (callback_stats['lock_us']['p99'] or 0) / 1000.0,
+        'spans': latency_metrics.registry.snapshot()['spans'],
+    }
+
+
+class FirstResultProbe:
+    """OrderedResultSink writer that only records when results arrive."""
+
+    def __init__(self):
+        self.first_at = None
+        self.count = 0
+
+    def write(self, entry):
+        if self.first_at is None:
+            self.first_at = time.perf_counter()
+        self.count += 1
+
+    def close(self, commit=True):
+        pass
+
+
+def run_batch(args, server, wav_path):
+    import media_transcribe
+    import subtitle_export
+
+    config = service_config(server, args)
+    config['media_decode_processes'] = 0
+    with open('config.json', 'w', encoding='utf-8') as f:
+        json.dump(config, f)
+    processor = media_transcribe.MediaProcessor(source_override=args.source)
+    probe = FirstResultProbe()
+    sink = subtitle_export.OrderedResultSink([probe])
+
+    started = time.perf_counter()
+    ok = processor.process_file(wav_path, enable_translation=args.translate, target_language='Chinese', result_sink=sink)
+    sink.close()
+    finished = time.perf_counter()
+    failed = sum(1 for result in processor.results.values() if result.get('status') != 'completed')
+    return {
+        'scenario': 'batch',
+        'ok': ok,
+        'segments': len(processor.results),
+        'elapsed': finished - started,
+        'ttft': [probe.first_at - started] if probe.first_at is not None else [],
+        'finals': probe.count,
+        'errors': [f"{failed} segments not completed"] if failed else [],
+        'spans': {},
+    }
+
+
+def print_report(result, audio_seconds, server, traced_peak):
+    elapsed = result['elapsed']
+    ttft = result['ttft']
+    print(f"\n== {result['scenario']} ==")
+    print(f"segments:            {result['segments']} ({result['segments'] / elapsed:.2f}/s over {elapsed:.1f}s, "
+          f"{audio_seconds / elapsed:.1f}x real time)")
+    if 'feed_seconds' in result:
+        print(f"feed / drain:        {result['feed_seconds']:.1f}s / {result['drain_seconds']:.1f}s")
+        print(f"audio_callback:      p99 {result['callback_p99_ms']:.2f} ms, max {result['callback_max_ms']:.2f} ms, "
+              f"audio_lock held p99 {result['lock_p99_ms']:.2f} ms")
+    if ttft:
+        print(f"time to first text:  p50 {statistics.median(ttft) * 1000:.0f} ms, p95 {percentile(ttft, 95) * 1000:.0f} ms, "
+              f"max {max(ttft) * 1000:.0f} ms")
+    print(f"final transcripts:   {result['finals']}" + (f", translations: {result['translations']}" if 'translations' in result else ''))
+    for label, groups in sorted(result['spans'].items()):
+        for group, spans in sorted(groups.items()):
+            cells = ', '.join(f"{name} {stats['p50']}/{stats['p95']}" for name, stats in spans.items() if stats['p50'] is not None)
+            print(f"  {label} {group} (p50/p95 ms): {cells}")
+    mock = server.stats.snapshot()
+    print(f"mock requests:       {mock['requests']} failures: {mock['failures'] or 'none'} peak in flight: {mock['peak_in_flight']}")
+    rss = max_rss_mb()
+    memory = f"max RSS {rss:.0f} MB" if rss is not None else 'max RSS n/a'
+    if traced_peak is not None:
+        memory += f", tracemalloc peak {traced_peak / (1024 * 1024):.1f} MB"
+    print(f"memory:              {memory}")
+    if result['errors']:
+        print(f"errors ({len(result['errors'])}): {result['errors'][:3]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Offline live/batch pipeline benchmark with mock providers')
+    parser.add_argument('scenario', choices=['live', 'batch', 'all'])
+    parser.add_argument('--wav', help='16-bit PCM WAV to replay (default: synthetic audio)')
+    parser.add_argument('--audio', default='bursts', choices=sorted(synthetic_audio.GENERATORS))
+    parser.add_argument('--seconds', type=float, default=60.0)
+    parser.add_argument('--sample-rate', type=int, default=48000, help='Rate of synthetic audio (48 kHz exercises resampling)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--speed', type=float, default=4.0, help='Live replay speed, multiple of real time (0 = unthrottled)')
+    parser.add_argument('--source', default='openai', choices=['openai', 'soniox'])
+    parser.add_argument('--engine', default='openai', choices=['openai', 'gemini'])
+    parser.add_argument('--no-translate', dest='translate', action='store_false')
+    parser.add_argument('--workers', type=int, default=3)
+    parser.add_argument('--timeout', type=float, default=120.0, help='Seconds to wait for the live pipeline to drain')
+    parser.add_argument('--trace-memory', action='store_true')
+    mock_provider_server.add_profile_arguments(parser)
+    args = parser.parse_args()
+
+    audio, rate = load_audio(args)
+    audio_seconds = len(audio) / float(rate)
+    scenarios = ['live', 'batch'] if args.scenario == 'all' else [args.scenario]
+    print(f"audio: {audio_seconds:.1f}s @ {rate} Hz ({args.wav or args.audio}), source={args.source}, "
+          f"translation={args.engine if args.translate else 'off'}")
+
+    os.environ.pop('OPENAI_BASE_URL', None)  # media_transcribe prefers it over config
+    previous_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        wav_path = os.path.abspath(args.wav) if args.wav else os.path.join(workdir, 'input.wav')
+        os.chdir(workdir)  # recordings/, config.json and caches stay out of the tree
+        if not args.wav:
+            synthetic_audio.write_wav(wav_path, audio[:, 0], rate)
+        for scenario in scenarios:
+            server = mock_provider_server.MockProviderServer(profiles=mock_provider_server.profiles_from_args(args), seed=args.seed)
+            with server:
+                if args.trace_memory:
+                    tracemalloc.start()
+                if scenario == 'live':
+                    result = run_live(args, server, wav_path, audio_seconds)
+                else:
+                    result = run_batch(args, server, wav_path)
+                traced_peak = None
+                if args.trace_memory:
+                    traced_peak = tracemalloc.get_traced_memory()[1]
+                    tracemalloc.stop()
+                print_report(result, audio_seconds, server, traced_peak)
+        os.chdir(previous_cwd)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""
+Resampler benchmark: streaming polyphase (resampler.py) vs the previous paths
+(scipy.signal.resample FFT and np.interp linear interpolation).
+
+Reports wall time, realtime factor and peak Python-side memory (tracemalloc,
+which NumPy reports its buffers to) for a synthetic signal.
+
+Usage:
+    python benchmarks/bench_resampler.py [--seconds 600] [--rates 44100:16000,48000:16000,48000:44100]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import resampler  # noqa: E402
+
+try:
+    from scipy import signal
+except ImportError:
+    signal = None
+
+
+def interp_resample(audio, in_rate, out_rate):
+    """The former simple_resample fallback."""
+    new_length = int(len(audio) * out_rate / in_rate)
+    original_indices = np.arange(len(audio))
+    new_indices = np.linspace(0, len(audio) - 1, new_length)
+    return np.interp(new_indices, original_indices, audio).astype(np.float32)
+
+
+def scipy_resample(audio, in_rate, out_rate):
+    return signal.resample(audio, int(len(audio) * out_rate / in_rate)).astype(np.float32)
+
+
+def streaming_blocks(audio, in_rate, out_rate, block=1024):
+    """Live-capture shaped input: small callback-sized blocks."""
+    stream = resampler.StreamingResampler(in_rate, out_rate)
+    out = [stream.process(audio[i:i + block]) for i in range(0, len(audio), block)]
+    out.append(stream.finish())
+    return np.concatenate(out)
+
+
+def measure(fn, audio, in_rate, out_rate):
+    tracemalloc.start()
+    start = time.perf_counter()
+    out = fn(audio, in_rate, out_rate)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return out, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Resampler speed/memory benchmark')
+    parser.add_argument('--seconds', type=float, default=600.0, help='Signal length in seconds')
+    parser.add_argument('--rates', default='44100:16000,48000:16000,48000:44100,16000:44100')
+    args = parser.parse_args()
+
+    candidates = [
+        ('polyphase', resampler.resample),
+        ('polyphase-1024', streaming_blocks),
+        ('np.interp', interp_resample),
+    ]
+    if signal is not None:
+        candidates.append(('scipy-fft', scipy_resample))
+    else:
+        print("scipy not installed; skipping scipy.signal.resample")
+
+    rng = np.random.default_rng(0)
+    for pair in args.rates.split(','):
+        in_rate, out_rate = (int(v) for v in pair.split(':'))
+        frames = int(args.seconds * in_rate)
+        t = np.arange(frames, dtype=np.float64) / in_rate
+        audio = (0.3 * np.sin(2 * np.pi * 440.0 * t) + 0.05 * rng.standard_normal(frames)).astype(np.float32)
+        del t
+        print(f"\n{in_rate} -> {out_rate} Hz, {args.seconds:.0f}s ({audio.nbytes / 1e6:.1f} MB input)")
+        print(f"{'method':<16}{'time (s)':>10}{'x realtime':>12}{'peak MB':>10}{'out frames':>12}")
+        for name, fn in candidates:
+            out, elapsed, peak = measure(fn, audio, in_rate, out_rate)
+            speed = args.seconds / elapsed if elapsed > 0 else float('inf')
+            print(f"{name:<16}{elapsed:>10.3f}{speed:>12.0f}{peak / 1e6:>10.1f}{len(out):>12}")
+            del out
+
+
+if __name__ == '__main__':
+    main()
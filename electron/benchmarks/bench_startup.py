@@ -0,0 +1,113 @@
+"""
+Cold start benchmark for transcribe_service: time from process spawn to the
+ready log line Electron waits for ("Service started, waiting for commands").
+
+Each run starts a fresh interpreter in a temporary working directory, reads
+stdout until the ready line arrives, then closes stdin so the service exits.
+For comparison, the modules that used to be imported before ready are timed
+in a separate interpreter. --importtime adds a -X importtime profile of one
+run (top modules by cumulative import time; whatever the background preload
+imports before the service exits may also appear).
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 10] [--importtime] [--top 15]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SERVICE = os.path.join(ROOT, 'transcribe_service.py')
+READY_MARKER = 'waiting for commands'
+
+# Imported at module level before lazy loading
+EAGER_MODULES = ('numpy', 'sounddevice', 'soundfile', 'modles', 'asr_filter', 'provider_routing',
+                 'segment_executor', 'audio_capture', 'capture_graph', 'resampler', 'language_id')
+
+
+def time_to_ready(extra_args=(), cwd=None):
+    """Seconds until the ready line, plus stderr (import profile) up to that point."""
+    env = dict(os.environ, PYTHONIOENCODING='utf-8', PYTHONPATH=ROOT)
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, *extra_args, SERVICE],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        cwd=cwd, env=env, text=True, encoding='utf-8',
+    )
+    elapsed = None
+    try:
+        for line in proc.stdout:
+            if READY_MARKER in line:
+                elapsed = time.perf_counter() - start
+                break
+    finally:
+        try:
+            # Empty input closes stdin, which ends the service's read loop
+            _, stderr = proc.communicate(input='', timeout=30)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            _, stderr = proc.communicate()
+    if elapsed is None:
+        raise RuntimeError(f"Service exited without a ready line:\n{stderr[-2000:]}")
+    return elapsed, stderr
+
+
+def eager_import_seconds():
+    """Cost of the previous eager import set, skipping modules that are not installed."""
+    code = (
+        "import importlib, sys, time\n"
+        "t = time.perf_counter(); missing = []\n"
+        f"for name in {EAGER_MODULES!r}:\n"
+        "    try: importlib.import_module(name)\n"
+        "    except Exception: missing.append(name)\n"
+        "print(time.perf_counter() - t); print(','.join(missing))\n"
+    )
+    out = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True).stdout.split('\n')
+    return float(out[0]), [name for name in out[1].split(',') if name]
+
+
+def import_profile(stderr, top):
+    """Parse -X importtime output: [(cumulative_us, module)] sorted, top-level entries only."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative_us, name = line.split('|')
+        if name.startswith('  '):
+            continue  # nested import, already counted in its parent
+        rows.append((int(cumulative_us), name.strip()))
+    rows.sort(reverse=True)
+    return rows[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='transcribe_service time-to-ready benchmark')
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--importtime', action='store_true', help='Print the -X importtime profile of one run')
+    parser.add_argument('--top', type=int, default=15)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cwd:
+        time_to_ready(cwd=cwd)  # warm the OS file cache and __pycache__
+        samples = [time_to_ready(cwd=cwd)[0] for _ in range(args.runs)]
+        print(f"time-to-ready over {args.runs} runs: min {min(samples) * 1000:.0f} ms, "
+              f"median {statistics.median(samples) * 1000:.0f} ms, max {max(samples) * 1000:.0f} ms")
+
+        eager, missing = eager_import_seconds()
+        note = f" (not installed: {', '.join(missing)})" if missing else ''
+        print(f"previous eager imports alone: {eager * 1000:.0f} ms{note}")
+
+        if args.importtime:
+            _, stderr = time_to_ready(extra_args=('-X', 'importtime'), cwd=cwd)
+            print(f"\n{'cumulative ms':>14}  top-level import")
+            for cumulative_us, name in import_profile(stderr, args.top):
+                print(f"{cumulative_us / 1000:>14.1f}  {name}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,577 @@
+"""
+Local mock of the provider APIs the service calls, for offline benchmarks.
+
+Endpoints (point openai_base_url at http://host:port/v1 and gemini_base_url /
+soniox_base_url at http://host:port / ws://host:port):
+    POST /v1/audio/transcriptions        OpenAI transcription (text/json/verbose_json)
+    POST /v1/responses                   OpenAI Responses streaming (used for streamed transcription)
+    POST /v1/chat/completions            OpenAI chat, streamed (SSE) or not
+    GET  /v1/models                      OpenAI warm-up
+    POST /v1beta/models/<m>:generateContent   Gemini
+    GET  /v1beta/models                  Gemini warm-up
+    GET  /transcribe-websocket           Soniox-like realtime websocket
+
+Each endpoint family ('transcribe', 'chat', 'gemini', 'soniox') has a
+LatencyProfile: time to first byte plus a per-audio-second cost, uniform
+jitter, the gap between streamed tokens, and the fraction of requests that
+fail with 500 or 429. Transcripts are filler words, about WORDS_PER_SECOND per
+second of uploaded audio, so response sizes scale like real ones.
+
+Standalone:
+    python benchmarks/mock_provider_server.py --port 8765 --ttfb-ms 400 --jitter-ms 150 --error-rate 0.02
+"""
+
+import argparse
+import base64
+import hashlib
+import io
+import json
+import random
+import struct
+import threading
+import time
+import uuid
+import wave
+from email import message_from_bytes
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+WORDS_PER_SECOND = 2.5
+# Transcripts sample this vocabulary per request: repeating one script would make
+# consecutive segments near-duplicates, which the service's ASR filter drops
+FILLER_WORDS = (
+    'the', 'meeting', 'starts', 'at', 'nine', 'and', 'we', 'will', 'review', 'last', 'week',
+    'numbers', 'before', 'moving', 'on', 'to', 'roadmap', 'for', 'next', 'quarter',
+    'budget', 'team', 'customer', 'release', 'schedule', 'design', 'update', 'server', 'launch', 'plan',
+    'report', 'sales', 'product', 'feature', 'testing', 'deadline', 'office', 'project', 'question', 'answer',
+    'morning', 'afternoon', 'tomorrow', 'yesterday', 'monday', 'friday', 'early', 'later', 'quickly', 'carefully',
+    'marketing', 'engineering', 'support', 'finance', 'hiring', 'training', 'contract', 'partner', 'vendor', 'invoice',
+    'agree', 'discuss', 'confirm', 'prepare', 'share', 'send', 'check', 'finish', 'start', 'change',
+    'small', 'large', 'new', 'old', 'main', 'final', 'first', 'second', 'third', 'open',
+    'issue', 'risk', 'goal', 'metric', 'growth', 'cost', 'price', 'market', 'region', 'country',
+    'data', 'model', 'system', 'network', 'mobile', 'desktop', 'browser', 'account', 'user', 'password',
+)
+WEBSOCKET_GUID = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+FAMILIES = ('transcribe', 'chat', 'gemini', 'soniox')
+
+
+class LatencyProfile:
+    """Latency and failure model of one endpoint family (times in seconds)."""
+
+    def __init__(
+        self,
+        ttfb: float = 0.3,
+        per_audio_second: float = 0.02,
+        jitter: float = 0.1,
+        token_interval: float = 0.02,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+    ):
+        self.ttfb = ttfb
+        self.per_audio_second = per_audio_second
+        self.jitter = jitter
+        self.token_interval = token_interval
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+
+    def first_byte_delay(self, rng: random.Random, audio_seconds: float = 0.0) -> float:
+        return max(0.0, self.ttfb + self.per_audio_second * audio_seconds + rng.uniform(-self.jitter, self.jitter))
+
+    def failure(self, rng: random.Random) -> Optional[int]:
+        """HTTP status to fail with (429/500), or None."""
+        roll = rng.random()
+        if roll < self.rate_limit_rate:
+            return 429
+        if roll < self.rate_limit_rate + self.error_rate:
+            return 500
+        return None
+
+
+class MockStats:
+    """Request counters shared by the handler threads."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests: Dict[str, int] = {}
+        self.failures: Dict[str, int] = {}
+        self.audio_seconds = 0.0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    def begin(self, family: str, audio_seconds: float = 0.0) -> None:
+        with self._lock:
+            self.requests[family] = self.requests.get(family, 0) + 1
+            self.audio_seconds += audio_seconds
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def add_audio(self, seconds: float) -> None:
+        with self._lock:
+            self.audio_seconds += seconds
+
+    def end(self, family: str, failed_status: Optional[int] = None) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            if failed_status is not None:
+                key = f"{family}:{failed_status}"
+                self.failures[key] = self.failures.get(key, 0) + 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'requests': dict(self.requests),
+                'failures': dict(self.failures),
+                'audio_seconds': round(self.audio_seconds, 1),
+                'peak_in_flight': self.peak_in_flight,
+            }
+
+
+def filler_text(audio_seconds: float, seed: int = 0) -> str:
+    """About WORDS_PER_SECOND words per audio second, sampled from FILLER_WORDS by seed."""
+    count = max(1, int(round(audio_seconds * WORDS_PER_SECOND)))
+    rng = random.Random(seed)
+    return ' '.join(rng.choice(FILLER_WORDS) for _ in range(count))
+
+
+def wav_seconds(data: bytes) -> float:
+    """Duration of a WAV payload; unknown formats count as 16 kHz 16-bit mono."""
+    try:
+        with wave.open(io.BytesIO(data), 'rb') as f:
+            return f.getnframes() / float(f.getframerate() or 1)
+    except Exception:
+        return len(data) / 32000.0
+
+
+def streamed_seconds(data: bytes) -> float:
+    """Audio seconds in a WAV prefix received so far (the header's frame count is for the whole file)."""
+    try:
+        with wave.open(io.BytesIO(data[:64] + b'\0' * 64), 'rb') as f:
+            bytes_per_second = f.getframerate() * f.getnchannels() * f.getsampwidth()
+        return max(0, len(data) - 44) / float(bytes_per_second or 32000)
+    except Exception:
+        return len(data) / 32000.0
+
+
+def _multipart_fields(content_type: str, body: bytes) -> Dict[str, bytes]:
+    message = message_from_bytes(f"Content-Type: {content_type}\r\n\r\n".encode('latin-1') + body, policy=HTTP)
+    fields = {}
+    for part in message.iter_parts():
+        name = part.get_param('name', header='content-disposition')
+        if name:
+            fields[name] = part.get_payload(decode=True) or b''
+    return fields
+
+
+class MockProviderHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive, like the real APIs
+    server: 'MockProviderServer'
+
+    def log_message(self, format, *args):  # noqa: A002 - BaseHTTPRequestHandler signature
+        pass
+
+    # ---- plumbing ----
+
+    def _body(self) -> bytes:
+        length = int(self.headers.get('Content-Length') or 0)
+        return self.rfile.read(length) if length else b''
+
+    def _send(self, status: int, body: bytes, content_type: str = 'application/json', headers: Optional[Dict[str, str]] = None) -> None:
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status: int, payload: Any) -> None:
+        self._send(status, json.dumps(payload, ensure_ascii=False).encode('utf-8'))
+
+    def _fail(self, status: int) -> None:
+        if status == 429:
+            self._send(429, json.dumps({'error': {'message': 'Rate limit reached (mock)', 'type': 'rate_limit_error', 'code': 'rate_limit_exceeded'}}).encode('utf-8'),
+                       headers={'Retry-After': '1'})
+        else:
+            self._send(status, json.dumps({'error': {'message': 'Internal error (mock)', 'type': 'server_error'}}).encode('utf-8'))
+
+    def _start_stream(self) -> None:
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+
+    def _chunk(self, data: bytes) -> None:
+        self.wfile.write(f"{len(data):X}\r\n".encode('ascii') + data + b"\r\n")
+        self.wfile.flush()
+
+    def _event(self, payload: Any, event: Optional[str] = None) -> None:
+        text = (f"event: {event}\n" if event else '') + f"data: {payload if isinstance(payload, str) else json.dumps(payload, ensure_ascii=False)}\n\n"
+        self._chunk(text.encode('utf-8'))
+
+    def _end_stream(self) -> None:
+        self._chunk(b'')
+
+    def _respond(self, family: str, audio_seconds: float, handler) -> None:
+        """Common latency/failure handling around one endpoint."""
+        profile = self.server.profiles[family]
+        rng = self.server.rng()
+        self.server.stats.begin(family, audio_seconds)
+        failed = profile.failure(rng)
+        try:
+            time.sleep(profile.first_byte_delay(rng, audio_seconds))
+            if failed is not None:
+                self._fail(failed)
+            else:
+                handler(profile, rng)
+        finally:
+            self.server.stats.end(family, failed)
+
+    # ---- routes ----
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path.endswith('/v1/models') or path == '/models':
+            self._send_json(200, {'object': 'list', 'data': [{'id': 'gpt-4o-transcribe', 'object': 'model', 'created': 0, 'owned_by': 'mock'}]})
+        elif path.startswith('/v1beta/models'):
+            self._send_json(200, {'models': [{'name': 'models/gemini-2.0-flash'}]})
+        elif path.endswith('/transcribe-websocket'):
+            self._soniox_session()
+        else:
+            self._send_json(404, {'error': {'message': f'No mock for GET {path}'}})
+
+    def do_POST(self):
+        path = urlsplit(self.path).path
+        body = self._body()
+        if path.endswith('/audio/transcriptions'):
+            self._openai_transcription(body)
+        elif path.endswith('/responses'):
+            self._openai_responses(body)
+        elif path.endswith('/chat/completions'):
+            self._openai_chat(body)
+        elif path.startswith('/v1beta/models/') and path.endswith(':generateContent'):
+            self._gemini_generate(body)
+        else:
+            self._send_json(404, {'error': {'message': f'No mock for POST {path}'}})
+
+    # ---- OpenAI ----
+
+    def _openai_transcription(self, body: bytes) -> None:
+        fields = _multipart_fields(self.headers.get('Content-Type', ''), body)
+        seconds = wav_seconds(fields.get('file', b''))
+        response_format = fields.get('response_format', b'json').decode('utf-8', 'ignore')
+
+        def handler(profile, rng):
+            text = filler_text(seconds, rng.getrandbits(32))
+            if response_format == 'text':
+                self._send(200, text.encode('utf-8'), 'text/plain; charset=utf-8')
+            elif response_format == 'verbose_json':
+                words = text.split()
+                step = seconds / max(1, len(words))
+                self._send_json(200, {
+                    'text': text,
+                    'duration': seconds,
+                    'words': [{'word': w, 'start': round(i * step, 3), 'end': round((i + 1) * step, 3)} for i, w in enumerate(words)],
+                    'segments': [{'id': 0, 'text': text, 'start': 0.0, 'end': round(seconds, 3)}],
+                })
+            else:
+                self._send_json(200, {'text': text})
+
+        self._respond('transcribe', seconds, handler)
+
+    def _openai_responses(self, body: bytes) -> None:
+        request = json.loads(body or b'{}')
+        seconds = 0.0
+        for message in request.get('input') or []:
+            parts = message.get('content') if isinstance(message, dict) else None
+            for part in parts if isinstance(parts, list) else []:
+                if isinstance(part, dict) and part.get('type') == 'input_audio':
+                    seconds += wav_seconds(base64.b64decode((part.get('audio') or {}).get('data') or ''))
+        model = request.get('model') or 'gpt-4o-transcribe'
+
+        def handler(profile, rng):
+            text = filler_text(seconds, rng.getrandbits(32))
+            self._stream_response(model, text, profile)
+
+        self._respond('transcribe', seconds, handler)
+
+    def _stream_response(self, model: str, text: str, profile: LatencyProfile) -> None:
+        response_id = f"resp_{uuid.uuid4().hex[:16]}"
+        item_id = f"msg_{uuid.uuid4().hex[:16]}"
+        base = {
+            'id': response_id, 'object': 'response', 'created_at': int(time.time()), 'model': model,
+            'status': 'in_progress', 'output': [], 'parallel_tool_calls': False, 'tool_choice': 'auto', 'tools': [],
+            'error': None, 'incomplete_details': None, 'instructions': None, 'metadata': {}, 'temperature': 0, 'top_p': 1,
+        }
+        sequence = iter(range(1 << 30))
+        ids = {'item_id': item_id, 'output_index': 0, 'content_index': 0}
+
+        def emit(kind, **payload):
+            self._event(dict(payload, type=kind, sequence_number=next(sequence)), event=kind)
+
+        self._start_stream()
+        emit('response.created', response=base)
+        emit('response.output_item.added', output_index=0, item={'id': item_id, 'type': 'message', 'role': 'assistant', 'status': 'in_progress', 'content': []})
+        emit('response.content_part.added', part={'type': 'output_text', 'text': '', 'annotations': []}, **ids)
+        for index, word in enumerate(text.split()):
+            emit('response.output_text.delta', delta=(' ' if index else '') + word, logprobs=[], **ids)
+            time.sleep(profile.token_interval)
+        part = {'type': 'output_text', 'text': text, 'annotations': []}
+        item = {'id': item_id, 'type': 'message', 'role': 'assistant', 'status': 'completed', 'content': [part]}
+        emit('response.output_text.done', text=text, logprobs=[], **ids)
+        emit('response.content_part.done', part=part, **ids)
+        emit('response.output_item.done', output_index=0, item=item)
+        emit('response.completed', response=dict(base, status='completed', output=[item]))
+        self._end_stream()
+
+    def _openai_chat(self, body: bytes) -> None:
+        request = json.loads(body or b'{}')
+        messages = request.get('messages') or []
+        source = next((m.get('content') for m in reversed(messages) if m.get('role') == 'user' and isinstance(m.get('content'), str)), '')
+        model = request.get('model') or 'gpt-4o-mini'
+        stream = bool(request.get('stream'))
+
+        def handler(profile, rng):
+            text = f"[mock] {source}".strip()
+            completion_id = f"chatcmpl-{uuid.uuid4().hex[:16]}"
+            created = int(time.time())
+            if not stream:
+                self._send_json(200, {
+                    'id': completion_id, 'object': 'chat.completion', 'created': created, 'model': model,
+                    'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': text}, 'finish_reason': 'stop'}],
+                    'usage': {'prompt_tokens': len(source) // 4, 'completion_tokens': len(text) // 4, 'total_tokens': (len(source) + len(text)) // 4},
+                })
+                return
+            self._start_stream()
+
+            def chunk(delta, finish=None):
+                self._event({'id': completion_id, 'object': 'chat.completion.chunk', 'created': created, 'model': model,
+                             'choices': [{'index': 0, 'delta': delta, 'finish_reason': finish}]})
+
+            chunk({'role': 'assistant', 'content': ''})
+            for index, word in enumerate(text.split()):
+                chunk({'content': (' ' if index else '') + word})
+                time.sleep(profile.token_interval)
+            chunk({}, 'stop')
+            self._event('[DONE]')
+            self._end_stream()
+
+        self._respond('chat', 0.0, handler)
+
+    # ---- Gemini ----
+
+    def _gemini_generate(self, body: bytes) -> None:
+        request = json.loads(body or b'{}')
+        texts = [part.get('text') for content in request.get('contents') or [] for part in content.get('parts') or [] if isinstance(part, dict) and part.get('text')]
+        seconds = sum(wav_seconds(base64.b64decode(part['inlineData'].get('data') or ''))
+                      for content in request.get('contents') or [] for part in content.get('parts') or []
+                      if isinstance(part, dict) and isinstance(part.get('inlineData'), dict))
+
+        def handler(profile, rng):
+            text = filler_text(seconds, rng.getrandbits(32)) if seconds else f"[mock] {texts[-1] if texts else ''}".strip()
+            self._send_json(200, {
+                'candidates': [{'content': {'role': 'model', 'parts': [{'text': text}]}, 'finishReason': 'STOP', 'index': 0}],
+                'usageMetadata': {'promptTokenCount': sum(len(t) for t in texts) // 4, 'candidatesTokenCount': len(text) // 4},
+            })
+
+        self._respond('gemini', seconds, handler)
+
+    # ---- Soniox-like websocket ----
+
+    def _soniox_session(self) -> None:
+        key = self.headers.get('Sec-WebSocket-Key')
+        if not key or 'websocket' not in (self.headers.get('Upgrade') or '').lower():
+            self._send_json(400, {'error': {'message': 'websocket upgrade required'}})
+            return
+        accept = base64.b64encode(hashlib.sha1((key + WEBSOCKET_GUID).encode('ascii')).digest()).decode('ascii')
+        self.send_response(101, 'Switching Protocols')
+        self.send_header('Upgrade', 'websocket')
+        self.send_header('Connection', 'Upgrade')
+        self.send_header('Sec-WebSocket-Accept', accept)
+        self.end_headers()
+        self.close_connection = True
+
+        profile = self.server.profiles['soniox']
+        rng = self.server.rng()
+        audio = bytearray()
+        sent_seconds = 0.0
+        failed = profile.failure(rng)
+        self.server.stats.begin('soniox')
+        try:
+            opcode, payload = _ws_read(self.rfile)  # config message
+            if failed is not None:
+                _ws_send_text(self.wfile, {'error_code': failed, 'error_message': 'mock failure'})
+                return
+            while True:
+                opcode, payload = _ws_read(self.rfile)
+                if opcode == 0x8 or (opcode == 0x1 and not payload):
+                    break  # close, or empty text = end of audio
+                if opcode == 0x2:
+                    audio.extend(payload)
+                    seconds = streamed_seconds(bytes(audio))
+                    if seconds - sent_seconds >= 1.0:
+                        # Final tokens for each second of audio received, after the model latency
+                        time.sleep(profile.first_byte_delay(rng, seconds - sent_seconds) * 0.25)
+                        text = filler_text(seconds - sent_seconds, rng.getrandbits(32))
+                        _ws_send_text(self.wfile, {'tokens': [{'text': ' ' + text, 'is_final': True}]})
+                        sent_seconds = seconds
+            seconds = streamed_seconds(bytes(audio))
+            time.sleep(profile.first_byte_delay(rng, max(0.0, seconds - sent_seconds)))
+            tail = [{'text': ' ' + filler_text(seconds - sent_seconds, rng.getrandbits(32)), 'is_final': True}] if seconds - sent_seconds > 0.2 else []
+            _ws_send_text(self.wfile, {'tokens': tail, 'finished': True})
+            self.server.stats.add_audio(seconds)
+            self.wfile.write(b'\x88\x00')  # close frame
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            self.server.stats.end('soniox', failed)
+
+
+def _ws_read(stream) -> Tuple[int, bytes]:
+    """Read one (unfragmented, client-masked) websocket frame."""
+    header = stream.read(2)
+    if len(header) < 2:
+        raise ConnectionError('websocket closed')
+    opcode = header[0] & 0x0F
+    length = header[1] & 0x7F
+    if length == 126:
+        length = struct.unpack('>H', stream.read(2))[0]
+    elif length == 127:
+        length = struct.unpack('>Q', stream.read(8))[0]
+    mask = stream.read(4) if header[1] & 0x80 else b''
+    payload = bytearray(stream.read(length))
+    if mask:
+        for i in range(len(payload)):
+            payload[i] ^= mask[i % 4]
+    return opcode, bytes(payload)
+
+
+def _ws_send_text(stream, payload: Any) -> None:
+    data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+    if len(data) < 126:
+        header = struct.pack('>BB', 0x81, len(data))
+    elif len(data) < 1 << 16:
+        header = struct.pack('>BBH', 0x81, 126, len(data))
+    else:
+        header = struct.pack('>BBQ', 0x81, 127, len(data))
+    stream.write(header + data)
+    stream.flush()
+
+
+class MockProviderServer(ThreadingHTTPServer):
+    """Threaded mock server; use as a context manager or call start()/stop()."""
+
+    daemon_threads = True
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, profiles: Optional[Dict[str, LatencyProfile]] = None, seed: int = 0):
+        super().__init__((host, port), MockProviderHandler)
+        self.profiles = {family: LatencyProfile() for family in FAMILIES}
+        self.profiles.update(profiles or {})
+        self.stats = MockStats()
+        self._seed = seed
+        self._rng_lock = threading.Lock()
+        self._rng_counter = 0
+        self._thread: Optional[threading.Thread] = None
+
+    def rng(self) -> random.Random:
+        """Per-request RNG, seeded so a run is reproducible for a fixed request order."""
+        with self._rng_lock:
+            self._rng_counter += 1
+            return random.Random(self._seed * 1_000_003 + self._rng_counter)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def provider_config(self) -> Dict[str, Any]:
+        """Config keys that route every provider to this server."""
+        return {
+            'openai_api_key': 'mock-key',
+            'openai_base_url': f"{self.base_url}/v1",
+            'gemini_api_key': 'mock-key',
+            'gemini_base_url': self.base_url,
+            'soniox_api_key': 'mock-key',
+            'soniox_base_url': self.base_url.replace('http://', 'ws://'),
+        }
+
+    def start(self) -> 'MockProviderServer':
+        self._thread = threading.Thread(target=self.serve_forever, name='mock-providers', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def add_profile_arguments(parser: argparse.ArgumentParser) -> None:
+    """Shared CLI flags; every family uses them unless overridden with --profile."""
+    parser.add_argument('--ttfb-ms', type=float, default=300.0, help='Time to first byte')
+    parser.add_argument('--per-audio-second-ms', type=float, default=20.0, help='Extra latency per second of uploaded audio')
+    parser.add_argument('--jitter-ms', type=float, default=100.0, help='Uniform +/- jitter on the first byte')
+    parser.add_argument('--token-ms', type=float, default=20.0, help='Gap between streamed tokens')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests failing with 500')
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0, help='Fraction of requests failing with 429')
+    parser.add_argument('--profile', action='append', default=[], metavar='FAMILY:KEY=VALUE,...',
+                        help='Per-family override, e.g. chat:ttfb_ms=800,error_rate=0.1 (families: ' + ', '.join(FAMILIES) + ')')
+
+
+def profiles_from_args(args) -> Dict[str, LatencyProfile]:
+    def build(overrides: Dict[str, float]) -> LatencyProfile:
+        values = {
+            'ttfb_ms': args.ttfb_ms, 'per_audio_second_ms': args.per_audio_second_ms, 'jitter_ms': args.jitter_ms,
+            'token_ms': args.token_ms, 'error_rate': args.error_rate, 'rate_limit_rate': args.rate_limit_rate,
+        }
+        values.update(overrides)
+        return LatencyProfile(
+            ttfb=values['ttfb_ms'] / 1000.0,
+            per_audio_second=values['per_audio_second_ms'] / 1000.0,
+            jitter=values['jitter_ms'] / 1000.0,
+            token_interval=values['token_ms'] / 1000.0,
+            error_rate=values['error_rate'],
+            rate_limit_rate=values['rate_limit_rate'],
+        )
+
+    overrides: Dict[str, Dict[str, float]] = {family: {} for family in FAMILIES}
+    for spec in args.profile:
+        family, _, assignments = spec.partition(':')
+        if family not in overrides:
+            raise SystemExit(f"Unknown profile family: {family}")
+        for assignment in filter(None, assignments.split(',')):
+            key, _, value = assignment.partition('=')
+            overrides[family][key.strip()] = float(value)
+    return {family: build(values) for family, values in overrides.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Mock OpenAI/Gemini/Soniox server for offline benchmarks')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--seed', type=int, default=0)
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+
+    server = MockProviderServer(args.host, args.port, profiles_from_args(args), seed=args.seed)
+    print(f"Mock providers on {server.base_url}")
+    for key, value in server.provider_config().items():
+        print(f"  {key}: {value}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(json.dumps(server.stats.snapshot(), indent=2))
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
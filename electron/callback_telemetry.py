@@ -0,0 +1,132 @@
+"""
+Audio callback telemetry.
+The input stream callback runs on PortAudio's real-time thread, so it only
+updates counters here: callback duration and audio_lock hold time go into
+log-bucketed histograms (microseconds), PortAudio status flags into overflow/
+underflow counts, and gaps in the stream's ADC timestamps into dropped frames.
+A callback slower than its block's duration is an overrun (the device buffer
+fills while it runs).
+
+take() swaps in a fresh window and returns the finished one as a compact dict
+for the periodic audio_stats message (snapshot() reads the current window
+without resetting it); formatting and sending happen on the consumer thread,
+never in the callback. Keep one CallbackTelemetry per stream: dropped-frame
+detection follows that stream's ADC clock and rate.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Dict, Optional
+
+from provider_routing import LatencyHistogram, log_bucket_bounds
+
+
+# Callback buckets: 10 us .. ~1 s (a 1024-frame block at 48 kHz is 21 ms)
+CALLBACK_BUCKET_BOUNDS_US = log_bucket_bounds(10.0, 1_000_000.0)
+
+
+class CallbackWindow:
+    """Counters and histograms of one reporting window."""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.callbacks = 0
+        self.frames = 0
+        self.overruns = 0
+        self.input_overflows = 0
+        self.input_underflows = 0
+        self.other_status = 0
+        self.dropped_frames = 0
+        self.errors = 0
+        self.max_duration = 0.0
+        self.max_lock_hold = 0.0
+        self.duration = LatencyHistogram(CALLBACK_BUCKET_BOUNDS_US)
+        self.lock_hold = LatencyHistogram(CALLBACK_BUCKET_BOUNDS_US)
+
+
+class CallbackTelemetry:
+    """Per-callback counters; record() is cheap enough for the real-time thread."""
+
+    def __init__(self):
+        self._window = CallbackWindow()
+        self.stream_rate = 0
+        self._next_adc_time: Optional[float] = None
+
+    def stream_started(self, sample_rate: int) -> None:
+        """A new stream at sample_rate (device rate, before resampling) starts calling back."""
+        self.stream_rate = int(sample_rate or 0)
+        self._next_adc_time = None
+
+    def record(self, duration: float, lock_hold: float, frames: int, status: Any = None, time_info: Any = None) -> None:
+        window = self._window
+        window.callbacks += 1
+        window.frames += frames
+        window.duration.record(duration * 1e6)
+        window.lock_hold.record(lock_hold * 1e6)
+        if duration > window.max_duration:
+            window.max_duration = duration
+        if lock_hold > window.max_lock_hold:
+            window.max_lock_hold = lock_hold
+        rate = self.stream_rate
+        if rate and frames and duration * rate > frames:
+            window.overruns += 1
+        if status:
+            if getattr(status, 'input_overflow', False):
+                window.input_overflows += 1
+            elif getattr(status, 'input_underflow', False):
+                window.input_underflows += 1
+            else:
+                window.other_status += 1
+        adc_time = getattr(time_info, 'inputBufferAdcTime', 0.0) if time_info is not None else 0.0
+        if adc_time and rate:
+            # Host APIs without timestamps report 0; a jump past the expected time means lost blocks
+            expected = self._next_adc_time
+            if expected is not None and (adc_time - expected) * rate > frames / 2:
+                window.dropped_frames += int(round((adc_time - expected) * rate))
+            self._next_adc_time = adc_time + frames / float(rate)
+
+    def error(self) -> None:
+        self._window.errors += 1
+
+    def take(self) -> Dict[str, Any]:
+        """Finished window as {'callbacks', 'overruns', ..., 'callback_us': {...}, 'lock_us': {...}}."""
+        window = self._window
+        self._window = CallbackWindow()
+        return self._describe(window)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current window so far, like take() but without starting a new one."""
+        return self._describe(self._window)
+
+    def _describe(self, window: CallbackWindow) -> Dict[str, Any]:
+        duration = window.duration.snapshot()
+        lock_hold = window.lock_hold.snapshot()
+        rate = self.stream_rate
+        return {
+            'seconds': round(time.monotonic() - window.started, 1),
+            'callbacks': window.callbacks,
+            'frames': window.frames,
+            'sample_rate': rate,
+            'overruns': window.overruns,
+            'input_overflows': window.input_overflows,
+            'input_underflows': window.input_underflows,
+            'other_status': window.other_status,
+            'dropped_frames': window.dropped_frames,
+            'errors': window.errors,
+            'budget_us': int(window.frames / window.callbacks / rate * 1e6) if window.callbacks and rate else None,
+            'callback_us': {
+                'p50': _whole(duration['p50']),
+                'p99': _whole(duration['p99']),
+                'max': int(window.max_duration * 1e6),
+            },
+            'lock_us': {
+                'p50': _whole(lock_hold['p50']),
+                'p99': _whole(lock_hold['p99']),
+                'max': int(window.max_lock_hold * 1e6),
+            },
+        }
+
+
+def _whole(value: Optional[float]) -> Optional[int]:
+    return int(round(value)) if value is not None else None
@@ -0,0 +1,332 @@
+"""
+Multi-source capture: several microphones, multi-channel interfaces and
+system loopback recorded and segmented by one engine.
+PortAudio streams are per device, so each source opens its own stream (or, for
+loopback, a SoundCard reader thread); every block is fed to CaptureGraph,
+which converts it to the processing rate and runs voice activity detection for
+all channels of the block at once (per-channel RMS is one NumPy reduction).
+Finished segments are tagged with the channel's label and handed to
+on_segment, so each speaker/source is transcribed as its own segment.
+
+capture_sources config (list, one entry per device):
+    {"device": "USB Audio" | 3, "channels": [0, 1], "labels": ["Host", "Guest"]}
+    {"loopback": true, "device": "Speakers" (optional), "label": "System"}
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import sounddevice as sd
+
+import audio_capture
+import callback_telemetry
+import level_meter
+import resampler
+
+
+LOOPBACK_BLOCK_FRAMES = 1024
+LOOPBACK_SAMPLE_RATE = 48000
+STREAM_BLOCK_FRAMES = 1024
+
+
+class SourceSpec:
+    """One capture device and the channels taken from it."""
+
+    def __init__(self, device: Any = None, channels: Optional[List[int]] = None, labels: Optional[List[str]] = None, loopback: bool = False):
+        self.device = device
+        self.channels = list(channels) if channels else [0]
+        self.labels = list(labels) if labels else []
+        self.loopback = loopback
+        self.name = ''
+        self.samplerate = 0
+        self.device_index: Optional[int] = None
+
+    def label(self, position: int) -> str:
+        if position < len(self.labels) and self.labels[position]:
+            return str(self.labels[position])
+        base = self.name or ('System audio' if self.loopback else 'Input')
+        return base if len(self.channels) == 1 else f"{base} ch{self.channels[position] + 1}"
+
+
+def parse_capture_sources(value: Any) -> List[SourceSpec]:
+    """Build SourceSpecs from the capture_sources config value (invalid entries are skipped)."""
+    specs: List[SourceSpec] = []
+    if not isinstance(value, list):
+        return specs
+    for entry in value:
+        if not isinstance(entry, dict):
+            continue
+        channels = entry.get('channels')
+        if isinstance(channels, int):
+            channels = list(range(max(1, channels)))
+        elif isinstance(channels, list):
+            channels = [int(c) for c in channels if isinstance(c, (int, float)) and int(c) >= 0]
+        else:
+            channels = None
+        labels = entry.get('labels')
+        if not isinstance(labels, list):
+            labels = [entry['label']] if isinstance(entry.get('label'), str) else None
+        specs.append(SourceSpec(entry.get('device'), channels, labels, bool(entry.get('loopback'))))
+    return specs
+
+
+def _resolve_input_device(spec: SourceSpec) -> None:
+    """Fill in device index, name and native rate for a PortAudio input source."""
+    if spec.device is None or spec.device == '':
+        info = sd.query_devices(kind='input')
+        spec.device_index = info.get('index')
+    elif isinstance(spec.device, int):
+        info = sd.query_devices(spec.device)
+        spec.device_index = spec.device
+    else:
+        needle = str(spec.device).lower()
+        info = None
+        for index, candidate in enumerate(sd.query_devices()):
+            if candidate.get('max_input_channels', 0) > 0 and needle in str(candidate.get('name', '')).lower():
+                info = candidate
+                spec.device_index = index
+                break
+        if info is None:
+            raise ValueError(f"Input device not found: {spec.device}")
+    available = int(info.get('max_input_channels') or 0)
+    if max(spec.channels) >= available:
+        raise ValueError(f"{info.get('name')} has {available} input channels, requested {[c + 1 for c in spec.channels]}")
+    spec.name = str(info.get('name') or 'Input')
+    spec.samplerate = int(round(float(info.get('default_samplerate') or 48000)))
+
+
+class _SourceState:
+    """Per-source VAD state; arrays are indexed by the source's channel position."""
+
+    def __init__(self, spec: SourceSpec, sample_rate: int, pre_roll_frames: int):
+        count = len(spec.channels)
+        self.spec = spec
+        self.labels = [spec.label(position) for position in range(count)]
+        self.columns = np.asarray(spec.channels, dtype=np.intp)
+        self.resampler = None if spec.samplerate == sample_rate else resampler.StreamingResampler(spec.samplerate, sample_rate)
+        self.active = np.zeros(count, dtype=bool)
+        self.silence = np.zeros(count, dtype=np.int64)
+        self.chunks: List[List[np.ndarray]] = [[] for _ in range(count)]
+        self.pre_roll = audio_capture.PreRollRing(pre_roll_frames, count)
+
+
+class CaptureGraph:
+    """Callback-driven multi-source recorder with per-channel segmentation.
+
+    on_segment(chunks, label) receives (frames, 1) float32 chunks of one
+    channel; on_activity(label, active) and on_status(source_name, status)
+    (PortAudio status flags) are optional UI hooks. All hooks run on capture
+    threads, most under the graph lock, so they should only queue work. While
+    meter (a level_meter.VolumeMeter) is active, every block adds each
+    channel's sum of squares and peak to it under the channel's label. Each source stream records its callback
+    timing into its own CallbackTelemetry (telemetry_by_source()).
+    """
+
+    def __init__(
+        self,
+        sources: List[SourceSpec],
+        *,
+        sample_rate: int,
+        silence_threshold: float,
+        min_silence_seconds: float,
+        pre_roll_seconds: float,
+        on_segment: Callable[[List[np.ndarray], str], None],
+        on_activity: Optional[Callable[[str, bool], None]] = None,
+        meter: Optional[level_meter.VolumeMeter] = None,
+        on_status: Optional[Callable[[str, Any], None]] = None,
+        log: Optional[Callable[[str, str], None]] = None,
+    ):
+        self.sources = sources
+        self.sample_rate = int(sample_rate)
+        self.silence_threshold = float(silence_threshold)
+        self.min_silence_frames = int(float(min_silence_seconds) * self.sample_rate)
+        self.pre_roll_frames = int(float(pre_roll_seconds) * self.sample_rate)
+        self.on_segment = on_segment
+        self.on_activity = on_activity
+        self.meter = meter
+        self.on_status = on_status
+        self._log = log or (lambda level, message: None)
+        self._lock = threading.Lock()
+        self._states: List[_SourceState] = []
+        self._streams: List[Any] = []
+        self._readers: List[threading.Thread] = []
+        self._running = False
+        self.telemetry: List[callback_telemetry.CallbackTelemetry] = []
+
+    def telemetry_by_source(self) -> Dict[str, callback_telemetry.CallbackTelemetry]:
+        names: Dict[str, callback_telemetry.CallbackTelemetry] = {}
+        for index, (spec, telemetry) in enumerate(zip(self.sources, self.telemetry)):
+            name = spec.name or f"source {index + 1}"
+            names[name if name not in names else f"{name} ({index + 1})"] = telemetry
+        return names
+
+    # ---- lifecycle ----
+
+    def start(self) -> None:
+        """Resolve devices and open every source; raises if any source cannot be opened."""
+        for spec in self.sources:
+            if spec.loopback:
+                spec.samplerate = spec.samplerate or LOOPBACK_SAMPLE_RATE
+            else:
+                _resolve_input_device(spec)
+        self._states = [_SourceState(spec, self.sample_rate, self.pre_roll_frames) for spec in self.sources]
+        self.telemetry = [callback_telemetry.CallbackTelemetry() for _ in self.sources]
+        for spec, telemetry in zip(self.sources, self.telemetry):
+            telemetry.stream_started(spec.samplerate)
+        self._running = True
+        try:
+            for index, spec in enumerate(self.sources):
+                if spec.loopback:
+                    self._start_loopback(index, spec)
+                else:
+                    stream = sd.InputStream(
+                        device=spec.device_index,
+                        samplerate=spec.samplerate,
+                        channels=max(spec.channels) + 1,
+                        dtype='float32',
+                        blocksize=STREAM_BLOCK_FRAMES,
+                        callback=self._make_callback(index),
+                    )
+                    stream.start()
+                    self._streams.append(stream)
+                labels = ', '.join(spec.label(i) for i in range(len(spec.channels)))
+                self._log("info", f"Capture source {index + 1}: {spec.name} @ {spec.samplerate}Hz -> [{labels}]")
+        except Exception:
+            self.stop(flush=False)
+            raise
+
+    def stop(self, flush: bool = True) -> None:
+        """Close all sources; with flush, unfinished channel segments are emitted."""
+        self._running = False
+        for stream in self._streams:
+            try:
+                stream.stop()
+                stream.close()
+            except Exception as e:
+                self._log("warning", f"Closing capture stream failed: {e}")
+        self._streams = []
+        for reader in self._readers:
+            reader.join(timeout=2)
+        self._readers = []
+        if flush:
+            with self._lock:
+                for state in self._states:
+                    for position in np.flatnonzero(state.active):
+                        self._finish_segment(state, int(position))
+
+    def _make_callback(self, index: int):
+        telemetry = self.telemetry[index]
+        spec = self.sources[index]
+
+        def callback(indata, frames, time_info, status):
+            started = time.perf_counter()
+            held = 0.0
+            try:
+                held = self.feed(index, indata)
+            except Exception as e:
+                # Never raise into PortAudio's callback thread
+                telemetry.error()
+                self._log("error", f"Capture graph error: {e}")
+            if status and self.on_status is not None:
+                self.on_status(spec.name or f"source {index + 1}", status)
+            telemetry.record(time.perf_counter() - started, held, frames, status, time_info)
+        return callback
+
+    def _start_loopback(self, index: int, spec: SourceSpec) -> None:
+        import soundcard as sc  # Optional dependency, only needed for loopback sources
+
+        if spec.device:
+            speaker = sc.get_speaker(str(spec.device))
+        else:
+            speaker = sc.default_speaker()
+        microphone = sc.get_microphone(id=str(speaker.name), include_loopback=True)
+        spec.name = f"{speaker.name} (loopback)"
+        count = max(spec.channels) + 1
+        telemetry = self.telemetry[index]
+
+        def reader():
+            try:
+                with microphone.recorder(samplerate=spec.samplerate, channels=count, blocksize=LOOPBACK_BLOCK_FRAMES) as recorder:
+                    while self._running:
+                        block = recorder.record(numframes=LOOPBACK_BLOCK_FRAMES)
+                        started = time.perf_counter()
+                        held = self.feed(index, block)
+                        telemetry.record(time.perf_counter() - started, held, len(block))
+            except Exception as e:
+                self._log("error", f"Loopback capture failed: {e}")
+
+        thread = threading.Thread(target=reader, name=f"loopback-{index + 1}", daemon=True)
+        self._readers.append(thread)
+        thread.start()
+
+    # ---- segmentation ----
+
+    def feed(self, index: int, block: np.ndarray) -> float:
+        """Segment one device block (frames, device_channels); returns seconds the graph lock was held."""
+        if not self._running or block is None or len(block) == 0:
+            return 0.0
+        with self._lock:
+            acquired = time.perf_counter()
+            state = self._states[index]
+            data = np.asarray(block, dtype=np.float32)
+            if data.ndim == 1:
+                data = data[:, None]
+            data = data[:, state.columns]
+            if state.resampler is not None:
+                data = state.resampler.process(data)
+                if len(data) == 0:
+                    return time.perf_counter() - acquired
+            frames = len(data)
+
+            # One reduction for every channel of the block
+            sum_squares = np.sum(np.square(data), axis=0)
+            rms = np.sqrt(sum_squares / frames)
+            loud = rms >= self.silence_threshold
+
+            starting = loud & ~state.active
+            if starting.any():
+                buffered = state.pre_roll.snapshot()
+                for position in np.flatnonzero(starting):
+                    position = int(position)
+                    if len(buffered):
+                        state.chunks[position].append(buffered[:, position:position + 1].copy())
+                    self._notify_activity(state, position, True)
+                state.active |= starting
+
+            for position in np.flatnonzero(state.active):
+                state.chunks[position].append(data[:, position:position + 1].copy())
+
+            state.silence = np.where(state.active & ~loud, state.silence + frames, 0)
+            ending = state.active & (state.silence >= self.min_silence_frames)
+            for position in np.flatnonzero(ending):
+                self._finish_segment(state, int(position))
+
+            state.pre_roll.write(data)
+
+            meter = self.meter
+            if meter is not None and meter.active:
+                peaks = np.max(np.abs(data), axis=0)
+                for position, label in enumerate(state.labels):
+                    meter.accumulate_source(label, float(sum_squares[position]), float(peaks[position]), frames)
+            return time.perf_counter() - acquired
+
+    def _finish_segment(self, state: _SourceState, position: int) -> None:
+        chunks = state.chunks[position]
+        state.chunks[position] = []
+        state.active[position] = False
+        state.silence[position] = 0
+        self._notify_activity(state, position, False)
+        if chunks:
+            self.on_segment(chunks, state.labels[position])
+
+    def _notify_activity(self, state: _SourceState, position: int, active: bool) -> None:
+        if self.on_activity is None:
+            return
+        try:
+            self.on_activity(state.labels[position], active)
+        except Exception:
+            pass
@@ -0,0 +1,279 @@
+"""
+Offline language hints for smart translation.
+Script detection is table driven: codepoint ranges are compiled once into a
+BMP lookup array (plus a bisect over the few supplementary-plane ranges), and
+a transcript is classified in bulk by viewing its UTF-32 encoding as a NumPy
+array and counting script ids with bincount, instead of testing every
+character against a chain of range comparisons in Python.
+
+Languages written in the same script (English vs Spanish, Russian vs
+Ukrainian, Arabic vs Persian) tie on script counts; the tie is broken by a
+character-trigram model over the ranked profiles in language_profiles.py, so
+smart translation never needs a network call to pick a target.
+"""
+
+import bisect
+import math
+import re
+import unicodedata
+from collections import Counter
+from functools import lru_cache
+
+import numpy as np
+
+import language_profiles
+
+LANGUAGE_SCRIPT_MAP = {
+    'arabic': {'arabic'},
+    'bengali': {'bengali'},
+    'chinese': {'han'},
+    'czech': {'latin'},
+    'danish': {'latin'},
+    'dutch': {'latin'},
+    'english': {'latin'},
+    'finnish': {'latin'},
+    'french': {'latin'},
+    'german': {'latin'},
+    'greek': {'greek'},
+    'gujarati': {'gujarati'},
+    'hebrew': {'hebrew'},
+    'hindi': {'devanagari'},
+    'hungarian': {'latin'},
+    'icelandic': {'latin'},
+    'indonesian': {'latin'},
+    'italian': {'latin'},
+    'japanese': {'han', 'hiragana', 'katakana'},
+    'kannada': {'kannada'},
+    'korean': {'hangul'},
+    'malay': {'latin'},
+    'malayalam': {'malayalam'},
+    'norwegian': {'latin'},
+    'persian': {'arabic'},
+    'polish': {'latin'},
+    'portuguese': {'latin'},
+    'punjabi': {'gurmukhi'},
+    'romanian': {'latin'},
+    'russian': {'cyrillic'},
+    'simplified chinese': {'han'},
+    'spanish': {'latin'},
+    'swedish': {'latin'},
+    'tamil': {'tamil'},
+    'telugu': {'telugu'},
+    'thai': {'thai'},
+    'traditional chinese': {'han'},
+    'turkish': {'latin'},
+    'ukrainian': {'cyrillic'},
+    'urdu': {'arabic'},
+    'vietnamese': {'latin'},
+    'zh': {'han'}
+}
+
+def normalize_language_name(name):
+    if not isinstance(name, str):
+        return ''
+    return name.strip().lower()
+
+def language_scripts(name):
+    normalized = normalize_language_name(name)
+    if not normalized:
+        return {'latin'}
+    if normalized in LANGUAGE_SCRIPT_MAP:
+        return LANGUAGE_SCRIPT_MAP[normalized]
+    return {'latin'}
+
+
+# (first, last, script) codepoint ranges; earlier entries win where ranges overlap
+SCRIPT_RANGES = (
+    (0x3400, 0x4DBF, 'han'), (0x4E00, 0x9FFF, 'han'), (0xF900, 0xFAFF, 'han'), (0x20000, 0x2CEAF, 'han'),
+    (0x3040, 0x309F, 'hiragana'),
+    (0x30A0, 0x30FF, 'katakana'), (0xFF66, 0xFF9D, 'katakana'),
+    (0xAC00, 0xD7AF, 'hangul'), (0x1100, 0x11FF, 'hangul'), (0x3130, 0x318F, 'hangul'),
+    (0x0400, 0x052F, 'cyrillic'), (0x2DE0, 0x2DFF, 'cyrillic'), (0xA640, 0xA69F, 'cyrillic'),
+    (0x0370, 0x03FF, 'greek'), (0x1F00, 0x1FFF, 'greek'),
+    (0x0590, 0x05FF, 'hebrew'), (0xFB1D, 0xFB4F, 'hebrew'),
+    (0x0600, 0x06FF, 'arabic'), (0x0750, 0x077F, 'arabic'), (0x08A0, 0x08FF, 'arabic'),
+    (0xFB50, 0xFDFF, 'arabic'), (0xFE70, 0xFEFF, 'arabic'),
+    (0x0900, 0x097F, 'devanagari'),
+    (0x0980, 0x09FF, 'bengali'),
+    (0x0A00, 0x0A7F, 'gurmukhi'),
+    (0x0A80, 0x0AFF, 'gujarati'),
+    (0x0B80, 0x0BFF, 'tamil'),
+    (0x0C00, 0x0C7F, 'telugu'),
+    (0x0C80, 0x0CFF, 'kannada'),
+    (0x0D00, 0x0D7F, 'malayalam'),
+    (0x0E00, 0x0E7F, 'thai'),
+    (0x1780, 0x17FF, 'khmer'),
+    (0x0100, 0x024F, 'latin'), (0x00C0, 0x00FF, 'latin'), (0x0000, 0x007F, 'latin'),
+)
+
+# Script ids; 'space' marks whitespace, which detection skips
+SCRIPTS = ('other', 'space') + tuple(sorted({script for _, _, script in SCRIPT_RANGES}))
+SCRIPT_IDS = {script: index for index, script in enumerate(SCRIPTS)}
+OTHER_ID = SCRIPT_IDS['other']
+SPACE_ID = SCRIPT_IDS['space']
+
+
+def _build_tables():
+    bmp = np.full(0x10000, OTHER_ID, dtype=np.uint8)
+    astral = []
+    # Reverse order so the first matching range in SCRIPT_RANGES ends up in the table
+    for first, last, script in reversed(SCRIPT_RANGES):
+        if first < 0x10000:
+            bmp[first:min(last, 0xFFFF) + 1] = SCRIPT_IDS[script]
+        else:
+            astral.append((first, last, SCRIPT_IDS[script]))
+    # str.isspace() is only true below U+3001
+    for codepoint in range(0x3001):
+        if chr(codepoint).isspace():
+            bmp[codepoint] = SPACE_ID
+    astral.sort()
+    return bmp, [first for first, _, _ in astral], astral
+
+
+_BMP_TABLE, _ASTRAL_STARTS, _ASTRAL_RANGES = _build_tables()
+_BMP_BYTES = _BMP_TABLE.tobytes()  # Plain bytes indexing is cheaper than NumPy scalars for short text
+
+# Below this length a Python loop over the byte table beats NumPy call overhead
+SHORT_TEXT_CHARS = 48
+
+
+def _astral_script_id(codepoint):
+    index = bisect.bisect_right(_ASTRAL_STARTS, codepoint) - 1
+    if index >= 0:
+        first, last, script_id = _ASTRAL_RANGES[index]
+        if codepoint <= last:
+            return script_id
+    return OTHER_ID
+
+
+def classify_script(char):
+    codepoint = ord(char)
+    if codepoint < 0x10000:
+        script_id = int(_BMP_TABLE[codepoint])
+        # Whitespace keeps its range script for single-character callers
+        if script_id == SPACE_ID:
+            return 'latin' if codepoint <= 0x7F else 'other'
+        return SCRIPTS[script_id]
+    return SCRIPTS[_astral_script_id(codepoint)]
+
+
+def script_histogram(text):
+    """Count non-whitespace characters per script id (array indexed like SCRIPTS)."""
+    if len(text) < SHORT_TEXT_CHARS:
+        tally = [0] * len(SCRIPTS)
+        for char in text:
+            codepoint = ord(char)
+            tally[_BMP_BYTES[codepoint] if codepoint < 0x10000 else _astral_script_id(codepoint)] += 1
+        tally[SPACE_ID] = 0
+        return np.array(tally)
+    codepoints = np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+    ids = _BMP_TABLE[np.minimum(codepoints, 0xFFFF)]
+    astral = codepoints > 0xFFFF
+    if astral.any():
+        # Rare (CJK extension B+, emoji): resolve individually
+        for index in np.flatnonzero(astral):
+            ids[index] = _astral_script_id(int(codepoints[index]))
+    counts = np.bincount(ids, minlength=len(SCRIPTS))
+    counts[SPACE_ID] = 0
+    return counts
+
+
+@lru_cache(maxsize=64)
+def _language_mask(normalized_name):
+    mask = np.zeros(len(SCRIPTS), dtype=bool)
+    for script in language_scripts(normalized_name):
+        if script in SCRIPT_IDS:
+            mask[SCRIPT_IDS[script]] = True
+    return mask
+
+
+# Only the head of a long transcript is scored; a few hundred characters decide reliably
+NGRAM_MAX_CHARS = 600
+# Fewer trigrams than this (one or two short words) is not evidence either way
+NGRAM_MIN_TRIGRAMS = 6
+# Required gap in mean log-probability per trigram before a winner is declared
+NGRAM_MIN_MARGIN = 0.05
+# Unseen trigrams score as if ranked this many times past the end of the profile
+NGRAM_UNSEEN_FACTOR = 2.0
+
+_WORD_RE = re.compile(r"[^\W\d_]+")
+
+
+def text_trigrams(text, limit=NGRAM_MAX_CHARS):
+    """Count space-padded character trigrams of the words in text."""
+    counts = Counter()
+    if not text:
+        return counts
+    normalized = unicodedata.normalize('NFC', text[:limit]).lower()
+    for word in _WORD_RE.findall(normalized):
+        padded = f" {word} "
+        for index in range(len(padded) - 2):
+            counts[padded[index:index + 3]] += 1
+    return counts
+
+
+def has_trigram_profile(name):
+    return normalize_language_name(name) in language_profiles.PROFILES
+
+
+@lru_cache(maxsize=64)
+def _trigram_weights(normalized_name):
+    """(log-probability by trigram, unseen log-probability) for one profile.
+
+    Profiles only store trigrams in rank order, so probabilities follow a
+    Zipf curve over the rank: p(rank r) = 1 / ((r + 1) * H), H normalising
+    over PROFILE_SIZE ranks for every language alike.
+    """
+    packed = language_profiles.PROFILES[normalized_name]
+    size = language_profiles.PROFILE_SIZE
+    log_norm = math.log(sum(1.0 / rank for rank in range(1, size + 1)))
+    weights = {}
+    for rank, offset in enumerate(range(0, len(packed), 3)):
+        weights.setdefault(packed[offset:offset + 3], -math.log(rank + 1) - log_norm)
+    unseen = -math.log(size * NGRAM_UNSEEN_FACTOR) - log_norm
+    return weights, unseen
+
+
+def identify_language(text, candidates):
+    """Pick the most likely of candidates (language names) by trigram profile.
+
+    Returns the normalized name, or None when a candidate has no profile, the
+    text is too short, or the best two scores are too close to call.
+    """
+    names = [normalize_language_name(name) for name in candidates]
+    if len(set(names)) < 2 or not all(name in language_profiles.PROFILES for name in names):
+        return None
+    counts = text_trigrams(text)
+    total = sum(counts.values())
+    if total < NGRAM_MIN_TRIGRAMS:
+        return None
+    scores = []
+    for name in names:
+        weights, unseen = _trigram_weights(name)
+        get = weights.get
+        score = sum(count * get(trigram, unseen) for trigram, count in counts.items())
+        scores.append((score / total, name))
+    scores.sort(reverse=True)
+    if scores[0][0] - scores[1][0] < NGRAM_MIN_MARGIN:
+        return None
+    return scores[0][1]
+
+
+def detect_language_by_charset(text, language1, language2):
+    if not text or not text.strip():
+        return None
+
+    counts = script_histogram(text)
+    # A character of a script shared by both languages counts for both
+    score1 = int(counts[_language_mask(normalize_language_name(language1))].sum())
+    score2 = int(counts[_language_mask(normalize_language_name(language2))].sum())
+
+    if score1 > score2:
+        return normalize_language_name(language1)
+    if score2 > score1:
+        return normalize_language_name(language2)
+
+    # Same script (or no letters at all): let the trigram model break the tie
+    if score1:
+        return identify_language(text, (language1, language2))
+    return None
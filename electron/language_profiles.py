@@ -0,0 +1,438 @@
+"""
+Character-trigram language profiles used by language_id.identify_language.
+Generated by scripts/build_language_profiles.py from scripts/language_samples;
+do not edit by hand.
+
+Each profile is its trigrams concatenated in descending frequency order (every
+trigram is exactly three characters, words padded with one space each side).
+"""
+
+PROFILE_SIZE = 300
+
+PROFILES = {
+    'arabic': (
+        ' ال أن في منأن في  إن عل يعإنهمن هم  لا هذالتالمذا رة لا لة '
+        'لى نا نهاها  تر شك كل ما معأناالأالجالحالسالعالقالكاليتريجمي'
+        'دا دة ديدرا ساعشكرعلىعليعملقريكراكل لك لكنله مع مل هذاوع وم '
+        'ون يد يدةير يعميف ين يوم أخ أش أص أع أف أك أو أي إل بب بخ تأ'
+        ' تذ تك جد جز جم جي حا ست سن شر شي صب عد غد فض فع فك قا قب قر'
+        ' كب كي لك لل لي مح مر مس مش نت نح نه هل هن وا وص يب يج يل يم'
+        ' يوأتيأخيأسبأشتأصدأطفأعتأفهأكثأكلأودأينإلىئهااء ائهات اج اجت'
+        'احااحقاذاار اسواشراع اعةاعداقشاك ال الاالبالطالفاللايةبا باح'
+        'ببطبة بت بخيبدأبركبطءبل بوعبونبيتبيرتأتتأكتاجتحقتذكترستقدتقر'
+        'تك تكاتكلتماتي تينثر جب جتمجداجديجزيجيدحا حاسحالحباحتاحديحطة'
+        'حفلحقاحققخي خيردأ دتكدقاديقديمدينذكرذه رتيرحبرسلرف رك ركةروع'
+        'ري ريبريدريرريقزيلسبتسبوسة ستأسل سنوسوبشاءشة شترشرةشركشروشكل'
+        'شونشيءصباصبرصدقضلكطء طارطة طفاطقسعاشعبوعة عتقعدتعديعرفعشاعله'
+        'عيشغدافالفريفضلفعلفكرفلةفهمقا قائقالقبلقة قد قديقس قشةقطاقق '
+        'كالكبيكة كثركرةكرتكلةكلمكلهكن كنككنيكيفلأسلأطلاجلاحلبيلت لتق'
+    ),
+    'czech': (
+        'je  je po ve v  dě ko pr seat ji se  do ne ná přco dneem kon'
+        'mi prosímto ím  a  by ch co dn mu má mů s  to tý vš za žeají'
+        'alebrachcde dobděkděles et ečeeš hceho it jí klaku kujké la '
+        'latli me mocmtomusmě ncenesobroc oncostpompočrattelujiusíve '
+        'velvečzkoímeěkuěliže  ab ah al bl br ce de dv dů fi he ho hr'
+        ' ja k  kd le lí ma mi ml mn mo my mě na no ně pa rá sc si so'
+        ' sp st sv tr tv tí už vě zk zp zí řeabyacuad adyahoak arkaré'
+        'asíatračeačíažíblíbotbrýby bycbydbřece celcemcercešch chncht'
+        'chůcujdesdindkudlídomdradvady dějdětdůleched ejieklektelaeli'
+        'elkelmelýemuepoer eroerteseezkeřiežifirhezhnihodhojhrahtěhůz'
+        'ichijdin irmitéivojakjdejekka kdeko koskoukt ky ladle lejlet'
+        'ležlivlkélmilovluvlí límlíslízlýmmajmalmemmlumnomu mysmámmáš'
+        'mímměsmůjmůžna ne necnepnerni no nohnovntrná nádnáknápněcobo'
+        'obřodiohooj ojeoloomaomoomtoměontoslosíotuou oupovaovýozdozu'
+        'očaočíořápadparpitpospozpořpraprápuspělpřepřipřára racrajraž'
+    ),
+    'danish': (
+        'en  deer et det i  videned le  er meil ne  at ha hv je tiang'
+        'at de eg gerjegke kkengeor re tenvil af di du he hu sk ta ve'
+        'ad al ar derdu eregenharigtin kalligllemedndernerteskater en'
+        ' fo ga go ik ko li ma mi og på se staftag ak an dagdindt ege'
+        'eleeneennernettforftege getgodgt hedhelhunhvahvoig ikkillirk'
+        'jekkenmanmmenernneog ommpå rdarkesensomtakte tiltteun utevad'
+        'vi vorår  al ar ba be bi bo br by bø co da ge gø hj ho id in'
+        ' ka ki kl kø la le lø mo mø no ny om pa pr ra sa si sp sy sø'
+        ' tj to tå tæ ud ug væ åraf agdaleallaltamlaneapparbarkartave'
+        'banbe begbejbilboebrobyebørcercomdandejdgadigdisdlidé egyegå'
+        'ej ejdejlejrekkektendensertes galgamgangdeggeghegsogtigyngår'
+        'gørhavhejhjæholhusidlidtidéiggighindineingiseiskjdejlijrejæl'
+        'kankirklokomkonkosksokt kutkøblanldelegletlidlmoloklp lt lør'
+        'madme megmenmermhemigminmkomlemodmormpumødncenegnennesngsnin'
+        'nognsmnyeod odiodtoetogeojeokkoldomhomkomponcordorgorsortost'
+    ),
+    'dutch': (
+        'en et  hehet deat de is er  be is je weje  me morenten da st'
+        ' wa zeaarmetweeze  al co er ik in ko ni va voag ar datdereen'
+        'eleereeteietij ik in moendenieoetooror rijrt statervanvoowat'
+        'we  bi di ee en ga ge go gr ha hu ie la mi op sp ve wiaagaat'
+        'allangankartatebedbegbijcondandendited ee eekeelek el enderg'
+        'erkes gaagoegriheeienil indit kt lanle nd nk oedop prereerk '
+        'sprurewil br ei et hi ho id ja ka ke ki ku ma om ou pa pr ra'
+        ' te ti tw uu vl vr wo za zoad adeak al alsam amean anaandapp'
+        'arearkatiavobelbesbeublibrocerchtcomct daadagdeedezdriduleam'
+        'ebeeblectedaedeedredueereeteftegiegrei einekeelaenkenoerderi'
+        'ertespetseureuwezeft gadgebgedgengingragrogzahaahalhelhijhoe'
+        'htehuihulideiediefieuijfijkijnijpingintionjarjebjecjesjf jk '
+        'jn jp kaakenkerkinkomkopkoskunlaklatld lenlerlesliellellolo '
+        'lp lsjmaame menmermijmismoomormpunavncendanenng ngrngznktnoc'
+        'nt ntrochoe oeroi ojeoleom omeompon oncondoneontooiootopeorg'
+    ),
+    'english': (
+        ' ththehe is  to yong you isat er ingre thi coforherin nd ou '
+        'to  do fo i  in we wheryhator stathaver ch he it ne st wi wo'
+        'andcomen endhinhisit ithld mornk on rt th ts wit a  an ar be'
+        ' bu di ev ha ho li me mo pa pl sa sh te veam ankantanyareart'
+        'atiaveay ce ch ck daydo eareatereevehanhavhelienme ncene nt '
+        'ny omeomporeortoulourow porry se shetantarteruldur ve we wha'
+        'wou am at bi br ca ci cl ea en fi fr go id im kn la ma mu my'
+        ' ni no o  of ol on pr re se sl so sp t  ti tr tw un wa wr ye'
+        'aidainak an ar arkarsaseateathatuayibeebefbigbrobutbuycancer'
+        'chechichucitckecloconcosct cusdeaderdindisdoedondreds ea eak'
+        'eameaseckected eedeekeeneetefoek ellelpencepoersertes etheti'
+        'etsew ey finfrightgoohecheyhilholhouhowht huriceickid ideig '
+        'ighikeildimpineinkinnioniscityivijecke ketknoks latlayldrle '
+        'lealiklivllolo loclowlp ly manmeemetmpampompumucmy ndendsnea'
+        'neenernewnicnigninnnenotnowockod odaoesof ojeoldoleomooncone'
+    ),
+    'finnish': (
+        'in  täon  ka misa ssasta onminta aa si sä tä än inuistle ssä'
+        'ttäullustää  hy ki ko ku tiellen esset etthyvikkitäkonlislla'
+        'llemitnulokotaatietostäsyvä en et ha he hä il ja ke kä la lä'
+        ' me pu ra se ta viaamaikainaluansat desdä dänea ei eidennest'
+        'halhänidäietiitisiissitoiväja kaakaikankaukiikkiko kokkseksi'
+        'kuskuula llilualuulähmeimenmmina neenennisnssntaos ossppupua'
+        'ritse setsinstätaitanteltiittatyytäntävtäyua uluuu uulvä vät'
+        'ymmytyyy äheänäässät äyt aa al as av ei er hi hu id jo ky le'
+        ' li lo mo mu my ol os ov pa pr sa si su sy sä te tu ty uu va'
+        ' ve vo vu ym yr ysaisaksaljalkallaloammamuanaanhannanoantapo'
+        'apsarkaseasiasuatiauaaunaupautavudeaeasee eeseetehdeikeksekt'
+        'eleeljemaemmeneeniensenteriertesketoetäeäägishaahdähe heihel'
+        'hemhethithu huoideieaieniikiimiinikaikoilliltimiippirkis ise'
+        'isyitaitkittityjekjenjonjotkakkeakelkenkeskeäki kirkiskivkke'
+        'kkokoakouktikymkärkäylallaplauleeleilipljeljolkallollälo lop'
+    ),
+    'french': (
+        'le  de lelle ilde us  qu voenter es il ne nt ourre ur  ce co'
+        ' es la pa poce estis la ns ouspoust  av en je ma noaiset ill'
+        'je maivou da di el fa pl pr to un viansantavecomdaneauec ell'
+        'ez ienin it joumenncenouon outqu quese toutrets ue ut vec a '
+        ' be bi bo et me mo ne sa se trachainaitas atiau avabeaboncet'
+        'checi devdraemaen encenderceureuxevofaiiseleslezlusmermmemon'
+        'ndeommonsortotrouvparpaspluporproraircird rt rèsseste terune'
+        'uteuveux vaivievonvotès  ac ai al am an au c  du dé dî fi fr'
+        ' ga gr ha he hu id im jo l  m  or où pe ra ré s  so ta tu va'
+        ' ve vé y  à  ég éqabiaidailairallameamiandangannapparcardare'
+        'arlarrateaucaujautaîtbiebilbitblèbrecerconcoucoûcutdemdepdeu'
+        'di dindisditdixds du déedémdînedieilemeenfensenveprepuertete'
+        'etsetteusfanfaufiefinfrègargergligrahabhe hetheuhuiideidéiei'
+        'ierifiilsimpinaineionipeir ireiscisoiteix jetlaîlenletlisls '
+        'lèmmanmarmatmbrme medmismpomprnatndrndsnernfangenionjonnenné'
+    ),
+    'german': (
+        'en er  deich daderst as chtie  di isdasht ist midieeinin ir '
+        'te  be es ge ha in wich em es he ineit ute ic ka ko ni sc si'
+        ' sp st woabecheeleiellenmitnd ndene nicschsensiesprssestaten'
+        'terundwas ab al du ei er fr fü gu he ki mö mü pr se un vi wa'
+        ' we zuallam ankartassbenberbesdandeidemdendu echehteitendese'
+        'espet eutfenfürgehgutheuhr hrehteiesmirmmtmt möcmüsnzeprerec'
+        'renricrtesamsemss stetettteum vieweiwiröchür üss am ar ba bi'
+        ' br co en et fi ga gl gr hi id ih im ja je la me mo ne nä pa'
+        ' sa te tu uh um ve vo ze zwadtag agtahnahraltameamsangannanz'
+        'arbarkat aubaufausbahbe begbeibitbruchichochuchöckecomde dee'
+        'dirdt duleamedeeduee egieheehnehrei eißekteriersertesaessest'
+        'ettetweueeunfe firfrefrügangedgengesginglagrogsagt habhalhat'
+        'hauhenhichilhn hnehnhhofhonhtihunhönickideig ihrilfim immind'
+        'innircirmiteittiß jahjedjekkankarkauke kenkinkirkomkonkoskt '
+        'lanlauld leslfellellolo ltema meimermormpumstnennerneung ngs'
+    ),
+    'hungarian': (
+        ' a  va szan et gy  hoagyel  az el ke kö mibanellem szé ké na'
+        ' neaz besdenek ekeennereeszgyohogindkelll nagni nniogyszevan'
+        'zerzélégeés  ba be eg ez je jó la ma me te tu ésak al bendet'
+        'edeegyen entetngyeholik it köslenlomma megminmitnakndenemnk '
+        'nélnömnünok on retszöségtemtnétsétudvagvalyonzelzönél ét öm '
+        'önööszünk bá cs cé de do eb en es fo gy há hé id in já jö ko'
+        ' kü mo má pa pr re ré se so tí tü ve vá vé ér év ór öt újabb'
+        'acsaivaj aknakoalaamianaap apaarkaráassasúatiattaztbajbarbat'
+        'bb bbabbebátcercsacsocégde dikdjadoddoldtaduldő dődebbeg egb'
+        'eggegéegíekteleelmeléelőempenienkenőeriertestez ezdezzfongbe'
+        'ge gedgekgelggegi gnégozgépgésgítházhétia időie intivaiznja '
+        'jegjekjeljátjó jóljönkbakekkemketkezki knakonkorktekérkéskét'
+        'kölközküllaklamlasldelekletlgolj llellolmelnalnültslébléslőt'
+        'mbamedmi monmplmármásmítnapncendtnduneknienkint ntentonténék'
+        'nőrod ojeol olgolnom ombomáoncondontor oráos osboziparpatpel'
+    ),
+    'icelandic': (
+        'að  að vi í ið inn er þaar er  húir na um  fy hv miallfyrgar'
+        'hvahúnnn ðinún það al he ve á  ég þeki kkinumrirvaðverviðyri'
+        'ég ða  bo ek ga ge go ha hj ko kv la le og se sk sé taakkang'
+        'bordageikekkessgingotgt hefhjáhugig ikailtin inainukankilkir'
+        'kvöld leiliðlltlt ltumynni nnanniog ottrniru rðutt tu ugaunn'
+        'ur vilvinvölyndægtér öldþes at br by bö bú da ei en fe fu gó'
+        ' gö hu hæ ka ki kl kæ li lo me mj my mé mö ná ný ræ sa st sí'
+        ' tv tí tó tö ár þo þu þúafaag agiagðalaamáan anaardariarsarð'
+        'at athau augaupaðibróbyrbörbúidi dmaduref efnefueineitelden '
+        'enteraerkerneruerðestettetueð eðrfa ferfnifumfunfurga ganger'
+        'getgmygðigóðgömhafhalhelhvehæghúsikiikuil ilvinmirkirtitiitt'
+        'iðaiðija jarjunjá jáljögka kaukefkjukk kkaklukomkoskunkærkýr'
+        'la lanlauldmleslinlirllillóloklpilu luklunlvulvælægló ma mat'
+        'meðmigmikminmiðmjömlumálmæðmérmörnarnaðnd ndindung nganignin'
+        'niðnlenmænnunt nurnálnýjok oliomaorgorðostpa pinra ramrarrda'
+    ),
+    'indonesian': (
+        'an ya  di sang  seang ba menya be in kaah ak aya bi ha ma te'
+        ' tiakadi inikanni say peanyapaasiengharingma manta yan ap da'
+        ' de ko ta yaahualaamaanaantaruat barberdanereeriih ja memmen'
+        'mu ngantintupa ranrimrustahtasterti ua un us  ak an ke ki na'
+        ' st unabaahaaikamuar araarias atabahbaibanbelbesbisdakdendia'
+        'ekaelaeluemaembemuer ertesaetagangerhunia idaik ilaimain ir '
+        'isaitaiunkakkamkaskerkitlamlanmakmermuanaknannggnginnyoraper'
+        'ri sa sabsebselsemsihsiustatemtidtintu tuatukuanuh uk unt ad'
+        ' at ce cu du ge id it la le mi or pa pi pr pu ra ru su to tu'
+        'aanabtacaadaagiaguahwai ainajaakhakual aloam anmannapiapoau '
+        'bagbekbiabicbihbilbtubuacancarcercuada dahdatde dekdildimdua'
+        'ebeebiebuedaejaek ekeeliemeentenyepueraerjerlermerseruesoet '
+        'galgatggaggugi gingirgu gushaahalhashirhu hwaiayicaideikeiki'
+        'iksim imkimuiriituka kabkahkatkesketkhikirkomkonkotksakukkul'
+        'la lahlailaklaplebli lo lonlu luhlumlurmahmaimalmaumbambemin'
+    ),
+    'italian': (
+        ' coto la  peer on re  ch il la tu è areaziconil persa tti de'
+        ' do in ma stchecoselletthe llamanna ne ni no stati zie di gr'
+        ' i  no pa qu saanocomgraia imain ma nonoi osara ta ttotutuoi'
+        'uttvor al be ca ci e  fa mi pi pr si un veallamoandappavobbi'
+        'biacenchici co da de deldi dobei endentestiamiciie ieniniion'
+        'isciù le llellolo mo mpondandenteobbomponeortparpiùporquaque'
+        'razrtostotante tertimuesute ab ac ai am an az ba bi c  ce da'
+        ' du fi fr gi ha id im le mo ne nu og ot pu ra ri se sq su ta'
+        ' te tr va vi vo vuabaabiaccadrai aiualcambameamianaanganiann'
+        'antao apiarcardarlarmasaaseateatoattbambatbbebe belbenbigbin'
+        'bitcancapcasccecchcerciacincitcutdardeadeidetdiedisdomdovdra'
+        'dueea ebbecceciel empenaeneeniensenuenzeraereertesafarfavfin'
+        'fragetggigi giagiogliha hiahieianiaoiarideieciesietiglillimp'
+        'inaineinoio iocitaittiuniutizilarlavlcolenlieltimatmbime men'
+        'mi micmilmiomolmprmpuncenelnginioniznninsontantrnuonutnzaoca'
+    ),
+    'malay': (
+        'an ak ng  seang be dikanya  saber ba kaah  in me pe te tiaka'
+        'awaayadakdi inima ni say ap ke ma paadaamaar at atabanengerl'
+        'ia nganyaperta  aw da de he ko ta yaabaahaahuanaantapaarida '
+        'dandendiaemuereganharidaingkatkitlahlamlu maknakndantupa ran'
+        'rlusihtahtantertidtu wakyan ad bo ha ia ki la unaikalaam any'
+        'apiaraasibaibarbelbolekaelaeluendenteriermertesaetahanhenhun'
+        'ih ik imaitaja kahkaskawkerlehmanmenmuanggntantioleorapadpi '
+        'ri rimsabsebsedselsemtintukua uanuh uk ukaun untwan ab ak at'
+        ' ca cu du es fa ge hu id it kh mi na or pr pu ra ru si st sy'
+        ' toabtacaagiainakual andannap apoaruas asaasuatubahbekbesbin'
+        'btubuaca cakcancuadaldardatdeadekdihdikdilduadupea ebeebueda'
+        'edieh ehkejaek ekeelieloemaemben enaenyepuer erberderjerkers'
+        'eseesoesuesyet fahgalgatgerggaggughagi gu habhamhathelhidhka'
+        'hu hujianideiduihaihiikaikeikiilain incit itujekjunka kapkem'
+        'kenkesketkhakomkonkoskukkulla laklapli lo lonluhlumlurmahmai'
+    ),
+    'norwegian': (
+        'en  deet er  i det er me videneg ne  ha hv je tiil jegke kke'
+        'le re tenter du hu ko veag akkar dagde du ed eneereharig lle'
+        'mednennnertesentte al at br da di fi fo ga gj he ik li mi må'
+        ' og sa se sk sn st ta to væaltan at digeldennettforhunhvahvo'
+        'ikkillin inejekka kenkk kteliglt må nerog or ortrdarkesjesku'
+        'stataktettilun useva velvi vilvorværår ær  av ba be bi bo by'
+        ' en et fø go hj id jo ka ki kj kl kv la le lø ma mo mø no ny'
+        ' næ pa pr på ra si sj sl sy så tu tå uk å  åradeageaktal all'
+        'amaamlangapparkarnartasjaskataav barbbebegberbilbodbrabrobye'
+        'dandatdd ddadindisdlidé egyei ekeekkekteleelpendernertes ete'
+        'finfirførgalgamge gengergetggeghegjegjøgodgstgynha heihelhet'
+        'hjehusiddidlidéiggighiktintirkirmiskittjeljerjobjonjøpjørkal'
+        'kankerkinkirkjøkkaklokomkonkosktikulkutkvelagld ldilekletlit'
+        'll lmoloklpelutlørma manmasme megmenmidminmlemmemodmormøtna '
+        'nadnakndenesngenilnoensent nyenærobbod oddodioe ogsokkommone'
+    ),
+    'persian': (
+        'می  می کناستست  با اس ای بر خو درند ید  هاایدبرادر یم  ام را'
+        ' کا کهام ای اینبایخوبرا رایلی نندها چه که ین یک  بخ تو خی ده'
+        ' دو سا شر شو صب صح مم من نم هم و  چه کل یکار با بت تر ته حبت'
+        'خواخیلدا ده رم ری شودصحبما ممنمن منومه نمینه نوننیمهم همهواه'
+        'ود ون کارکلیکننکنییلی آخ آن آه آی از ان او بد بز بع بف بل بچ'
+        ' تا تر تی جد جل حا خا دا رو زن سل شا شن شه فر فه فک قد قط لط'
+        ' ما مش مه نز هز هف هو پا پر چط چی کج کم گز گفآخرآن آهسآیدادر'
+        'اردارشارهارکاریاز ازیاعتال التاماامرامشامپانجانشاننانهانیاه '
+        'اهماهیاو ایسایمباربازبح بخربخوبدابر برربزربعدبفربلیبم به بچه'
+        'بی تا تانتو تواتگاتی تیمجاسجامجدیجلسحالخانخر خرمخوردارداندرب'
+        'درمدهندو دوسدگیدیددیمدیکرادربارت رد رداررسرسترسیرش ره روزروش'
+        'روعروژرک رکترگ زارزدیزرگزندزی زینساعسالسایستاستهستگستیسرتسلا'
+        'سه سی شامشب شروشرکشن شنبشهرشکلصبحصبرطارطفاطورعت عدافا فت فته'
+        'فردفرسفهمفکرقدیقطالاملت لسهلطفلیتلیسمرومشبمشکمم مهممپیمک نبه'
+        'نجاندگنزدنسرنش نم نی هاسهر هزیهستهفتهممهندهواهی وا وانوب وبم'
+    ),
+    'polish': (
+        'dziie  konie dz pr w em ić zie je ni po siej estię jesmiena '
+        'rzesięst wieym  ba ch co do mi ty wi żechcczyesziedję mi prz'
+        'sz ść  cz dw i  mu mó na ra sp to ws z  za zeak aleardat bar'
+        'cieco dobdzoedześćgodhceiałieciejieliesimyiękko kolkujmusmy '
+        'mówobroszowypompraprordzremrt rzysimsposzyto ty tymujęusiwić'
+        'wszwy ysłze zięzo zyjzysówiękuła ściże  al bi br ca ci du fi'
+        ' gd ja ju ku la ma mo my no o  od om pa pó ro so st sw ta tr'
+        ' wa wo wy wł zj zr łaaciacjacuaczadnaj ająanianoapoarearkasz'
+        'awdawiać ałaałbałyażnba bawbilbićbotbrabrybrzby bymcałce cem'
+        'cercesci ciaciociócjęcoścujcy czeczoda daldnadnidomdużdwadwo'
+        'ebaebyec ecieczed edaegoejoekoektelieluereerpertesiespetyeśc'
+        'firgdzgo hciia iajiemierieśileimiiołirmisiiwoiółią iątiś jac'
+        'jakjdzje jekjeśjowjutją kajkankomkonkoskońkośkt ku kuplaclat'
+        'le lejlekletli liwlnilu lę masmocmożmpumu mysmyśmójncene nia'
+        'no nowobiobooc od odaodnogooimojeolaoleolnomoompomuomyomóonc'
+    ),
+    'portuguese': (
+        ' coos de comque de qudo estue  es o ão ar da elato  ma noado'
+        'as ia la om  a  el fa fi ho mu pa pe te voantbricê em er fic'
+        'icaigais itoma manmuinteocêojeor riasa statarte temuitumavoc'
+        ' am an bo da di do e  en me nã ob os po pr re su to tr ve é '
+        'aisam andanhca diseleempertes eu gadgosgreha hojhã isaje le '
+        'lhamaimosmpomprna ndendonhãno nãoobroisomeomporaparpelporpre'
+        'resrigrtostostásuatodtostá ua  ac aj al as be br ca ci cr cu'
+        ' em eq er eu go gr há id ig im in ir ja li mo na ne nu ol on'
+        ' sa se sá ta tu um vi à  àsabaachaciadaadeagaaibajualealgalh'
+        'amaamiamoanaanoançaraardariarqasaatóavoazeaçãbadbalbambemboa'
+        'bomcancarcascerchociacidcisciêcoiconcricuscutdaddeideldevdez'
+        'doidordosecieiaejaelhemaemoendentenvequerierresaessetoeuneva'
+        'ez eçafalfavfazfimga gargragumho horhá ianiaribaidaideifiigo'
+        'igrim impincingio ipeir iriirmiscissiteiãoiênja janjetjudlat'
+        'leslguliglá masme mermeumeçmigmo mormpumãoncancencinesngrniã'
+    ),
+    'romanian': (
+        'te să  să înest esstede  ce cu de ma muce ea multă ul în ți '
+        ' bi ca co di la nu pe to tr ve vrai areastcu că ei entescie '
+        'ii inela maintrnu nă penporra re ru sc trutuluieulțumevre ac'
+        ' as bu că ei fo fr lu o  or po pr ra se șiacear araartasăată'
+        'aș buibunca ci crecutdardinebuecheleenierieteeștfoaileimile '
+        'lțumeamesncene ni niint oaroator oraortrearebrtertustătoator'
+        'tretămunăva ăm și știțum a  aj an ar aș ci cr da do ea ec fa'
+        ' fi fă ga id im jo lo lâ me mi mâ mă no pa re ro ră sf sp su'
+        ' sâ te tâ un va vo ze îț șe ștaciacăainajualcaniantapoarcate'
+        'atoazăațăbdabeșbilbinbisbătcalcasceacepcercescevchechicincon'
+        'copcosct cuiculcumcămdeedimdisdoueareaseazeațeceected ediee '
+        'eg eguemeepeerteu evafacficfirfrafrufârfăcgargulgă he hipica'
+        'icăideieciesietifiiiiimpin intinăințipairmisciseituiu ițijoa'
+        'jutlatlculegletloclt luclumlânlă lțimarmbămeumi minmițmoampo'
+        'mpămâimânmă mănnaincindeneaneșngănountenânnțanțeoacoasocuog '
+    ),
+    'russian': (
+        'то ть  в  на чтчто ко по пр хоно ом  вс де не он сожноне ой '
+        'оро ну эт я аетгодделет итькомна нужня приромрошсо ся тсяужн'
+        'хор бо го до за и  ме мн мо но ра се сп те у  ужак ам аниаси'
+        'атьаю ая бо болботбы всевсёде дитднядомегоелаероетсешьже зал'
+        'ибоие конла латлетли льшмаюми намниеовеогооднольомпон онионц'
+        'очеошапаспросегсибсовспастасё та терходцершаяшь ьшоэтоёт  би'
+        ' бр бы ва ве вк во гд дв др ду жи зн иг ид ка ку ле об от оч'
+        ' па ря с  св ск ст су съ та тв то ты ут це чаабоавтажназаал '
+        'алаалиалуандаркароасоасхат ахоачиаютббобилбрабсубя ва важвер'
+        'ветвечвещвклвоивокворвоювтрвутвыйвьюгдего говгорграда двадес'
+        'детдеядледо дойдрудумды дётебяедеедлее ей ектел елиениеннень'
+        'еняериеркерпертестесяетаетиечеещаея жалжешживжинза завзжезна'
+        'зьяивеивуигридеидёии илеим имаимиин инаислитсйстказкакке кза'
+        'клюковкт купленлуйлючманме медменмнемноможмоймощмпампьнаенал'
+        'нахначндонеднеени ниинимнненовногнцанцень обсобыов овоовыовь'
+    ),
+    'spanish': (
+        ' esos  qula  dede estqueue  en laen na el  co eldo es ien ha'
+        'acias or  lo no paendncino porstastá gr mu po se toanaar cia'
+        'ciecondelempenaenegralosme ndendoodopartietodás  bu ce di em'
+        ' ho ma má re te ti tr tu un vi y ablaceadoan andantaraañabla'
+        'buecerciocomdesdosellemoencenter habhacia iasierieziónja lo '
+        'manmañmosmpomprmucmásnemnteon oy pacpo quira racrderesrmería'
+        'sa steta tarte tentesto tratu tá uchudauenunavieía ñanñosón '
+        ' a  al am an ay añ bi ca ci cr có do dó eq fa fi fu gu he id'
+        ' ig im in ju ll me mi ni nu or pe pr pu su sá ta veabaad ada'
+        'ajaal algamianoardarmarqaríasaavoay ayuañobadbajbieca casce '
+        'cenchachechociuciócoscrectocómda daddasdeadendiedijdordrídón'
+        'ea ectedeejaemaenveo epaequercereermeroertesaesiespeunevaevi'
+        'evoez ezafavfinforfunganglego gosgushashayhe herholhoshoyiar'
+        'ideiejiemigligoijoimpinainfio ionipoisaiudiviiñojo juglarlas'
+        'leslevlgollallellomermi migmo mpimuynadnalndrnennfoniñniónoc'
+    ),
+    'swedish': (
+        'en et  deag  i er ra tt är  må viar dendetll te  fö ja ko sk'
+        ' ti äran förilljagkanla år  at br di du li me mi på st vaatt'
+        'ckackedagdu intlleon på re skustatartettilyck al bi he ho hu'
+        ' hä id in my oc pr ta tå ve väackad adeallarebrach ck de ed '
+        'eraetaettgerggehonhäriggiljin ittka kerketkonkulle ligllamed'
+        'mmamycmårmåsna nennteochortretrtesteta tactentertiotorullute'
+        'vadvi vilällångåstöre ar av ba bo bö da en et fe fi ga gr gö'
+        ' ha hj ka kl kv ky kö le lå lö mo mö ny nä nå pa ra sa se si'
+        ' sl sn så tv ty ät åramlammamoapparbarkarnartataatiatoav bar'
+        'betbilbitbotbrobördatddaderdindisditdredé eckej ekeektel ela'
+        'enaernertfelfinga gamgongotgrugsagstgt görharhejhelhjähurhus'
+        'ickidaiddidéig igtiktinaio ioniskiteja jarjekjetjälkenkicklo'
+        'komkosktektikutkväkyrköplamleklerlitljaljelltloclp lt lutlån'
+        'lörma marmenmidmigminmlamodmormånmötnadnarnerngangsnnensent '
+        'ntrnyanälnärnågockod ojeollommoneonsontor orgornostot ottpa '
+    ),
+    'turkish': (
+        'yor bi ya buin ir laror ıyo koar ardbilbu im kononuoruın  is'
+        ' ne sa so ye çobirda de deredeereeriesiistiyondaun yaryi  ba'
+        ' bü da ed ge gü ha he iç on te ve ön şeabaahaamıarkarıavaaşl'
+        'ce dahekiekkemeen enier eyieşegünha herikiiliiyiiçiki kkükür'
+        'mekmıyncene ni nlanuşok rderdırimrkerumrınsabsi sinsonstita '
+        'te teştiyum ve yemçinçokün ür ınışekşıy ak al am an ar aç be'
+        ' cu ek es et ev fi gö i  ik iy ka ki la lü ma me mi na oy pa'
+        ' pr ra sö to tr uz va yi yı ça şiaatabracaadaaftah ak akıakş'
+        'alialmalıam amaan anaanlantapaapoartasyasıat ayaazıaçıağıaş '
+        'aşıba bahbanbaşbenbrıbugbütbüycağceğcukcumdandaşdeşdi dımdır'
+        'ebieceediehiek ektel eleemiemlencerherkesket etletmettevdeği'
+        'eşifenfikftagelgergisgöngüzhabhafhavhirileilgilminiiplirdirk'
+        'isaiseisiiyeiz jeykadkarkesketkilkipkirkiyklaktaktekü kınkşa'
+        'la lamlanlazle lecledlerletlgili lirlisliyllalmalmelmılsılüt'
+        'lıylışma makmalmammarmemmermesmismizmlimınmızna nasndenemner'
+    ),
+    'ukrainian': (
+        'ти  на що у на  ко по пргодитине ні ся тьсщо ься во до з  не'
+        ' ро ти я комогоій  бу в  ве вс ві га го де ду дя за зн ме мі'
+        ' сь те тр ус хо це і ам арнатиаєтба будвечви витвонворвсевін'
+        'вітгарговда де динднідякебаечееш же залзнаквику куюменми нам'
+        'ня нішовоодиодномпориою праприратребритрнасе скасьотертратре'
+        'усіую церчерше ьогякуєтьів ін іт іше ал ба би бр бі ва вв вж'
+        ' ви вм вр гр дв др ді жи зв зі кв ку кі ла мо но о  об па пе'
+        ' пі св ск сп ст су та тв ци ць чи щи ют як ід їсавиавтагаада'
+        'адіажлазаак ал алаалеалианданцаніарааркароаскат атоахоацюаю '
+        'аютбагбгобе би битбноботбрабребілва важввевелвжевийвмиво вок'
+        'воювоївравтрвутвілвіргатграгу двадесдеядитдо добдопдоюдрудуж'
+        'думдь дісдітебеевіелиенееніерееркероерпертерюеріесяея жешжив'
+        'жлижняза завзвізнізумзямзі ивоивуивіижний ийдикаикіим инаинк'
+        'иніироиткитритьйдека казкаєкзаки конкт купківкійкінла ласлат'
+        'ле ли ливликльнля манмаюмикмогможмп мпаму міймісміюнадналнар'
+    ),
+    'urdu': (
+        'یں  میمیںہے  ہےہیں کی کے ہوکے یہ  کہ ہینے وں  آپ اس رہ کر یہ'
+        'آپ تے  سا چا کھئی ات اس تا سے مجھنا کہ کیاہوںیا  آج او اچ بھ'
+        ' بہ خر خی دو سب سے شک صب لی مج نہ وہ پر کا کم کو گھ ہف ہمآج '
+        'ئے اتھال الوام انےاوراچھاہتبہتتھ جھےخراخیارٹ رہےری ریہساتسب '
+        'شکرفتےلیکمیرنہینی ور وریوہ پورچاہچھاکرنکریکمپکھاکہاکی گھرگی '
+        'ھا ھانھر ھے ہا ہت ہفتہمیہو یالیک  آئ آت آخ آہ اخ ال اپ ای با'
+        ' بج بر بع بو بچ بڑ دس دن دی را رپ ری سم سک شر شہ ضر عل قر مد'
+        ' مع من مو نئ نے ٹک ٹھ ٹی پا پو پہ کئ کل کن کچ گر گی گےآئےآتا'
+        'آخرآہسائیابیاجااخرارکاسٹالسانااپناں اہ ایکباتبجےبح بر برابعد'
+        'بولبچےبڑیبھابھیبی بے توںتہ جا جاتجھ جے خر خریدد دس دن دنادو '
+        'دوسدیکرا رابراتراجرانراہرتارجارم رنارنیرورروعرپورک رہ رہاریب'
+        'ریدریلرے سالستوستہسرٹسلاسم سمجسٹیسکتشروشن شہرصبحصبرصوبضروعد '
+        'علوعلیقریلاملسللو لوملوںلوےلیںلیےلے مددمعلمنصموسمپنمپیمیٹنئے'
+        'نسرنصونگ وئیوبےورٹوستوسموع ولیوم وٹروگیوے ٹر ٹنگٹکٹٹھیٹیشٹیم'
+        'پارپر پراپنیپنےپہلپیوچالچھ چے ڑی کئیکا کامکتےکرتکرمکل کم کن '
+    ),
+    'vietnamese': (
+        'ng  ch nh tr bạ khbạnôi ạn  th tôtôiông là cô nó phhônkhôơn '
+        'ều  cả mu ng và ơn ở ai ay choho hà iềulàmnh nhàongrontroàm '
+        'ần ết ối ới ời  bả cu có gi gì ha họ ki mộ na nà rấ ta tố vi'
+        ' vớ đâ đề ấychúcó cô côncảmgì hiềhúnhảihỏeiêniếtkhỏlà muốmột'
+        'naynhinàynó nóiphảrấtta thờtratốiuốnvà vớiào ày áo ên ói úng'
+        'ườiải ảm ất ấy ỏe ốn ột  an bi bu bá bè bắ bọ bữ cá cù cũ cầ'
+        ' củ dự ga gầ gử hi hò hô hơ hế lu lú lớ ma má mư mọ mớ nă qu'
+        ' rằ rồ sa sá sẽ số sự ti tu ty tí tư vé vì vấ xi án ý  ăn đa'
+        ' đi đã đư đầ đẹ đế độ đỡan anganhau biếbuổbáobè bảnbảybắtbọn'
+        'bữachichàchơchậcuốcuộcáocùncũ cả cầncủadự ga ghĩgiúgiờgôigườ'
+        'gầngửihaihayhi hiểhànhàohí hòahómhômhĩ hơihơnhưnhạchảohẫnhậm'
+        'hếthể họ họphố hờ hờihởihứ in iúpiểmiểuiệciờ khởkiêkiểluậlúc'
+        'lớnmaimuamáymườmọimớinghngôngưnhónhưnhạnhẫnămphíphốquara rai'
+        'rướrằnrẻ rọnrồisausánsẽ sốnsự thàthảthểthứtiếtrưtrẻtrọtuầty '
+        'tíntưởua uanuầnuậnuốiuổiuộcviêviệvàové vì vấnxinànhán ángáy '
+    ),
+}
@@ -0,0 +1,190 @@
+"""
+Per-segment latency spans.
+Each live segment gets a SegmentTrace holding monotonic timestamps for its
+pipeline stages (capture end -> dispatch -> WAV written -> request sent ->
+first byte -> first delta -> final transcript -> translation queued/started/
+final). When a trace completes, the gaps between stages are recorded into
+log-bucketed histograms keyed by provider and model, so p50/p95/p99 show
+whether latency comes from queueing, encoding, admission, the provider or
+the translation queue.
+
+Provider calls deep in modles mark stages on the trace activated for the
+current thread (activate()); threads without an active trace mark nothing.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from provider_routing import LatencyHistogram, log_bucket_bounds
+
+
+CAPTURE_END = 'capture_end'
+DISPATCHED = 'dispatched'
+FILE_WRITTEN = 'file_written'
+REQUEST_SENT = 'request_sent'
+FIRST_BYTE = 'first_byte'
+FIRST_DELTA = 'first_delta'
+FINAL = 'final'
+TRANSLATION_QUEUED = 'translation_queued'
+TRANSLATION_STARTED = 'translation_started'
+TRANSLATION_FINAL = 'translation_final'
+
+GROUP_TRANSCRIBE = 'transcribe'
+GROUP_TRANSLATE = 'translate'
+
+# (span, from stage, to stage, label group); a span is recorded when both stages were marked
+SPANS = (
+    ('queue', CAPTURE_END, DISPATCHED, GROUP_TRANSCRIBE),
+    ('encode', DISPATCHED, FILE_WRITTEN, GROUP_TRANSCRIBE),
+    ('admission', FILE_WRITTEN, REQUEST_SENT, GROUP_TRANSCRIBE),  # governor, rate limits, retries
+    ('first_byte', REQUEST_SENT, FIRST_BYTE, GROUP_TRANSCRIBE),   # upload + model time to response headers
+    ('first_delta', REQUEST_SENT, FIRST_DELTA, GROUP_TRANSCRIBE),
+    ('response', FIRST_BYTE, FINAL, GROUP_TRANSCRIBE),
+    ('transcribe', REQUEST_SENT, FINAL, GROUP_TRANSCRIBE),
+    ('end_to_end', CAPTURE_END, FINAL, GROUP_TRANSCRIBE),
+    ('translation_wait', TRANSLATION_QUEUED, TRANSLATION_STARTED, GROUP_TRANSLATE),
+    ('translation', TRANSLATION_STARTED, TRANSLATION_FINAL, GROUP_TRANSLATE),
+    ('end_to_end_translation', CAPTURE_END, TRANSLATION_FINAL, GROUP_TRANSLATE),
+)
+
+# Span buckets: 1 ms .. ~180 s (stages such as encode take milliseconds)
+SPAN_BUCKET_BOUNDS = log_bucket_bounds(0.001, 180.0)
+
+# Traces waiting for their translation; the oldest are dropped beyond this
+MAX_OPEN_TRACES = 256
+
+_local = threading.local()
+
+
+class SegmentTrace:
+    """Stage timestamps of one segment plus the provider/model labels for its spans."""
+
+    __slots__ = ('key', 'stages', 'labels')
+
+    def __init__(self, key: str, captured_at: Optional[float] = None):
+        self.key = key
+        now = time.monotonic()
+        self.stages: Dict[str, float] = {CAPTURE_END: captured_at if captured_at is not None else now, DISPATCHED: now}
+        self.labels: Dict[str, Tuple[str, str]] = {}
+
+    def mark(self, stage: str, at: Optional[float] = None) -> None:
+        """Record a stage; repeated marks (e.g. retries) keep the latest time."""
+        self.stages[stage] = at if at is not None else time.monotonic()
+
+    def mark_once(self, stage: str) -> None:
+        if stage not in self.stages:
+            self.stages[stage] = time.monotonic()
+
+    def label(self, group: str, provider: Optional[str], model: Optional[str] = None) -> None:
+        self.labels[group] = (provider or 'unknown', model or 'default')
+
+    def spans(self) -> Dict[Tuple[str, str, str], float]:
+        """{(group label 'provider/model', group, span): seconds} for every complete span."""
+        result = {}
+        for name, start, end, group in SPANS:
+            if start in self.stages and end in self.stages:
+                provider, model = self.labels.get(group, ('unknown', 'default'))
+                result[(f"{provider}/{model}", group, name)] = max(0.0, self.stages[end] - self.stages[start])
+        return result
+
+
+class MetricsRegistry:
+    """Open traces by key and span histograms by provider/model."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._open: 'OrderedDict[str, SegmentTrace]' = OrderedDict()
+        self._histograms: Dict[Tuple[str, str, str], LatencyHistogram] = {}
+        self._completed = 0
+
+    @property
+    def completed(self) -> int:
+        return self._completed
+
+    def begin(self, key: str, captured_at: Optional[float] = None) -> SegmentTrace:
+        trace = SegmentTrace(key, captured_at)
+        with self._lock:
+            self._open[key] = trace
+            while len(self._open) > MAX_OPEN_TRACES:
+                self._open.popitem(last=False)
+        return trace
+
+    def get(self, key: str) -> Optional[SegmentTrace]:
+        with self._lock:
+            return self._open.get(key)
+
+    def mark(self, key: str, stage: str) -> None:
+        trace = self.get(key)
+        if trace is not None:
+            trace.mark(stage)
+
+    def finish(self, key: str) -> Optional[SegmentTrace]:
+        """Close a trace and record its spans."""
+        with self._lock:
+            trace = self._open.pop(key, None)
+        if trace is None:
+            return None
+        for span_key, seconds in trace.spans().items():
+            with self._lock:
+                histogram = self._histograms.get(span_key)
+                if histogram is None:
+                    histogram = self._histograms[span_key] = LatencyHistogram(SPAN_BUCKET_BOUNDS)
+            histogram.record(seconds)
+        self._completed += 1
+        return trace
+
+    def finish_unless_translating(self, key: str) -> None:
+        """Close the trace now unless a translation was queued for it (the worker closes it then)."""
+        trace = self.get(key)
+        if trace is not None and TRANSLATION_QUEUED not in trace.stages:
+            self.finish(key)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """{'segments': n, 'spans': {'provider/model': {group: {span: {count, p50, p95, p99}}}}} in ms."""
+        with self._lock:
+            items = list(self._histograms.items())
+            open_count = len(self._open)
+        spans: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for (label, group, name), histogram in sorted(items):
+            stats = histogram.snapshot()
+            for pct in ('p50', 'p95', 'p99'):
+                if stats[pct] is not None:
+                    stats[pct] = round(stats[pct] * 1000.0, 1)
+            spans.setdefault(label, {}).setdefault(group, {})[name] = stats
+        return {'segments': self._completed, 'open_traces': open_count, 'spans': spans}
+
+
+registry = MetricsRegistry()
+
+
+# ---- thread-local active trace (for marks from inside provider calls) ----
+
+@contextmanager
+def activate(trace: Optional[SegmentTrace]) -> Iterator[Optional[SegmentTrace]]:
+    previous = getattr(_local, 'trace', None)
+    _local.trace = trace
+    try:
+        yield trace
+    finally:
+        _local.trace = previous
+
+
+def current() -> Optional[SegmentTrace]:
+    return getattr(_local, 'trace', None)
+
+
+def mark_current(stage: str) -> None:
+    trace = getattr(_local, 'trace', None)
+    if trace is not None:
+        trace.mark(stage)
+
+
+def label_current(group: str, provider: Optional[str], model: Optional[str] = None) -> None:
+    trace = getattr(_local, 'trace', None)
+    if trace is not None:
+        trace.label(group, provider, model)
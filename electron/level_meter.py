@@ -0,0 +1,189 @@
+"""
+Decimated input level meter.
+The audio callback only adds each block's sum of squares, peak and frame count
+into a three-slot accumulator (accumulate(), no allocation, no formatting). A
+publisher thread swaps the accumulator out at rate_hz, turns it into RMS and
+peak, applies meter ballistics and hands the smoothed levels to on_level:
+
+    rms    VU-style: exponential integration with a 300 ms time constant
+           (attack and release configurable separately)
+    peak   instant attack, falls back at peak_fall_db_per_second
+
+Multi-source capture accumulates per label instead (accumulate_source());
+each label gets its own ballistics and is published under 'sources', and the
+top-level rms/peak are the loudest source.
+
+The meter runs only while subscribed (start() .. stop()); when it is stopped
+the callback skips accumulate() and no thread runs, so a hidden UI costs
+nothing. A block that lands during the swap may go to the old accumulator
+after it was read; the meter drops that block rather than taking a lock on the
+real-time thread.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+
+DEFAULT_RATE_HZ = 10.0
+MAX_RATE_HZ = 60.0
+VU_ATTACK_SECONDS = 0.3
+VU_RELEASE_SECONDS = 0.3
+PEAK_FALL_DB_PER_SECOND = 20.0
+FLOOR_DB = -80.0
+# Ticks without audio after which the ballistics restart from silence (next recording)
+IDLE_RESET_TICKS = 5
+
+
+def to_db(level: float) -> float:
+    return max(FLOOR_DB, 20.0 * math.log10(level)) if level > 0 else FLOOR_DB
+
+
+class VolumeMeter:
+    """Callback-side accumulator plus a publisher thread with VU/peak ballistics."""
+
+    def __init__(
+        self,
+        rate_hz: float = DEFAULT_RATE_HZ,
+        attack_seconds: float = VU_ATTACK_SECONDS,
+        release_seconds: float = VU_RELEASE_SECONDS,
+        peak_fall_db_per_second: float = PEAK_FALL_DB_PER_SECOND,
+        log: Optional[Callable[[str, str], None]] = None,
+    ):
+        self.rate_hz = DEFAULT_RATE_HZ
+        self.set_rate(rate_hz)
+        self.attack_seconds = attack_seconds
+        self.release_seconds = release_seconds
+        self.peak_fall_db_per_second = peak_fall_db_per_second
+        self._log = log or (lambda level, message: None)
+        self._acc: List[float] = [0.0, 0.0, 0.0]  # sum of squares, peak, frames
+        self._source_acc: Dict[str, List[float]] = {}  # label -> same three slots
+        self.active = False  # Read by the audio callback; True while a publisher runs
+        self._on_level: Optional[Callable[[Dict[str, Any]], None]] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.silence_threshold = 0.0
+        self.silence_db = FLOOR_DB
+
+    def set_rate(self, rate_hz: Any) -> None:
+        try:
+            rate = float(rate_hz)
+        except (TypeError, ValueError):
+            return
+        if rate > 0:
+            self.rate_hz = min(MAX_RATE_HZ, rate)
+
+    def set_silence_threshold(self, threshold: float) -> None:
+        """Reported with every level so the UI can draw the split threshold (dB computed once here)."""
+        self.silence_threshold = float(threshold)
+        self.silence_db = to_db(self.silence_threshold)
+
+    # ---- audio callback side ----
+
+    def accumulate(self, sum_squares: float, peak: float, frames: int) -> None:
+        acc = self._acc
+        acc[0] += sum_squares
+        if peak > acc[1]:
+            acc[1] = peak
+        acc[2] += frames
+
+    def accumulate_source(self, label: str, sum_squares: float, peak: float, frames: int) -> None:
+        acc = self._source_acc.get(label)
+        if acc is None:
+            # First block of this label since the last swap
+            acc = self._source_acc[label] = [0.0, 0.0, 0.0]
+        acc[0] += sum_squares
+        if peak > acc[1]:
+            acc[1] = peak
+        acc[2] += frames
+
+    # ---- subscription ----
+
+    def start(self, on_level: Callable[[Dict[str, Any]], None]) -> None:
+        """Subscribe: on_level(levels) is called from the publisher thread at rate_hz while audio flows."""
+        with self._lock:
+            self._on_level = on_level
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._acc = [0.0, 0.0, 0.0]
+            self._source_acc = {}
+            self._thread = threading.Thread(target=self._run, name="volume-meter", daemon=True)
+            self._thread.start()
+            self.active = True
+
+    def stop(self) -> None:
+        """Unsubscribe: the callback stops accumulating and the publisher thread exits."""
+        with self._lock:
+            self.active = False
+            self._stop.set()
+            thread = self._thread
+            self._thread = None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=2)
+
+    # ---- publisher ----
+
+    def _apply(self, state: List[float], acc: List[float], dt: float) -> None:
+        """Advance one [rms, peak] ballistic state by an accumulator covering dt seconds."""
+        sum_squares, peak, frames = acc
+        rms_level, peak_level = state
+        block_rms = math.sqrt(sum_squares / frames)
+        tau = self.attack_seconds if block_rms > rms_level else self.release_seconds
+        state[0] = rms_level + (block_rms - rms_level) * (1.0 - math.exp(-dt / tau) if tau > 0 else 1.0)
+        state[1] = max(peak, peak_level * 10.0 ** (-self.peak_fall_db_per_second * dt / 20.0))
+
+    def _run(self) -> None:
+        level = [0.0, 0.0]  # rms, peak
+        source_levels: Dict[str, List[float]] = {}
+        idle_ticks = 0
+        last = time.monotonic()
+        while not self._stop.wait(1.0 / self.rate_hz):
+            now = time.monotonic()
+            dt = now - last
+            last = now
+            acc = self._acc
+            self._acc = [0.0, 0.0, 0.0]
+            source_acc = self._source_acc
+            self._source_acc = {}
+            source_acc = {label: slots for label, slots in source_acc.items() if slots[2] > 0}
+            if acc[2] <= 0 and not source_acc:
+                idle_ticks += 1
+                if idle_ticks >= IDLE_RESET_TICKS:
+                    level = [0.0, 0.0]
+                    source_levels = {}
+                continue
+            idle_ticks = 0
+            if acc[2] > 0:
+                self._apply(level, acc, dt)
+            sources = None
+            if source_acc:
+                for label, slots in source_acc.items():
+                    self._apply(source_levels.setdefault(label, [0.0, 0.0]), slots, dt)
+                # Top-level meter shows the loudest source
+                level = [max(state[0] for state in source_levels.values()), max(state[1] for state in source_levels.values())]
+                sources = {
+                    label: {'rms': rms, 'db': to_db(rms), 'peak': peak, 'peak_db': to_db(peak)}
+                    for label, (rms, peak) in source_levels.items()
+                }
+            on_level = self._on_level
+            if on_level is None:
+                continue
+            levels = {
+                'rms': level[0],
+                'db': to_db(level[0]),
+                'peak': level[1],
+                'peak_db': to_db(level[1]),
+                'silence_rms': self.silence_threshold,
+                'silence_db': self.silence_db,
+            }
+            if sources is not None:
+                levels['sources'] = sources
+            try:
+                on_level(levels)
+            except Exception as e:
+                self._log("warning", f"Volume level delivery failed: {e}")
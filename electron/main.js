@@ -21,6 +21,7 @@ let isTrayRecordingIconActive = false;
 // Python service state
 let pythonProcess = null;
 let pythonReady = false;
+let volumeMeterSubscribed = null; // Last volume_meter state sent to the service
 let pythonBuffer = '';
 let pendingMessages = []; // queued outbound messages until ready
 let isRecordingFlag = false;
@@ -98,6 +99,51 @@ let config = {
   // Qwen3-ASR (DashScope)
   dashscope_api_key: '',
   qwen3_asr_model: 'qwen3-asr-flash',
+  // Fail over to other configured sources while a provider's circuit breaker is open
+  transcribe_failover_enabled: true,
+  transcribe_failover_sources: [],
+  // Hedged transcription: race a backup source once the primary exceeds its p95 latency
+  transcribe_hedge_enabled: false,
+  transcribe_hedge_source: '',
+  transcribe_hedge_percentile: 95,
+  transcribe_hedge_delay_ms: 2000,
+  // Retry policy for rate-limited (429) or transient provider errors; delays in seconds
+  api_max_attempts: 4,
+  api_retry_base_delay: 0.5,
+  api_retry_max_delay: 20,
+  // Per-provider request governor overrides, e.g. { openai: { max_concurrent: 4, rpm: 300, tpm: 150000 } }
+  provider_rate_limits: {},
+  // Warm provider connections after config is applied and keep them alive with idle pings (seconds)
+  provider_warmup: true,
+  provider_ping_interval_seconds: 30,
+  provider_keepalive_seconds: 600,
+  // Endpoint overrides (empty = provider default), e.g. a local stub for testing
+  gemini_base_url: '',
+  dashscope_base_url: '',
+  soniox_base_url: '',
+  // Per-stage latency percentiles sent as 'metrics' messages every N seconds (0 = only on get_metrics)
+  metrics_interval_seconds: 10,
+  // Audio callback timing/overflow counters sent as 'audio_stats' every N seconds while capturing (0 = off)
+  audio_stats_interval_seconds: 5,
+  // Smoothed input level updates per second while the main window is visible
+  volume_meter_rate_hz: 10,
+  // Live segment pool: worker count, in-memory queue bound and what to do when full ('merge' or 'spill')
+  segment_workers: 3,
+  segment_queue_size: 8,
+  segment_saturation_policy: 'merge',
+  segment_merge_max_seconds: 30,
+  // Coalesce consecutive short segments (< short seconds) into one request up to target seconds / max wait
+  segment_coalesce_enabled: true,
+  segment_coalesce_target_seconds: 8,
+  segment_coalesce_short_seconds: 3,
+  segment_coalesce_max_wait_ms: 1200,
+  segment_coalesce_max_gap_seconds: 2,
+  // Media: request word timings (verbose_json) when the transcribe model supports them, for SRT/VTT/JSON export
+  media_word_timestamps: true,
+  // Media: shared worker pools (threads) and files processed concurrently in batch mode
+  media_transcribe_workers: 2,
+  media_translate_workers: 1,
+  media_files_in_flight: 2,
   enable_translation: true,
   translate_language: 'Chinese',
   translation_mode: 'fixed',
@@ -107,6 +153,9 @@ let config = {
   silence_rms_threshold: 0.010,
   min_silence_seconds: 1.0,
   theater_mode: false,
+  // Flag hallucinated/duplicate ASR output and skip translating it (kept in media exports unless dropped)
+  asr_filter_enabled: true,
+  asr_filter_drop_from_export: false,
   app_language: 'en',
   // Voice input defaults
   voice_input_enabled: false,
@@ -115,7 +164,12 @@ let config = {
   voice_input_engine: 'openai',
   voice_input_language: 'auto',
   voice_input_translate: false,
-  voice_input_translate_language: 'Chinese'
+  voice_input_translate_language: 'Chinese',
+  // Hot mic standby: keep the input stream open between voice inputs, with a short pre-roll from before the hotkey
+  voice_input_hot_mic: false,
+  hot_mic_preroll_seconds: 0.5,
+  // Multi-source capture (empty = default microphone). Entries: { device, channels: [0, 1], labels: ['Host', 'Guest'] } or { loopback: true, label: 'System' }
+  capture_sources: []
 };
 
 function loadConfig() {
@@ -331,10 +385,16 @@ function createMainWindow() {
   mainWindow.on('show', () => {
     try { mainWindow.setSkipTaskbar(false); } catch {}
     try { updateTrayMenu(); } catch {}
+    syncVolumeMeterSubscription();
   });
 
+  mainWindow.on('hide', syncVolumeMeterSubscription);
+  mainWindow.on('minimize', syncVolumeMeterSubscription);
+  mainWindow.on('restore', syncVolumeMeterSubscription);
+
   mainWindow.on('closed', () => {
     mainWindow = null;
+    syncVolumeMeterSubscription();
   });
 }
 
@@ -476,6 +536,8 @@ function processPythonStdout(data) {
          String(obj.message || '').includes('waiting for commands'))
       ) {
         pythonReady = true;
+        volumeMeterSubscribed = null;
+        syncVolumeMeterSubscription();
         // Flush any queued messages with state-aware filtering
         while (pendingMessages.length > 0) {
           const msg = pendingMessages.shift();
@@ -702,6 +764,15 @@ function sendToPythonDirect(message) {
   }
 }
 
+// The service only meters input levels while a window can show them
+function syncVolumeMeterSubscription() {
+  const visible = !!(mainWindow && !mainWindow.isDestroyed() && mainWindow.isVisible() && !mainWindow.isMinimized());
+  if (!pythonReady || visible === volumeMeterSubscribed) return;
+  if (sendToPythonDirect({ type: 'volume_meter', subscribed: visible })) {
+    volumeMeterSubscribed = visible;
+  }
+}
+
 function sendToPython(message) {
   if (!pythonProcess) {
     return false;
@@ -848,6 +919,17 @@ ipcMain.handle('stop-recording', async () => {
   return ok;
 });
 
+// Sampling profiler in the Python service; profile_stopped reports the files written to recordings/
+ipcMain.handle('profile-start', async (_event, options) => {
+  const opts = options && typeof options === 'object' ? options : {};
+  return sendToPython({ type: 'profile_start', interval_ms: opts.interval_ms, max_seconds: opts.max_seconds });
+});
+
+ipcMain.handle('profile-stop', async (_event, options) => {
+  const opts = options && typeof options === 'object' ? options : {};
+  return sendToPython({ type: 'profile_stop', formats: opts.formats });
+});
+
 // Optional explicit voice-input control from renderer
 ipcMain.handle('start-voice-input', async () => {
   handleVoiceHotkeyDown();
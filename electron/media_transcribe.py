@@ -20,6 +20,18 @@ Engines & configuration (for extension):
   * gemini_translate_model: str (default gemini-2.0-flash)
   * gemini_translate_system_prompt: str (optional; auto-generated when missing)
 
+- transcribe_failover_enabled: bool (default true; switch provider while one's circuit breaker is open)
+  * transcribe_failover_sources: list (optional; defaults to every other provider with credentials)
+- asr_filter_enabled: bool (default true; skip translating hallucinated or duplicate segments)
+  * asr_filter_drop_from_export: bool (default false; also leave flagged segments out of the export)
+- api_max_attempts / api_retry_base_delay / api_retry_max_delay: retry policy for rate-limited or transient provider errors
+- provider_rate_limits: dict (optional; per provider max_concurrent / rpm / tpm, e.g. {"openai": {"max_concurrent": 4}})
+- segment_coalesce_enabled: bool (default true; join adjacent short segments into one request)
+  * segment_coalesce_target_seconds / segment_coalesce_short_seconds / segment_coalesce_max_gap_seconds
+- media_word_timestamps: bool (default true; request word timings from models that support verbose_json, e.g. whisper-1)
+- media_transcribe_workers / media_translate_workers / media_files_in_flight: shared pool sizes (defaults 2 / 1 / 2)
+- media_decode_processes: int (decode/resample/VAD worker processes; 0 = in-process, batch CLI defaults to files in flight)
+
 Legacy compatibility:
 - transcribe_source (legacy key) maps to recognition_engine when missing.
 
@@ -38,6 +50,10 @@ import queue
 import uuid
 import tempfile
 import shutil
+import glob
+import importlib.util
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from multiprocessing import shared_memory
 from datetime import datetime
 from pathlib import Path
 from typing import List, Tuple, Optional, Dict, Any
@@ -56,12 +72,10 @@ except Exception as _e:
     ttk = filedialog = messagebox = scrolledtext = None  # type: ignore
     _TK_IMPORT_ERROR = _e
 
-# Try OpenAI SDK presence (for diagnostics only)
+# Check OpenAI SDK presence without importing it (for diagnostics only; modles imports it on first use)
 try:
-    from openai import OpenAI as _OpenAIClient  # type: ignore
-    OPENAI_AVAILABLE = True
+    OPENAI_AVAILABLE = importlib.util.find_spec('openai') is not None
 except Exception:
-    _OpenAIClient = None
     OPENAI_AVAILABLE = False
 
 # Console encoding + logging helpers
@@ -133,27 +147,30 @@ def _resolve_ffmpeg_path():
         pass
     return None
 
-_ffmpeg_path = _resolve_ffmpeg_path()
-if _ffmpeg_path and not os.environ.get("IMAGEIO_FFMPEG_EXE"):
-    # Prioritize setting imageio-ffmpeg environment variable, MoviePy will read it
-    os.environ["IMAGEIO_FFMPEG_EXE"] = _ffmpeg_path
-    _log_if("debug", f"IMAGEIO_FFMPEG_EXE set -> {_ffmpeg_path}")
+_ffmpeg_path = None
+_ffmpeg_resolved = False
+
+def get_ffmpeg_path():
+    """Resolve ffmpeg on first use rather than at import (decode worker processes import this module too)"""
+    global _ffmpeg_path, _ffmpeg_resolved
+    if not _ffmpeg_resolved:
+        _ffmpeg_path = _resolve_ffmpeg_path()
+        _ffmpeg_resolved = True
+        if _ffmpeg_path and not os.environ.get("IMAGEIO_FFMPEG_EXE"):
+            # Prioritize setting imageio-ffmpeg environment variable, MoviePy will read it
+            os.environ["IMAGEIO_FFMPEG_EXE"] = _ffmpeg_path
+            _log_if("debug", f"IMAGEIO_FFMPEG_EXE set -> {_ffmpeg_path}")
+    return _ffmpeg_path
 
 # Audio/video processing: unified use of FFmpeg to extract audio, no longer depends on MoviePy
 
-_log_if("info", f"Python: {sys.version.split()[0]} | exe: {getattr(sys, 'executable', sys.argv[0])}")
-_log_if("info", f"Working dir: {os.getcwd()}")
-
 # Model helpers
 import modles
-
-# scipy for audio resampling
-try:
-    from scipy import signal
-    SCIPY_AVAILABLE = True
-except ImportError:
-    SCIPY_AVAILABLE = False
-    signal = None
+import asr_filter
+import provider_routing
+import segment_executor
+import subtitle_export
+import resampler
 
 # Configuration constants
 SAMPLE_RATE = 44100
@@ -180,6 +197,105 @@ GEMINI_TRANSLATE_MODEL = 'gemini-2.0-flash'
 AUDIO_FORMATS = ['.wav', '.mp3', '.flac', '.aac', '.ogg', '.m4a', '.wma']
 VIDEO_FORMATS = ['.mp4', '.avi', '.mov', '.mkv', '.flv', '.wmv', '.webm', '.m4v']
 
+class FileJob:
+    """Per-file state while one media file moves through the shared worker pools"""
+
+    def __init__(self, seq: int, file_path: str, enable_translation: bool, target_language: str, progress_callback=None, result_sink: Optional[subtitle_export.OrderedResultSink] = None):
+        self.seq = seq
+        self.file_path = file_path
+        self.enable_translation = enable_translation
+        self.target_language = target_language
+        self.progress_callback = progress_callback
+        # Optional streaming exporters (SRT/VTT/JSON/TXT) fed in order as segments finish
+        self.result_sink = result_sink
+        self.results: Dict[str, Dict[str, Any]] = {}
+        # Post-ASR hallucination/duplicate filter (per file)
+        self.transcript_filter = asr_filter.TranscriptFilter()
+        self.translation_counter = 0
+        self.total = 0
+        self.completed = 0
+        self.failed = 0
+        self.done = threading.Event()
+
+
+# Windows destroys a shared memory block when its last handle closes, so worker
+# processes hold exported blocks briefly until the parent has attached.
+SHARED_HANDLE_GRACE_SECONDS = 120.0
+_exported_blocks: List[Tuple[float, Any]] = []
+_decode_worker_processor = None
+
+
+class DecodedAudio:
+    """Decoded mono audio and its speech ranges; shared-memory backed when decoded in a worker process"""
+
+    def __init__(self, audio: np.ndarray, sample_rate: int, segments: List[Tuple[int, int]], shm=None):
+        self.audio = audio
+        self.sample_rate = sample_rate
+        self.segments = segments
+        self._shm = shm
+
+    @classmethod
+    def attach(cls, payload: Dict[str, Any]) -> 'DecodedAudio':
+        shm = shared_memory.SharedMemory(name=payload['shm'])
+        audio = np.ndarray(tuple(payload['shape']), dtype=np.dtype(payload['dtype']), buffer=shm.buf)
+        return cls(audio, payload['sample_rate'], [tuple(seg) for seg in payload['segments']], shm)
+
+    def close(self):
+        self.audio = None
+        shm, self._shm = self._shm, None
+        if shm is None:
+            return
+        try:
+            shm.close()
+        except BufferError:
+            # A worker still holds a segment view; the mapping goes away with it
+            pass
+        try:
+            shm.unlink()
+        except (FileNotFoundError, OSError):
+            pass
+
+
+def _release_exported_blocks(force: bool = False):
+    now = time.monotonic()
+    keep = []
+    for created, shm in _exported_blocks:
+        if force or now - created > SHARED_HANDLE_GRACE_SECONDS:
+            try:
+                shm.close()
+            except Exception:
+                pass
+        else:
+            keep.append((created, shm))
+    _exported_blocks[:] = keep
+
+
+def _decode_in_worker(file_path: str, theater_mode: bool, source_override: Optional[str]) -> Dict[str, Any]:
+    """Runs in a decode worker process; returns a picklable description of a shared memory block"""
+    global _decode_worker_processor
+    if _decode_worker_processor is None:
+        _decode_worker_processor = MediaProcessor(source_override=source_override)
+    _release_exported_blocks()
+    audio, sample_rate, segments = _decode_worker_processor.decode_to_array(file_path, theater_mode)
+    if audio is None:
+        return {'error': f"Decoding failed: {file_path}"}
+    audio = np.ascontiguousarray(audio, dtype=np.float32)
+    shm = shared_memory.SharedMemory(create=True, size=max(1, audio.nbytes))
+    np.ndarray(audio.shape, dtype=audio.dtype, buffer=shm.buf)[:] = audio
+    payload = {
+        'shm': shm.name,
+        'shape': list(audio.shape),
+        'dtype': audio.dtype.str,
+        'sample_rate': sample_rate,
+        'segments': [list(seg) for seg in segments],
+    }
+    if os.name == 'nt':
+        _exported_blocks.append((time.monotonic(), shm))
+    else:
+        shm.close()
+    return payload
+
+
 class MediaProcessor:
     """Media file processor"""
     
@@ -196,16 +312,40 @@ class MediaProcessor:
         self.translation_threads = []
         self.shutdown_event = threading.Event()
         
-        # Result storage
-        self.results = {}  # {task_id: {order, transcription, translation, status}}
+        # Pools are shared by every file in flight; batch mode keeps them alive between files
+        self.persistent_workers = False
+        self.jobs_lock = threading.RLock()
+        self.job_counter = 0
+
+        # Decode/resample/VAD in worker processes (0 = in the calling thread)
+        self.decode_processes = self._worker_count('media_decode_processes', 0, minimum=0)
+        self._decode_pool: Optional[ProcessPoolExecutor] = None
+
+        # Result storage (results of the most recent process_file call)
+        self.results = {}  # {task_id: {order, start, end, transcription, translation, words, filtered, status}}
         self.results_lock = threading.Lock()
         self.task_counter = 0
-        self.translation_counter = 0
         
         # Export data
         self.export_data = []
         self.export_lock = threading.Lock()
 
+        # Shared retry/backoff policy and request governor limits for provider calls
+        modles.configure_retries(
+            max_attempts=self.config.get('api_max_attempts'),
+            base_delay=self.config.get('api_retry_base_delay'),
+            max_delay=self.config.get('api_retry_max_delay'),
+        )
+        modles.configure_governor(self.config.get('provider_rate_limits'))
+        modles.configure_base_urls({
+            'gemini': self.config.get('gemini_base_url'),
+            'dashscope': self.config.get('dashscope_base_url'),
+            'soniox': self.config.get('soniox_base_url'),
+        })
+
+        # Provider health is process-wide so an outage seen by one file/thread protects the rest
+        provider_routing.health_registry.add_listener(self._log_provider_health)
+
     def load_config(self) -> Dict[str, Any]:
         """Load configuration file"""
         config_file = "config.json"
@@ -231,7 +371,7 @@ class MediaProcessor:
     def extract_audio_from_video(self, video_path: str, output_path: str = None) -> Optional[str]:
         """Extract audio from video file (using FFmpeg)"""
         # Use FFmpeg to directly extract as WAV mono 44.1kHz
-        ffmpeg_path = os.environ.get("IMAGEIO_FFMPEG_EXE") or _ffmpeg_path or "ffmpeg"
+        ffmpeg_path = os.environ.get("IMAGEIO_FFMPEG_EXE") or get_ffmpeg_path() or "ffmpeg"
         try:
             if output_path is None:
                 temp_dir = tempfile.mkdtemp()
@@ -265,30 +405,17 @@ class MediaProcessor:
         return None
 
     def simple_resample(self, audio_data: np.ndarray, original_rate: int, target_rate: int) -> np.ndarray:
-        """Simple audio resampling (linear interpolation)"""
+        """Audio resampling (streaming polyphase filter, see resampler.py)"""
         try:
-            if original_rate == target_rate:
-                return audio_data
-            
-            # Calculate resampling ratio
-            ratio = target_rate / original_rate
-            new_length = int(len(audio_data) * ratio)
-            
-            # Use linear interpolation for resampling
-            original_indices = np.arange(len(audio_data))
-            new_indices = np.linspace(0, len(audio_data) - 1, new_length)
-            resampled_audio = np.interp(new_indices, original_indices, audio_data)
-            
-            return resampled_audio.astype(np.float32)
-            
+            return resampler.resample(audio_data, original_rate, target_rate)
         except Exception as e:
-            print(f"Simple resampling failed: {e}")
+            print(f"Resampling failed: {e}")
             return audio_data
 
     def load_audio_file(self, file_path: str) -> Tuple[Optional[np.ndarray], Optional[int]]:
         """Load audio file"""
         try:
-            audio_data, sample_rate = sf.read(file_path)
+            audio_data, sample_rate = sf.read(file_path, dtype='float32')
             _log_if("info", f"Loaded audio: sr={sample_rate}Hz, shape={getattr(audio_data, 'shape', None)}")
             
             # Convert to mono
@@ -296,21 +423,10 @@ class MediaProcessor:
                 audio_data = np.mean(audio_data, axis=1)
                 _log_if("debug", "Converted to mono by averaging channels")
             
-            # Resample to target sample rate
+            # Resample to target sample rate (block-wise, memory stays O(output))
             if sample_rate != SAMPLE_RATE:
-                if SCIPY_AVAILABLE and signal is not None:
-                    try:
-                        num_samples = int(len(audio_data) * SAMPLE_RATE / sample_rate)
-                        audio_data = signal.resample(audio_data, num_samples)
-                        _log_if("info", f"Audio resampled (scipy): {sample_rate}Hz -> {SAMPLE_RATE}Hz")
-                    except Exception as e:
-                        _log("warning", f"scipy resampling failed, using simple resampling: {e}")
-                        audio_data = self.simple_resample(audio_data, sample_rate, SAMPLE_RATE)
-                        _log_if("info", f"Audio resampled (simple): {sample_rate}Hz -> {SAMPLE_RATE}Hz")
-                else:
-                    # Use simple resampling as fallback
-                    audio_data = self.simple_resample(audio_data, sample_rate, SAMPLE_RATE)
-                    _log_if("info", f"Audio resampled (simple): {sample_rate}Hz -> {SAMPLE_RATE}Hz")
+                audio_data = self.simple_resample(audio_data, sample_rate, SAMPLE_RATE)
+                _log_if("info", f"Audio resampled (polyphase): {sample_rate}Hz -> {SAMPLE_RATE}Hz")
             
             try:
                 rms = float(np.sqrt(np.mean(np.square(audio_data))))
@@ -424,77 +540,158 @@ class MediaProcessor:
             _log_if("debug", f"Segments preview: {', '.join(preview)}{' ...' if len(segments) > 5 else ''}")
         return segments
 
+    def coalesce_segments(self, segments: List[Tuple[int, int]], sample_rate: int) -> List[Tuple[int, int, int]]:
+        """Join adjacent short speech segments so each provider request carries more audio."""
+        if not isinstance(self.config, dict) or not self.config.get('segment_coalesce_enabled', True):
+            return [(start, end, 1) for start, end in segments]
+
+        def seconds(key: str, default: float) -> float:
+            value = self.config.get(key)
+            return float(value) if isinstance(value, (int, float)) and value > 0 else default
+
+        spans = segment_executor.coalesce_ranges(
+            segments,
+            sample_rate,
+            target_seconds=seconds('segment_coalesce_target_seconds', segment_executor.DEFAULT_COALESCE_TARGET_SECONDS),
+            short_seconds=seconds('segment_coalesce_short_seconds', segment_executor.DEFAULT_COALESCE_SHORT_SECONDS),
+            max_gap_seconds=seconds('segment_coalesce_max_gap_seconds', segment_executor.DEFAULT_COALESCE_MAX_GAP_SECONDS),
+        )
+        if len(spans) != len(segments):
+            _log_if("info", f"Coalesced {len(segments)} speech segments into {len(spans)} requests")
+        return spans
+
+    def resolve_transcribe_source(self) -> str:
+        """Selected provider (prefer new recognition_engine; fallback to legacy transcribe_source)"""
+        raw = (self.source_override or self.config.get('recognition_engine') or self.config.get('transcribe_source') or 'openai').strip().lower()
+        source = provider_routing.normalize_transcribe_source(raw)
+        if source == 'openai' and raw != 'openai':
+            _log('warning', f"Unknown transcribe_source '{raw}', falling back to OpenAI")
+        return source
+
+    def transcribe_credentials_available(self, source: str) -> bool:
+        if source == 'soniox':
+            return bool(os.environ.get('SONIOX_API_KEY') or self.config.get('soniox_api_key'))
+        if source == 'qwen3-asr':
+            return bool(os.environ.get('DASHSCOPE_API_KEY') or self.config.get('dashscope_api_key'))
+        return bool(os.environ.get('OPENAI_API_KEY') or self.config.get('openai_api_key'))
+
+    def failover_sources(self, primary: str) -> List[str]:
+        """Sources to fail over to when the primary's circuit breaker is open."""
+        if not self.config.get('transcribe_failover_enabled', True):
+            return []
+        configured = self.config.get('transcribe_failover_sources')
+        if isinstance(configured, list) and configured:
+            names = [provider_routing.normalize_transcribe_source(item) for item in configured if isinstance(item, str) and item.strip()]
+        else:
+            names = list(provider_routing.TRANSCRIBE_SOURCES)
+        return [name for name in names if name != primary and self.transcribe_credentials_available(name)]
+
+    def _write_temp_segment(self, audio_segment: np.ndarray, segment_id: str) -> Tuple[str, str]:
+        temp_dir = tempfile.mkdtemp()
+        temp_file = os.path.join(temp_dir, f"segment_{segment_id}.wav")
+        sf.write(temp_file, audio_segment, SAMPLE_RATE)
+        return temp_dir, temp_file
+
+    def request_transcription(self, source: str, temp_file: str, segment_id: str):
+        """Transcribe a WAV file with one specific provider; raises on provider errors.
+
+        Returns text, or a dict with 'text' and 'words' when word timestamps are available.
+        """
+        if source == 'soniox':
+            s_key = os.environ.get('SONIOX_API_KEY') or self.config.get('soniox_api_key')
+            _log_if('info', f"Transcribing segment {segment_id} via Soniox: key_set={bool(s_key)}")
+            return modles.transcribe_soniox(temp_file, s_key)
+        if source == 'qwen3-asr':
+            d_key = os.environ.get('DASHSCOPE_API_KEY') or self.config.get('dashscope_api_key')
+            try:
+                q_model = (self.config.get('qwen3_asr_model') or 'qwen3-asr-flash')
+            except Exception:
+                q_model = 'qwen3-asr-flash'
+            # Prefer language ID; only pass language if short code provided
+            lang = self.config.get('transcribe_language') if isinstance(self.config, dict) else None
+            if not isinstance(lang, str):
+                lang = None
+            else:
+                l = lang.strip().lower()
+                if l in ('', 'auto', 'automatic'):
+                    lang = None
+                elif not (len(l) <= 4 and l.isalpha()):
+                    lang = None
+            lid = bool(self.config.get('qwen3_asr_enable_lid', True))
+            itn = bool(self.config.get('qwen3_asr_enable_itn', False))
+            _log_if('info', f"Transcribing segment {segment_id} via Qwen3-ASR: model={q_model}, key_set={bool(d_key)}, lid={lid}, itn={itn}")
+            return modles.transcribe_qwen3_asr(temp_file, api_key=d_key, model=q_model, language=lang, enable_lid=lid, enable_itn=itn)
+        api_key = os.environ.get('OPENAI_API_KEY') or self.config.get('openai_api_key')
+        base_url = os.environ.get('OPENAI_BASE_URL') or self.config.get('openai_base_url')
+        try:
+            model = (self.config.get('openai_transcribe_model') or OPENAI_TRANSCRIBE_MODEL)
+        except Exception:
+            model = OPENAI_TRANSCRIBE_MODEL
+        key_set = bool(api_key and str(api_key).strip())
+        _log_if('info', f"Transcribing segment {segment_id} via OpenAI: model={model}, key_set={key_set}, base_url={'set' if base_url else 'unset'}")
+        if self.config.get('media_word_timestamps', True) and modles.supports_word_timestamps(model):
+            return modles.transcribe_openai_timed(temp_file, 'auto', api_key, base_url, model=model)
+        return modles.transcribe_openai(temp_file, 'auto', api_key, base_url, model=model)
+
+    def probe_transcribe_source(self, source: str, audio_segment: np.ndarray, segment_id: str):
+        """Background circuit-breaker probe: re-run this segment on a provider that was failing."""
+        def probe():
+            temp_dir, temp_file = self._write_temp_segment(audio_segment, f"{segment_id}_probe")
+            try:
+                return self.request_transcription(source, temp_file, f"{segment_id} (probe)")
+            finally:
+                shutil.rmtree(temp_dir, ignore_errors=True)
+        if provider_routing.health_registry.maybe_probe(source, probe):
+            _log_if('info', f"Probing {source} in background before closing its circuit breaker")
+
     def transcribe_audio_segment(self, audio_segment: np.ndarray, segment_id: str) -> Optional[str]:
-        """Transcribe audio segment using selected provider (openai | soniox | qwen3-asr)"""
-        
+        """Transcribe audio segment using selected provider (openai | soniox | qwen3-asr) with failover"""
+        text, _words = self.transcribe_audio_segment_timed(audio_segment, segment_id)
+        return text
+
+    def transcribe_audio_segment_timed(self, audio_segment: np.ndarray, segment_id: str) -> Tuple[Optional[str], List[Dict[str, Any]]]:
+        """Like transcribe_audio_segment, also returning word timings relative to the segment start"""
         try:
             # Save as temporary file
-            temp_dir = tempfile.mkdtemp()
-            temp_file = os.path.join(temp_dir, f"segment_{segment_id}.wav")
-            
-            sf.write(temp_file, audio_segment, SAMPLE_RATE)
-            
-            # Select provider (prefer new recognition_engine; fallback to legacy transcribe_source)
-            source = (self.source_override or self.config.get('recognition_engine') or self.config.get('transcribe_source') or 'openai').strip().lower()
-            transcription = None
-            if source == 'openai':
-                api_key = os.environ.get('OPENAI_API_KEY') or self.config.get('openai_api_key')
-                base_url = os.environ.get('OPENAI_BASE_URL') or self.config.get('openai_base_url')
-                try:
-                    model = (self.config.get('openai_transcribe_model') or OPENAI_TRANSCRIBE_MODEL)
-                except Exception:
-                    model = OPENAI_TRANSCRIBE_MODEL
-                key_set = bool(api_key and str(api_key).strip())
-                _log_if('info', f"Transcribing segment {segment_id} via OpenAI: model={model}, key_set={key_set}, base_url={'set' if base_url else 'unset'}")
-                transcription = modles.transcribe_openai(temp_file, 'auto', api_key, base_url, model=model)
-            elif source == 'soniox':
-                s_key = os.environ.get('SONIOX_API_KEY') or self.config.get('soniox_api_key')
-                _log_if('info', f"Transcribing segment {segment_id} via Soniox: key_set={bool(s_key)}")
-                transcription = modles.transcribe_soniox(temp_file, s_key)
-            elif source in ('qwen3-asr', 'qwen', 'dashscope'):
-                d_key = os.environ.get('DASHSCOPE_API_KEY') or self.config.get('dashscope_api_key')
-                try:
-                    q_model = (self.config.get('qwen3_asr_model') or 'qwen3-asr-flash')
-                except Exception:
-                    q_model = 'qwen3-asr-flash'
-                # Prefer language ID; only pass language if short code provided
-                lang = self.config.get('transcribe_language') if isinstance(self.config, dict) else None
-                if not isinstance(lang, str):
-                    lang = None
-                else:
-                    l = lang.strip().lower()
-                    if l in ('', 'auto', 'automatic'):
-                        lang = None
-                    elif not (len(l) <= 4 and l.isalpha()):
-                        lang = None
-                lid = bool(self.config.get('qwen3_asr_enable_lid', True))
-                itn = bool(self.config.get('qwen3_asr_enable_itn', False))
-                _log_if('info', f"Transcribing segment {segment_id} via Qwen3-ASR: model={q_model}, key_set={bool(d_key)}, lid={lid}, itn={itn}")
-                transcription = modles.transcribe_qwen3_asr(temp_file, api_key=d_key, model=q_model, language=lang, enable_lid=lid, enable_itn=itn)
-            else:
-                _log('warning', f"Unknown transcribe_source '{source}', falling back to OpenAI")
-                api_key = os.environ.get('OPENAI_API_KEY') or self.config.get('openai_api_key')
-                base_url = os.environ.get('OPENAI_BASE_URL') or self.config.get('openai_base_url')
-                transcription = modles.transcribe_openai(temp_file, 'auto', api_key, base_url, model=OPENAI_TRANSCRIBE_MODEL)
-            transcription = (transcription or '').strip()
-            
-            # Clean up temporary file
-            try:
-                os.unlink(temp_file)
-                os.rmdir(temp_dir)
-            except:
-                pass
-            
-            return transcription
-            
+            temp_dir, temp_file = self._write_temp_segment(audio_segment, segment_id)
         except Exception as e:
             _log("error", f"Transcription failed {segment_id}: {e}")
-            try:
-                import traceback as _tb
-                _log("error", f"Details: {_tb.format_exc()}")
-            except Exception:
-                pass
-            return None
+            return None, []
+
+        try:
+            primary = self.resolve_transcribe_source()
+            configured = [primary] + self.failover_sources(primary)
+            for source in configured:
+                self.probe_transcribe_source(source, audio_segment, segment_id)
+            candidates = provider_routing.health_registry.order(configured)
+            if candidates and candidates[0] != primary:
+                _log('warning', f"{primary} circuit open; segment {segment_id} failing over to {candidates[0]}")
+
+            for source in candidates:
+                started = time.monotonic()
+                try:
+                    transcription = self.request_transcription(source, temp_file, segment_id)
+                except Exception as e:
+                    provider_routing.health_registry.record_failure(source, e)
+                    _log("error", f"Transcription failed {segment_id} ({source}): {e}")
+                    try:
+                        import traceback as _tb
+                        _log_if("debug", f"Details: {_tb.format_exc()}")
+                    except Exception:
+                        pass
+                    continue
+                provider_routing.health_registry.record_success(source, time.monotonic() - started)
+                if isinstance(transcription, dict):
+                    return (transcription.get('text') or '').strip(), list(transcription.get('words') or [])
+                return (transcription or '').strip(), []
+            return None, []
+        finally:
+            # Clean up temporary file
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def _log_provider_health(self, snapshot: Dict[str, Any]):
+        level = 'warning' if snapshot.get('state') != 'closed' else 'info'
+        _log(level, f"Provider {snapshot.get('provider')} circuit {snapshot.get('state')} (consecutive_failures={snapshot.get('consecutive_failures')}, error_rate={snapshot.get('error_rate')})")
 
     def translate_text(self, text: str, target_language: str = "Chinese") -> Optional[str]:
         """Translate text via the configured translation engine."""
@@ -546,285 +743,481 @@ class MediaProcessor:
             _log('error', f"Translation failed ({engine}): {e}")
             return None
 
-    def process_file(self, file_path: str, theater_mode: bool = False, enable_translation: bool = True, target_language: str = "Chinese", progress_callback=None) -> bool:
-        """Process media file"""
-        try:
-            _log("info", f"Starting to process file: {file_path}")
-            
-            # Reset counters and results
-            self.task_counter = 0
-            self.translation_counter = 0
-            self.results.clear()
-            self.export_data.clear()
-            
-            # Check file type and extract audio
-            file_ext = Path(file_path).suffix.lower()
-            
-            if file_ext in VIDEO_FORMATS:
-                _log_if("info", "Detected video file, using FFmpeg to extract audio...")
-                if progress_callback:
-                    progress_callback("Extracting audio...")
-
-                audio_path = self.extract_audio_from_video(file_path)
-                if not audio_path:
-                    _log("error", "Audio extraction failed")
-                    return False
-                cleanup_audio = True
-            elif file_ext in AUDIO_FORMATS:
-                _log_if("info", "Detected audio file")
-                audio_path = file_path
-                cleanup_audio = False
-            else:
-                _log("error", f"Unsupported file format: {file_ext}")
-                return False
-            
-            # Load audio
-            _log_if("info", "Loading audio file...")
+    def decode_file(self, file_path: str, theater_mode: bool = False, progress_callback=None) -> Optional['DecodedAudio']:
+        """Decode, resample and detect speech, in a worker process when a decode pool is configured"""
+        if self.decode_processes > 0:
             if progress_callback:
-                progress_callback("Loading audio...")
-            
+                progress_callback("Decoding audio and detecting speech segments...")
+            try:
+                payload = self._get_decode_pool().submit(_decode_in_worker, file_path, theater_mode, self.source_override).result()
+            except Exception as e:
+                _log("error", f"Decode worker failed for {file_path}: {e}")
+                return None
+            if payload.get('error'):
+                _log("error", payload['error'])
+                return None
+            return DecodedAudio.attach(payload)
+
+        audio_data, sample_rate, segments = self.decode_to_array(file_path, theater_mode, progress_callback)
+        if audio_data is None:
+            return None
+        return DecodedAudio(audio_data, sample_rate, segments)
+
+    def decode_to_array(self, file_path: str, theater_mode: bool = False, progress_callback=None) -> Tuple[Optional[np.ndarray], Optional[int], List[Tuple[int, int]]]:
+        """CPU-bound front of the pipeline: ffmpeg extraction, load/resample and VAD"""
+        # Check file type and extract audio
+        file_ext = Path(file_path).suffix.lower()
+
+        if file_ext in VIDEO_FORMATS:
+            _log_if("info", "Detected video file, using FFmpeg to extract audio...")
+            if progress_callback:
+                progress_callback("Extracting audio...")
+
+            audio_path = self.extract_audio_from_video(file_path)
+            if not audio_path:
+                _log("error", "Audio extraction failed")
+                return None, None, []
+            cleanup_audio = True
+        elif file_ext in AUDIO_FORMATS:
+            _log_if("info", "Detected audio file")
+            audio_path = file_path
+            cleanup_audio = False
+        else:
+            _log("error", f"Unsupported file format: {file_ext}")
+            return None, None, []
+
+        # Load audio
+        _log_if("info", "Loading audio file...")
+        if progress_callback:
+            progress_callback("Loading audio...")
+
+        try:
             audio_data, sample_rate = self.load_audio_file(audio_path)
-            if audio_data is None:
-                _log("error", "Audio loading failed")
-                if cleanup_audio:
-                    try:
-                        os.unlink(audio_path)
-                        os.rmdir(os.path.dirname(audio_path))
-                    except:
-                        pass
+        finally:
+            # The extracted WAV is not needed once decoded
+            if cleanup_audio:
+                try:
+                    os.unlink(audio_path)
+                    os.rmdir(os.path.dirname(audio_path))
+                except:
+                    pass
+        if audio_data is None:
+            _log("error", "Audio loading failed")
+            return None, None, []
+
+        # Detect speech segments
+        _log_if("info", "Detecting speech segments...")
+        if progress_callback:
+            progress_callback("Detecting speech segments...")
+
+        segments = self.detect_speech_segments(audio_data, sample_rate, theater_mode)
+        return audio_data, sample_rate, segments
+
+    def _get_decode_pool(self) -> ProcessPoolExecutor:
+        with self.jobs_lock:
+            if self._decode_pool is None:
+                self._decode_pool = ProcessPoolExecutor(max_workers=self.decode_processes)
+                _log_if("info", f"Decode process pool started: processes={self.decode_processes}")
+            return self._decode_pool
+
+    def shutdown_decode_pool(self):
+        with self.jobs_lock:
+            pool = self._decode_pool
+            self._decode_pool = None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    def new_job(self, file_path: str, enable_translation: bool = True, target_language: str = "Chinese", progress_callback=None, result_sink: Optional[subtitle_export.OrderedResultSink] = None) -> FileJob:
+        with self.jobs_lock:
+            self.job_counter += 1
+            seq = self.job_counter
+        return FileJob(seq, file_path, enable_translation, target_language, progress_callback, result_sink)
+
+    def process_file(self, file_path: str, theater_mode: bool = False, enable_translation: bool = True, target_language: str = "Chinese", progress_callback=None, result_sink: Optional[subtitle_export.OrderedResultSink] = None) -> bool:
+        """Process media file
+
+        With result_sink, finished segments are streamed to it in order and their
+        text is released from self.results afterwards (export_data stays empty).
+        """
+        job = self.new_job(file_path, enable_translation, target_language, progress_callback, result_sink)
+        with self.results_lock:
+            self.results = job.results
+        self.export_data.clear()
+        try:
+            success = self.run_job(job, theater_mode)
+        finally:
+            if not self.persistent_workers:
+                self.stop_worker_threads()
+
+        # Organize export data
+        self.prepare_export_data()
+        return success
+
+    def run_job(self, job: FileJob, theater_mode: bool = False) -> bool:
+        """Decode and segment one file, feed the shared worker pools and wait for its segments"""
+        file_path = job.file_path
+        progress_callback = job.progress_callback
+        decoded = None
+        try:
+            _log("info", f"Starting to process file: {file_path}")
+
+            decoded = self.decode_file(file_path, theater_mode, progress_callback)
+            if decoded is None:
                 return False
-            
-            # Detect speech segments
-            _log_if("info", "Detecting speech segments...")
-            if progress_callback:
-                progress_callback("Detecting speech segments...")
-            
-            segments = self.detect_speech_segments(audio_data, sample_rate, theater_mode)
-            
-            if not segments:
+            if not decoded.segments:
                 print("No valid speech segments detected")
-                if cleanup_audio:
-                    try:
-                        os.unlink(audio_path)
-                        os.rmdir(os.path.dirname(audio_path))
-                    except:
-                        pass
                 return False
-            
-            # Start worker threads
-            self.start_worker_threads(enable_translation, target_language)
-            _log_if("info", f"Worker threads started: transcribe=2, translate={'1' if enable_translation else '0'}")
-            
-            # Add speech segments to processing queue
-            for i, (start, end) in enumerate(segments):
-                segment_audio = audio_data[start:end]
+            audio_data = decoded.audio
+            sample_rate = decoded.sample_rate
+            segments = decoded.segments
+
+            segments = self.coalesce_segments(segments, sample_rate)
+
+            # Start worker threads (no-op when the shared pools are already running)
+            self.start_worker_threads()
+
+            # Register every segment before queueing so completion can't race the total
+            job.total = len(segments)
+            tasks = []
+            for i, (start, end, _count) in enumerate(segments):
                 task_id = str(uuid.uuid4())
                 order = i + 1
-                
-                self.task_counter += 1
-                
-                # Add to processing queue
-                self.processing_queue.put((order, {
-                    'task_id': task_id,
-                    'order': order,
-                    'audio_segment': segment_audio,
-                    'enable_translation': enable_translation,
-                    'target_language': target_language,
-                    'progress_callback': progress_callback
-                }))
-                
-                # Initialize results
                 with self.results_lock:
-                    self.results[task_id] = {
+                    job.results[task_id] = {
                         'order': order,
+                        'start': start / float(sample_rate),
+                        'end': end / float(sample_rate),
                         'transcription': None,
                         'translation': None,
+                        'words': [],
+                        'filtered': None,
                         'status': 'queued'
                     }
-            
+                tasks.append((order, {
+                    'job': job,
+                    'task_id': task_id,
+                    'order': order,
+                    'start': start / float(sample_rate),
+                    'audio_segment': audio_data[start:end],
+                }))
+            self.task_counter = job.total
+
+            # Earlier files go first so their output completes (and streams) sooner
+            for order, task in tasks:
+                self.processing_queue.put(((job.seq, order), task))
+            del tasks
+
             # Wait for all tasks to complete
-            total_tasks = len(segments)
-            completed_tasks = 0
-            failed_tasks = 0
-            
-            while completed_tasks < total_tasks:
-                time.sleep(0.1)
-                with self.results_lock:
-                    statuses = [result['status'] for result in self.results.values()]
-                    completed_tasks = sum(1 for s in statuses if s == 'completed')
-                    failed_tasks = sum(1 for s in statuses if s == 'failed')
-                
-                if progress_callback:
+            total_tasks = job.total
+            last_reported = -1
+            while not job.done.wait(0.1):
+                completed_tasks = job.completed
+                if progress_callback and completed_tasks != last_reported:
+                    last_reported = completed_tasks
                     progress = (completed_tasks / total_tasks) * 100
                     progress_callback(f"Processing progress: {completed_tasks}/{total_tasks} ({progress:.1f}%)")
-                if failed_tasks and (completed_tasks + failed_tasks) >= total_tasks:
-                    _log("warning", f"Some segments failed: completed={completed_tasks}, failed={failed_tasks}, total={total_tasks}")
-                    break
-            
-            # Stop worker threads
-            self.stop_worker_threads()
-            
-            # Organize export data
-            self.prepare_export_data()
-            
-            # Clean up temporary audio file
-            if cleanup_audio:
-                try:
-                    os.unlink(audio_path)
-                    os.rmdir(os.path.dirname(audio_path))
-                except:
-                    pass
-            
+            completed_tasks = job.completed
+            failed_tasks = job.failed
+            if failed_tasks:
+                _log("warning", f"Some segments failed: completed={completed_tasks}, failed={failed_tasks}, total={total_tasks}")
+
+            # Decoded audio (and its shared memory block) is released in finally
+            audio_data = None
+
             if failed_tasks:
                 _log("warning", f"File processing finished with failures. Completed: {completed_tasks}, Failed: {failed_tasks}")
             else:
                 _log("info", "File processing completed")
             if progress_callback:
                 progress_callback("Processing completed")
-            
+
             return failed_tasks == 0
-            
+
         except Exception as e:
             _log("error", f"File processing failed: {e}")
             if progress_callback:
                 progress_callback(f"Processing failed: {e}")
             return False
+        finally:
+            if decoded is not None:
+                decoded.close()
+
+    def process_batch(self, files: List[str], output_dir: str, formats: List[str], *, files_in_flight: int = 2, theater_mode: bool = False, enable_translation: bool = True, target_language: str = "Chinese", skip_existing: bool = False, progress_callback=None) -> Dict[str, bool]:
+        """Run many files through the shared pools with up to files_in_flight decoding/waiting at once.
+
+        Each file streams to <output_dir>/<name>.<fmt> (in place only once it succeeded, so
+        skip_existing never mistakes a failed file for a finished one).
+        progress_callback(file_path, message).
+        Returns {file_path: success}.
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        planned = plan_batch_outputs(files, output_dir, formats)
+        outcomes: Dict[str, bool] = {}
+
+        def run_one(file_path: str, paths: Dict[str, str]) -> bool:
+            if skip_existing and all(os.path.exists(path) for path in paths.values()):
+                _log_if("info", f"Skipping {file_path}: outputs already exist")
+                return True
+            file_progress = (lambda message: progress_callback(file_path, message)) if progress_callback else None
+            try:
+                writers = [subtitle_export.open_writer(fmt, path) for fmt, path in paths.items()]
+            except Exception as e:
+                _log("error", f"Cannot open outputs for {file_path}: {e}")
+                return False
+            sink = subtitle_export.OrderedResultSink(writers)
+            job = self.new_job(file_path, enable_translation, target_language, file_progress, sink)
+            ok = False
+            try:
+                ok = self.run_job(job, theater_mode)
+                return ok
+            finally:
+                # Failed files leave no outputs, so skip_existing retries them
+                sink.close(commit=ok)
+
+        self.persistent_workers = True
+        self.start_worker_threads()
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, int(files_in_flight)), thread_name_prefix='media-file') as pool:
+                futures = {pool.submit(run_one, file_path, paths): file_path for file_path, paths in planned}
+                for future in as_completed(futures):
+                    file_path = futures[future]
+                    try:
+                        outcomes[file_path] = bool(future.result())
+                    except Exception as e:
+                        _log("error", f"Batch item failed {file_path}: {e}")
+                        outcomes[file_path] = False
+                    _log("info", f"Batch progress: {len(outcomes)}/{len(planned)} files ({file_path}: {'ok' if outcomes[file_path] else 'failed'})")
+        finally:
+            self.persistent_workers = False
+            self.stop_worker_threads()
+            self.shutdown_decode_pool()
+        return outcomes
 
-    def start_worker_threads(self, enable_translation: bool, target_language: str):
-        """Start worker threads"""
-        self.shutdown_event.clear()
-        
-        # Start transcription threads
-        for i in range(2):  # 2 transcription threads
-            thread = threading.Thread(target=self.transcription_worker, daemon=True)
-            thread.start()
-            self.worker_threads.append(thread)
-        
-        # Start translation threads
-        if enable_translation:
-            for i in range(1):  # 1 translation thread (to ensure order)
-                thread = threading.Thread(target=self.translation_worker, args=(target_language,), daemon=True)
+    def _worker_count(self, key: str, default: int, minimum: int = 1) -> int:
+        value = self.config.get(key) if isinstance(self.config, dict) else None
+        return int(value) if isinstance(value, (int, float)) and int(value) >= minimum else default
+
+    def start_worker_threads(self):
+        """Start the shared transcription/translation pools if they are not running"""
+        with self.jobs_lock:
+            if self.worker_threads:
+                return
+            self.shutdown_event.clear()
+            transcribe_workers = self._worker_count('media_transcribe_workers', 2)
+            translate_workers = self._worker_count('media_translate_workers', 1)
+
+            # Start transcription threads
+            for i in range(transcribe_workers):
+                thread = threading.Thread(target=self.transcription_worker, daemon=True)
+                thread.start()
+                self.worker_threads.append(thread)
+
+            # Translation threads pick tasks in (file, order) priority
+            for i in range(translate_workers):
+                thread = threading.Thread(target=self.translation_worker, daemon=True)
                 thread.start()
                 self.translation_threads.append(thread)
+        _log_if("info", f"Worker threads started: transcribe={transcribe_workers}, translate={translate_workers}")
 
     def stop_worker_threads(self):
         """Stop worker threads"""
-        self.shutdown_event.set()
-        
-        # Add stop signals to queues
-        for _ in self.worker_threads:
-            self.processing_queue.put((float('inf'), None))
-        
-        for _ in self.translation_threads:
-            self.translation_queue.put((float('inf'), None))
-        
-        # Wait for threads to finish
-        for thread in self.worker_threads:
-            thread.join(timeout=5)
-        
-        for thread in self.translation_threads:
-            thread.join(timeout=5)
-        
-        self.worker_threads.clear()
-        self.translation_threads.clear()
+        with self.jobs_lock:
+            self.shutdown_event.set()
+
+            # Add stop signals to queues (unique keys so the heap never compares payloads)
+            for i, _ in enumerate(self.worker_threads):
+                self.processing_queue.put(((float('inf'), i), None))
+
+            for i, _ in enumerate(self.translation_threads):
+                self.translation_queue.put(((float('inf'), i), None))
+
+            # Wait for threads to finish
+            for thread in self.worker_threads:
+                thread.join(timeout=5)
+
+            for thread in self.translation_threads:
+                thread.join(timeout=5)
+
+            self.worker_threads.clear()
+            self.translation_threads.clear()
 
     def transcription_worker(self):
         """Transcription worker thread"""
+        # File jobs yield to live transcription in the shared request governor
+        modles.set_request_priority(modles.PRIORITY_BATCH)
         while not self.shutdown_event.is_set():
+            task = None
             try:
                 priority, task = self.processing_queue.get(timeout=1)
-                
+
                 if task is None:  # Stop signal
                     break
-                
+
+                job = task['job']
                 task_id = task['task_id']
                 order = task['order']
                 audio_segment = task['audio_segment']
-                enable_translation = task['enable_translation']
-                target_language = task['target_language']
-                progress_callback = task.get('progress_callback')
-                
+
                 # Update status
                 with self.results_lock:
-                    if task_id in self.results:
-                        self.results[task_id]['status'] = 'transcribing'
-                
+                    if task_id in job.results:
+                        job.results[task_id]['status'] = 'transcribing'
+
                 # Execute transcription
                 _log_if("debug", f"Transcribing #{order}: task_id={task_id}")
-                transcription = self.transcribe_audio_segment(audio_segment, task_id)
-                
+                transcription, words = self.transcribe_audio_segment_timed(audio_segment, task_id)
+
                 if transcription:
+                    filter_reason = self.check_transcript_filter(transcription, job)
+                    # Provider word times are relative to the segment; make them file-absolute
+                    offset = float(task.get('start') or 0.0)
+                    words = [
+                        {'text': w['text'], 'start': w['start'] + offset, 'end': w['end'] + offset}
+                        for w in words
+                    ]
+
                     # Update transcription result
                     with self.results_lock:
-                        if task_id in self.results:
-                            self.results[task_id]['transcription'] = transcription
-                    
+                        if task_id in job.results:
+                            job.results[task_id]['transcription'] = transcription
+                            job.results[task_id]['words'] = words
+                            job.results[task_id]['filtered'] = filter_reason
+
                     _log_if("info", f"Transcription completed #{order}: {transcription[:50]}...")
-                    
+
+                    if filter_reason:
+                        # Likely hallucination or repeat; skip translation (exported untranslated unless dropping is enabled)
+                        _log_if("info", f"Transcription #{order} flagged as {filter_reason}, translation skipped")
+                        self.finish_task(job, task_id, 'completed')
                     # If translation enabled, add to translation queue
-                    if enable_translation and target_language:
-                        self.translation_counter += 1
-                        translation_order = self.translation_counter
-                        
-                        self.translation_queue.put((translation_order, {
+                    elif job.enable_translation and job.target_language:
+                        with self.results_lock:
+                            job.translation_counter += 1
+                            translation_order = job.translation_counter
+
+                        self.translation_queue.put(((job.seq, translation_order), {
+                            'job': job,
                             'task_id': task_id,
                             'order': order,
                             'transcription': transcription,
-                            'target_language': target_language
                         }))
                     else:
                         # No translation needed, mark as completed
-                        with self.results_lock:
-                            if task_id in self.results:
-                                self.results[task_id]['status'] = 'completed'
+                        self.finish_task(job, task_id, 'completed')
                 else:
                     _log("error", f"Transcription failed #{order}")
-                    with self.results_lock:
-                        if task_id in self.results:
-                            self.results[task_id]['status'] = 'failed'
-                
+                    self.finish_task(job, task_id, 'failed')
+
             except queue.Empty:
                 continue
             except Exception as e:
                 _log("error", f"Transcription thread error: {e}")
+                # Never leave a file waiting on a segment that crashed its worker
+                if task:
+                    self.finish_task(task['job'], task['task_id'], 'failed')
+
+    def is_exportable(self, result: Dict[str, Any]) -> bool:
+        """Transcribed results are exported; flagged ones only unless asr_filter_drop_from_export is set."""
+        if not result.get('transcription'):
+            return False
+        if result.get('filtered') and isinstance(self.config, dict):
+            return not self.config.get('asr_filter_drop_from_export', False)
+        return True
+
+    def check_transcript_filter(self, text: str, job: FileJob) -> Optional[str]:
+        """Return a reason when ASR output looks like a hallucination or repeat, else None."""
+        try:
+            if isinstance(self.config, dict) and not self.config.get('asr_filter_enabled', True):
+                return None
+            return job.transcript_filter.check(text)
+        except Exception as e:
+            _log("warning", f"Transcript filter failed: {e}")
+            return None
 
-    def translation_worker(self, target_language: str):
+    def translation_worker(self):
         """Translation worker thread"""
+        # File jobs yield to live transcription in the shared request governor
+        modles.set_request_priority(modles.PRIORITY_BATCH)
         while not self.shutdown_event.is_set():
+            task = None
             try:
                 priority, task = self.translation_queue.get(timeout=1)
-                
+
                 if task is None:  # Stop signal
                     break
-                
+
+                job = task['job']
                 task_id = task['task_id']
                 order = task['order']
                 transcription = task['transcription']
-                
+                target_language = job.target_language
+
                 # Update status
                 with self.results_lock:
-                    if task_id in self.results:
-                        self.results[task_id]['status'] = 'translating'
-                
+                    if task_id in job.results:
+                        job.results[task_id]['status'] = 'translating'
+
                 # Execute translation
                 _log_if("debug", f"Translating #{order} -> {target_language}")
                 translation = self.translate_text(transcription, target_language)
-                
+
                 # Update results
                 with self.results_lock:
-                    if task_id in self.results:
-                        self.results[task_id]['translation'] = translation
-                        self.results[task_id]['status'] = 'completed'
-                
+                    if task_id in job.results:
+                        job.results[task_id]['translation'] = translation
+                self.finish_task(job, task_id, 'completed')
+
                 if translation:
                     _log_if("info", f"Translation completed #{order}: {translation[:50]}...")
                 else:
                     _log("warning", f"Translation failed #{order}")
-                
+
             except queue.Empty:
                 continue
             except Exception as e:
                 _log("error", f"Translation thread error: {e}")
+                if task:
+                    self.finish_task(task['job'], task['task_id'], 'completed')
+
+    def finish_task(self, job: FileJob, task_id: str, status: str):
+        """Set a final status, count it toward the file and stream it to the file's sink."""
+        with self.results_lock:
+            result = job.results.get(task_id)
+            if result is None or result['status'] in ('completed', 'failed'):
+                return
+            result['status'] = status
+            if status == 'completed':
+                job.completed += 1
+            else:
+                job.failed += 1
+            finished = job.completed + job.failed >= job.total
+            sink = job.result_sink
+            if sink is None:
+                if finished:
+                    job.done.set()
+                return
+            entry = None
+            if status == 'completed' and self.is_exportable(result):
+                entry = {
+                    'order': result['order'],
+                    'start': result['start'],
+                    'end': result['end'],
+                    'transcription': result['transcription'],
+                    'translation': result.get('translation') or '',
+                    'words': result.get('words') or [],
+                }
+            order = result['order']
+            # Text lives on disk from here on; keep only the status for progress accounting
+            result['transcription'] = None
+            result['translation'] = None
+            result['words'] = []
+        try:
+            sink.push(order, entry)
+        except Exception as e:
+            _log("error", f"Streaming export failed for #{order}: {e}")
+        # Signal completion only after the last entry reached the sink
+        if finished:
+            job.done.set()
 
     def prepare_export_data(self):
         """Prepare export data"""
@@ -834,11 +1227,14 @@ class MediaProcessor:
             
             self.export_data.clear()
             for task_id, result in sorted_results:
-                if result['status'] == 'completed' and result['transcription']:
+                if result['status'] == 'completed' and self.is_exportable(result):
                     entry = {
                         'order': result['order'],
+                        'start': result.get('start'),
+                        'end': result.get('end'),
                         'transcription': result['transcription'],
                         'translation': result.get('translation', ''),
+                        'words': result.get('words') or [],
                         'timestamp': datetime.now().isoformat()
                     }
                     self.export_data.append(entry)
@@ -1071,6 +1467,125 @@ class MediaTranscribeGUI:
         self.root.mainloop()
 
 
+MANIFEST_EXTENSIONS = ('.txt', '.lst', '.list', '.m3u', '.m3u8')
+
+
+def _is_media_file(path: str) -> bool:
+    return Path(path).suffix.lower() in AUDIO_FORMATS + VIDEO_FORMATS
+
+
+def _read_manifest_lines(lines, base_dir: str) -> List[str]:
+    paths = []
+    for line in lines:
+        entry = line.strip().strip('"')
+        if not entry or entry.startswith('#'):
+            continue
+        paths.append(entry if os.path.isabs(entry) else os.path.join(base_dir, entry))
+    return paths
+
+
+def collect_batch_inputs(inputs: List[str], recursive: bool = False) -> List[str]:
+    """Expand directories, globs, manifests (one path per line) and '-' (stdin) into media files."""
+    found: List[str] = []
+    for item in inputs or []:
+        if item == '-':
+            candidates = _read_manifest_lines(sys.stdin, os.getcwd())
+        elif os.path.isdir(item):
+            if recursive:
+                candidates = [os.path.join(root, name) for root, _dirs, names in os.walk(item) for name in names]
+            else:
+                candidates = [os.path.join(item, name) for name in os.listdir(item)]
+            candidates = sorted(path for path in candidates if _is_media_file(path))
+        elif os.path.isfile(item) and Path(item).suffix.lower() in MANIFEST_EXTENSIONS:
+            with open(item, 'r', encoding='utf-8') as f:
+                candidates = _read_manifest_lines(f, os.path.dirname(os.path.abspath(item)))
+        elif os.path.isfile(item):
+            candidates = [item]
+        else:
+            candidates = sorted(path for path in glob.glob(item, recursive=True) if _is_media_file(path))
+        for path in candidates:
+            if path not in found:
+                found.append(path)
+    return found
+
+
+def plan_batch_outputs(files: List[str], output_dir: str, formats: List[str]) -> List[Tuple[str, Dict[str, str]]]:
+    """Map each input to <output_dir>/<stem>.<fmt>, suffixing duplicate stems (_2, _3, ...)."""
+    used: Dict[str, int] = {}
+    planned = []
+    for file_path in files:
+        stem = Path(file_path).stem or 'output'
+        count = used.get(stem.lower(), 0) + 1
+        used[stem.lower()] = count
+        name = stem if count == 1 else f"{stem}_{count}"
+        planned.append((file_path, {fmt: os.path.join(output_dir, f"{name}.{fmt}") for fmt in formats}))
+    return planned
+
+
+def resolve_export_formats(value: Optional[str], output: Optional[str]) -> List[str]:
+    """Parse --format; default to the output file's extension, else txt."""
+    formats: List[str] = []
+    for item in (value or '').split(','):
+        fmt = item.strip().lower().lstrip('.')
+        if not fmt:
+            continue
+        if fmt not in subtitle_export.EXPORT_FORMATS:
+            raise SystemExit(f"Error: Unsupported export format: {fmt}")
+        if fmt not in formats:
+            formats.append(fmt)
+    if not formats:
+        ext = os.path.splitext(output or '')[1].lower().lstrip('.')
+        formats.append(ext if ext in subtitle_export.EXPORT_FORMATS else 'txt')
+    return formats
+
+
+def run_batch_cli(args):
+    """Batch mode: many files through one shared pipeline, per-file outputs in --output-dir"""
+    files = collect_batch_inputs(args.input, recursive=getattr(args, 'recursive', False))
+    if not files:
+        print("Error: No media files found for batch input")
+        sys.exit(1)
+    output_dir = args.output_dir or os.path.join(os.getcwd(), 'transcripts')
+    formats = resolve_export_formats(getattr(args, 'format', None), None)
+
+    processor = MediaProcessor(source_override=getattr(args, 'source', None))
+    if getattr(args, 'workers', None):
+        processor.config['media_transcribe_workers'] = args.workers
+    in_flight = args.files_in_flight or processor._worker_count('media_files_in_flight', 2)
+    # CPU-bound decode/VAD scales with cores when it runs outside the GIL
+    if getattr(args, 'decode_processes', None) is not None:
+        processor.decode_processes = max(0, args.decode_processes)
+    elif 'media_decode_processes' not in processor.config:
+        processor.decode_processes = max(1, min(in_flight, os.cpu_count() or 1))
+    _log("info", f"Batch mode: {len(files)} files -> {output_dir} (formats={','.join(formats)}, files_in_flight={in_flight}, decode_processes={processor.decode_processes})")
+
+    def progress_callback(file_path, message):
+        print(f"Progress: [{os.path.basename(file_path)}] {message}")
+
+    try:
+        outcomes = processor.process_batch(
+            files,
+            output_dir,
+            formats,
+            files_in_flight=in_flight,
+            theater_mode=getattr(args, 'theater_mode', False),
+            enable_translation=args.translate,
+            target_language=args.language,
+            skip_existing=getattr(args, 'skip_existing', False),
+            progress_callback=progress_callback,
+        )
+    except KeyboardInterrupt:
+        print("\nUser interrupted processing")
+        sys.exit(1)
+
+    failed = [path for path, ok in outcomes.items() if not ok]
+    print(f"Processing completed: {len(outcomes) - len(failed)}/{len(outcomes)} files succeeded, results saved to: {output_dir}")
+    for path in failed:
+        print(f"Error: Failed to process {path}")
+    if failed:
+        sys.exit(1)
+
+
 def main():
     """Main function"""
     import argparse
@@ -1080,6 +1595,15 @@ def main():
     parser = argparse.ArgumentParser(description='Media file transcription and translation tool')
     parser.add_argument('--file', help='Input media file path')
     parser.add_argument('--output', help='Output file path')
+    parser.add_argument('--input', action='append', help="Batch mode: directory, glob, manifest file (one path per line) or '-' for stdin; repeatable")
+    parser.add_argument('--output-dir', help='Batch mode: directory for per-file outputs')
+    parser.add_argument('--recursive', action='store_true', help='Batch mode: include subdirectories')
+    parser.add_argument('--files-in-flight', type=int, help='Batch mode: files decoded/processed concurrently (default: config media_files_in_flight or 2)')
+    parser.add_argument('--workers', type=int, help='Transcription worker threads shared by all files (default: config media_transcribe_workers or 2)')
+    parser.add_argument('--decode-processes', type=int, help='Decode/resample/VAD worker processes (default: config media_decode_processes; batch mode defaults to files in flight)')
+    parser.add_argument('--skip-existing', action='store_true', help='Batch mode: skip files whose outputs already exist')
+    parser.add_argument('--format', help='Comma-separated export formats: txt, srt, vtt, json (default: from --output extension). '
+                                         'The first is written to --output, others next to it')
     parser.add_argument('--translate', action='store_true', help='Enable translation')
     parser.add_argument('--language', default='Chinese', help='Target translation language')
     parser.add_argument('--theater-mode', action='store_true', help='Enable theater mode')
@@ -1090,7 +1614,7 @@ def main():
     
     # Parse arguments, default to GUI if no arguments provided
     if len(sys.argv) == 1:
-        args = argparse.Namespace(gui=True, file=None, output=None, translate=False, language='Chinese', theater_mode=False, verbose=False, log_level=None, source=None)
+        args = argparse.Namespace(gui=True, file=None, output=None, format=None, input=None, translate=False, language='Chinese', theater_mode=False, verbose=False, log_level=None, source=None)
     else:
         args = parser.parse_args()
 
@@ -1100,7 +1624,14 @@ def main():
         _LOG_LEVEL = _LOG_LEVELS['debug']
     if getattr(args, 'log_level', None):
         _LOG_LEVEL = _LOG_LEVELS.get(args.log_level, _LOG_LEVEL)
+
+    _log_if("info", f"Python: {sys.version.split()[0]} | exe: {getattr(sys, 'executable', sys.argv[0])}")
+    _log_if("info", f"Working dir: {os.getcwd()}")
     
+    if getattr(args, 'input', None):
+        run_batch_cli(args)
+        return
+
     # If GUI mode is specified or necessary command line arguments are not provided, launch graphical interface
     if args.gui or not args.file or not args.output:
         print("Media File Transcription and Translation Tool")
@@ -1113,8 +1644,6 @@ def main():
         # No longer force dependency on moviepy; video processing uses FFmpeg
         if not OPENAI_AVAILABLE:
             missing_deps.append("openai")
-        if not SCIPY_AVAILABLE:
-            optional_deps.append("scipy")
         if not TK_AVAILABLE:
             optional_deps.append("tkinter (GUI)")
         
@@ -1132,13 +1661,13 @@ def main():
             print(f"Install command: pip install {' '.join(optional_deps)}")
             
         # FFmpeg prompt
-        if not _ffmpeg_path:
+        if not get_ffmpeg_path():
             print("\nNote: Built-in ffmpeg not detected, you can place ffmpeg.exe at:")
             print("  - Application root or electron root directory")
             print("  - Same directory as media_transcribe.exe or its ffmpeg subdirectory")
             print("If ffmpeg is already in system PATH, it can be used directly. Can be ignored when processing audio files only.")
 
-        if missing_deps or optional_deps or not _ffmpeg_path:
+        if missing_deps or optional_deps or not get_ffmpeg_path():
             print("\nProgram will run with currently available features...\n")
         
         # Launch GUI
@@ -1177,25 +1706,36 @@ def main():
         if not api_key_present:
             _log("warning", "OpenAI API key not set; transcription may fail. Set OPENAI_API_KEY in environment or config.json.")
         
+        # Resolve export formats; results stream to these files as segments finish
+        formats = resolve_export_formats(getattr(args, 'format', None), args.output)
+        paths = subtitle_export.output_paths(args.output, formats)
+        try:
+            writers = [subtitle_export.open_writer(fmt, path) for fmt, path in paths.items()]
+        except Exception as e:
+            print(f"Error: Export failed: {e}")
+            sys.exit(1)
+        sink = subtitle_export.OrderedResultSink(writers)
+        success = False
+
         # Process file
         def progress_callback(message):
             print(f"Progress: {message}")
         
-        success = processor.process_file(
-            file_path=args.file,
-            theater_mode=getattr(args, 'theater_mode', False),
-            enable_translation=args.translate,
-            target_language=args.language,
-            progress_callback=progress_callback
-        )
+        try:
+            success = processor.process_file(
+                file_path=args.file,
+                theater_mode=getattr(args, 'theater_mode', False),
+                enable_translation=args.translate,
+                target_language=args.language,
+                progress_callback=progress_callback,
+                result_sink=sink
+            )
+        finally:
+            # Existing outputs are replaced only by a successful run
+            sink.close(commit=success)
         
         if success:
-            # Export results
-            if processor.export_to_txt(args.output):
-                print(f"Processing completed, results saved to: {args.output}")
-            else:
-                print("Error: Export failed")
-                sys.exit(1)
+            print(f"Processing completed, results saved to: {', '.join(paths.values())}")
         else:
             print("Error: File processing failed")
             sys.exit(1)
@@ -1214,4 +1754,7 @@ def main():
 
 
 if __name__ == "__main__":
+    # Decode worker processes re-enter here on Windows / frozen builds
+    import multiprocessing
+    multiprocessing.freeze_support()
     main()
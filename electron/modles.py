@@ -7,13 +7,24 @@ from __future__ import annotations
 
 import os
 import base64
-from typing import Callable, Optional, List
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, List, Tuple
+import heapq
+import http.client
 import json
+import random
+import socket
+import ssl
+import threading
+import time
 from datetime import datetime
+from email.utils import parsedate_to_datetime
 import urllib.request
 import urllib.error
 import urllib.parse
 
+import latency_metrics
+
 
 def _ensure_text(value: Optional[str]) -> str:
     """Normalize potentially None values into UTF-8 safe strings."""
@@ -69,16 +80,811 @@ def _guess_audio_format(filepath: str) -> str:
     return 'wav'
 
 
+# ---------------------------- Retry / rate limiting ----------------------------
+
+ERROR_RATE_LIMIT = 'rate_limit'
+ERROR_TRANSIENT = 'transient'
+ERROR_FATAL = 'fatal'
+
+RETRY_MAX_ATTEMPTS = 4          # first try + 3 retries
+RETRY_BASE_DELAY = 0.5          # seconds
+RETRY_MAX_DELAY = 20.0          # cap per sleep
+RETRY_AFTER_MAX = 60.0          # never honor Retry-After beyond this
+
+# Token bucket defaults per (provider, model); adapted down on 429 and back up on success
+BUCKET_RATE = 5.0               # requests per second
+BUCKET_CAPACITY = 10.0
+BUCKET_MIN_RATE = 0.2
+BUCKET_RECOVERY_STEP = 0.1
+
+_TRANSIENT_STATUS = {408, 409, 425, 500, 502, 503, 504, 520, 522, 524, 529}
+_STREAMING_UNSUPPORTED_STATUS = {400, 404, 405, 415, 422}
+
+
+class ProviderHTTPError(RuntimeError):
+    """Provider error carrying an HTTP-like status code and optional Retry-After seconds."""
+
+    def __init__(self, message: str, status_code: Optional[int] = None, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+def _iter_error_chain(exc: BaseException):
+    seen = set()
+    current: Optional[BaseException] = exc
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        yield current
+        current = current.__cause__ or current.__context__
+
+
+def _error_status(exc: BaseException) -> Optional[int]:
+    for err in _iter_error_chain(exc):
+        for attr in ('status_code', 'code', 'status'):
+            value = getattr(err, attr, None)
+            if isinstance(value, int) and 100 <= value <= 599:
+                return value
+    return None
+
+
+def _parse_retry_after(value) -> Optional[float]:
+    if value is None:
+        return None
+    text = str(value).strip()
+    if not text:
+        return None
+    try:
+        return max(0.0, float(text))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(text)
+        return max(0.0, when.timestamp() - time.time())
+    except Exception:
+        return None
+
+
+def _error_retry_after(exc: BaseException) -> Optional[float]:
+    """Read Retry-After (or retry-after-ms) from the provider error, if present."""
+    for err in _iter_error_chain(exc):
+        explicit = getattr(err, 'retry_after', None)
+        if isinstance(explicit, (int, float)):
+            return float(explicit)
+        headers = getattr(err, 'headers', None)
+        response = getattr(err, 'response', None)
+        if headers is None and response is not None:
+            headers = getattr(response, 'headers', None)
+        if headers is None:
+            continue
+        try:
+            millis = headers.get('retry-after-ms')
+            if millis is not None:
+                return max(0.0, float(millis) / 1000.0)
+        except Exception:
+            pass
+        try:
+            parsed = _parse_retry_after(headers.get('retry-after'))
+            if parsed is not None:
+                return parsed
+        except Exception:
+            pass
+    return None
+
+
+def classify_error(exc: BaseException) -> str:
+    """Classify a provider exception as rate_limit, transient or fatal."""
+    status = _error_status(exc)
+    if status == 429:
+        return ERROR_RATE_LIMIT
+    if status is not None:
+        return ERROR_TRANSIENT if status in _TRANSIENT_STATUS or status >= 500 else ERROR_FATAL
+    for err in _iter_error_chain(exc):
+        name = type(err).__name__
+        if name in ('RateLimitError',):
+            return ERROR_RATE_LIMIT
+        if name in ('APIConnectionError', 'APITimeoutError', 'InternalServerError'):
+            return ERROR_TRANSIENT
+        if isinstance(err, (urllib.error.URLError, socket.timeout, TimeoutError, ConnectionError)):
+            return ERROR_TRANSIENT
+    return ERROR_FATAL
+
+
+def _is_streaming_unsupported(exc: BaseException) -> bool:
+    """True when a streaming attempt failed because the endpoint/model can't stream."""
+    if isinstance(exc, (AttributeError, TypeError, NotImplementedError)):
+        return True
+    return _error_status(exc) in _STREAMING_UNSUPPORTED_STATUS
+
+
+class _TokenBucket:
+    """Token bucket with AIMD rate adaptation and a shared pause after 429s."""
+
+    def __init__(self, rate: float = BUCKET_RATE, capacity: float = BUCKET_CAPACITY):
+        self.max_rate = float(rate)
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self.updated)
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.updated = now
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self.paused_until:
+                    wait = self.paused_until - now
+                elif self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
+                else:
+                    wait = (1.0 - self.tokens) / max(self.rate, 1e-6)
+            time.sleep(min(max(wait, 0.01), 1.0))
+
+    def on_rate_limited(self, retry_after: Optional[float]) -> None:
+        with self._lock:
+            self.rate = max(BUCKET_MIN_RATE, self.rate / 2.0)
+            if retry_after:
+                self.paused_until = max(self.paused_until, time.monotonic() + retry_after)
+
+    def on_success(self) -> None:
+        with self._lock:
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + BUCKET_RECOVERY_STEP)
+
+
+_buckets: Dict[Tuple[str, str], _TokenBucket] = {}
+_bucket_limits: Dict[Tuple[str, str], Tuple[float, float]] = {}
+_buckets_lock = threading.Lock()
+
+
+def configure_rate_limit(provider: str, model: Optional[str] = None, rate: Optional[float] = None, burst: Optional[float] = None) -> None:
+    """Override the token bucket for (provider, model); model=None sets the provider default."""
+    key = (provider, model or '*')
+    with _buckets_lock:
+        current = _bucket_limits.get(key, (BUCKET_RATE, BUCKET_CAPACITY))
+        limits = (float(rate) if rate else current[0], float(burst) if burst else current[1])
+        _bucket_limits[key] = limits
+        for bucket_key in list(_buckets):
+            if bucket_key == key or (model is None and bucket_key[0] == provider):
+                del _buckets[bucket_key]
+
+
+def configure_retries(max_attempts: Optional[int] = None, base_delay: Optional[float] = None, max_delay: Optional[float] = None) -> None:
+    """Adjust the shared retry policy (e.g. from app config)."""
+    global RETRY_MAX_ATTEMPTS, RETRY_BASE_DELAY, RETRY_MAX_DELAY
+    if isinstance(max_attempts, int) and max_attempts >= 1:
+        RETRY_MAX_ATTEMPTS = max_attempts
+    if isinstance(base_delay, (int, float)) and base_delay > 0:
+        RETRY_BASE_DELAY = float(base_delay)
+    if isinstance(max_delay, (int, float)) and max_delay > 0:
+        RETRY_MAX_DELAY = float(max_delay)
+
+
+def _get_bucket(provider: str, model: Optional[str]) -> _TokenBucket:
+    key = (provider, model or '*')
+    with _buckets_lock:
+        bucket = _buckets.get(key)
+        if bucket is None:
+            rate, burst = _bucket_limits.get(key) or _bucket_limits.get((provider, '*')) or (BUCKET_RATE, BUCKET_CAPACITY)
+            bucket = _TokenBucket(rate, burst)
+            _buckets[key] = bucket
+        return bucket
+
+
+# ---------------------------- Concurrency governor ----------------------------
+
+# Lower value = served first. Live transcription must never queue behind summaries.
+PRIORITY_LIVE = 0
+PRIORITY_INTERACTIVE = 1
+PRIORITY_TRANSLATION = 2
+PRIORITY_BATCH = 3
+PRIORITY_BACKGROUND = 4
+
+# Per-provider limits; 0 disables a limit. Overridable via configure_governor().
+DEFAULT_PROVIDER_LIMITS: Dict[str, Dict[str, int]] = {
+    'openai': {'max_concurrent': 6, 'rpm': 500, 'tpm': 200000},
+    'gemini': {'max_concurrent': 4, 'rpm': 60, 'tpm': 1000000},
+    'soniox': {'max_concurrent': 4, 'rpm': 0, 'tpm': 0},
+    'qwen3-asr': {'max_concurrent': 4, 'rpm': 0, 'tpm': 0},
+}
+FALLBACK_PROVIDER_LIMITS = {'max_concurrent': 4, 'rpm': 0, 'tpm': 0}
+
+_request_context = threading.local()
+
+
+class request_priority:
+    """Context manager tagging model calls made on this thread with a priority."""
+
+    def __init__(self, priority: int):
+        self.priority = priority
+        self._previous: Optional[int] = None
+
+    def __enter__(self):
+        self._previous = getattr(_request_context, 'priority', None)
+        _request_context.priority = self.priority
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _request_context.priority = self._previous
+        return False
+
+
+def set_request_priority(priority: Optional[int]) -> None:
+    """Set the default priority for model calls made on the current (worker) thread."""
+    _request_context.priority = priority
+
+
+def current_priority() -> int:
+    priority = getattr(_request_context, 'priority', None)
+    return PRIORITY_TRANSLATION if priority is None else priority
+
+
+def estimate_tokens(text: Optional[str], max_output: int = 0) -> int:
+    """Rough token estimate for TPM accounting (about 4 chars/token, 1 per CJK char)."""
+    if not text:
+        return max_output
+    wide = sum(1 for ch in text if ord(ch) > 0x2E80)
+    return (len(text) - wide) // 4 + wide + max_output
+
+
+class ProviderGovernor:
+    """Admission control for one provider: concurrency, requests/minute, tokens/minute.
+
+    Waiters are served strictly in (priority, arrival) order. When more than one
+    concurrent slot exists, the last slot is kept for live transcription so
+    background work can never starve it.
+    """
+
+    WINDOW = 60.0
+
+    def __init__(self, max_concurrent: int = 4, rpm: int = 0, tpm: int = 0):
+        self.max_concurrent = max(1, int(max_concurrent or 1))
+        self.rpm = max(0, int(rpm or 0))
+        self.tpm = max(0, int(tpm or 0))
+        self.in_flight = 0
+        self._window: Deque[Tuple[float, int]] = deque()
+        self._window_tokens = 0
+        self._waiting: List[Tuple[int, int]] = []
+        self._seq = 0
+        self._cond = threading.Condition()
+
+    def _expire(self, now: float) -> None:
+        while self._window and now - self._window[0][0] >= self.WINDOW:
+            _, tokens = self._window.popleft()
+            self._window_tokens -= tokens
+
+    def _wait_time(self, priority: int, tokens: int, now: float) -> Optional[float]:
+        """None when admissible now, else seconds to wait (-1 = until a slot is released)."""
+        limit = self.max_concurrent
+        if priority > PRIORITY_LIVE and limit > 1:
+            limit -= 1
+        if self.in_flight >= limit:
+            return -1.0
+        if self.rpm and len(self._window) >= self.rpm:
+            return self.WINDOW - (now - self._window[0][0])
+        if self.tpm and self._window and self._window_tokens + tokens > self.tpm:
+            # Wait until enough of the window expires (an oversized request waits for an empty window)
+            needed = self._window_tokens + tokens - self.tpm
+            freed = 0
+            for stamp, used in self._window:
+                freed += used
+                if freed >= needed:
+                    return self.WINDOW - (now - stamp)
+            return self.WINDOW - (now - self._window[-1][0])
+        return None
+
+    def acquire(self, priority: int, tokens: int = 0) -> float:
+        """Block until the request may start; returns the time spent waiting."""
+        started = time.monotonic()
+        with self._cond:
+            self._seq += 1
+            ticket = (priority, self._seq)
+            heapq.heappush(self._waiting, ticket)
+            try:
+                while True:
+                    now = time.monotonic()
+                    self._expire(now)
+                    if self._waiting[0] != ticket:
+                        wait = -1.0
+                    else:
+                        wait = self._wait_time(priority, tokens, now)
+                    if wait is None:
+                        break
+                    self._cond.wait(timeout=1.0 if wait < 0 else max(0.01, wait))
+            finally:
+                self._waiting.remove(ticket)
+                heapq.heapify(self._waiting)
+            self.in_flight += 1
+            self._window.append((time.monotonic(), tokens))
+            self._window_tokens += tokens
+            self._cond.notify_all()
+        return time.monotonic() - started
+
+    def release(self) -> None:
+        with self._cond:
+            self.in_flight = max(0, self.in_flight - 1)
+            self._cond.notify_all()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._cond:
+            self._expire(time.monotonic())
+            return {
+                'in_flight': self.in_flight,
+                'waiting': len(self._waiting),
+                'requests_last_minute': len(self._window),
+                'tokens_last_minute': self._window_tokens,
+                'max_concurrent': self.max_concurrent,
+                'rpm': self.rpm,
+                'tpm': self.tpm,
+            }
+
+
+_governors: Dict[str, ProviderGovernor] = {}
+_governor_limits: Dict[str, Dict[str, int]] = {k: dict(v) for k, v in DEFAULT_PROVIDER_LIMITS.items()}
+_governors_lock = threading.Lock()
+
+
+def configure_governor(limits: Optional[Dict[str, Dict[str, Any]]]) -> None:
+    """Apply per-provider limits, e.g. {'openai': {'max_concurrent': 4, 'rpm': 300, 'tpm': 150000}}."""
+    if not isinstance(limits, dict):
+        return
+    with _governors_lock:
+        for provider, values in limits.items():
+            if not isinstance(values, dict):
+                continue
+            merged = dict(_governor_limits.get(provider, FALLBACK_PROVIDER_LIMITS))
+            for field in ('max_concurrent', 'rpm', 'tpm'):
+                value = values.get(field)
+                if isinstance(value, (int, float)) and value >= 0:
+                    merged[field] = int(value)
+            _governor_limits[provider] = merged
+            governor = _governors.get(provider)
+            if governor is not None:
+                with governor._cond:
+                    governor.max_concurrent = max(1, merged['max_concurrent'] or 1)
+                    governor.rpm = merged['rpm']
+                    governor.tpm = merged['tpm']
+                    governor._cond.notify_all()
+
+
+def get_governor(provider: str) -> ProviderGovernor:
+    with _governors_lock:
+        governor = _governors.get(provider)
+        if governor is None:
+            governor = ProviderGovernor(**_governor_limits.get(provider, FALLBACK_PROVIDER_LIMITS))
+            _governors[provider] = governor
+        return governor
+
+
+def governor_snapshot() -> Dict[str, Dict[str, Any]]:
+    with _governors_lock:
+        governors = dict(_governors)
+    return {provider: governor.snapshot() for provider, governor in governors.items()}
+
+
+def _backoff_delay(attempt: int, retry_after: Optional[float]) -> float:
+    """Full-jitter exponential backoff, never shorter than the server's Retry-After."""
+    ceiling = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * (2 ** attempt))
+    delay = random.uniform(0.0, ceiling)
+    if retry_after is not None:
+        delay = max(delay, min(retry_after, RETRY_AFTER_MAX) + random.uniform(0.0, RETRY_BASE_DELAY))
+    return delay
+
+
+def call_with_retry(
+    provider: str,
+    model: Optional[str],
+    fn: Callable[[], Any],
+    *,
+    can_retry: Optional[Callable[[], bool]] = None,
+    tokens: int = 0,
+) -> Any:
+    """Call fn with governor admission, token-bucket pacing and retries on
+    rate-limit/transient errors.
+
+    can_retry lets streaming callers refuse a retry once deltas were already emitted.
+    tokens is the estimated prompt+completion size counted against the provider TPM.
+    """
+    bucket = _get_bucket(provider, model)
+    governor = get_governor(provider)
+    priority = current_priority()
+    attempt = 0
+    while True:
+        governor.acquire(priority, tokens)
+        try:
+            bucket.acquire()
+            latency_metrics.mark_current(latency_metrics.REQUEST_SENT)
+            result = fn()
+        except Exception as exc:
+            governor.release()
+            kind = classify_error(exc)
+            retry_after = _error_retry_after(exc)
+            if kind == ERROR_RATE_LIMIT:
+                bucket.on_rate_limited(retry_after)
+            attempt += 1
+            if kind == ERROR_FATAL or attempt >= RETRY_MAX_ATTEMPTS or (can_retry is not None and not can_retry()):
+                raise
+            time.sleep(_backoff_delay(attempt, retry_after))
+            continue
+        governor.release()
+        bucket.on_success()
+        _provider_activity[provider] = time.monotonic()
+        return result
+
+
+# Streaming attempts that failed because the endpoint cannot stream; skip them next time
+_streaming_unsupported = set()
+_streaming_lock = threading.Lock()
+
+
+def _streaming_supported(key: Tuple[str, str, str]) -> bool:
+    with _streaming_lock:
+        return key not in _streaming_unsupported
+
+
+def _mark_streaming_unsupported(key: Tuple[str, str, str]) -> None:
+    with _streaming_lock:
+        _streaming_unsupported.add(key)
+
+
+def _run_streaming(
+    provider: str,
+    model: str,
+    key: Tuple[str, str, str],
+    fn: Callable[[Callable[[str], None]], Any],
+    callback: Callable[[str], None],
+    tokens: int = 0,
+) -> Tuple[bool, Any]:
+    """Run a streaming request with retries.
+
+    Returns (True, result) on success, or (False, None) when the caller should fall
+    back to a non-streaming request: streaming is unsupported for this
+    endpoint/model, or the stream broke with a transient/connection error after
+    deltas were emitted (no streaming retry then; a fresh request usually works).
+    Other errors are raised, since a second full upload would hit the same failure.
+    """
+    if not _streaming_supported(key):
+        return False, None
+    emitted = {'any': False}
+
+    def on_delta(text: str) -> None:
+        emitted['any'] = True
+        callback(text)
+
+    try:
+        return True, call_with_retry(
+            provider,
+            model,
+            lambda: fn(on_delta),
+            can_retry=lambda: not emitted['any'],
+            tokens=tokens,
+        )
+    except Exception as exc:
+        if not emitted['any'] and _is_streaming_unsupported(exc):
+            _mark_streaming_unsupported(key)
+            return False, None
+        if emitted['any'] and classify_error(exc) == ERROR_TRANSIENT:
+            # Dropped mid-stream: the caller's non-streaming request replaces the partial output
+            return False, None
+        raise
+
+
+# ---------------------------- SDK preloading ----------------------------
+
+# Optional SDK modules imported on first use by the provider helpers below
+PROVIDER_SDK_MODULES: Dict[str, Tuple[str, ...]] = {
+    'openai': ('openai',),
+    'qwen3-asr': ('dashscope',),
+    'soniox': ('soniox_realtime',),
+}
+
+
+def preload_provider_sdks(providers: Optional[List[str]] = None) -> Dict[str, Optional[float]]:
+    """Import provider SDKs ahead of the first request (e.g. from a background thread).
+
+    Returns import seconds per module, None for modules that are not installed.
+    Importing is idempotent, so the helpers' own lazy imports become dict lookups.
+    """
+    import importlib
+
+    timings: Dict[str, Optional[float]] = {}
+    for provider in (providers or list(PROVIDER_SDK_MODULES)):
+        for module_name in PROVIDER_SDK_MODULES.get(provider, ()):
+            if module_name in timings:
+                continue
+            started = time.perf_counter()
+            try:
+                importlib.import_module(module_name)
+            except Exception:
+                timings[module_name] = None
+                continue
+            timings[module_name] = time.perf_counter() - started
+    return timings
+
+
+# ---------------------------- Connection pooling / warm-up ----------------------------
+
+# Overridable endpoints (e.g. a local stub for tests/benchmarks); OpenAI takes base_url per call
+DEFAULT_BASE_URLS: Dict[str, str] = {
+    'gemini': 'https://generativelanguage.googleapis.com',
+    'dashscope': '',  # empty: SDK default
+    'soniox': 'wss://stt-rt.soniox.com',
+}
+_base_urls: Dict[str, str] = dict(DEFAULT_BASE_URLS)
+
+# Idle pooled connections older than this are discarded instead of reused
+POOL_KEEPALIVE_SECONDS = 90.0
+POOL_MAX_IDLE_PER_HOST = 4
+WARMUP_TIMEOUT_SECONDS = 10.0
+OPENAI_CLIENT_CACHE_SIZE = 4
+
+# provider -> monotonic time of the last successful call (read by the warm-up pinger)
+_provider_activity: Dict[str, float] = {}
+
+
+def configure_base_urls(urls: Optional[Dict[str, Any]]) -> None:
+    """Override provider endpoints, e.g. {'gemini': 'http://127.0.0.1:8900'}; empty values restore defaults."""
+    updated = dict(DEFAULT_BASE_URLS)
+    for provider, url in (urls or {}).items():
+        if provider in updated and isinstance(url, str) and url.strip():
+            updated[provider] = url.strip().rstrip('/')
+    _base_urls.clear()
+    _base_urls.update(updated)
+
+
+def get_base_url(provider: str) -> str:
+    return _base_urls.get(provider, '')
+
+
+def provider_idle_seconds(provider: str) -> Optional[float]:
+    """Seconds since the provider last answered a call, None if never."""
+    last = _provider_activity.get(provider)
+    return None if last is None else time.monotonic() - last
+
+
+class HTTPConnectionPool:
+    """Keep-alive http.client connections per (scheme, host, port), shared by threads.
+
+    urllib opens a new TCP + TLS connection per request; reusing one saves a
+    handshake per call. Hosts reached through a configured proxy fall back to
+    urllib so proxy settings keep working. A request on a reused connection
+    that the server already closed is retried once on a fresh connection.
+    """
+
+    def __init__(self, max_idle_per_host: int = POOL_MAX_IDLE_PER_HOST, keepalive: float = POOL_KEEPALIVE_SECONDS):
+        self.max_idle_per_host = max_idle_per_host
+        self.keepalive = keepalive
+        self._idle: Dict[Tuple[str, str, int], List[Tuple[http.client.HTTPConnection, float]]] = {}
+        self._lock = threading.Lock()
+        self._ssl_context: Optional[ssl.SSLContext] = None
+        self._proxies: Optional[Dict[str, str]] = None
+
+    @staticmethod
+    def _split(url: str) -> Tuple[Tuple[str, str, int], str]:
+        parts = urllib.parse.urlsplit(url)
+        scheme = parts.scheme.lower()
+        port = parts.port or (443 if scheme == 'https' else 80)
+        path = parts.path or '/'
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        return (scheme, parts.hostname or '', port), path
+
+    def _uses_proxy(self, scheme: str, host: str) -> bool:
+        if self._proxies is None:
+            self._proxies = urllib.request.getproxies()
+        if scheme not in self._proxies:
+            return False
+        try:
+            return not urllib.request.proxy_bypass(host)
+        except Exception:
+            return True
+
+    def _connect(self, key: Tuple[str, str, int], timeout: float) -> http.client.HTTPConnection:
+        scheme, host, port = key
+        if scheme == 'https':
+            if self._ssl_context is None:
+                self._ssl_context = ssl.create_default_context()
+            return http.client.HTTPSConnection(host, port, timeout=timeout, context=self._ssl_context)
+        return http.client.HTTPConnection(host, port, timeout=timeout)
+
+    def _acquire(self, key: Tuple[str, str, int], timeout: float) -> Tuple[http.client.HTTPConnection, bool]:
+        now = time.monotonic()
+        with self._lock:
+            idle = self._idle.get(key) or []
+            while idle:
+                conn, released = idle.pop()
+                if now - released < self.keepalive:
+                    conn.timeout = timeout
+                    if conn.sock is not None:
+                        conn.sock.settimeout(timeout)
+                    return conn, True
+                conn.close()
+        return self._connect(key, timeout), False
+
+    def _release(self, key: Tuple[str, str, int], conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append((conn, time.monotonic()))
+                return
+        conn.close()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 60.0,
+    ) -> Tuple[int, Any, bytes]:
+        """Send a request and return (status, headers, body); HTTP errors are returned, not raised."""
+        key, path = self._split(url)
+        if self._uses_proxy(key[0], key[1]):
+            return self._request_urllib(method, url, body, headers, timeout)
+        for attempt in range(2):
+            conn, reused = self._acquire(key, timeout)
+            try:
+                conn.request(method, path, body=body, headers=headers or {})
+                response = conn.getresponse()
+                latency_metrics.mark_current(latency_metrics.FIRST_BYTE)
+                payload = response.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                if reused and attempt == 0:
+                    continue  # Server dropped the idle connection; retry once on a fresh one
+                raise
+            except Exception:
+                conn.close()
+                raise
+            if response.will_close:
+                conn.close()
+            else:
+                self._release(key, conn)
+            return response.status, response.headers, payload
+        raise ConnectionError(f"Connection to {key[1]} failed")
+
+    @staticmethod
+    def _request_urllib(method, url, body, headers, timeout) -> Tuple[int, Any, bytes]:
+        request = urllib.request.Request(url, data=body, headers=headers or {}, method=method)
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                latency_metrics.mark_current(latency_metrics.FIRST_BYTE)
+                return response.status, response.headers, response.read()
+        except urllib.error.HTTPError as exc:
+            try:
+                payload = exc.read()
+            except Exception:
+                payload = b''
+            return exc.code, exc.headers, payload
+
+    def warm(self, url: str, timeout: float = WARMUP_TIMEOUT_SECONDS) -> bool:
+        """Open an idle connection (DNS + TCP + TLS) to url's host ahead of the first request."""
+        key, _ = self._split(url)
+        if self._uses_proxy(key[0], key[1]):
+            return False
+        conn, reused = self._acquire(key, timeout)
+        if not reused:
+            try:
+                conn.connect()
+            except Exception:
+                conn.close()
+                raise
+        self._release(key, conn)
+        return True
+
+    def close_all(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for conn, _ in connections:
+                conn.close()
+
+
+http_pool = HTTPConnectionPool()
+
+
+def _resolve_host(url: str) -> None:
+    """Warm the resolver cache for SDKs that open their own connections per call."""
+    parts = urllib.parse.urlsplit(url)
+    if parts.hostname:
+        socket.getaddrinfo(parts.hostname, parts.port or 443, type=socket.SOCK_STREAM)
+
+
+def warm_provider(provider: str, api_key: Optional[str] = None, base_url: Optional[str] = None) -> str:
+    """Open (or refresh) the pooled connection to a provider; raises on failure.
+
+    Used both for the warm-up after configuration and for idle keep-alive
+    pings. Returns a short description of the endpoint that was reached.
+    """
+    if provider == 'openai':
+        client = _create_openai_client(api_key or os.environ.get('OPENAI_API_KEY'), base_url or os.environ.get('OPENAI_BASE_URL'))
+        # Authenticated round-trip on the cached client's connection pool (DNS, TLS, key check)
+        client.with_options(timeout=WARMUP_TIMEOUT_SECONDS).models.list()
+        return str(getattr(client, 'base_url', '') or 'openai')
+    if provider == 'gemini':
+        key = api_key or os.environ.get('GEMINI_API_KEY') or os.environ.get('GOOGLE_API_KEY')
+        if not key:
+            raise RuntimeError('Missing Gemini API key')
+        base = get_base_url('gemini')
+        status, headers, payload = http_pool.request(
+            'GET', f"{base}/v1beta/models?pageSize=1&key={urllib.parse.quote(key)}", timeout=WARMUP_TIMEOUT_SECONDS
+        )
+        if status >= 400:
+            detail = payload.decode('utf-8', 'ignore')[:200]
+            raise ProviderHTTPError(f'Gemini API error {status}: {detail}', status, _parse_retry_after(headers.get('Retry-After')))
+        return base
+    if provider == 'qwen3-asr':
+        import dashscope  # type: ignore
+        _apply_dashscope_base_url(dashscope)
+        url = getattr(dashscope, 'base_http_api_url', '') or 'https://dashscope.aliyuncs.com'
+        _resolve_host(url)
+        return url
+    if provider == 'soniox':
+        url = get_base_url('soniox')
+        _resolve_host(url)
+        return url
+    raise ValueError(f"Unknown provider: {provider}")
+
+
+def _apply_dashscope_base_url(dashscope_module) -> None:
+    url = get_base_url('dashscope')
+    if url:
+        dashscope_module.base_http_api_url = url
+
+
 # ---------------------------- OpenAI helpers ----------------------------
 
+# (api_key, base_url) -> client; each client owns an httpx pool, so reusing it reuses connections
+_openai_clients: Dict[Tuple[str, str], Any] = {}
+_openai_clients_lock = threading.Lock()
+
+
 def _create_openai_client(api_key: Optional[str], base_url: Optional[str]):
     if not api_key:
         raise RuntimeError('Missing OpenAI API key')
+    cache_key = (api_key, base_url or '')
+    with _openai_clients_lock:
+        client = _openai_clients.get(cache_key)
+        if client is not None:
+            return client
     try:
         from openai import OpenAI as OpenAIClient  # type: ignore
     except Exception as e:
         raise RuntimeError('OpenAI SDK not installed') from e
-    return OpenAIClient(api_key=api_key, base_url=base_url) if base_url else OpenAIClient(api_key=api_key)
+    kwargs: Dict[str, Any] = {'api_key': api_key, 'max_retries': 0}
+    # SDK retries are disabled; call_with_retry owns backoff so attempts aren't multiplied
+    if base_url:
+        kwargs['base_url'] = base_url
+    try:
+        # httpx drops idle connections after 5 s by default; keep them for the warm-up pinger
+        import httpx  # type: ignore
+        from openai import DefaultHttpxClient  # type: ignore
+        kwargs['http_client'] = DefaultHttpxClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=POOL_KEEPALIVE_SECONDS),
+            # Sync hooks run on the calling thread, so the active segment trace gets the response-header time
+            event_hooks={'response': [lambda response: latency_metrics.mark_current(latency_metrics.FIRST_BYTE)]},
+        )
+    except Exception:
+        pass
+    client = OpenAIClient(**kwargs)
+    with _openai_clients_lock:
+        existing = _openai_clients.get(cache_key)
+        if existing is not None:
+            client.close()
+            return existing
+        if len(_openai_clients) >= OPENAI_CLIENT_CACHE_SIZE:
+            # Drop the oldest (e.g. a replaced API key)
+            _openai_clients.pop(next(iter(_openai_clients))).close()
+        _openai_clients[cache_key] = client
+    return client
 
 
 def _transcribe_openai_streaming(
@@ -193,23 +999,31 @@ def transcribe_openai(
     stream_callback: Optional[Callable[[str], None]] = None,
 ) -> Optional[str]:
     client = _create_openai_client(api_key, base_url)
+    transcribe_model = model or 'gpt-4o-transcribe'
     if stream_callback:
-        try:
-            return _transcribe_openai_streaming(client, filepath, language, model, stream_callback)
-        except Exception:
-            # Fallback to non-streaming flow
-            pass
+        streamed, result = _run_streaming(
+            'openai',
+            transcribe_model,
+            ('transcribe', base_url or '', transcribe_model),
+            lambda on_delta: _transcribe_openai_streaming(client, filepath, language, model, on_delta),
+            stream_callback,
+        )
+        if streamed:
+            return result
+        # Streaming unsupported for this endpoint/model: fall back to non-streaming flow
 
     params = {
-        'model': (model or 'gpt-4o-transcribe'),
-        'file': None,
+        'model': transcribe_model,
         'response_format': 'text',
     }
     if language and language != 'auto':
         params['prompt'] = f'Please only transcribe in {language}'
-    with open(filepath, 'rb') as f:
-        params['file'] = f
-        result = client.audio.transcriptions.create(**params)
+
+    def request():
+        with open(filepath, 'rb') as f:
+            return client.audio.transcriptions.create(file=f, **params)
+
+    result = call_with_retry('openai', transcribe_model, request)
     output_text = getattr(result, 'text', str(result))
     cleaned = _ensure_text(output_text)
     if stream_callback and cleaned:
@@ -217,6 +1031,79 @@ def transcribe_openai(
     return cleaned
 
 
+# Transcription models whose API returns verbose_json with word timestamps
+WORD_TIMESTAMP_MODEL_PREFIXES = ('whisper',)
+
+
+def supports_word_timestamps(model: Optional[str]) -> bool:
+    return bool(model) and str(model).strip().lower().startswith(WORD_TIMESTAMP_MODEL_PREFIXES)
+
+
+def _timed_item(item: Any, text_key: str) -> Optional[Dict[str, Any]]:
+    getter = item.get if isinstance(item, dict) else (lambda key, default=None: getattr(item, key, default))
+    text = getter(text_key)
+    start = getter('start')
+    end = getter('end')
+    if not isinstance(text, str) or not isinstance(start, (int, float)) or not isinstance(end, (int, float)):
+        return None
+    return {'text': _ensure_text(text) or '', 'start': float(start), 'end': float(end)}
+
+
+def transcribe_openai_timed(
+    filepath: str,
+    language: Optional[str],
+    api_key: Optional[str],
+    base_url: Optional[str],
+    model: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Transcribe and return {'text', 'words', 'segments'} with times in seconds from file start.
+
+    Word/segment timings come from verbose_json and are only available for
+    models that support it (see supports_word_timestamps); other models return
+    plain text with empty timing lists.
+    """
+    transcribe_model = model or 'gpt-4o-transcribe'
+    if not supports_word_timestamps(transcribe_model):
+        text = transcribe_openai(filepath, language, api_key, base_url, model=transcribe_model)
+        return {'text': text or '', 'words': [], 'segments': []}
+
+    client = _create_openai_client(api_key, base_url)
+    params: Dict[str, Any] = {
+        'model': transcribe_model,
+        'response_format': 'verbose_json',
+        'timestamp_granularities': ['word', 'segment'],
+    }
+    if language and language != 'auto':
+        params['prompt'] = f'Please only transcribe in {language}'
+
+    def request():
+        with open(filepath, 'rb') as f:
+            return client.audio.transcriptions.create(file=f, **params)
+
+    result = call_with_retry('openai', transcribe_model, request)
+    words = [w for w in (_timed_item(item, 'word') for item in (getattr(result, 'words', None) or [])) if w]
+    segments = [seg for seg in (_timed_item(item, 'text') for item in (getattr(result, 'segments', None) or [])) if seg]
+    return {
+        'text': _ensure_text(getattr(result, 'text', '')) or '',
+        'words': words,
+        'segments': segments,
+    }
+
+
+def _stream_chat_completion(client, on_delta: Callable[[str], None], **params) -> Optional[str]:
+    """Stream a chat completion, forwarding deltas; returns the joined text (or None)."""
+    stream = client.chat.completions.create(stream=True, **params)
+    collected: List[str] = []
+    for chunk in stream:
+        fragment = _ensure_text(_extract_chat_delta_text(chunk))
+        if fragment:
+            collected.append(fragment)
+            on_delta(fragment)
+    if collected:
+        return _ensure_text(''.join(collected).strip())
+    return None
+
+
 def translate_openai(
     text: str,
     target_language: str,
@@ -254,42 +1141,40 @@ def _translate_openai_internal(
     stream_callback: Optional[Callable[[str], None]] = None,
 ) -> Optional[str]:
     translate_model = model or 'gpt-4o-mini'
+    messages = [
+        {'role': 'system', 'content': system_prompt},
+        {'role': 'user', 'content': text},
+    ]
+    # Translation output is roughly the size of the input
+    tokens = estimate_tokens(system_prompt + text, estimate_tokens(text))
     if stream_callback:
-        try:
-            stream = client.chat.completions.create(
+        streamed, result = _run_streaming(
+            'openai',
+            translate_model,
+            ('chat', str(getattr(client, 'base_url', '') or ''), translate_model),
+            lambda on_delta: _stream_chat_completion(
+                client,
+                on_delta,
                 model=translate_model,
-                messages=[
-                    {'role': 'system', 'content': system_prompt},
-                    {'role': 'user', 'content': text},
-                ],
+                messages=messages,
                 max_tokens=5000,
                 temperature=0.1,
                 top_p=0.95,
-                stream=True,
-            )
-            collected: List[str] = []
-            for chunk in stream:
-                fragment = _extract_chat_delta_text(chunk)
-                fragment = _ensure_text(fragment)
-                if fragment:
-                    collected.append(fragment)
-                    stream_callback(fragment)
-            if collected:
-                return _ensure_text(''.join(collected).strip())
-        except Exception:
-            # Fallback to non-streaming flow if streaming fails
-            pass
+            ),
+            stream_callback,
+            tokens=tokens,
+        )
+        if streamed and result:
+            return result
+        # Streaming unsupported or returned nothing: fall back to non-streaming flow
 
-    resp = client.chat.completions.create(
+    resp = call_with_retry('openai', translate_model, lambda: client.chat.completions.create(
         model=translate_model,
-        messages=[
-            {'role': 'system', 'content': system_prompt},
-            {'role': 'user', 'content': text},
-        ],
+        messages=messages,
         max_tokens=5000,
         temperature=0.1,
         top_p=0.95,
-    )
+    ), tokens=tokens)
     content = resp.choices[0].message.content if resp.choices else None
     cleaned = _ensure_text(content)
     if stream_callback and cleaned:
@@ -308,8 +1193,9 @@ def optimize_openai(
         return None
     client = _create_openai_client(api_key, base_url)
     prompt = (system_prompt or DEFAULT_OPTIMIZE_PROMPT).strip() or DEFAULT_OPTIMIZE_PROMPT
-    resp = client.chat.completions.create(
-        model=(model or 'gpt-4o-mini'),
+    optimize_model = model or 'gpt-4o-mini'
+    resp = call_with_retry('openai', optimize_model, lambda: client.chat.completions.create(
+        model=optimize_model,
         messages=[
             {'role': 'system', 'content': prompt},
             {'role': 'user', 'content': text.strip()},
@@ -317,7 +1203,7 @@ def optimize_openai(
         max_tokens=800,
         temperature=0.25,
         top_p=0.9,
-    )
+    ), tokens=estimate_tokens(prompt + text, estimate_tokens(text)))
     content = resp.choices[0].message.content if resp.choices else None
     if isinstance(content, str):
         try:
@@ -352,41 +1238,38 @@ def summarize_openai(
     elif '{{TARGET_LANGUAGE}}' in prompt:
         prompt = prompt.replace('{{TARGET_LANGUAGE}}', 'the requested language')
     summarize_model = model or 'gpt-4o-mini'
+    messages = [
+        {'role': 'system', 'content': prompt},
+        {'role': 'user', 'content': segments_text.strip()},
+    ]
+    tokens = estimate_tokens(prompt + segments_text, max_tokens)
     if stream_callback:
-        try:
-            stream = client.chat.completions.create(
+        streamed, result = _run_streaming(
+            'openai',
+            summarize_model,
+            ('chat', str(getattr(client, 'base_url', '') or ''), summarize_model),
+            lambda on_delta: _stream_chat_completion(
+                client,
+                on_delta,
                 model=summarize_model,
-                messages=[
-                    {'role': 'system', 'content': prompt},
-                    {'role': 'user', 'content': segments_text.strip()},
-                ],
+                messages=messages,
                 max_tokens=max_tokens,
                 temperature=0.2,
                 top_p=0.9,
-                stream=True,
-            )
-            collected: List[str] = []
-            for chunk in stream:
-                fragment = _extract_chat_delta_text(chunk)
-                fragment = _ensure_text(fragment)
-                if fragment:
-                    collected.append(fragment)
-                    stream_callback(fragment)
-            if collected:
-                return _ensure_text(''.join(collected).strip())
-        except Exception:
-            pass
+            ),
+            stream_callback,
+            tokens=tokens,
+        )
+        if streamed and result:
+            return result
 
-    resp = client.chat.completions.create(
+    resp = call_with_retry('openai', summarize_model, lambda: client.chat.completions.create(
         model=summarize_model,
-        messages=[
-            {'role': 'system', 'content': prompt},
-            {'role': 'user', 'content': segments_text.strip()},
-        ],
+        messages=messages,
         max_tokens=max_tokens,
         temperature=0.2,
         top_p=0.9,
-    )
+    ), tokens=tokens)
     content = resp.choices[0].message.content if resp.choices else None
     cleaned = _ensure_text(content)
     if stream_callback and cleaned:
@@ -400,7 +1283,7 @@ def detect_language_openai(text: str, language1: str, language2: str, api_key: O
         f"Detect whether the user text is in '{language1}' or '{language2}'.\n"
         f"Respond with exactly one word: either {language1} or {language2}."
     )
-    resp = client.chat.completions.create(
+    resp = call_with_retry('openai', 'gpt-4o-mini', lambda: client.chat.completions.create(
         model='gpt-4o-mini',
         messages=[
             {'role': 'system', 'content': system_prompt},
@@ -408,7 +1291,7 @@ def detect_language_openai(text: str, language1: str, language2: str, api_key: O
         ],
         max_tokens=4,
         temperature=0,
-    )
+    ), tokens=estimate_tokens(system_prompt + text[:4000], 4))
     detected = resp.choices[0].message.content.strip()
     if detected == language1:
         return language2
@@ -435,6 +1318,42 @@ DEFAULT_OPTIMIZE_PROMPT = (
 )
 
 
+def _gemini_request_once(model_name: str, key: str, data: bytes) -> str:
+    endpoint = (
+        f"{get_base_url('gemini')}/v1beta/models/{model_name}:generateContent"
+        f"?key={urllib.parse.quote(key)}"
+    )
+    try:
+        status, headers, payload = http_pool.request(
+            'POST',
+            endpoint,
+            body=data,
+            headers={
+                'Content-Type': 'application/json; charset=utf-8'
+            },
+            timeout=60,
+        )
+    except Exception as exc:
+        raise RuntimeError(f'Gemini API request failed: {exc}') from exc
+    if status >= 400:
+        message = payload.decode('utf-8', 'ignore') or http.client.responses.get(status, '')
+        retry_after = _parse_retry_after(headers.get('Retry-After')) if headers else None
+        raise ProviderHTTPError(f'Gemini API error {status}: {message}', status, retry_after)
+    return payload.decode('utf-8')
+
+
+def _gemini_generate_content(model_name: str, key: str, body: dict):
+    """POST generateContent with shared retry/rate limiting and return the parsed JSON."""
+    data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+    max_output = (body.get('generationConfig') or {}).get('maxOutputTokens') or 0
+    tokens = estimate_tokens(data.decode('utf-8', 'ignore'), max_output)
+    payload = call_with_retry('gemini', model_name, lambda: _gemini_request_once(model_name, key, data), tokens=tokens)
+    try:
+        return json.loads(payload) if isinstance(payload, str) else payload
+    except Exception as exc:
+        raise RuntimeError(f'Gemini API returned invalid JSON: {exc}') from exc
+
+
 def translate_gemini(
     text: str,
     target_language: str,
@@ -469,36 +1388,7 @@ def translate_gemini(
             'maxOutputTokens': 2048,
         }
     }
-    data = json.dumps(body, ensure_ascii=False).encode('utf-8')
-    endpoint = (
-        f"https://generativelanguage.googleapis.com/v1beta/models/{model_name}:generateContent"
-        f"?key={urllib.parse.quote(key)}"
-    )
-    request = urllib.request.Request(
-        endpoint,
-        data=data,
-        headers={
-            'Content-Type': 'application/json; charset=utf-8'
-        }
-    )
-    try:
-        with urllib.request.urlopen(request, timeout=60) as response:
-            payload = response.read().decode('utf-8')
-    except urllib.error.HTTPError as exc:
-        detail = ''
-        try:
-            detail = exc.read().decode('utf-8', 'ignore')
-        except Exception:
-            pass
-        message = detail or exc.reason or ''
-        raise RuntimeError(f'Gemini API error {exc.code}: {message}') from exc
-    except Exception as exc:
-        raise RuntimeError(f'Gemini API request failed: {exc}') from exc
-
-    try:
-        parsed = json.loads(payload) if isinstance(payload, str) else payload
-    except Exception as exc:
-        raise RuntimeError(f'Gemini API returned invalid JSON: {exc}') from exc
+    parsed = _gemini_generate_content(model_name, key, body)
 
     candidates = parsed.get('candidates') if isinstance(parsed, dict) else None
     if isinstance(candidates, list):
@@ -566,36 +1456,7 @@ def summarize_gemini(
             'maxOutputTokens': max_tokens,
         }
     }
-    data = json.dumps(body, ensure_ascii=False).encode('utf-8')
-    endpoint = (
-        f"https://generativelanguage.googleapis.com/v1beta/models/{model_name}:generateContent"
-        f"?key={urllib.parse.quote(key)}"
-    )
-    request = urllib.request.Request(
-        endpoint,
-        data=data,
-        headers={
-            'Content-Type': 'application/json; charset=utf-8'
-        }
-    )
-    try:
-        with urllib.request.urlopen(request, timeout=60) as response:
-            payload = response.read().decode('utf-8')
-    except urllib.error.HTTPError as exc:
-        detail = ''
-        try:
-            detail = exc.read().decode('utf-8', 'ignore')
-        except Exception:
-            pass
-        message = detail or exc.reason or ''
-        raise RuntimeError(f'Gemini API error {exc.code}: {message}') from exc
-    except Exception as exc:
-        raise RuntimeError(f'Gemini API request failed: {exc}') from exc
-
-    try:
-        parsed = json.loads(payload) if isinstance(payload, str) else payload
-    except Exception as exc:
-        raise RuntimeError(f'Gemini API returned invalid JSON: {exc}') from exc
+    parsed = _gemini_generate_content(model_name, key, body)
 
     candidates = parsed.get('candidates') if isinstance(parsed, dict) else None
     if isinstance(candidates, list):
@@ -644,36 +1505,7 @@ def optimize_gemini(
             'maxOutputTokens': 800,
         }
     }
-    data = json.dumps(body, ensure_ascii=False).encode('utf-8')
-    endpoint = (
-        f"https://generativelanguage.googleapis.com/v1beta/models/{model_name}:generateContent"
-        f"?key={urllib.parse.quote(key)}"
-    )
-    request = urllib.request.Request(
-        endpoint,
-        data=data,
-        headers={
-            'Content-Type': 'application/json; charset=utf-8'
-        }
-    )
-    try:
-        with urllib.request.urlopen(request, timeout=60) as response:
-            payload = response.read().decode('utf-8')
-    except urllib.error.HTTPError as exc:
-        detail = ''
-        try:
-            detail = exc.read().decode('utf-8', 'ignore')
-        except Exception:
-            pass
-        message = detail or exc.reason or ''
-        raise RuntimeError(f'Gemini API error {exc.code}: {message}') from exc
-    except Exception as exc:
-        raise RuntimeError(f'Gemini API request failed: {exc}') from exc
-
-    try:
-        parsed = json.loads(payload) if isinstance(payload, str) else payload
-    except Exception as exc:
-        raise RuntimeError(f'Gemini API returned invalid JSON: {exc}') from exc
+    parsed = _gemini_generate_content(model_name, key, body)
 
     candidates = parsed.get('candidates') if isinstance(parsed, dict) else None
     if isinstance(candidates, list):
@@ -735,6 +1567,7 @@ def transcribe_qwen3_asr(
         import dashscope  # type: ignore
     except Exception as e:
         raise RuntimeError('DashScope SDK (dashscope) not installed') from e
+    _apply_dashscope_base_url(dashscope)
 
     # DashScope Qwen3-ASR 这里改为直接使用系统绝对路径，不再添加 file:// 前缀
     # 例如 Windows: C:\Users\...\录音录音.mp4
@@ -754,13 +1587,25 @@ def transcribe_qwen3_asr(
     # Only pass language if caller provides code like 'zh'/'en'; otherwise rely on LID
     if language and language.lower() not in ("auto", "automatic"):
         asr_opts["language"] = language
-    resp = dashscope.MultiModalConversation.call(
-        api_key=key,
-        model=(model or 'qwen3-asr-flash'),
-        messages=messages,
-        result_format='message',
-        asr_options=asr_opts,
-    )
+    asr_model = model or 'qwen3-asr-flash'
+
+    def request():
+        result = dashscope.MultiModalConversation.call(
+            api_key=key,
+            model=asr_model,
+            messages=messages,
+            result_format='message',
+            asr_options=asr_opts,
+        )
+        # Error responses come back as objects with a non-200 status_code rather than exceptions
+        status = getattr(result, 'status_code', None)
+        if isinstance(status, int) and status != 200:
+            code = getattr(result, 'code', '') or ''
+            message = getattr(result, 'message', '') or ''
+            raise ProviderHTTPError(f'DashScope API error {status}: {code} {message}'.strip(), status)
+        return result
+
+    resp = call_with_retry('qwen3-asr', asr_model, request)
     # Parse message content -> first text part
     try:
         choices = (resp or {}).get('output', {}).get('choices', [])
@@ -802,14 +1647,15 @@ def transcribe_soniox(filepath: str, api_key: Optional[str]) -> Optional[str]:
         if cwd and cwd not in _sys.path:
             _sys.path.insert(0, cwd)
         sr = importlib.import_module('soniox_realtime')
+        sr.SONIOX_WEBSOCKET_URL = f"{get_base_url('soniox')}/transcribe-websocket"
         for name in ('transcribe_file', 'transcribe_wav_file', 'transcribe_wav', 'transcribe', 'recognize_file'):
             fn = getattr(sr, name, None)
             if callable(fn):
                 try:
-                    return fn(filepath, key)
+                    return call_with_retry('soniox', None, lambda: fn(filepath, key))
                 except TypeError:
                     os.environ['SONIOX_API_KEY'] = key
-                    return fn(filepath)
+                    return call_with_retry('soniox', None, lambda: fn(filepath))
     except ModuleNotFoundError:
         pass
     raise RuntimeError('Soniox helper/SDK not available')
@@ -15,6 +15,8 @@ contextBridge.exposeInMainWorld('electronAPI', {
   setDevice: (deviceId) => ipcRenderer.invoke('set-device', deviceId),
   testPython: (pythonPath) => ipcRenderer.invoke('test-python', pythonPath),
   restartPythonService: () => ipcRenderer.invoke('restart-python-service'),
+  startProfile: (options) => ipcRenderer.invoke('profile-start', options),
+  stopProfile: (options) => ipcRenderer.invoke('profile-stop', options),
   
   // 媒体转写相关API
   processMediaFile: (params) => ipcRenderer.invoke('process-media-file', params),
@@ -0,0 +1,395 @@
+"""
+Provider routing helpers shared by the live service and media processor.
+Tracks per-provider latency and health (circuit breaker with background probes)
+and runs hedged (raced) requests across providers.
+"""
+
+from __future__ import annotations
+
+import bisect
+import queue
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+
+TRANSCRIBE_SOURCES = ('openai', 'soniox', 'qwen3-asr')
+
+
+# Halve all counts after this many samples so the histogram follows drifting latency
+HISTOGRAM_DECAY_EVERY = 200
+
+DEFAULT_HEDGE_PERCENTILE = 95.0
+DEFAULT_HEDGE_DELAY_SECONDS = 2.0
+MIN_HEDGE_DELAY_SECONDS = 0.3
+MIN_HEDGE_SAMPLES = 20
+
+# Circuit breaker: open after N consecutive failures or a high error rate over recent calls
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_ERROR_RATE_THRESHOLD = 0.5
+CIRCUIT_ERROR_RATE_WINDOW = 20
+CIRCUIT_ERROR_RATE_MIN_CALLS = 6
+CIRCUIT_COOLDOWN_SECONDS = 30.0
+CIRCUIT_MAX_COOLDOWN_SECONDS = 300.0
+LATENCY_EWMA_ALPHA = 0.2
+
+STATE_CLOSED = 'closed'
+STATE_OPEN = 'open'
+STATE_HALF_OPEN = 'half_open'
+
+
+def normalize_transcribe_source(source) -> str:
+    """Map config aliases onto a canonical transcription source name (default openai)."""
+    candidate = source.strip().lower() if isinstance(source, str) else ''
+    if candidate in ('qwen3-asr', 'qwen', 'dashscope'):
+        return 'qwen3-asr'
+    if candidate == 'soniox':
+        return 'soniox'
+    return 'openai'
+
+
+def log_bucket_bounds(first: float, last: float, growth: float = 1.25) -> List[float]:
+    """Bucket upper bounds from first to last seconds, growing geometrically."""
+    bounds = []
+    bound = first
+    while bound < last:
+        bounds.append(round(bound, 4))
+        bound *= growth
+    return bounds
+
+
+# Latency histogram buckets: 50ms .. ~180s, growing by 25% per bucket
+_BUCKET_BOUNDS: List[float] = log_bucket_bounds(0.05, 180.0)
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram (seconds) with percentile queries."""
+
+    def __init__(self, bounds: Optional[List[float]] = None):
+        self._bounds = bounds or _BUCKET_BOUNDS
+        self._counts = [0.0] * (len(self._bounds) + 1)
+        self._total = 0.0
+        self._samples = 0
+        self._lock = threading.Lock()
+
+    @property
+    def count(self) -> int:
+        return self._samples
+
+    def record(self, seconds: float) -> None:
+        if seconds is None or seconds < 0:
+            return
+        index = bisect.bisect_left(self._bounds, seconds)
+        with self._lock:
+            self._counts[index] += 1.0
+            self._total += 1.0
+            self._samples += 1
+            if self._samples % HISTOGRAM_DECAY_EVERY == 0:
+                self._counts = [c / 2.0 for c in self._counts]
+                self._total /= 2.0
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Upper bound of the bucket holding the given percentile, or None when empty."""
+        with self._lock:
+            if self._total <= 0:
+                return None
+            target = self._total * max(0.0, min(100.0, pct)) / 100.0
+            running = 0.0
+            for index, value in enumerate(self._counts):
+                running += value
+                if running >= target and value > 0:
+                    return self._bounds[index] if index < len(self._bounds) else self._bounds[-1]
+        return self._bounds[-1]
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'p99': self.percentile(99),
+        }
+
+
+class LatencyRegistry:
+    """Per-provider latency histograms."""
+
+    def __init__(self):
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def get(self, provider: str) -> LatencyHistogram:
+        with self._lock:
+            histogram = self._histograms.get(provider)
+            if histogram is None:
+                histogram = LatencyHistogram()
+                self._histograms[provider] = histogram
+            return histogram
+
+    def record(self, provider: str, seconds: float) -> None:
+        self.get(provider).record(seconds)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            items = list(self._histograms.items())
+        return {name: hist.snapshot() for name, hist in items}
+
+
+latency_registry = LatencyRegistry()
+
+
+class ProviderHealth:
+    """Error rate, consecutive failures and latency EWMA for one provider, with a circuit breaker.
+
+    closed -> open after repeated failures; open -> half_open when the cooldown has
+    elapsed and a background probe starts; half_open -> closed on probe success or
+    back to open (with doubled cooldown) on probe failure.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.state = STATE_CLOSED
+        self.consecutive_failures = 0
+        self.latency_ewma: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.opened_at = 0.0
+        self.cooldown = CIRCUIT_COOLDOWN_SECONDS
+        self._outcomes: Deque[bool] = deque(maxlen=CIRCUIT_ERROR_RATE_WINDOW)
+
+    @property
+    def error_rate(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return sum(1 for ok in self._outcomes if not ok) / float(len(self._outcomes))
+
+    @property
+    def retry_at(self) -> float:
+        return self.opened_at + self.cooldown if self.state != STATE_CLOSED else 0.0
+
+    def is_available(self) -> bool:
+        return self.state == STATE_CLOSED
+
+    def probe_due(self, now: float) -> bool:
+        return self.state == STATE_OPEN and now >= self.retry_at
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            'provider': self.name,
+            'state': self.state,
+            'consecutive_failures': self.consecutive_failures,
+            'error_rate': round(self.error_rate, 3),
+            'latency_ewma': round(self.latency_ewma, 3) if self.latency_ewma is not None else None,
+            'last_error': self.last_error,
+            'retry_in': round(max(0.0, self.retry_at - time.monotonic()), 1) if self.state != STATE_CLOSED else 0.0,
+        }
+
+
+class HealthRegistry:
+    """Per-provider health shared by every caller in the process."""
+
+    def __init__(self):
+        self._providers: Dict[str, ProviderHealth] = {}
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[Dict[str, Any]], None]] = []
+
+    def add_listener(self, listener: Callable[[Dict[str, Any]], None]) -> None:
+        """Register a callback invoked with a snapshot whenever a breaker changes state."""
+        with self._lock:
+            if listener not in self._listeners:
+                self._listeners.append(listener)
+
+    def _get_locked(self, provider: str) -> ProviderHealth:
+        health = self._providers.get(provider)
+        if health is None:
+            health = ProviderHealth(provider)
+            self._providers[provider] = health
+        return health
+
+    def _notify(self, snapshot: Dict[str, Any]) -> None:
+        for listener in list(self._listeners):
+            try:
+                listener(snapshot)
+            except Exception:
+                pass
+
+    def _transition_locked(self, health: ProviderHealth, state: str) -> Optional[Dict[str, Any]]:
+        if health.state == state:
+            return None
+        health.state = state
+        if state == STATE_OPEN:
+            health.opened_at = time.monotonic()
+        elif state == STATE_CLOSED:
+            # Recovered: forget the outage so one stray error doesn't reopen the breaker
+            health.cooldown = CIRCUIT_COOLDOWN_SECONDS
+            health._outcomes.clear()
+        return health.snapshot()
+
+    def record_success(self, provider: str, latency: Optional[float] = None) -> None:
+        with self._lock:
+            health = self._get_locked(provider)
+            health._outcomes.append(True)
+            health.consecutive_failures = 0
+            if latency is not None and latency >= 0:
+                if health.latency_ewma is None:
+                    health.latency_ewma = latency
+                else:
+                    health.latency_ewma += LATENCY_EWMA_ALPHA * (latency - health.latency_ewma)
+            change = self._transition_locked(health, STATE_CLOSED)
+        if latency is not None:
+            latency_registry.record(provider, latency)
+        if change:
+            self._notify(change)
+
+    def record_failure(self, provider: str, error: Any = None) -> None:
+        with self._lock:
+            health = self._get_locked(provider)
+            health._outcomes.append(False)
+            health.consecutive_failures += 1
+            if error is not None:
+                health.last_error = str(error)[:200]
+            change = None
+            if health.state == STATE_CLOSED:
+                too_many = health.consecutive_failures >= CIRCUIT_FAILURE_THRESHOLD
+                too_often = (
+                    len(health._outcomes) >= CIRCUIT_ERROR_RATE_MIN_CALLS
+                    and health.error_rate >= CIRCUIT_ERROR_RATE_THRESHOLD
+                )
+                if too_many or too_often:
+                    change = self._transition_locked(health, STATE_OPEN)
+        if change:
+            self._notify(change)
+
+    def is_available(self, provider: str) -> bool:
+        with self._lock:
+            return self._get_locked(provider).is_available()
+
+    def order(self, candidates: List[str]) -> List[str]:
+        """Filter candidates down to healthy providers, keeping configured order.
+
+        When every breaker is open, return only the one whose cooldown ends first so
+        the segment still gets a single attempt instead of a round of doomed uploads.
+        """
+        unique: List[str] = []
+        for name in candidates:
+            if name and name not in unique:
+                unique.append(name)
+        if not unique:
+            return []
+        with self._lock:
+            available = [name for name in unique if self._get_locked(name).is_available()]
+            if available:
+                return available
+            return [min(unique, key=lambda name: self._get_locked(name).retry_at)]
+
+    def maybe_probe(self, provider: str, probe: Callable[[], Any]) -> bool:
+        """Start a background probe when the provider's breaker is open and its cooldown has elapsed.
+
+        The probe should raise on failure; any return value counts as success.
+        """
+        with self._lock:
+            health = self._get_locked(provider)
+            if not health.probe_due(time.monotonic()):
+                return False
+            change = self._transition_locked(health, STATE_HALF_OPEN)
+        if change:
+            self._notify(change)
+
+        def run():
+            started = time.monotonic()
+            try:
+                probe()
+            except Exception as exc:
+                with self._lock:
+                    health.last_error = str(exc)[:200]
+                    health.cooldown = min(health.cooldown * 2.0, CIRCUIT_MAX_COOLDOWN_SECONDS)
+                    reopened = self._transition_locked(health, STATE_OPEN)
+                if reopened:
+                    self._notify(reopened)
+                return
+            self.record_success(provider, time.monotonic() - started)
+
+        threading.Thread(target=run, daemon=True).start()
+        return True
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {name: health.snapshot() for name, health in self._providers.items()}
+
+
+health_registry = HealthRegistry()
+
+
+def hedge_delay(
+    provider: str,
+    percentile: float = DEFAULT_HEDGE_PERCENTILE,
+    default: float = DEFAULT_HEDGE_DELAY_SECONDS,
+    minimum: float = MIN_HEDGE_DELAY_SECONDS,
+) -> float:
+    """Delay before firing a backup request: the provider's observed tail latency."""
+    histogram = latency_registry.get(provider)
+    if histogram.count < MIN_HEDGE_SAMPLES:
+        return max(minimum, default)
+    observed = histogram.percentile(percentile)
+    if observed is None:
+        return max(minimum, default)
+    return max(minimum, observed)
+
+
+def hedged_call(
+    primary: Tuple[str, Callable[[threading.Event], Any]],
+    secondary: Tuple[str, Callable[[threading.Event], Any]],
+    delay: float,
+) -> Tuple[Optional[str], bool, Any]:
+    """Run primary; if it has not answered within `delay` seconds, race secondary too.
+
+    Callers record latency/health themselves. Each callable receives a cancel Event that is set once another provider wins, so
+    it can stop emitting side effects (stream deltas). Blocking SDK calls cannot be
+    interrupted, so the loser's answer is simply discarded. A callable fails by
+    raising; a primary that fails before the delay triggers the secondary
+    immediately. Any answer that did not raise wins, including an empty
+    transcript. Returns (provider, True, result) for the winner, or
+    (None, False, None) when both raised.
+    """
+    results: "queue.Queue[Tuple[str, bool, Any]]" = queue.Queue()
+    cancel_events: Dict[str, threading.Event] = {}
+
+    def launch(name: str, fn: Callable[[threading.Event], Any]) -> None:
+        cancel = threading.Event()
+        cancel_events[name] = cancel
+
+        def run():
+            try:
+                results.put((name, True, fn(cancel)))
+            except Exception:
+                results.put((name, False, None))
+
+        threading.Thread(target=run, daemon=True).start()
+
+    def finish(winner: str, value: Any) -> Tuple[Optional[str], bool, Any]:
+        for name, event in cancel_events.items():
+            if name != winner:
+                event.set()
+        return winner, True, value
+
+    primary_name, primary_fn = primary
+    secondary_name, secondary_fn = secondary
+    launch(primary_name, primary_fn)
+    pending = 1
+
+    try:
+        name, ok, value = results.get(timeout=max(0.0, float(delay)))
+        pending -= 1
+        if ok:
+            return finish(name, value)
+    except queue.Empty:
+        pass
+
+    launch(secondary_name, secondary_fn)
+    pending += 1
+
+    while pending > 0:
+        name, ok, value = results.get()
+        pending -= 1
+        if ok:
+            return finish(name, value)
+    return None, False, None
@@ -0,0 +1,176 @@
+"""
+Provider connection warm-up.
+After update_config applies credentials, the providers in use are warmed on a
+background thread: their SDK is imported and a pooled connection is opened
+(DNS, TCP, TLS and, where cheap, an authenticated round-trip), so the first
+transcription or translation does not pay for it. While the app is idle the
+connections are kept alive with periodic pings, for at most keepalive_seconds
+after the provider was last used; real traffic resets that window.
+
+Status per provider ('warming', 'ready', 'idle', 'failed') is reported through
+on_status whenever it changes.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+DEFAULT_PING_INTERVAL = 30.0
+DEFAULT_KEEPALIVE_SECONDS = 600.0
+
+
+class WarmupTarget:
+    """One provider to warm, with the credentials/endpoint it will be called with."""
+
+    __slots__ = ('provider', 'api_key', 'base_url')
+
+    def __init__(self, provider: str, api_key: Optional[str] = None, base_url: Optional[str] = None):
+        self.provider = provider
+        self.api_key = api_key
+        self.base_url = base_url
+
+    def key(self) -> Tuple[str, str, str]:
+        return (self.provider, self.api_key or '', self.base_url or '')
+
+
+class ProviderWarmup:
+    """Warms provider connections and keeps them alive while idle.
+
+    warm_fn(target) opens/refreshes the connection and returns an endpoint
+    description; preload_fn(providers) imports SDKs; idle_fn(provider) returns
+    seconds since the provider last served a real call (None if never).
+    """
+
+    def __init__(
+        self,
+        *,
+        warm_fn: Callable[[WarmupTarget], str],
+        preload_fn: Optional[Callable[[List[str]], Any]] = None,
+        idle_fn: Optional[Callable[[str], Optional[float]]] = None,
+        on_status: Optional[Callable[[Dict[str, Dict[str, Any]]], None]] = None,
+        log: Optional[Callable[[str, str], None]] = None,
+    ):
+        self.warm_fn = warm_fn
+        self.preload_fn = preload_fn
+        self.idle_fn = idle_fn or (lambda provider: None)
+        self.on_status = on_status
+        self._log = log or (lambda level, message: None)
+        self.ping_interval = DEFAULT_PING_INTERVAL
+        self.keepalive_seconds = DEFAULT_KEEPALIVE_SECONDS
+        self._lock = threading.Lock()
+        self._status: Dict[str, Dict[str, Any]] = {}
+        self._targets: List[WarmupTarget] = []
+        self._generation = 0
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def configure(self, ping_interval: Optional[float] = None, keepalive_seconds: Optional[float] = None) -> None:
+        if isinstance(ping_interval, (int, float)) and ping_interval > 0:
+            self.ping_interval = float(ping_interval)
+        if isinstance(keepalive_seconds, (int, float)) and keepalive_seconds >= 0:
+            self.keepalive_seconds = float(keepalive_seconds)
+
+    def apply(self, targets: List[WarmupTarget]) -> bool:
+        """Warm a new target set; returns False when it is unchanged (nothing restarted)."""
+        keys = [target.key() for target in targets]
+        with self._lock:
+            if keys == [target.key() for target in self._targets] and self._thread is not None and self._thread.is_alive():
+                return False
+            self._generation += 1
+            generation = self._generation
+            self._targets = list(targets)
+            self._status = {target.provider: {'state': 'warming'} for target in targets}
+        self._wake.set()
+        self._emit()
+        if targets:
+            self._wake = threading.Event()
+            self._thread = threading.Thread(target=self._run, args=(generation, list(targets)), name="provider-warmup", daemon=True)
+            self._thread.start()
+        return True
+
+    def stop(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._targets = []
+            self._status = {}
+        self._wake.set()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {provider: dict(status) for provider, status in self._status.items()}
+
+    # ---- worker ----
+
+    def _current(self, generation: int) -> bool:
+        return generation == self._generation
+
+    def _set(self, generation: int, provider: str, **status: Any) -> None:
+        with self._lock:
+            if not self._current(generation):
+                return
+            previous = self._status.get(provider, {})
+            changed = previous.get('state') != status.get('state') or previous.get('error') != status.get('error')
+            self._status[provider] = status
+        if changed:
+            self._emit()
+
+    def _emit(self) -> None:
+        if self.on_status is None:
+            return
+        try:
+            self.on_status(self.snapshot())
+        except Exception:
+            pass
+
+    def _warm(self, generation: int, target: WarmupTarget, ping: bool) -> bool:
+        started = time.perf_counter()
+        try:
+            endpoint = self.warm_fn(target)
+        except Exception as e:
+            already_failed = self.snapshot().get(target.provider, {}).get('state') == 'failed'
+            self._set(generation, target.provider, state='failed', error=str(e)[:300], at=time.time())
+            if not already_failed:
+                self._log("warning", f"{'Keep-alive ping' if ping else 'Warm-up'} failed for {target.provider}: {e}")
+            return False
+        elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+        self._set(generation, target.provider, state='ready', endpoint=endpoint, elapsed_ms=elapsed_ms, at=time.time())
+        if not ping:
+            self._log("info", f"Provider {target.provider} warmed in {elapsed_ms:.0f} ms ({endpoint})")
+        return True
+
+    def _run(self, generation: int, targets: List[WarmupTarget]) -> None:
+        wake = self._wake
+        if self.preload_fn is not None:
+            try:
+                self.preload_fn([target.provider for target in targets])
+            except Exception as e:
+                self._log("warning", f"SDK preload failed: {e}")
+        warmed_at: Dict[str, float] = {}
+        for target in targets:
+            if not self._current(generation):
+                return
+            self._warm(generation, target, ping=False)
+            warmed_at[target.provider] = time.monotonic()
+        last_touch = dict(warmed_at)
+
+        while not wake.wait(self.ping_interval):
+            if not self._current(generation):
+                return
+            now = time.monotonic()
+            for target in targets:
+                provider = target.provider
+                used = self.idle_fn(provider)
+                since_use = used if used is not None else float('inf')
+                if min(since_use, now - warmed_at[provider]) >= self.keepalive_seconds:
+                    # Unused for a long time: let the connection lapse until real traffic resumes
+                    status = self.snapshot().get(provider, {})
+                    if status.get('state') == 'ready':
+                        self._set(generation, provider, **dict(status, state='idle'))
+                    continue
+                if min(since_use, now - last_touch[provider]) < self.ping_interval:
+                    continue  # Real traffic or a recent ping kept the connection warm
+                self._warm(generation, target, ping=True)
+                last_touch[provider] = time.monotonic()
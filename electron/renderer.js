@@ -2268,6 +2268,11 @@ function handleTranscriptionUpdateMessage(message) {
         return;
     }
     const { conversation, entry } = context;
+    if (message.merged_into) {
+        // Segment merged into a later queued one; its text arrives on that entry
+        deleteResultEntry(entry, conversation, { silent: true });
+        return;
+    }
     if (typeof message.transcription === 'string') {
         const sanitized = removeInvalidSurrogates(message.transcription);
         entry.transcription = sanitized;
@@ -3668,7 +3673,7 @@ async function requestOptimizationForEntry(entry, conversation) {
     }
 }
 
-function deleteResultEntry(entry, conversation) {
+function deleteResultEntry(entry, conversation, options = {}) {
     if (!entry || !conversation) {
         return;
     }
@@ -3699,7 +3704,9 @@ function deleteResultEntry(entry, conversation) {
     markConversationUpdated(conversation);
     saveConversationsToStorage();
     renderHistoryList();
-    addLogEntry('info', t('index.log.entryDeleted'));
+    if (!options.silent) {
+        addLogEntry('info', t('index.log.entryDeleted'));
+    }
 }
 
 async function copyLastResult() {
@@ -0,0 +1,70 @@
+"""
+Regenerate language_profiles.py (trigram profiles for language_id).
+
+Reads one UTF-8 sample text per language from a directory (<language>.txt,
+named like the keys of language_id.LANGUAGE_SCRIPT_MAP), ranks the
+space-padded character trigrams of each and writes the top PROFILE_SIZE per
+language in rank order. A larger corpus (e.g. a few hundred Tatoeba
+sentences per language) gives sharper profiles; the file format stays the same.
+
+Usage:
+    python scripts/build_language_profiles.py [--samples scripts/language_samples] [--size 300]
+"""
+
+import argparse
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from language_id import text_trigrams  # noqa: E402
+
+HEADER = '''"""
+Character-trigram language profiles used by language_id.identify_language.
+Generated by scripts/build_language_profiles.py from scripts/language_samples;
+do not edit by hand.
+
+Each profile is its trigrams concatenated in descending frequency order (every
+trigram is exactly three characters, words padded with one space each side).
+"""
+
+'''
+
+
+def build_profile(text, size):
+    counts = text_trigrams(text, limit=len(text))
+    ranked = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+    return ''.join(trigram for trigram, _ in ranked[:size])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build trigram language profiles')
+    parser.add_argument('--samples', default=os.path.join(ROOT, 'scripts', 'language_samples'))
+    parser.add_argument('--size', type=int, default=300, help='Trigrams kept per language')
+    parser.add_argument('--output', default=os.path.join(ROOT, 'language_profiles.py'))
+    args = parser.parse_args()
+
+    profiles = {}
+    for filename in sorted(os.listdir(args.samples)):
+        if not filename.endswith('.txt'):
+            continue
+        with open(os.path.join(args.samples, filename), 'r', encoding='utf-8') as f:
+            profiles[filename[:-4].lower()] = build_profile(f.read(), args.size)
+
+    with open(args.output, 'w', encoding='utf-8') as out:
+        out.write(HEADER)
+        out.write(f"PROFILE_SIZE = {args.size}\n\n")
+        out.write("PROFILES = {\n")
+        for name, packed in profiles.items():
+            out.write(f"    {name!r}: (\n")
+            # 20 trigrams per source line
+            for offset in range(0, len(packed), 60):
+                out.write(f"        {packed[offset:offset + 60]!r}\n")
+            out.write("    ),\n")
+        out.write("}\n")
+    print(f"Wrote {len(profiles)} profiles to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,374 @@
+"""
+Bounded executor for recorded speech segments.
+A fixed pool of workers drains a FIFO queue of segments. When the in-memory
+queue is full the configured saturation policy applies: 'merge' appends the new
+segment to the newest queued one (they are adjacent in time), 'spill' writes it
+to disk and only keeps the path in memory.
+
+Short segments can also be coalesced before they reach the pool, so quick
+back-and-forth speech costs one provider round-trip instead of several.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+import soundfile as sf
+
+
+POLICY_MERGE = 'merge'
+POLICY_SPILL = 'spill'
+SATURATION_POLICIES = (POLICY_MERGE, POLICY_SPILL)
+
+DEFAULT_WORKERS = 3
+DEFAULT_QUEUE_SIZE = 8
+DEFAULT_MERGE_MAX_SECONDS = 30.0
+METRICS_MIN_INTERVAL = 0.5  # seconds between routine metrics emissions
+
+# Coalescing of short adjacent segments into one provider request
+DEFAULT_COALESCE_TARGET_SECONDS = 8.0
+DEFAULT_COALESCE_SHORT_SECONDS = 3.0
+DEFAULT_COALESCE_MAX_WAIT_SECONDS = 1.2
+DEFAULT_COALESCE_MAX_GAP_SECONDS = 2.0
+
+
+class SegmentJob:
+    """One queued segment: raw chunks in memory, or a WAV path once spilled.
+
+    recorded_at is the wall-clock time the segment was cut (submitted_at is the
+    monotonic one, for queue waits). result_id is the UI placeholder sent at
+    submission; absorbed_result_ids lists the placeholders of segments merged
+    into this job, which its result replaces.
+    """
+
+    __slots__ = (
+        'chunks', 'frames', 'seg_idx', 'order', 'from_split', 'source', 'spill_path', 'submitted_at', 'merged_count',
+        'recorded_at', 'result_id', 'absorbed_result_ids',
+    )
+
+    def __init__(self, chunks: List[np.ndarray], seg_idx: Optional[int], order: Optional[int], from_split: bool = True, source: Optional[str] = None):
+        self.chunks = chunks
+        self.frames = sum(len(chunk) for chunk in chunks)
+        self.seg_idx = seg_idx
+        self.order = order
+        self.from_split = from_split
+        self.source = source  # Speaker/source label in multi-source capture; only same-source jobs merge
+        self.spill_path: Optional[str] = None
+        self.submitted_at = time.monotonic()
+        self.merged_count = 1
+        self.recorded_at = time.time()
+        self.result_id: Optional[str] = None
+        self.absorbed_result_ids: List[str] = []
+
+    def absorb(self, other: 'SegmentJob') -> None:
+        """Append a later in-memory segment (keeps this job's order and index)."""
+        self.chunks = self.chunks + other.chunks
+        self.frames += other.frames
+        self.merged_count += other.merged_count
+        if other.result_id is not None:
+            self.absorbed_result_ids.append(other.result_id)
+        self.absorbed_result_ids.extend(other.absorbed_result_ids)
+
+    def load_chunks(self) -> List[np.ndarray]:
+        if self.spill_path is None:
+            return self.chunks
+        try:
+            data, _ = sf.read(self.spill_path, dtype='float32', always_2d=True)
+            return [data]
+        finally:
+            try:
+                os.remove(self.spill_path)
+            except OSError:
+                pass
+
+
+class SegmentExecutor:
+    """Fixed worker pool with a bounded segment queue and explicit saturation policy.
+
+    process_fn(job, chunks) runs on a worker thread. on_metrics(dict) receives
+    queue depth / wait time snapshots (throttled, plus every saturation event).
+    """
+
+    def __init__(
+        self,
+        process_fn: Callable[[SegmentJob, List[np.ndarray]], Any],
+        *,
+        sample_rate: int,
+        workers: int = DEFAULT_WORKERS,
+        max_queue: int = DEFAULT_QUEUE_SIZE,
+        policy: str = POLICY_MERGE,
+        merge_max_seconds: float = DEFAULT_MERGE_MAX_SECONDS,
+        spill_dir: Optional[str] = None,
+        on_metrics: Optional[Callable[[Dict[str, Any]], None]] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+    ):
+        self.process_fn = process_fn
+        self.sample_rate = int(sample_rate)
+        self.workers = max(1, int(workers))
+        self.max_queue = max(1, int(max_queue))
+        self.policy = policy if policy in SATURATION_POLICIES else POLICY_MERGE
+        self.merge_max_frames = int(max(1.0, float(merge_max_seconds)) * self.sample_rate)
+        self.spill_dir = spill_dir
+        self.on_metrics = on_metrics
+        self.on_error = on_error
+
+        self._queue: Deque[SegmentJob] = deque()
+        self._cond = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        self._running = False
+        self._in_flight = 0
+
+        self._submitted = 0
+        self._processed = 0
+        self._merged = 0
+        self._spilled = 0
+        self._last_wait = 0.0
+        self._max_wait = 0.0
+        self._total_wait = 0.0
+        self._last_metrics_emit = 0.0
+
+    # ---- lifecycle ----
+
+    def start(self) -> None:
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+            for index in range(self.workers):
+                thread = threading.Thread(target=self._worker, name=f"segment-worker-{index + 1}", daemon=True)
+                self._threads.append(thread)
+                thread.start()
+
+    def shutdown(self, wait: bool = False, timeout: Optional[float] = None) -> None:
+        """Stop accepting work; queued segments are still processed before workers exit."""
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+            threads = list(self._threads)
+            self._threads = []
+        if wait:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            for thread in threads:
+                remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                thread.join(remaining)
+
+    # ---- submission ----
+
+    def submit(self, job: SegmentJob) -> None:
+        saturation = None
+        with self._cond:
+            self._submitted += 1
+            in_memory = sum(1 for queued in self._queue if queued.spill_path is None)
+            if in_memory >= self.max_queue:
+                saturation = self._apply_saturation_policy(job)
+            else:
+                self._queue.append(job)
+            self._cond.notify()
+        self._emit_metrics(force=saturation is not None, event=saturation)
+
+    def _apply_saturation_policy(self, job: SegmentJob) -> str:
+        """Called with the lock held when the in-memory queue is full."""
+        tail = self._queue[-1] if self._queue else None
+        if (
+            self.policy == POLICY_MERGE
+            and tail is not None
+            and tail.spill_path is None
+            and tail.source == job.source
+            and tail.frames + job.frames <= self.merge_max_frames
+        ):
+            tail.absorb(job)
+            self._merged += 1
+            return 'merged'
+        if self._spill(job):
+            self._queue.append(job)
+            self._spilled += 1
+            return 'spilled'
+        # Spill failed (or no directory): keep it in memory rather than dropping speech
+        self._queue.append(job)
+        return 'overflow'
+
+    def _spill(self, job: SegmentJob) -> bool:
+        if not self.spill_dir or not job.chunks:
+            return False
+        try:
+            os.makedirs(self.spill_dir, exist_ok=True)
+            path = os.path.join(self.spill_dir, f"spill_{uuid.uuid4().hex}.wav")
+            data = np.concatenate(job.chunks, axis=0) if len(job.chunks) > 1 else job.chunks[0]
+            sf.write(path, data, self.sample_rate)
+        except Exception:
+            return False
+        job.spill_path = path
+        job.chunks = []
+        return True
+
+    # ---- workers ----
+
+    def _worker(self) -> None:
+        while True:
+            with self._cond:
+                while not self._queue and self._running:
+                    self._cond.wait()
+                if not self._queue:
+                    return
+                job = self._queue.popleft()
+                self._in_flight += 1
+                wait = time.monotonic() - job.submitted_at
+                self._last_wait = wait
+                self._max_wait = max(self._max_wait, wait)
+                self._total_wait += wait
+            self._emit_metrics()
+            try:
+                self.process_fn(job, job.load_chunks())
+            except Exception as exc:
+                if self.on_error:
+                    try:
+                        self.on_error(exc)
+                    except Exception:
+                        pass
+            finally:
+                with self._cond:
+                    self._in_flight -= 1
+                    self._processed += 1
+                    idle = not self._queue and self._in_flight == 0
+                # Always report the drained state so the UI doesn't keep a stale depth
+                self._emit_metrics(force=idle)
+
+    # ---- metrics ----
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._cond:
+            started = self._processed + self._in_flight
+            return {
+                'queue_depth': len(self._queue),
+                'spilled_pending': sum(1 for job in self._queue if job.spill_path is not None),
+                'in_flight': self._in_flight,
+                'workers': self.workers,
+                'max_queue': self.max_queue,
+                'policy': self.policy,
+                'submitted': self._submitted,
+                'processed': self._processed,
+                'merged': self._merged,
+                'spilled': self._spilled,
+                'last_wait_ms': round(self._last_wait * 1000.0, 1),
+                'avg_wait_ms': round(self._total_wait * 1000.0 / started, 1) if started else 0.0,
+                'max_wait_ms': round(self._max_wait * 1000.0, 1),
+            }
+
+    def _emit_metrics(self, force: bool = False, event: Optional[str] = None) -> None:
+        if not self.on_metrics:
+            return
+        now = time.monotonic()
+        with self._cond:
+            if not force and now - self._last_metrics_emit < METRICS_MIN_INTERVAL:
+                return
+            self._last_metrics_emit = now
+        snapshot = self.snapshot()
+        if event:
+            snapshot['event'] = event
+        try:
+            self.on_metrics(snapshot)
+        except Exception:
+            pass
+
+
+class SegmentCoalescer:
+    """Buffers consecutive short segments and forwards them as one job.
+
+    A buffer is flushed once it reaches target_seconds, when a long segment
+    arrives (the buffer goes first to keep order), or when the oldest buffered
+    segment has waited max_wait_seconds. Live segments already end with the
+    silence that split them, so they are joined back-to-back.
+    """
+
+    def __init__(
+        self,
+        submit_fn: Callable[[SegmentJob], None],
+        *,
+        sample_rate: int,
+        target_seconds: float = DEFAULT_COALESCE_TARGET_SECONDS,
+        short_seconds: float = DEFAULT_COALESCE_SHORT_SECONDS,
+        max_wait_seconds: float = DEFAULT_COALESCE_MAX_WAIT_SECONDS,
+    ):
+        self.submit_fn = submit_fn
+        self.target_frames = int(float(target_seconds) * sample_rate)
+        self.short_frames = int(float(short_seconds) * sample_rate)
+        self.max_wait_seconds = max(0.05, float(max_wait_seconds))
+        self._pending: Optional[SegmentJob] = None
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+
+    def add(self, job: SegmentJob) -> None:
+        ready: List[SegmentJob] = []
+        with self._lock:
+            if self._pending is not None and self._pending.source != job.source:
+                # Different speaker/source: never join their audio
+                self._take_pending(ready)
+            if job.spill_path is not None or job.frames >= self.short_frames:
+                self._take_pending(ready)
+                ready.append(job)
+            elif self._pending is None:
+                self._pending = job
+                self._timer = threading.Timer(self.max_wait_seconds, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+            else:
+                self._pending.absorb(job)
+                if self._pending.frames >= self.target_frames:
+                    self._take_pending(ready)
+            # Submit while holding the lock so a timer flush can't reorder jobs
+            for item in ready:
+                self.submit_fn(item)
+
+    def flush(self) -> None:
+        ready: List[SegmentJob] = []
+        with self._lock:
+            self._take_pending(ready)
+            for item in ready:
+                self.submit_fn(item)
+
+    def _take_pending(self, ready: List[SegmentJob]) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._pending is not None:
+            ready.append(self._pending)
+            self._pending = None
+
+
+def coalesce_ranges(
+    ranges: List[Tuple[int, int]],
+    sample_rate: int,
+    *,
+    target_seconds: float = DEFAULT_COALESCE_TARGET_SECONDS,
+    short_seconds: float = DEFAULT_COALESCE_SHORT_SECONDS,
+    max_gap_seconds: float = DEFAULT_COALESCE_MAX_GAP_SECONDS,
+) -> List[Tuple[int, int, int]]:
+    """Group adjacent short (start, end) sample ranges of one file.
+
+    Returns (start, end, count) spans: neighbours are joined when both are short,
+    the silence between them is at most max_gap_seconds and the whole span stays
+    within target_seconds. Spans cover the original audio, so timing is preserved.
+    """
+    target = int(float(target_seconds) * sample_rate)
+    short = int(float(short_seconds) * sample_rate)
+    max_gap = int(float(max_gap_seconds) * sample_rate)
+    spans: List[Tuple[int, int, int]] = []
+    for start, end in ranges:
+        if spans:
+            prev_start, prev_end, count = spans[-1]
+            if (
+                end - start < short
+                and (prev_end - prev_start < short or count > 1)
+                and start - prev_end <= max_gap
+                and end - prev_start <= target
+            ):
+                spans[-1] = (prev_start, end, count + 1)
+                continue
+        spans.append((start, end, 1))
+    return spans
@@ -0,0 +1,350 @@
+"""
+Sampling profiler for the running service.
+A daemon thread wakes every interval, reads every thread's Python stack
+(sys._current_frames) and counts identical stacks per thread. Nothing is
+installed in the profiled threads (no settrace/setprofile), so the overhead is
+one stack walk per thread per sample and it can stay on in production.
+
+Outputs, written on stop:
+    <name>.folded            collapsed stacks ("thread;outer;...;inner count"),
+                             for flamegraph.pl, speedscope, inferno
+    <name>.speedscope.json   one sampled profile per thread (https://www.speedscope.app)
+
+Per thread the summary reports CPU seconds (pthread CPU clocks on Linux/macOS,
+GetThreadTimes on Windows; null elsewhere, see thread_cpu_clock in the
+summary) and a GIL wait estimate: a thread that used a fair share
+of CPU during a ~100 ms window was runnable for that window, so the part of
+it spent off CPU was mostly spent waiting for the GIL (short blocking calls
+inside such windows count too, so this is an upper bound). The
+sampler's own wake-up lag is a process-wide estimate: it needs the GIL to
+take a sample, so lag beyond the timer's jitter is time spent waiting for it.
+
+The audio callback runs on PortAudio's thread, which only shows Python frames
+while the callback executes; it is reported as "audio-callback".
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+DEFAULT_INTERVAL_SECONDS = 0.005
+DEFAULT_MAX_SECONDS = 300.0  # A forgotten profile stops itself
+MAX_STACK_DEPTH = 128
+
+# A thread that used at least this share of a window's wall time on CPU counts
+# as runnable for the whole window (see the GIL wait estimate above); windows
+# span several GIL switch intervals (5 ms) so contending threads all get CPU
+GIL_WINDOW_SECONDS = 0.1
+RUNNABLE_CPU_SHARE = 0.1
+
+# Threads whose stack contains this function are named after it
+CALLBACK_FUNCTIONS = {'audio_callback': 'audio-callback'}
+
+Frame = Tuple[str, str, int]  # (function, file, first line)
+
+
+class _PthreadCpuClock:
+    """Thread CPU seconds from the thread's POSIX CPU-time clock."""
+
+    def __init__(self, clock_id: int):
+        self._clock_id = clock_id
+
+    def read(self) -> float:
+        return time.clock_gettime(self._clock_id)
+
+    def close(self) -> None:
+        pass
+
+
+class _WindowsThreadTimes:
+    """Thread CPU seconds (kernel + user) from GetThreadTimes on a thread handle."""
+
+    THREAD_QUERY_LIMITED_INFORMATION = 0x0800
+
+    def __init__(self, native_id: int):
+        import ctypes
+        from ctypes import wintypes
+
+        self._ctypes = ctypes
+        self._kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+        self._kernel32.OpenThread.restype = wintypes.HANDLE
+        self._kernel32.OpenThread.argtypes = (wintypes.DWORD, wintypes.BOOL, wintypes.DWORD)
+        self._kernel32.GetThreadTimes.argtypes = (wintypes.HANDLE,) + (ctypes.POINTER(wintypes.FILETIME),) * 4
+        self._kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+        self._times = [wintypes.FILETIME() for _ in range(4)]  # creation, exit, kernel, user
+        self._handle = self._kernel32.OpenThread(self.THREAD_QUERY_LIMITED_INFORMATION, False, native_id)
+        if not self._handle:
+            raise OSError(ctypes.get_last_error(), 'OpenThread failed')
+
+    def read(self) -> float:
+        ctypes = self._ctypes
+        if not self._kernel32.GetThreadTimes(self._handle, *(ctypes.byref(t) for t in self._times)):
+            raise OSError(ctypes.get_last_error(), 'GetThreadTimes failed')
+        kernel, user = self._times[2], self._times[3]
+        ticks = ((kernel.dwHighDateTime << 32) | kernel.dwLowDateTime) + ((user.dwHighDateTime << 32) | user.dwLowDateTime)
+        return ticks / 1e7  # 100 ns units
+
+    def close(self) -> None:
+        if self._handle:
+            self._kernel32.CloseHandle(self._handle)
+            self._handle = None
+
+
+def thread_cpu_clock_kind() -> Optional[str]:
+    """Per-thread CPU source on this platform, None when there is none."""
+    if hasattr(time, 'pthread_getcpuclockid'):
+        return 'pthread'
+    if sys.platform == 'win32':
+        return 'GetThreadTimes'
+    return None
+
+
+def _thread_cpu_clock(ident: int, native_id: Optional[int]):
+    """Reader of a thread's CPU seconds, None where unavailable."""
+    try:
+        getter = getattr(time, 'pthread_getcpuclockid', None)
+        if getter is not None:
+            return _PthreadCpuClock(getter(ident))
+        if sys.platform == 'win32' and native_id:
+            return _WindowsThreadTimes(native_id)
+    except (OSError, OverflowError, ValueError, AttributeError):
+        pass
+    return None
+
+
+class _ThreadProfile:
+    __slots__ = ('name', 'stacks', 'samples', 'gil_wait', 'window_at', 'window_cpu', 'clock', 'cpu_start', 'cpu_last', 'cpu_end')
+
+    def __init__(self, name: str, clock):
+        self.name = name
+        self.stacks: Dict[Tuple[Frame, ...], int] = {}
+        self.samples = 0
+        self.gil_wait = 0.0
+        self.clock = clock
+        self.cpu_start = self.cpu_end = self._cpu()
+        self.window_at = time.perf_counter()
+        self.window_cpu = self.cpu_start
+
+    def _cpu(self) -> Optional[float]:
+        if self.clock is None:
+            return None
+        try:
+            return self.clock.read()
+        except OSError:  # Thread exited
+            self.clock.close()
+            self.clock = None
+            return None
+
+
+class StackSampler:
+    """Samples all threads until stop(); not restartable (create a new one per profile)."""
+
+    def __init__(
+        self,
+        interval: float = DEFAULT_INTERVAL_SECONDS,
+        max_seconds: float = DEFAULT_MAX_SECONDS,
+        log: Optional[Callable[[str, str], None]] = None,
+    ):
+        self.interval = max(0.001, float(interval))
+        self.max_seconds = float(max_seconds) if max_seconds and max_seconds > 0 else DEFAULT_MAX_SECONDS
+        self._log = log or (lambda level, message: None)
+        self._threads: Dict[int, _ThreadProfile] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lags: List[float] = []
+        self.started_at = 0.0
+        self.stopped_at = 0.0
+        self._process_cpu_start = 0.0
+        self._process_cpu_end = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self._thread is not None:
+            raise RuntimeError('StackSampler cannot be restarted')
+        self.started_at = time.perf_counter()
+        self._process_cpu_start = time.process_time()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5)
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        next_at = time.perf_counter()
+        deadline = self.started_at + self.max_seconds
+        while not self._stop.is_set():
+            now = time.perf_counter()
+            if now >= deadline:
+                self._log("warning", f"Profiler stopped after its {self.max_seconds:.0f}s limit")
+                break
+            self._lags.append(max(0.0, now - next_at))
+            try:
+                self._sample(own)
+            except Exception as e:
+                self._log("warning", f"Profiler sample failed: {e}")
+            next_at += self.interval
+            delay = next_at - time.perf_counter()
+            if delay < 0:
+                next_at = time.perf_counter()  # Fell behind; don't burst to catch up
+            else:
+                self._stop.wait(delay)
+        self.stopped_at = time.perf_counter()
+        self._process_cpu_end = time.process_time()
+        for profile in self._threads.values():
+            cpu = profile._cpu()
+            if cpu is not None:
+                profile.cpu_end = cpu
+            if profile.clock is not None:
+                profile.clock.close()
+                profile.clock = None
+
+    def _sample(self, own: int) -> None:
+        frames = sys._current_frames()
+        now = time.perf_counter()
+        threads = {thread.ident: thread for thread in threading.enumerate()}
+        for ident, frame in frames.items():
+            if ident == own:
+                continue
+            stack: List[Frame] = []
+            while frame is not None and len(stack) < MAX_STACK_DEPTH:
+                code = frame.f_code
+                stack.append((code.co_name, code.co_filename, code.co_firstlineno))
+                frame = frame.f_back
+            stack.reverse()
+            profile = self._threads.get(ident)
+            if profile is None:
+                thread = threads.get(ident)
+                name = thread.name if thread is not None else f"thread-{ident}"
+                native_id = getattr(thread, 'native_id', None)
+                profile = self._threads[ident] = _ThreadProfile(name, _thread_cpu_clock(ident, native_id))
+            if profile.name.startswith(('Dummy-', 'thread-')):
+                # PortAudio's thread has no Python name; name it after the callback it runs
+                for function, _, _ in stack:
+                    label = CALLBACK_FUNCTIONS.get(function)
+                    if label is not None:
+                        profile.name = label
+                        break
+            key = tuple(stack)
+            profile.stacks[key] = profile.stacks.get(key, 0) + 1
+            profile.samples += 1
+            cpu = profile._cpu()
+            if cpu is not None:
+                profile.cpu_end = cpu
+                elapsed = now - profile.window_at
+                if elapsed >= GIL_WINDOW_SECONDS:
+                    used = cpu - profile.window_cpu
+                    if used >= elapsed * RUNNABLE_CPU_SHARE:
+                        profile.gil_wait += max(0.0, elapsed - used)
+                    profile.window_at = now
+                    profile.window_cpu = cpu
+
+    # ---- results ----
+
+    def summary(self) -> Dict[str, Any]:
+        wall = max(1e-9, (self.stopped_at or time.perf_counter()) - self.started_at)
+        lags = sorted(self._lags)
+        threads = []
+        for ident, profile in self._threads.items():
+            cpu = None
+            if profile.cpu_start is not None and profile.cpu_end is not None:
+                cpu = profile.cpu_end - profile.cpu_start
+            threads.append({
+                'name': profile.name,
+                'ident': ident,
+                'samples': profile.samples,
+                'cpu_seconds': round(cpu, 3) if cpu is not None else None,
+                'cpu_share': round(cpu / wall, 3) if cpu is not None else None,
+                'gil_wait_seconds': round(profile.gil_wait, 3) if profile.cpu_start is not None else None,
+                'gil_wait_share': round(profile.gil_wait / wall, 3) if profile.cpu_start is not None else None,
+            })
+        threads.sort(key=lambda item: item['samples'], reverse=True)
+        return {
+            'wall_seconds': round(wall, 3),
+            'interval_ms': round(self.interval * 1000.0, 2),
+            'samples': len(lags),
+            'thread_cpu_clock': thread_cpu_clock_kind(),  # None: cpu_seconds/gil_wait_* are null on this platform
+            'process_cpu_seconds': round((self._process_cpu_end or time.process_time()) - self._process_cpu_start, 3),
+            'sampler_lag_ms': {
+                'p50': round(lags[len(lags) // 2] * 1000.0, 2) if lags else None,
+                'p99': round(lags[min(len(lags) - 1, int(len(lags) * 0.99))] * 1000.0, 2) if lags else None,
+                'max': round(lags[-1] * 1000.0, 2) if lags else None,
+            },
+            'threads': threads,
+        }
+
+    def write_collapsed(self, path: str) -> None:
+        with open(path, 'w', encoding='utf-8') as f:
+            for profile in self._threads.values():
+                thread = profile.name.replace(';', ':').replace(' ', '_')
+                for stack, count in sorted(profile.stacks.items(), key=lambda item: item[1], reverse=True):
+                    names = ';'.join(_frame_label(frame).replace(';', ':') for frame in stack)
+                    f.write(f"{thread};{names} {count}\n" if names else f"{thread} {count}\n")
+
+    def write_speedscope(self, path: str, name: str = 'transcribe_service') -> None:
+        frames: List[Dict[str, Any]] = []
+        index: Dict[Frame, int] = {}
+        profiles = []
+        for profile in self._threads.values():
+            samples = []
+            weights = []
+            for stack, count in profile.stacks.items():
+                sample = []
+                for frame in stack:
+                    position = index.get(frame)
+                    if position is None:
+                        position = index[frame] = len(frames)
+                        frames.append({'name': frame[0], 'file': frame[1], 'line': frame[2]})
+                    sample.append(position)
+                samples.append(sample)
+                weights.append(count * self.interval)
+            profiles.append({
+                'type': 'sampled',
+                'name': profile.name,
+                'unit': 'seconds',
+                'startValue': 0,
+                'endValue': sum(weights),
+                'samples': samples,
+                'weights': weights,
+            })
+        document = {
+            '$schema': 'https://www.speedscope.app/file-format-schema.json',
+            'name': name,
+            'exporter': 'stack_sampler',
+            'activeProfileIndex': 0,
+            'shared': {'frames': frames},
+            'profiles': profiles,
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(document, f)
+
+    def write(self, directory: str, basename: str, formats=('collapsed', 'speedscope')) -> List[str]:
+        """Write the requested formats into directory; returns the paths."""
+        os.makedirs(directory, exist_ok=True)
+        paths = []
+        if 'collapsed' in formats:
+            path = os.path.join(directory, f"{basename}.folded")
+            self.write_collapsed(path)
+            paths.append(path)
+        if 'speedscope' in formats:
+            path = os.path.join(directory, f"{basename}.speedscope.json")
+            self.write_speedscope(path, basename)
+            paths.append(path)
+        return paths
+
+
+def _frame_label(frame: Frame) -> str:
+    function, filename, line = frame
+    return f"{function} ({os.path.basename(filename)}:{line})"
@@ -0,0 +1,256 @@
+"""
+Streaming result exporters (TXT, SRT, WebVTT, JSON) for media transcription.
+Segments finish out of order on worker threads; OrderedResultSink releases
+them to the writers in order as soon as the next expected segment is done, so
+output reaches disk incrementally and only the out-of-order window is held.
+Writers stream into <path>.part and replace the output only when the run
+succeeds (close(commit=True)), so a failed run leaves an existing file intact
+and never leaves a partial one under the final name.
+
+Result entries are dicts with: order, start, end (seconds), transcription,
+translation and optionally words ([{'text', 'start', 'end'}], absolute seconds).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+EXPORT_FORMATS = ('txt', 'srt', 'vtt', 'json')
+
+# Cue shaping when splitting a segment on word timestamps
+MAX_CUE_CHARS = 84
+MAX_CUE_SECONDS = 6.0
+
+
+def format_timestamp(seconds: Optional[float], separator: str = ',') -> str:
+    """HH:MM:SS<sep>mmm (',' for SRT, '.' for WebVTT)."""
+    total_ms = max(0, int(round(float(seconds or 0.0) * 1000.0)))
+    hours, rem = divmod(total_ms, 3600000)
+    minutes, rem = divmod(rem, 60000)
+    secs, millis = divmod(rem, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}{separator}{millis:03d}"
+
+
+def _join_words(words: List[Dict[str, Any]]) -> str:
+    text = ''
+    for word in words:
+        token = str(word.get('text') or '').strip()
+        if not token:
+            continue
+        # CJK words come without spaces; latin words need them
+        if text and not ('\u3000' <= token[0] <= '\u9fff' or '\uac00' <= token[0] <= '\ud7af'):
+            text += ' '
+        text += token
+    return text
+
+
+def build_cues(entry: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Split an entry into subtitle cues.
+
+    Entries with word timings and no translation are split into readable cues;
+    translated entries stay one bilingual cue, since the translation cannot be
+    aligned to individual words.
+    """
+    start = float(entry.get('start') or 0.0)
+    end = float(entry.get('end') or start)
+    transcription = (entry.get('transcription') or '').strip()
+    translation = (entry.get('translation') or '').strip()
+    words = entry.get('words') or []
+    if translation or not words:
+        lines = [line for line in (transcription, translation) if line]
+        return [{'start': start, 'end': end, 'text': '\n'.join(lines)}] if lines else []
+
+    cues: List[Dict[str, Any]] = []
+    current: List[Dict[str, Any]] = []
+    for word in words:
+        if current:
+            candidate = _join_words(current + [word])
+            if len(candidate) > MAX_CUE_CHARS or float(word['end']) - float(current[0]['start']) > MAX_CUE_SECONDS:
+                cues.append({'start': float(current[0]['start']), 'end': float(current[-1]['end']), 'text': _join_words(current)})
+                current = []
+        current.append(word)
+    if current:
+        cues.append({'start': float(current[0]['start']), 'end': float(current[-1]['end']), 'text': _join_words(current)})
+    return [cue for cue in cues if cue['text']]
+
+
+class ResultWriter:
+    """Base streaming writer; subclasses render one entry at a time."""
+
+    def __init__(self, path: str):
+        directory = os.path.dirname(os.path.abspath(path))
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.part_path = path + '.part'
+        self._file = open(self.part_path, 'w', encoding='utf-8', newline='\n')
+        self.count = 0
+        self.write_header()
+
+    def write_header(self) -> None:
+        pass
+
+    def write_footer(self) -> None:
+        pass
+
+    def write(self, entry: Dict[str, Any]) -> None:
+        self.render(entry)
+        self.count += 1
+        self._file.flush()
+
+    def render(self, entry: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    def close(self, commit: bool = True) -> None:
+        """Finish the file and move it to path (commit) or delete the partial file."""
+        if self._file.closed:
+            return
+        try:
+            if commit:
+                self.write_footer()
+        finally:
+            self._file.close()
+            if commit:
+                os.replace(self.part_path, self.path)
+            else:
+                try:
+                    os.remove(self.part_path)
+                except OSError:
+                    pass
+
+
+class TxtResultWriter(ResultWriter):
+    """Same layout as MediaProcessor.export_to_txt (parsed back by the Electron UI)."""
+
+    def write_header(self) -> None:
+        self._file.write("媒体转写翻译结果\n")
+        self._file.write(f"生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        self._file.write("=" * 50 + "\n\n")
+
+    def render(self, entry: Dict[str, Any]) -> None:
+        self._file.write(f"段落 {entry['order']}:\n")
+        self._file.write(f"原文: {entry['transcription']}\n")
+        if entry.get('translation'):
+            self._file.write(f"翻译: {entry['translation']}\n")
+        self._file.write("\n")
+
+
+class SrtResultWriter(ResultWriter):
+    def __init__(self, path: str):
+        self.cue_index = 0
+        super().__init__(path)
+
+    def render(self, entry: Dict[str, Any]) -> None:
+        for cue in build_cues(entry):
+            self.cue_index += 1
+            self._file.write(f"{self.cue_index}\n")
+            self._file.write(f"{format_timestamp(cue['start'])} --> {format_timestamp(cue['end'])}\n")
+            self._file.write(f"{cue['text']}\n\n")
+
+
+class VttResultWriter(ResultWriter):
+    def write_header(self) -> None:
+        self._file.write("WEBVTT\n\n")
+
+    def render(self, entry: Dict[str, Any]) -> None:
+        for cue in build_cues(entry):
+            self._file.write(f"{format_timestamp(cue['start'], '.')} --> {format_timestamp(cue['end'], '.')}\n")
+            # A blank line would end the cue early
+            self._file.write(cue['text'].replace('\n\n', '\n') + "\n\n")
+
+
+class JsonResultWriter(ResultWriter):
+    """Writes a JSON array incrementally: '[', one object per entry, ']' on close."""
+
+    def write_header(self) -> None:
+        self._file.write("[")
+
+    def render(self, entry: Dict[str, Any]) -> None:
+        item = {
+            'order': entry.get('order'),
+            'start': round(float(entry.get('start') or 0.0), 3),
+            'end': round(float(entry.get('end') or 0.0), 3),
+            'transcription': entry.get('transcription') or '',
+            'translation': entry.get('translation') or '',
+            'words': [
+                {'text': w.get('text'), 'start': round(float(w['start']), 3), 'end': round(float(w['end']), 3)}
+                for w in (entry.get('words') or [])
+            ],
+        }
+        self._file.write(("," if self.count else "") + "\n  " + json.dumps(item, ensure_ascii=False))
+
+    def write_footer(self) -> None:
+        self._file.write("\n]\n")
+
+
+_WRITERS = {
+    'txt': TxtResultWriter,
+    'srt': SrtResultWriter,
+    'vtt': VttResultWriter,
+    'json': JsonResultWriter,
+}
+
+
+def open_writer(fmt: str, path: str) -> ResultWriter:
+    cls = _WRITERS.get((fmt or '').lower())
+    if cls is None:
+        raise ValueError(f"Unsupported export format: {fmt}")
+    return cls(path)
+
+
+def output_paths(output: str, formats: List[str]) -> Dict[str, str]:
+    """First format writes to output as given; others use the same base name with their extension."""
+    base, _ = os.path.splitext(output)
+    paths: Dict[str, str] = {}
+    for index, fmt in enumerate(formats):
+        paths[fmt] = output if index == 0 else f"{base}.{fmt}"
+    return paths
+
+
+class OrderedResultSink:
+    """Releases completed entries to writers strictly in order.
+
+    push(order, entry) is called once per order; entry None marks a segment
+    that produced nothing to export (failed or filtered) so later ones flow.
+    """
+
+    def __init__(self, writers: List[ResultWriter], first_order: int = 1):
+        self.writers = writers
+        self._next = first_order
+        self._pending: Dict[int, Optional[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def push(self, order: int, entry: Optional[Dict[str, Any]]) -> None:
+        with self._lock:
+            self._pending[order] = entry
+            while self._next in self._pending:
+                ready = self._pending.pop(self._next)
+                self._next += 1
+                if ready is None:
+                    continue
+                for writer in self.writers:
+                    writer.write(ready)
+
+    @property
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def close(self, commit: bool = True) -> None:
+        """Flush whatever is left (out of order gaps are skipped) and close writers.
+
+        commit=False (failed run) discards the writers' partial files instead.
+        """
+        with self._lock:
+            for order in sorted(self._pending):
+                ready = self._pending[order]
+                if ready is not None:
+                    for writer in self.writers:
+                        writer.write(ready)
+            self._pending.clear()
+        for writer in self.writers:
+            writer.close(commit)
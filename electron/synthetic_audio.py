@@ -0,0 +1,128 @@
+"""
+Synthetic audio for benchmarks and headless runs.
+Generators return mono float32 arrays in [-1, 1]. "Speech" is a voiced
+harmonic source (jittered pitch, a few formant-like partials) modulated at a
+syllabic rate, which is enough to drive RMS voice activity detection and
+provider upload sizes the way real speech does; it is not intelligible.
+
+Everything is seeded, so the same arguments always produce the same samples.
+"""
+
+from __future__ import annotations
+
+import wave
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+SPEECH_LEVEL = 0.12     # RMS of voiced audio, well above the default 0.010 silence threshold
+NOISE_LEVEL = 0.002     # Background floor between bursts, below the threshold
+
+
+def _voiced(frames: int, sample_rate: int, rng: np.random.Generator) -> np.ndarray:
+    """Voiced speech-like signal: gliding pitch, 5 partials, ~4 Hz syllable envelope."""
+    if frames <= 0:
+        return np.zeros(0, dtype=np.float32)
+    t = np.arange(frames, dtype=np.float64) / sample_rate
+    base = rng.uniform(100.0, 220.0)
+    glide = base * (1.0 + 0.08 * np.sin(2 * np.pi * rng.uniform(0.3, 0.8) * t + rng.uniform(0, 2 * np.pi)))
+    phase = 2 * np.pi * np.cumsum(glide) / sample_rate
+    signal = np.zeros(frames, dtype=np.float64)
+    for harmonic, weight in ((1, 1.0), (2, 0.6), (3, 0.45), (5, 0.25), (8, 0.12)):
+        signal += weight * np.sin(harmonic * phase)
+    syllables = 0.55 + 0.45 * np.abs(np.sin(np.pi * rng.uniform(3.0, 5.0) * t + rng.uniform(0, np.pi)))
+    signal *= syllables
+    signal += 0.05 * rng.standard_normal(frames)  # breath/fricative noise
+    rms = float(np.sqrt(np.mean(np.square(signal)))) or 1.0
+    return (signal * (SPEECH_LEVEL / rms)).astype(np.float32)
+
+
+def silence(seconds: float, sample_rate: int, *, level: float = NOISE_LEVEL, seed: int = 0) -> np.ndarray:
+    """Low background noise (not digital zero, like a real microphone)."""
+    rng = np.random.default_rng(seed)
+    return (level * rng.standard_normal(int(seconds * sample_rate))).astype(np.float32)
+
+
+def noise(seconds: float, sample_rate: int, *, level: float = 0.05, seed: int = 0) -> np.ndarray:
+    """White noise at the given RMS; above the silence threshold, so it segments like speech."""
+    rng = np.random.default_rng(seed)
+    return (level * rng.standard_normal(int(seconds * sample_rate))).clip(-1.0, 1.0).astype(np.float32)
+
+
+def continuous_speech(seconds: float, sample_rate: int, *, seed: int = 0) -> np.ndarray:
+    """Speech without pauses long enough to split (only max-length cuts apply)."""
+    rng = np.random.default_rng(seed)
+    pieces: List[np.ndarray] = []
+    remaining = int(seconds * sample_rate)
+    while remaining > 0:
+        frames = min(remaining, int(rng.uniform(1.5, 4.0) * sample_rate))
+        pieces.append(_voiced(frames, sample_rate, rng))
+        remaining -= frames
+    return np.concatenate(pieces) if pieces else np.zeros(0, dtype=np.float32)
+
+
+def speech_bursts(
+    seconds: float,
+    sample_rate: int,
+    *,
+    burst: Tuple[float, float] = (1.0, 6.0),
+    gap: Tuple[float, float] = (1.2, 2.5),
+    seed: int = 0,
+) -> np.ndarray:
+    """Utterances of `burst` seconds separated by `gap` seconds of background noise.
+
+    Gaps default to longer than the 1 s split threshold, so each burst becomes one segment.
+    """
+    rng = np.random.default_rng(seed)
+    total = int(seconds * sample_rate)
+    out = (NOISE_LEVEL * rng.standard_normal(total)).astype(np.float32)
+    pos = int(rng.uniform(*gap) * sample_rate)
+    while pos < total:
+        frames = min(total - pos, int(rng.uniform(*burst) * sample_rate))
+        out[pos:pos + frames] += _voiced(frames, sample_rate, rng)
+        pos += frames + int(rng.uniform(*gap) * sample_rate)
+    return out
+
+
+GENERATORS: Dict[str, Callable[..., np.ndarray]] = {
+    'bursts': speech_bursts,
+    'continuous': continuous_speech,
+    'noise': noise,
+    'silence': silence,
+}
+
+
+def generate(kind: str, seconds: float, sample_rate: int, *, seed: int = 0) -> np.ndarray:
+    """Generator by name ('bursts', 'continuous', 'noise', 'silence')."""
+    try:
+        generator = GENERATORS[kind]
+    except KeyError:
+        raise ValueError(f"Unknown synthetic audio kind: {kind} (expected one of {', '.join(GENERATORS)})") from None
+    return generator(seconds, sample_rate, seed=seed)
+
+
+def write_wav(path: str, audio: np.ndarray, sample_rate: int) -> None:
+    """Write mono 16-bit PCM (stdlib wave, no soundfile needed)."""
+    pcm = (np.clip(audio, -1.0, 1.0) * 32767.0).astype('<i2')
+    with wave.open(path, 'wb') as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(int(sample_rate))
+        f.writeframes(pcm.tobytes())
+
+
+def read_wav(path: str, channels: Optional[int] = None) -> Tuple[np.ndarray, int]:
+    """Read 16-bit PCM WAV as float32 (frames, channels); channels downmixes/keeps the first N."""
+    with wave.open(path, 'rb') as f:
+        if f.getsampwidth() != 2:
+            raise ValueError(f"{path}: only 16-bit PCM WAV is supported")
+        count = f.getnchannels()
+        sample_rate = f.getframerate()
+        data = np.frombuffer(f.readframes(f.getnframes()), dtype='<i2')
+    audio = (data.astype(np.float32) / 32768.0).reshape(-1, count)
+    if channels == 1 and count > 1:
+        audio = audio.mean(axis=1, keepdims=True)
+    elif channels is not None and channels < count:
+        audio = audio[:, :channels]
+    return audio, sample_rate
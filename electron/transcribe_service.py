@@ -14,10 +14,10 @@ import re
 import queue
 import uuid
 import math
+import importlib
 from datetime import datetime
-import sounddevice as sd
-import soundfile as sf
-import numpy as np
+
+SERVICE_IMPORT_STARTED = time.perf_counter()
 
 # Set standard output encoding to UTF-8
 def setup_console_encoding():
@@ -46,165 +46,81 @@ def setup_console_encoding():
 # Set encoding on module import
 setup_console_encoding()
 
-import modles
-
-# Script classification for smart translation
-LANGUAGE_SCRIPT_MAP = {
-    'arabic': {'arabic'},
-    'bengali': {'bengali'},
-    'chinese': {'han'},
-    'czech': {'latin'},
-    'danish': {'latin'},
-    'dutch': {'latin'},
-    'english': {'latin'},
-    'finnish': {'latin'},
-    'french': {'latin'},
-    'german': {'latin'},
-    'greek': {'greek'},
-    'gujarati': {'gujarati'},
-    'hebrew': {'hebrew'},
-    'hindi': {'devanagari'},
-    'hungarian': {'latin'},
-    'icelandic': {'latin'},
-    'indonesian': {'latin'},
-    'italian': {'latin'},
-    'japanese': {'han', 'hiragana', 'katakana'},
-    'kannada': {'kannada'},
-    'korean': {'hangul'},
-    'malay': {'latin'},
-    'malayalam': {'malayalam'},
-    'norwegian': {'latin'},
-    'persian': {'arabic'},
-    'polish': {'latin'},
-    'portuguese': {'latin'},
-    'punjabi': {'gurmukhi'},
-    'romanian': {'latin'},
-    'russian': {'cyrillic'},
-    'simplified chinese': {'han'},
-    'spanish': {'latin'},
-    'swedish': {'latin'},
-    'tamil': {'tamil'},
-    'telugu': {'telugu'},
-    'thai': {'thai'},
-    'traditional chinese': {'han'},
-    'turkish': {'latin'},
-    'ukrainian': {'cyrillic'},
-    'urdu': {'arabic'},
-    'vietnamese': {'latin'},
-    'zh': {'han'}
-}
-
-def normalize_language_name(name):
-    if not isinstance(name, str):
-        return ''
-    return name.strip().lower()
-
-def language_scripts(name):
-    normalized = normalize_language_name(name)
-    if not normalized:
-        return {'latin'}
-    if normalized in LANGUAGE_SCRIPT_MAP:
-        return LANGUAGE_SCRIPT_MAP[normalized]
-    return {'latin'}
-
-def classify_script(char):
-    codepoint = ord(char)
-    if 0x3400 <= codepoint <= 0x4DBF or 0x4E00 <= codepoint <= 0x9FFF or 0xF900 <= codepoint <= 0xFAFF or 0x20000 <= codepoint <= 0x2CEAF:
-        return 'han'
-    if 0x3040 <= codepoint <= 0x309F:
-        return 'hiragana'
-    if 0x30A0 <= codepoint <= 0x30FF or 0xFF66 <= codepoint <= 0xFF9D:
-        return 'katakana'
-    if 0xAC00 <= codepoint <= 0xD7AF or 0x1100 <= codepoint <= 0x11FF or 0x3130 <= codepoint <= 0x318F:
-        return 'hangul'
-    if 0x0400 <= codepoint <= 0x052F or 0x2DE0 <= codepoint <= 0x2DFF or 0xA640 <= codepoint <= 0xA69F:
-        return 'cyrillic'
-    if 0x0370 <= codepoint <= 0x03FF or 0x1F00 <= codepoint <= 0x1FFF:
-        return 'greek'
-    if 0x0590 <= codepoint <= 0x05FF or 0xFB1D <= codepoint <= 0xFB4F:
-        return 'hebrew'
-    if 0x0600 <= codepoint <= 0x06FF or 0x0750 <= codepoint <= 0x077F or 0x08A0 <= codepoint <= 0x08FF or 0xFB50 <= codepoint <= 0xFDFF or 0xFE70 <= codepoint <= 0xFEFF:
-        return 'arabic'
-    if 0x0900 <= codepoint <= 0x097F:
-        return 'devanagari'
-    if 0x0980 <= codepoint <= 0x09FF:
-        return 'bengali'
-    if 0x0A00 <= codepoint <= 0x0A7F:
-        return 'gurmukhi'
-    if 0x0A80 <= codepoint <= 0x0AFF:
-        return 'gujarati'
-    if 0x0B80 <= codepoint <= 0x0BFF:
-        return 'tamil'
-    if 0x0C00 <= codepoint <= 0x0C7F:
-        return 'telugu'
-    if 0x0C80 <= codepoint <= 0x0CFF:
-        return 'kannada'
-    if 0x0D00 <= codepoint <= 0x0D7F:
-        return 'malayalam'
-    if 0x0E00 <= codepoint <= 0x0E7F:
-        return 'thai'
-    if 0x1780 <= codepoint <= 0x17FF:
-        return 'khmer'
-    if 0x0100 <= codepoint <= 0x024F or 0x00C0 <= codepoint <= 0x00FF or 0x0000 <= codepoint <= 0x007F:
-        return 'latin'
-    return 'other'
-
-def detect_language_by_charset(text, language1, language2):
-    if not text or not text.strip():
-        return None
-
-    lang1_scripts = language_scripts(language1)
-    lang2_scripts = language_scripts(language2)
-
-    score1 = 0
-    score2 = 0
-    ascii_letters = 0
+import asr_filter
+import callback_telemetry
+import latency_metrics
+import level_meter
+import provider_routing
+import provider_warmup
 
-    for char in text:
-        if not char or char.isspace():
-            continue
 
-        script = classify_script(char)
-        if script in lang1_scripts and script not in lang2_scripts:
-            score1 += 1
-            continue
-        if script in lang2_scripts and script not in lang1_scripts:
-            score2 += 1
-            continue
-        if script in lang1_scripts and script in lang2_scripts:
-            score1 += 1
-            score2 += 1
-            continue
-        if script == 'latin' and char.isalpha():
-            ascii_letters += 1
+class _LazyModule:
+    """Stand-in for a module that is imported on first attribute access.
 
-    if score1 == 0 and score2 == 0 and ascii_letters:
-        if 'latin' in lang1_scripts and 'latin' not in lang2_scripts:
-            score1 = ascii_letters
-        elif 'latin' in lang2_scripts and 'latin' not in lang1_scripts:
-            score2 = ascii_letters
+    The first access rebinds the module-level name to the real module, so
+    later lookups (including in the audio callback) cost nothing extra.
+    Startup profile: python -X importtime transcribe_service.py < /dev/null
+    """
 
-    if score1 > score2:
-        return normalize_language_name(language1)
-    if score2 > score1:
-        return normalize_language_name(language2)
+    def __init__(self, module_name, alias):
+        self._module_name = module_name
+        self._alias = alias
+
+    def _load(self):
+        module = importlib.import_module(self._module_name)
+        globals()[self._alias] = module
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __repr__(self):
+        return f"<lazy module {self._module_name!r}>"
+
+
+# Deferred so the ready message goes out before NumPy, PortAudio/libsndfile and
+# the provider layer load (together they dominated time-to-ready)
+np = _LazyModule('numpy', 'np')
+sd = _LazyModule('sounddevice', 'sd')
+sf = _LazyModule('soundfile', 'sf')
+modles = _LazyModule('modles', 'modles')
+segment_executor = _LazyModule('segment_executor', 'segment_executor')
+audio_capture = _LazyModule('audio_capture', 'audio_capture')
+capture_graph = _LazyModule('capture_graph', 'capture_graph')
+resampler = _LazyModule('resampler', 'resampler')
+language_id = _LazyModule('language_id', 'language_id')  # Script + trigram language hints for smart translation
+audio_replay = _LazyModule('audio_replay', 'audio_replay')  # File/synthetic input instead of a device
+stack_sampler = _LazyModule('stack_sampler', 'stack_sampler')  # Only loaded by profile_start
+
+# Loaded by the first start_recording (or earlier by the background preload)
+AUDIO_BACKEND_MODULES = ('np', 'sd', 'sf', 'resampler', 'audio_capture', 'capture_graph', 'segment_executor')
+# Replay needs the processing stack but not PortAudio
+REPLAY_MODULES = ('np', 'sf', 'resampler', 'segment_executor', 'audio_replay')
+# Loaded in the background right after the ready message
+PRELOAD_MODULES = ('modles', 'language_id')
 
-    return None
 # Configuration constants
-SAMPLE_RATE = 44100  # Fixed: use standard sampling rate
+SAMPLE_RATE = 44100  # Processing rate; capture runs at the device's native rate and is converted to this
 CHANNELS = 1
 DTYPE = 'float32'
 OUTPUT_DIR = 'recordings'
+DEVICE_CACHE_FILE = 'audio_devices.json'  # Negotiated capture formats, per input device
 
 # Auto-segmentation parameters
 MIN_SILENCE_SEC_FOR_SPLIT = 1.0
 SILENCE_RMS_THRESHOLD = 0.010
 PRE_ROLL_SECONDS = 1.0
+HOT_MIC_PREROLL_SECONDS = 0.5  # Audio kept from before start_voice_input in hot mic standby
 
 # Theater mode parameters
 THEATER_MODE_TARGET_RMS = 0.05  # Target RMS volume
 THEATER_MODE_MAX_GAIN = 10.0    # Maximum amplification factor
 
+# Latency metrics stream (metrics_interval_seconds overrides; 0 disables)
+METRICS_INTERVAL_SECONDS = 10.0
+# Audio callback timing/overflow stream while capturing (audio_stats_interval_seconds overrides; 0 disables)
+AUDIO_STATS_INTERVAL_SECONDS = 5.0
+
 # OpenAI configuration (defaults; can be overridden by config)
 OPENAI_TRANSCRIBE_MODEL = "gpt-4o-transcribe"
 OPENAI_TRANSLATE_MODEL = "gpt-4o-mini"
@@ -252,10 +168,9 @@ override_translate_language = None
 audio_lock = threading.Lock()
 segment_frames = 0
 silence_frames_contig = 0
-split_requested = False
 segment_index = 1
 segment_active = False
-new_segment_requested = False
+segment_handoff = queue.SimpleQueue()  # (chunks, seg_idx, source) from capture to recording_loop; None stops it
 pre_roll_chunks = []
 pre_roll_frames = 0
 
@@ -266,8 +181,30 @@ translation_worker_running = False
 translation_counter = 0  # Used to ensure translation order
 translation_next_expected = 1  # Worker starts expecting this order
 transcription_counter = 0  # Used to ensure transcription order/placeholders
+transcription_counter_lock = threading.Lock()
+segment_pool = None  # segment_executor.SegmentExecutor for the current recording session
+segment_coalescer = None  # segment_executor.SegmentCoalescer in front of segment_pool (optional)
 pending_translations = {}  # Store pending translation tasks {result_id: task_info}
-last_volume_emit = 0.0
+callback_events = queue.SimpleQueue()  # (kind, time.time(), payload) posted by audio_callback for the consumer thread
+audio_telemetry = callback_telemetry.CallbackTelemetry()  # Callback timing/overflow counters of the current window
+graph_telemetry = {}  # Source name -> CallbackTelemetry of the last capture graph (kept so its final window is reported)
+volume_meter = level_meter.VolumeMeter(log=lambda level, message: log_message(level, message))  # Runs while the UI subscribes
+volume_meter.set_silence_threshold(SILENCE_RMS_THRESHOLD)
+transcript_filter = asr_filter.TranscriptFilter()  # Post-ASR hallucination/duplicate filter (per session)
+capture_format = None  # audio_capture.CaptureFormat of the current recording
+capture_resampler = None  # resampler.StreamingResampler when the device rate differs from SAMPLE_RATE
+active_capture_graph = None  # capture_graph.CaptureGraph when recording several sources/channels
+active_replay = None  # audio_replay.ReplaySpec when the current recording reads a file/synthetic audio
+replay_cli_spec = None  # --replay: every recording replays this instead of opening the microphone
+replay_cli_options = {}  # --replay-speed / --replay-loop defaults for replay specs
+active_profiler = None  # stack_sampler.StackSampler between profile_start and profile_stop
+profiler_lock = threading.Lock()
+standby_stream = None  # Hot mic standby: input stream kept open between recordings
+standby_ring = None  # audio_capture.PreRollRing filled by the standby stream while idle
+standby_lock = threading.Lock()
+audio_backend_loaded = False  # Set once AUDIO_BACKEND_MODULES are imported
+audio_backend_lock = threading.Lock()
+capture_negotiator = None  # audio_capture.CaptureNegotiator, created with the audio backend
 
 
 def _sanitize_utf8_text(text):
@@ -375,31 +312,90 @@ def ensure_output_dir():
         os.makedirs(OUTPUT_DIR)
         log_message("info", f"Created recording directory: {OUTPUT_DIR}")
 
-def check_audio_device():
-    """Check if audio device is available"""
-    global SAMPLE_RATE
-    
+def _ensure_module(alias):
+    """Import a deferred module now (no-op once loaded)"""
+    value = globals()[alias]
+    if isinstance(value, _LazyModule):
+        value._load()
+
+
+def load_audio_backend():
+    """Import the capture stack on first use; returns False if it cannot be loaded"""
+    global audio_backend_loaded
+    if audio_backend_loaded:
+        return True
+    with audio_backend_lock:
+        if audio_backend_loaded:
+            return True
+        started = time.perf_counter()
+        try:
+            for alias in AUDIO_BACKEND_MODULES:
+                _ensure_module(alias)
+        except Exception as e:
+            log_message("error", f"Failed to load audio libraries: {e}")
+            return False
+        audio_backend_loaded = True
+        log_message("info", f"Audio libraries loaded in {(time.perf_counter() - started) * 1000:.0f} ms")
+        return True
+
+
+def load_replay_backend():
+    """Import what replay input needs (no sounddevice); returns False if it cannot be loaded"""
     try:
-        # Check default input device
-        device_info = sd.query_devices(kind='input')
-        log_message("info", f"Default input device: {device_info['name']}")
-        
-        # Check if sampling rate is supported
+        for alias in REPLAY_MODULES:
+            _ensure_module(alias)
+    except Exception as e:
+        log_message("error", f"Failed to load replay libraries: {e}")
+        return False
+    return True
+
+
+def get_capture_negotiator():
+    global capture_negotiator
+    if capture_negotiator is None:
+        with audio_backend_lock:
+            if capture_negotiator is None:
+                capture_negotiator = audio_capture.CaptureNegotiator(DEVICE_CACHE_FILE, CHANNELS, DTYPE, log=log_message)
+    return capture_negotiator
+
+
+def _background_preload():
+    """Warm everything the first request needs, after the ready message went out"""
+    started = time.perf_counter()
+    if load_audio_backend():
+        # Probe the input device's native rate; recording start only reads the cache
         try:
-            sd.check_input_settings(device=None, channels=CHANNELS, dtype=DTYPE, samplerate=SAMPLE_RATE)
-            log_message("info", f"Audio device supports sampling rate {SAMPLE_RATE}Hz")
-            return True
+            get_capture_negotiator().probe_async()
         except Exception as e:
-            log_message("warning", f"Sampling rate {SAMPLE_RATE}Hz not supported, trying 16000Hz: {e}")
-            # Try lower sampling rate
-            SAMPLE_RATE = 16000
-            sd.check_input_settings(device=None, channels=CHANNELS, dtype=DTYPE, samplerate=SAMPLE_RATE)
-            log_message("info", f"Using sampling rate {SAMPLE_RATE}Hz")
-            return True
-            
+            log_message("warning", f"Audio device probe not started: {e}")
+    for alias in PRELOAD_MODULES:
+        try:
+            _ensure_module(alias)
+        except Exception as e:
+            log_message("warning", f"Preloading {alias} failed: {e}")
+    try:
+        timings = modles.preload_provider_sdks()
+        loaded = ', '.join(f"{name} {seconds * 1000:.0f} ms" for name, seconds in timings.items() if seconds is not None)
+        log_message("info", f"Background preload finished in {(time.perf_counter() - started) * 1000:.0f} ms (SDKs: {loaded or 'none installed'})")
+    except Exception as e:
+        log_message("warning", f"Provider SDK preload failed: {e}")
+
+
+def start_background_preload():
+    thread = threading.Thread(target=_background_preload, name="preload", daemon=True)
+    thread.start()
+    return thread
+
+
+def check_audio_device():
+    """Resolve the capture format of the default input device (cached; no probing here)"""
+    try:
+        fmt = get_capture_negotiator().resolve()
+        log_message("info", f"Default input device: {fmt.name} ({fmt.samplerate}Hz, {'cached' if fmt.verified else 'reported default'})")
+        return fmt
     except Exception as e:
         log_message("error", f"Audio device check failed: {e}")
-        return False
+        return None
 
 def init_openai_client():
     """Initialize OpenAI client"""
@@ -437,7 +433,7 @@ def transcribe_with_soniox(filepath):
         return modles.transcribe_soniox(filepath, api_key)
     except Exception as e:
         log_message("error", f"Soniox transcription error: {e}")
-        return None
+        raise
 
 def transcribe_with_qwen3_asr(filepath):
     """Transcribe using Qwen3-ASR (DashScope)."""
@@ -482,7 +478,7 @@ def transcribe_with_qwen3_asr(filepath):
         )
     except Exception as e:
         log_message("error", f"Qwen3-ASR transcription error: {e}")
-        return None
+        raise
 
 def _translate_text_openai(text, target_language, *, stream_callback=None):
     """Translate text via OpenAI using models module."""
@@ -585,11 +581,20 @@ def _translation_credentials_available(engine=None):
     return bool(os.environ.get('OPENAI_API_KEY'))
 
 
-def _translate_text_dispatch(text, target_language, *, stream_callback=None):
+def _translation_label():
+    """(engine, model) of the translation engine, for latency metrics labels."""
     engine = _get_translation_engine()
     if engine == 'gemini':
-        return _translate_text_gemini(text, target_language)
-    return _translate_text_openai(text, target_language, stream_callback=stream_callback)
+        return engine, config.get('gemini_translate_model') or None
+    return engine, config.get('openai_translate_model') or OPENAI_TRANSLATE_MODEL
+
+
+def _translate_text_dispatch(text, target_language, *, stream_callback=None):
+    with modles.request_priority(modles.PRIORITY_TRANSLATION):
+        engine = _get_translation_engine()
+        if engine == 'gemini':
+            return _translate_text_gemini(text, target_language)
+        return _translate_text_openai(text, target_language, stream_callback=stream_callback)
 
 
 def _summary_credentials_available(engine=None):
@@ -695,10 +700,11 @@ def _optimize_text_gemini(text, system_prompt=None, override_model=None):
 
 
 def _optimize_text_dispatch(text, system_prompt=None, *, engine=None):
-    chosen_engine = engine or _get_optimize_engine()
-    if chosen_engine == 'gemini':
-        return _optimize_text_gemini(text, system_prompt)
-    return _optimize_text_openai(text, system_prompt)
+    with modles.request_priority(modles.PRIORITY_INTERACTIVE):
+        chosen_engine = engine or _get_optimize_engine()
+        if chosen_engine == 'gemini':
+            return _optimize_text_gemini(text, system_prompt)
+        return _optimize_text_openai(text, system_prompt)
 
 
 def _build_summary_text(segments):
@@ -812,17 +818,19 @@ def _summarize_text_dispatch(
     max_tokens=None,
     stream_callback=None,
 ):
-    chosen_engine = engine or _get_summary_engine()
-    tokens = max_tokens if isinstance(max_tokens, int) and max_tokens > 0 else CONVERSATION_TITLE_MAX_TOKENS
-    if chosen_engine == 'gemini':
-        return _summarize_text_gemini(segments_text, target_language, system_prompt, max_tokens=tokens)
-    return _summarize_text_openai(
-        segments_text,
-        target_language,
-        system_prompt,
-        max_tokens=tokens,
-        stream_callback=stream_callback,
-    )
+    # Titles and summaries yield to live transcription/translation in the request governor
+    with modles.request_priority(modles.PRIORITY_BACKGROUND):
+        chosen_engine = engine or _get_summary_engine()
+        tokens = max_tokens if isinstance(max_tokens, int) and max_tokens > 0 else CONVERSATION_TITLE_MAX_TOKENS
+        if chosen_engine == 'gemini':
+            return _summarize_text_gemini(segments_text, target_language, system_prompt, max_tokens=tokens)
+        return _summarize_text_openai(
+            segments_text,
+            target_language,
+            system_prompt,
+            max_tokens=tokens,
+            stream_callback=stream_callback,
+        )
 
 
 
@@ -836,7 +844,7 @@ def start_translation_worker():
         return
     
     translation_worker_running = True
-    translation_worker_thread = threading.Thread(target=translation_worker, daemon=True)
+    translation_worker_thread = threading.Thread(target=translation_worker, name="translation-worker", daemon=True)
     translation_worker_thread.start()
     log_message("info", "Translation queue worker thread started, will process translation tasks in order")
 
@@ -895,8 +903,14 @@ def translation_worker():
     def perform_translation_task(order, result_id, transcription, target_language, context):
         """Run translation with streaming callbacks and emit UI updates."""
         if not transcription or not target_language:
+            latency_metrics.registry.finish(result_id)
             return False, None
 
+        trace = latency_metrics.registry.get(result_id)
+        if trace is not None:
+            trace.mark(latency_metrics.TRANSLATION_STARTED)
+            trace.label(latency_metrics.GROUP_TRANSLATE, *_translation_label())
+
         base_payload = {
             "type": "translation_update",
             "result_id": result_id,
@@ -942,6 +956,9 @@ def translation_worker():
         except Exception as exc:
             log_message("error", f"Translation execution error #{order}: {exc}")
             translation_text = None
+        if trace is not None:
+            trace.mark(latency_metrics.TRANSLATION_FINAL)
+            latency_metrics.registry.finish(result_id)
 
         if translation_text:
             final_text = _sanitize_utf8_text(translation_text.strip())
@@ -1079,6 +1096,8 @@ def queue_translation(result_id, transcription, target_language, context=None):
     # Create task, format: (order, result_id, transcription, target_language, context)
     task = (order, result_id, transcription, target_language, context)
     
+    # Marked before put so a fast worker cannot close the trace first
+    latency_metrics.registry.mark(result_id, latency_metrics.TRANSLATION_QUEUED)
     try:
         # Use priority queue, priority is order number, ensure processing in order
         translation_queue.put((order, task), timeout=1)
@@ -1086,126 +1105,136 @@ def queue_translation(result_id, transcription, target_language, context=None):
         return True, order
     except queue.Full:
         log_message("warning", f"Translation queue full, skipping task #{order}: {result_id}")
+        latency_metrics.registry.finish(result_id)
         return False, order
 
+def _post_callback_event(kind, payload=None):
+    """Queue a message for the consumer thread (the audio callback never formats or writes output)"""
+    callback_events.put((kind, time.time(), payload))
+
 def audio_callback(indata, frames, time_info, status):
-    """Audio recording callback function"""
-    global audio_data, segment_frames, silence_frames_contig, split_requested
-    global segment_active, new_segment_requested, pre_roll_chunks, pre_roll_frames
-    global is_recording, last_volume_emit
-    
-    if status:
-        log_message("warning", f"Recording status: {status}")
-    
-    if not is_recording:
+    """Audio recording callback function (PortAudio's real-time thread)
+
+    Only copies samples into the segment state and updates counters; log lines
+    and UI messages go through callback_events to the consumer thread.
+    """
+    started = time.perf_counter()
+    if not is_recording and standby_ring is None:
         return
 
+    held = 0.0
     try:
         with audio_lock:
-            if indata is None or len(indata) == 0:
-                return
-
+            acquired = time.perf_counter()
             try:
-                rms = float(np.sqrt(np.mean(np.square(indata))))
-            except Exception as e:
-                log_message("warning", f"RMS calculation failed: {e}")
-                rms = 0.0
+                _capture_block(indata, frames)
+            finally:
+                held = time.perf_counter() - acquired
+    except Exception as e:
+        audio_telemetry.error()
+        _post_callback_event("log", ("error", f"Audio callback function error: {e}"))
+        # Don't re-raise exception, this would cause CFFI error
+    if status:
+        _post_callback_event("status", status)
+    audio_telemetry.record(time.perf_counter() - started, held, frames, status, time_info)
 
-            try:
-                now = time.time()
-                if now - last_volume_emit >= 0.1:
-                    last_volume_emit = now
-                    if rms > 0:
-                        db = 20.0 * math.log10(rms)
-                    else:
-                        db = -80.0
-                    silence_db = 20.0 * math.log10(SILENCE_RMS_THRESHOLD) if SILENCE_RMS_THRESHOLD > 0 else -80.0
-                    send_message({
-                        "type": "volume_level",
-                        "rms": rms,
-                        "db": db,
-                        "silence_rms": SILENCE_RMS_THRESHOLD,
-                        "silence_db": silence_db,
-                        "timestamp": datetime.now().isoformat()
-                    })
-            except Exception as e:
-                log_message("warning", f"Volume message failed: {e}")
+def _capture_block(indata, frames):
+    """Segment state update for one input block; called with audio_lock held"""
+    global audio_data, segment_frames, silence_frames_contig, segment_index
+    global segment_active, pre_roll_chunks, pre_roll_frames
 
-            if simple_recording_mode:
-                try:
-                    audio_data.append(indata.copy())
-                except Exception as e:
-                    log_message("warning", f"Simple mode append failed: {e}")
-                return
+    if indata is None or len(indata) == 0:
+        return
 
-            # Non-silent: maintain pre-roll buffer
-            if not segment_active:
-                try:
-                    pre_roll_chunks.append(indata.copy())
-                    pre_roll_frames += frames
-                    max_pre = int(PRE_ROLL_SECONDS * SAMPLE_RATE)
-                    while pre_roll_frames > max_pre and pre_roll_chunks:
-                        drop = pre_roll_chunks.pop(0)
-                        pre_roll_frames -= len(drop)
-                except Exception as e:
-                    log_message("warning", f"Pre-roll buffer handling failed: {e}")
+    # Device-rate audio -> SAMPLE_RATE; the filter may hold back its first few frames
+    if capture_resampler is not None:
+        indata = capture_resampler.process(indata)
+        frames = len(indata)
+        if frames == 0:
+            return
 
-            # Detect voice entry: start new segment
-            if not segment_active and rms >= SILENCE_RMS_THRESHOLD:
-                new_segment_requested = True
-                segment_active = True
-                segment_frames = 0
-                silence_frames_contig = 0
-                
-                try:
-                    # Send voice activity start message
-                    send_message({
-                        "type": "voice_activity",
-                        "active": True,
-                        "timestamp": datetime.now().isoformat()
-                    })
-                    
-                    # Merge pre-roll
-                    if pre_roll_chunks:
-                        for ch in pre_roll_chunks:
-                            audio_data.append(ch)
-                            segment_frames += len(ch)
-                        pre_roll_chunks = []
-                        pre_roll_frames = 0
-                except Exception as e:
-                    log_message("warning", f"Voice activity handling failed: {e}")
+    # Not recording (or stop won the race for the lock): standby keeps the most recent audio
+    if not is_recording:
+        if standby_ring is not None:
+            standby_ring.write(indata)
+        return
 
-            # Within segment: save raw data
-            if segment_active:
-                try:
-                    audio_data.append(indata.copy())
-                    segment_frames += frames
-                    if rms < SILENCE_RMS_THRESHOLD:
-                        silence_frames_contig += frames
-                        if silence_frames_contig >= int(MIN_SILENCE_SEC_FOR_SPLIT * SAMPLE_RATE):
-                            split_requested = True
-                            segment_active = False
-                            # Send voice activity end message
-                            send_message({
-                                "type": "voice_activity",
-                                "active": False,
-                                "timestamp": datetime.now().isoformat()
-                            })
-                    else:
-                        silence_frames_contig = 0
-                except Exception as e:
-                    log_message("warning", f"Audio data processing failed: {e}")
-                    
+    try:
+        samples = indata.ravel()
+        sum_squares = float(np.dot(samples, samples))
+        rms = math.sqrt(sum_squares / len(samples))
+        # Metering only while a UI listens; the publisher thread does the smoothing and dB
+        if volume_meter.active:
+            volume_meter.accumulate(sum_squares, float(np.abs(samples).max()), frames)
     except Exception as e:
-        log_message("error", f"Audio callback function error: {e}")
-        # Don't re-raise exception, this would cause CFFI error
+        _post_callback_event("log", ("warning", f"RMS calculation failed: {e}"))
+        rms = 0.0
 
-def start_recording():
-    """Start recording"""
+    if simple_recording_mode:
+        try:
+            audio_data.append(indata.copy())
+        except Exception as e:
+            _post_callback_event("log", ("warning", f"Simple mode append failed: {e}"))
+        return
+
+    # Non-silent: maintain pre-roll buffer
+    if not segment_active:
+        try:
+            pre_roll_chunks.append(indata.copy())
+            pre_roll_frames += frames
+            max_pre = int(PRE_ROLL_SECONDS * SAMPLE_RATE)
+            while pre_roll_frames > max_pre and pre_roll_chunks:
+                drop = pre_roll_chunks.pop(0)
+                pre_roll_frames -= len(drop)
+        except Exception as e:
+            _post_callback_event("log", ("warning", f"Pre-roll buffer handling failed: {e}"))
+
+    # Detect voice entry: start new segment
+    if not segment_active and rms >= SILENCE_RMS_THRESHOLD:
+        segment_active = True
+        segment_frames = 0
+        silence_frames_contig = 0
+
+        try:
+            _post_callback_event("voice_activity", True)
+
+            # Merge pre-roll
+            if pre_roll_chunks:
+                for ch in pre_roll_chunks:
+                    audio_data.append(ch)
+                    segment_frames += len(ch)
+                pre_roll_chunks = []
+                pre_roll_frames = 0
+        except Exception as e:
+            _post_callback_event("log", ("warning", f"Voice activity handling failed: {e}"))
+
+    # Within segment: save raw data
+    if segment_active:
+        try:
+            audio_data.append(indata.copy())
+            segment_frames += frames
+            if rms < SILENCE_RMS_THRESHOLD:
+                silence_frames_contig += frames
+                if silence_frames_contig >= int(MIN_SILENCE_SEC_FOR_SPLIT * SAMPLE_RATE):
+                    # Hand the finished segment over right away; the consumer blocks on the queue
+                    segment_handoff.put((audio_data, segment_index, None))
+                    audio_data = []
+                    segment_index += 1
+                    segment_frames = 0
+                    silence_frames_contig = 0
+                    segment_active = False
+                    _post_callback_event("voice_activity", False)
+            else:
+                silence_frames_contig = 0
+        except Exception as e:
+            _post_callback_event("log", ("warning", f"Audio data processing failed: {e}"))
+
+def start_recording(replay=None):
+    """Start recording; replay (or --replay) feeds a file/synthetic audio instead of the microphone"""
     global is_recording, audio_data, recording_thread
-    global segment_frames, silence_frames_contig, split_requested, segment_index
-    global segment_active, new_segment_requested, pre_roll_chunks, pre_roll_frames
-    global translation_counter
+    global segment_frames, silence_frames_contig, segment_index, segment_handoff
+    global segment_active, pre_roll_chunks, pre_roll_frames
+    global translation_counter, capture_format, active_replay
 
     if is_recording:
         log_message("warning", "Recording already in progress")
@@ -1217,8 +1246,36 @@ def start_recording():
     except Exception:
         pass
 
-    # Check audio device
-    if not check_audio_device():
+    active_replay = None
+    replay_value = replay if replay is not None else replay_cli_spec
+    if replay_value:
+        try:
+            if not load_replay_backend():
+                raise RuntimeError("replay libraries failed to load")
+            active_replay = audio_replay.parse_replay_spec(replay_value, defaults=replay_cli_options)
+        except Exception as e:
+            log_message("error", f"Invalid replay input: {e}")
+            send_message({
+                "type": "recording_error",
+                "message": f"Replay input could not be used: {e}",
+                "timestamp": datetime.now().isoformat()
+            })
+            return
+        # The replay stands in for the microphone, release a standby stream
+        stop_hot_mic_standby()
+    # First recording pays for loading the audio libraries unless the background preload already did
+    elif not load_audio_backend():
+        send_message({
+            "type": "recording_error",
+            "message": "Audio libraries failed to load, cannot start recording",
+            "timestamp": datetime.now().isoformat()
+        })
+        return
+
+    # Check audio device (a standby stream is already open with a known format)
+    if active_replay is None and not standby_stream_alive():
+        capture_format = check_audio_device()
+    if active_replay is None and capture_format is None:
         log_message("error", "Audio device check failed, cannot start recording")
         send_message({
             "type": "recording_error", 
@@ -1255,63 +1312,247 @@ def start_recording():
     except Exception as _e:
         log_message("warning", f"Failed to reset translation worker: {_e}")
     
-    is_recording = True
-    
+    segment_active = False
+    pre_roll_chunks = []
+    pre_roll_frames = 0
+
     with audio_lock:
         audio_data = []
         segment_frames = 0
         silence_frames_contig = 0
-        split_requested = False
         segment_index = 1
+        segment_handoff = queue.SimpleQueue()
+        # Hot mic standby: start from the audio captured just before the request
+        if standby_ring is not None and active_replay is None:
+            buffered = standby_ring.snapshot()
+            standby_ring.clear()
+            if len(buffered):
+                if simple_recording_mode:
+                    audio_data.append(buffered)
+                else:
+                    pre_roll_chunks.append(buffered)
+                    pre_roll_frames = len(buffered)
+        is_recording = True
+    transcript_filter.reset()
+    start_segment_pool()
     
-    segment_active = False
-    new_segment_requested = False
-    pre_roll_chunks = []
-    pre_roll_frames = 0
-    
-    recording_thread = threading.Thread(target=record_audio)
+    recording_thread = threading.Thread(target=record_audio, name="record-audio")
     recording_thread.start()
     
     log_message("info", "Recording started")
 
+def open_capture_stream():
+    """Open the input stream at the negotiated device rate; re-probe once if the device rejects it"""
+    global capture_format, capture_resampler
+    fmt = capture_format
+    for attempt in range(2):
+        capture_resampler = None if fmt.samplerate == SAMPLE_RATE else resampler.StreamingResampler(fmt.samplerate, SAMPLE_RATE)
+        try:
+            stream = sd.InputStream(
+                device=fmt.device,
+                samplerate=fmt.samplerate,
+                channels=CHANNELS,
+                dtype=DTYPE,
+                callback=audio_callback,
+                blocksize=1024  # Add fixed block size
+            )
+        except sd.PortAudioError as e:
+            if attempt:
+                raise
+            log_message("warning", f"Opening input at {fmt.samplerate}Hz failed, probing device: {e}")
+            get_capture_negotiator().invalidate(fmt)
+            probed = get_capture_negotiator().probe(exclude=[fmt.samplerate])
+            if probed is None:
+                raise
+            fmt = probed
+            continue
+        get_capture_negotiator().confirm(fmt)
+        capture_format = fmt
+        audio_telemetry.stream_started(fmt.samplerate)
+        log_message("info", f"Starting audio recording, device rate: {fmt.samplerate}Hz, processing rate: {SAMPLE_RATE}Hz, channels: {CHANNELS}")
+        return stream
+
+def open_replay_stream(spec):
+    """ReplayInputStream for spec, resampled to SAMPLE_RATE like a device stream"""
+    global capture_resampler
+    source = spec.open()
+    capture_resampler = None if source.sample_rate == SAMPLE_RATE else resampler.StreamingResampler(source.sample_rate, SAMPLE_RATE)
+    audio_telemetry.stream_started(source.sample_rate)
+    log_message("info", f"Replaying {spec.describe()}, source rate: {source.sample_rate}Hz, processing rate: {SAMPLE_RATE}Hz")
+    return audio_replay.ReplayInputStream(
+        source,
+        audio_callback,
+        blocksize=1024,
+        channels=CHANNELS,
+        speed=spec.speed,
+        loop=spec.loop,
+        on_finished=_on_replay_finished if spec.stop_at_end else None,
+        log=log_message,
+    )
+
+def _on_replay_finished():
+    if not is_recording:
+        return
+    send_message({"type": "replay_finished", "timestamp": datetime.now().isoformat()})
+    # stop_recording joins the recording thread, which is waiting on this replay; stop from elsewhere
+    threading.Thread(target=stop_recording, name="replay-stop", daemon=True).start()
+
+def record_replay(spec):
+    """Recording thread body for replay input (kept apart so sounddevice is never imported)"""
+    try:
+        with open_replay_stream(spec):
+            log_message("info", "Replay stream started")
+            recording_loop()
+    except Exception as e:
+        log_message("error", f"Replay error: {e}")
+        send_message({
+            "type": "recording_error",
+            "message": f"Replay input failed: {e}",
+            "timestamp": datetime.now().isoformat()
+        })
+    finally:
+        log_message("info", "Recording thread ended")
+
+def recording_loop():
+    """Hand finished segments from the audio callback to the segment pool until recording stops"""
+    handoff = segment_handoff
+    while True:
+        item = handoff.get()
+        if item is None:  # Stop signal from stop_recording
+            break
+        local_chunks, seg_idx, source = item
+        submit_segment(local_chunks, seg_idx, source)
+
+def _queue_graph_segment(chunks, source):
+    global segment_index
+    # Called under the graph lock (one for all sources), so indices follow hand-off order
+    seg_idx = segment_index
+    segment_index += 1
+    segment_handoff.put((chunks, seg_idx, source))
+
+def _emit_graph_activity(source, active):
+    # Capture thread, under the graph lock: only queue for the consumer
+    _post_callback_event("voice_activity", (active, source))
+
+def _post_graph_status(source, status):
+    _post_callback_event("status", (source, status))
+
+def _post_graph_log(level, text):
+    _post_callback_event("log", (level, text))
+
+def record_capture_graph(sources):
+    """Record several devices/channels with per-channel VAD; segments carry their source label"""
+    global active_capture_graph, graph_telemetry
+    graph = capture_graph.CaptureGraph(
+        sources,
+        sample_rate=SAMPLE_RATE,
+        silence_threshold=SILENCE_RMS_THRESHOLD,
+        min_silence_seconds=MIN_SILENCE_SEC_FOR_SPLIT,
+        pre_roll_seconds=PRE_ROLL_SECONDS,
+        on_segment=_queue_graph_segment,
+        on_activity=_emit_graph_activity,
+        meter=volume_meter,
+        on_status=_post_graph_status,
+        log=_post_graph_log,
+    )
+    graph.start()
+    graph_telemetry = graph.telemetry_by_source()
+    with audio_lock:
+        if not is_recording:
+            # Stopped while the sources were opening
+            graph.stop(flush=False)
+            return
+        active_capture_graph = graph
+    log_message("info", f"Multi-source capture started ({len(sources)} sources)")
+    try:
+        recording_loop()
+    finally:
+        active_capture_graph = None
+
+def standby_stream_alive():
+    stream = standby_stream
+    return stream is not None and stream.active
+
+def start_hot_mic_standby():
+    """Open the input stream now and keep it running into a small pre-roll ring while idle"""
+    global standby_stream, standby_ring, capture_format
+    if not load_audio_backend():
+        return False
+    with standby_lock:
+        if standby_stream_alive():
+            return True
+        _close_standby_stream()
+        fmt = check_audio_device()
+        if fmt is None:
+            return False
+        capture_format = fmt
+        seconds = _get_float_config('hot_mic_preroll_seconds', HOT_MIC_PREROLL_SECONDS)
+        ring = audio_capture.PreRollRing(max(0.05, seconds) * SAMPLE_RATE, CHANNELS)
+        try:
+            stream = open_capture_stream()
+            standby_ring = ring
+            stream.start()
+        except Exception as e:
+            standby_ring = None
+            log_message("error", f"Hot mic standby failed to open the input stream: {e}")
+            return False
+        standby_stream = stream
+    log_message("info", f"Hot mic standby active (pre-roll {seconds:.2f}s)")
+    send_message({"type": "hot_mic_standby", "active": True, "timestamp": datetime.now().isoformat()})
+    return True
+
+def _close_standby_stream():
+    global standby_stream, standby_ring
+    stream = standby_stream
+    standby_stream = None
+    standby_ring = None
+    if stream is not None:
+        try:
+            stream.stop()
+            stream.close()
+        except Exception as e:
+            log_message("warning", f"Closing standby stream failed: {e}")
+
+def stop_hot_mic_standby():
+    """Close the standby stream (the microphone is released)"""
+    global capture_resampler
+    with standby_lock:
+        if standby_stream is None:
+            return
+        if is_recording:
+            # The running recording still reads this stream; stop_recording closes it
+            return
+        _close_standby_stream()
+        capture_resampler = None
+    log_message("info", "Hot mic standby stopped")
+    send_message({"type": "hot_mic_standby", "active": False, "timestamp": datetime.now().isoformat()})
+
+def hot_mic_wanted():
+    return bool(config.get('voice_input_hot_mic')) if isinstance(config, dict) else False
+
+def apply_hot_mic_standby():
+    """Start or stop standby to match config (voice_input_hot_mic)"""
+    if hot_mic_wanted():
+        start_hot_mic_standby()
+    else:
+        stop_hot_mic_standby()
+
 def record_audio():
     """Recording thread"""
-    global is_recording, split_requested, segment_index, audio_data
-    global new_segment_requested
-    
+    if active_replay is not None:
+        record_replay(active_replay)
+        return
     try:
-        log_message("info", f"Starting audio recording, sampling rate: {SAMPLE_RATE}Hz, channels: {CHANNELS}")
-        
-        with sd.InputStream(
-            samplerate=SAMPLE_RATE,
-            channels=CHANNELS,
-            dtype=DTYPE,
-            callback=audio_callback,
-            blocksize=1024  # Add fixed block size
-        ) as stream:
-            log_message("info", "Audio stream started")
-            
-            while is_recording:
-                if new_segment_requested:
-                    new_segment_requested = False
-                
-                if split_requested:
-                    with audio_lock:
-                        local_chunks = audio_data
-                        audio_data = []
-                        segment_frames = 0
-                        silence_frames_contig = 0
-                        split_requested = False
-                        seg_idx = segment_index
-                        segment_index += 1
-                    
-                    threading.Thread(
-                        target=process_segment_chunks,
-                        args=(local_chunks, seg_idx, True),
-                        daemon=True,
-                    ).start()
-                
-                sd.sleep(100)
+        sources = capture_graph.parse_capture_sources(config.get('capture_sources')) if isinstance(config, dict) else []
+        if sources and not simple_recording_mode:
+            record_capture_graph(sources)
+        elif standby_stream_alive():
+            log_message("info", "Recording from hot mic standby stream")
+            recording_loop()
+        else:
+            with open_capture_stream() as stream:
+                log_message("info", "Audio stream started")
+                recording_loop()
                 
     except sd.PortAudioError as e:
         error_msg = f"Audio device error: {e}"
@@ -1335,15 +1576,29 @@ def record_audio():
 def stop_recording():
     """Stop recording"""
     global is_recording, audio_data, recording_thread, segment_active
+    global capture_resampler
     
     if not is_recording:
         return
     
-    is_recording = False
+    # Under the lock so no callback can queue a segment behind the stop signal
+    with audio_lock:
+        is_recording = False
+        graph = active_capture_graph
+        if graph is None:
+            segment_handoff.put(None)
+    if graph is not None:
+        # Close the sources first; unfinished per-channel segments are queued ahead of the stop signal
+        graph.stop()
+        segment_handoff.put(None)
     
     if recording_thread and recording_thread.is_alive():
         recording_thread.join()
+    if not standby_stream_alive():
+        capture_resampler = None
     
+    # Flush coalesced segments ahead of the final one; queued segments still drain on the pool's workers
+    stop_segment_pool()
     if audio_data:
         save_audio_file()
     # Notify main process that recording has completely stopped (for external coordination restart)
@@ -1354,6 +1609,11 @@ def stop_recording():
         })
     except Exception:
         pass
+    # Return to standby (reopening the stream if it died), or release it if standby was turned off
+    if hot_mic_wanted():
+        start_hot_mic_standby()
+    else:
+        stop_hot_mic_standby()
 
 def save_audio_file():
     """Save final audio segment"""
@@ -1363,37 +1623,382 @@ def save_audio_file():
         audio_data = []
     process_segment_chunks(local_chunks, None, False)
 
-def process_segment_chunks(chunks, seg_idx=None, from_split=False):
-    """Process audio chunks with a placeholder-first flow"""
+def next_transcription_order():
+    """Allocate the next transcription order (segments are produced on several threads)."""
     global transcription_counter
+    with transcription_counter_lock:
+        transcription_counter += 1
+        return transcription_counter
+
+
+def _get_int_config(key, default, minimum=1):
+    try:
+        value = config.get(key) if isinstance(config, dict) else None
+        if isinstance(value, (int, float)) and int(value) >= minimum:
+            return int(value)
+    except Exception:
+        pass
+    return default
+
+
+def _emit_segment_metrics(snapshot):
+    try:
+        payload = {"type": "segment_queue", "timestamp": datetime.now().isoformat()}
+        payload.update(snapshot)
+        send_message(payload)
+        if snapshot.get('event'):
+            log_message("warning", f"Segment queue saturated ({snapshot.get('event')}): depth={snapshot.get('queue_depth')}, in_flight={snapshot.get('in_flight')}")
+    except Exception:
+        pass
+
+
+def send_latency_metrics():
+    """Send per-stage latency percentiles (ms) by provider/model"""
+    payload = {"type": "metrics"}
+    payload.update(latency_metrics.registry.snapshot())
+    payload["timestamp"] = datetime.now().isoformat()
+    send_message(payload)
+
+
+def _metrics_interval():
+    value = config.get('metrics_interval_seconds') if isinstance(config, dict) else None
+    if isinstance(value, (int, float)) and value >= 0:
+        return float(value)
+    return METRICS_INTERVAL_SECONDS
+
+
+def _metrics_publisher():
+    """Periodic metrics stream; only sent when segments completed since the last one"""
+    last_completed = latency_metrics.registry.completed
+    while True:
+        interval = _metrics_interval()
+        time.sleep(interval or METRICS_INTERVAL_SECONDS)
+        completed = latency_metrics.registry.completed
+        if interval <= 0 or completed == last_completed:
+            continue
+        last_completed = completed
+        try:
+            send_latency_metrics()
+        except Exception:
+            pass
+
+
+def start_metrics_publisher():
+    threading.Thread(target=_metrics_publisher, name="metrics-publisher", daemon=True).start()
+
+
+def send_audio_stats(force=False, reset=True):
+    """Send the callback telemetry window (skipped when no callback ran, unless forced).
+
+    Capture graph streams report under "sources". reset=False sends the windows
+    so far without starting new ones (on-demand requests leave the periodic
+    window intact).
+    """
+    read = (lambda telemetry: telemetry.take()) if reset else (lambda telemetry: telemetry.snapshot())
+    stats = read(audio_telemetry)
+    sources = {}
+    for name, telemetry in list(graph_telemetry.items()):
+        window = read(telemetry)
+        if window['callbacks'] or force:
+            sources[name] = window
+    if not stats['callbacks'] and not sources and not force:
+        return
+    payload = {"type": "audio_stats"}
+    payload.update(stats)
+    if sources:
+        payload["sources"] = sources
+    payload["timestamp"] = datetime.now().isoformat()
+    send_message(payload)
+
+
+def _audio_stats_interval():
+    value = config.get('audio_stats_interval_seconds') if isinstance(config, dict) else None
+    if isinstance(value, (int, float)) and value >= 0:
+        return float(value)
+    return AUDIO_STATS_INTERVAL_SECONDS
+
+
+def _dispatch_callback_event(kind, at, payload):
+    timestamp = datetime.fromtimestamp(at).isoformat()
+    if kind == "voice_activity":
+        message = {"type": "voice_activity"}
+        if isinstance(payload, tuple):
+            # Capture graph: (active, source label)
+            message["active"], message["source"] = payload
+        else:
+            message["active"] = payload
+        message["timestamp"] = timestamp
+        send_message(message)
+    elif kind == "log":
+        level, text = payload
+        log_message(level, text)
+
+
+def _callback_event_consumer():
+    """Formats and sends what audio_callback posted, and the periodic audio_stats window"""
+    last_stats = time.monotonic()
+    status_count = 0
+    status_text = None
+    status_logged = 0.0
+    while True:
+        try:
+            kind, at, payload = callback_events.get(timeout=0.5)
+        except queue.Empty:
+            kind = None
+        if kind == "status":
+            # Overflow storms flag every block; log them at most once a second
+            status_count += 1
+            status_text = f"{payload[0]}: {payload[1]}" if isinstance(payload, tuple) else str(payload)
+        elif kind is not None:
+            try:
+                _dispatch_callback_event(kind, at, payload)
+            except Exception as e:
+                log_message("warning", f"Audio event delivery failed: {e}")
+        now = time.monotonic()
+        if status_count and now - status_logged >= 1.0:
+            log_message("warning", f"Recording status: {status_text}" + (f" ({status_count} blocks)" if status_count > 1 else ""))
+            status_count = 0
+            status_logged = now
+        interval = _audio_stats_interval()
+        if now - last_stats >= (interval or AUDIO_STATS_INTERVAL_SECONDS):
+            last_stats = now
+            if interval > 0:
+                try:
+                    send_audio_stats()
+                except Exception as e:
+                    log_message("warning", f"Audio stats failed: {e}")
+
+
+def start_callback_event_consumer():
+    threading.Thread(target=_callback_event_consumer, name="audio-events", daemon=True).start()
+
+
+def _publish_volume_level(levels):
+    payload = {"type": "volume_level"}
+    payload.update(levels)
+    payload["timestamp"] = datetime.now().isoformat()
+    send_message(payload)
+
+
+def set_volume_meter_subscription(subscribed, rate_hz=None):
+    """Start or stop the level meter for the UI (volume_meter message)"""
+    if rate_hz is not None:
+        volume_meter.set_rate(rate_hz)
+    if subscribed:
+        if not volume_meter.active:
+            log_message("info", f"Volume meter on ({volume_meter.rate_hz:g} Hz)")
+        volume_meter.start(_publish_volume_level)
+    elif volume_meter.active:
+        volume_meter.stop()
+        log_message("info", "Volume meter off (no UI subscribed)")
+
+
+def start_profiler(interval_ms=None, max_seconds=None):
+    """Start sampling every thread's stack (profile_start)"""
+    global active_profiler
+    with profiler_lock:
+        if active_profiler is not None and active_profiler.running:
+            log_message("warning", "Profiler already running")
+            return
+        previous = active_profiler
+        active_profiler = None
+    if previous is not None:
+        # Stopped itself at its time limit and nobody collected it yet
+        _write_profile(previous)
+    try:
+        interval = float(interval_ms) / 1000.0 if interval_ms else stack_sampler.DEFAULT_INTERVAL_SECONDS
+        limit = float(max_seconds) if max_seconds else stack_sampler.DEFAULT_MAX_SECONDS
+        profiler = stack_sampler.StackSampler(interval, limit, log=log_message)
+        profiler.start()
+    except Exception as e:
+        log_message("error", f"Failed to start profiler: {e}")
+        send_message({"type": "profile_error", "message": str(e), "timestamp": datetime.now().isoformat()})
+        return
+    with profiler_lock:
+        active_profiler = profiler
+    log_message("info", f"Profiler started ({profiler.interval * 1000:.1f} ms interval, stops after {profiler.max_seconds:.0f}s)")
+    send_message({
+        "type": "profile_started",
+        "interval_ms": round(profiler.interval * 1000.0, 2),
+        "max_seconds": profiler.max_seconds,
+        "timestamp": datetime.now().isoformat()
+    })
+
+
+def stop_profiler(formats=None):
+    """Stop the profiler and write its stacks to the recordings directory (profile_stop)"""
+    global active_profiler
+    with profiler_lock:
+        profiler = active_profiler
+        active_profiler = None
+    if profiler is None:
+        log_message("warning", "Profiler is not running")
+        send_message({"type": "profile_error", "message": "Profiler is not running", "timestamp": datetime.now().isoformat()})
+        return
+    profiler.stop()
+    _write_profile(profiler, formats)
+
+
+def _write_profile(profiler, formats=None):
+    if isinstance(formats, str):
+        formats = (formats,)
+    formats = tuple(formats) if formats else ('collapsed', 'speedscope')
+    try:
+        ensure_output_dir()
+        basename = f"profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        files = [os.path.abspath(path) for path in profiler.write(OUTPUT_DIR, basename, formats)]
+    except Exception as e:
+        log_message("error", f"Failed to write profile: {e}")
+        send_message({"type": "profile_error", "message": str(e), "timestamp": datetime.now().isoformat()})
+        return
+    summary = profiler.summary()
+    log_message("info", f"Profile written ({summary['samples']} samples over {summary['wall_seconds']}s): {', '.join(files)}")
+    payload = {"type": "profile_stopped", "files": files}
+    payload.update(summary)
+    payload["timestamp"] = datetime.now().isoformat()
+    send_message(payload)
+
+
+def _run_segment_job(job, chunks):
+    if job.merged_count > 1:
+        log_message("info", f"Processing {job.merged_count} merged segments starting at seg{job.seg_idx}")
+    for absorbed_id in job.absorbed_result_ids:
+        # Their audio is transcribed with this job; drop their placeholders
+        send_message({
+            "type": "transcription_update",
+            "result_id": absorbed_id,
+            "transcription": "",
+            "transcription_pending": False,
+            "merged_into": job.result_id,
+            "timestamp": datetime.now().isoformat()
+        })
+    process_segment_chunks(
+        chunks,
+        job.seg_idx,
+        job.from_split,
+        trans_order=job.order,
+        source=job.source,
+        captured_at=job.submitted_at,
+        result_id=job.result_id,
+        recorded_at=datetime.fromtimestamp(job.recorded_at),
+    )
+
+
+def _get_float_config(key, default):
+    try:
+        value = config.get(key) if isinstance(config, dict) else None
+        if isinstance(value, (int, float)) and value > 0:
+            return float(value)
+    except Exception:
+        pass
+    return default
+
+
+def start_segment_pool():
+    """Create the bounded worker pool that transcribes split segments for this session."""
+    global segment_pool, segment_coalescer
+    policy = config.get('segment_saturation_policy') if isinstance(config, dict) else None
+    merge_max = config.get('segment_merge_max_seconds') if isinstance(config, dict) else None
+    segment_pool = segment_executor.SegmentExecutor(
+        _run_segment_job,
+        sample_rate=SAMPLE_RATE,
+        workers=_get_int_config('segment_workers', segment_executor.DEFAULT_WORKERS),
+        max_queue=_get_int_config('segment_queue_size', segment_executor.DEFAULT_QUEUE_SIZE),
+        policy=policy if isinstance(policy, str) else segment_executor.POLICY_MERGE,
+        merge_max_seconds=merge_max if isinstance(merge_max, (int, float)) else segment_executor.DEFAULT_MERGE_MAX_SECONDS,
+        spill_dir=os.path.join(OUTPUT_DIR, 'spill'),
+        on_metrics=_emit_segment_metrics,
+        on_error=lambda exc: log_message("error", f"Error processing audio segment: {exc}"),
+    )
+    segment_pool.start()
+
+    segment_coalescer = None
+    if isinstance(config, dict) and config.get('segment_coalesce_enabled', True):
+        segment_coalescer = segment_executor.SegmentCoalescer(
+            segment_pool.submit,
+            sample_rate=SAMPLE_RATE,
+            target_seconds=_get_float_config('segment_coalesce_target_seconds', segment_executor.DEFAULT_COALESCE_TARGET_SECONDS),
+            short_seconds=_get_float_config('segment_coalesce_short_seconds', segment_executor.DEFAULT_COALESCE_SHORT_SECONDS),
+            max_wait_seconds=_get_float_config('segment_coalesce_max_wait_ms', segment_executor.DEFAULT_COALESCE_MAX_WAIT_SECONDS * 1000.0) / 1000.0,
+        )
+
+
+def stop_segment_pool():
+    global segment_pool, segment_coalescer
+    coalescer = segment_coalescer
+    segment_coalescer = None
+    if coalescer is not None:
+        coalescer.flush()
+    pool = segment_pool
+    segment_pool = None
+    if pool is not None:
+        pool.shutdown(wait=False)
+
+
+def submit_segment(chunks, seg_idx, source=None):
+    """Queue a split segment; the order is fixed now so merges/spills keep UI ordering."""
+    if not chunks:
+        return
+    job = segment_executor.SegmentJob(chunks, seg_idx, next_transcription_order(), source=source)
+    if not simple_recording_mode:
+        # Placeholder now, so queued (or coalescing) speech shows up while it waits for a worker
+        job.result_id = str(uuid.uuid4())
+        duration_seconds = float(job.frames) / float(SAMPLE_RATE)
+        _send_result_placeholder(job.result_id, job.order, datetime.fromtimestamp(job.recorded_at), duration_seconds, source)
+    coalescer = segment_coalescer
+    if coalescer is not None:
+        # Short segments share one provider request; the merged result keeps the first order
+        coalescer.add(job)
+        return
+    pool = segment_pool
+    if pool is None:
+        _run_segment_job(job, chunks)
+        return
+    pool.submit(job)
+
+
+def _send_result_placeholder(result_id, trans_order, recorded_at, duration_seconds, source=None):
+    try:
+        payload = {
+            "type": "result",
+            "result_id": result_id,
+            "transcription": "",
+            "transcription_pending": True,
+            "transcription_order": trans_order,
+            "timestamp": recorded_at.isoformat(),
+            "recorded_at": recorded_at.isoformat(),
+            "duration_seconds": duration_seconds
+        }
+        if current_recording_context == 'voice_input':
+            payload["context"] = "voice_input"
+        if source:
+            payload["source"] = source
+        send_message(payload)
+    except Exception:
+        pass
+
+def process_segment_chunks(chunks, seg_idx=None, from_split=False, trans_order=None, source=None, captured_at=None, result_id=None, recorded_at=None):
+    """Process audio chunks with a placeholder-first flow.
+
+    captured_at is the monotonic time the segment was cut. Pool jobs pass the
+    result_id/recorded_at of the placeholder sent at submission; otherwise the
+    placeholder is sent here.
+    """
     try:
         if not chunks:
             return
         combined_audio = np.concatenate(chunks, axis=0) if len(chunks) > 1 else chunks[0]
         duration_seconds = float(len(combined_audio)) / float(SAMPLE_RATE) if len(combined_audio) > 0 else 0.0
-        recorded_at = datetime.now()
+        if recorded_at is None:
+            recorded_at = datetime.now()
 
         # Assign result_id and order, send placeholder first to maintain ordering in UI
-        transcription_counter += 1
-        trans_order = transcription_counter
-        result_id = str(uuid.uuid4())
-        if not simple_recording_mode:
-            try:
-                payload = {
-                    "type": "result",
-                    "result_id": result_id,
-                    "transcription": "",
-                    "transcription_pending": True,
-                    "transcription_order": trans_order,
-                    "timestamp": recorded_at.isoformat(),
-                    "recorded_at": recorded_at.isoformat(),
-                    "duration_seconds": duration_seconds
-                }
-                if current_recording_context == 'voice_input':
-                    payload["context"] = "voice_input"
-                send_message(payload)
-            except Exception:
-                pass
+        if trans_order is None:
+            trans_order = next_transcription_order()
+        if result_id is None:
+            result_id = str(uuid.uuid4())
+            if not simple_recording_mode:
+                _send_result_placeholder(result_id, trans_order, recorded_at, duration_seconds, source)
 
         process_combined_audio(
             combined_audio,
@@ -1402,7 +2007,9 @@ def process_segment_chunks(chunks, seg_idx=None, from_split=False):
             result_id=result_id,
             trans_order=trans_order,
             recorded_at=recorded_at,
-            duration_seconds=duration_seconds
+            duration_seconds=duration_seconds,
+            source=source,
+            captured_at=captured_at
         )
     except Exception as e:
         log_message("error", f"Error processing audio segment: {e}")
@@ -1414,10 +2021,18 @@ def process_combined_audio(
     result_id=None,
     trans_order=None,
     recorded_at=None,
-    duration_seconds=None
+    duration_seconds=None,
+    source=None,
+    captured_at=None
 ):
-    """Save combined audio and transcribe/translate"""
+    """Save combined audio and transcribe/translate (source: speaker/source label in multi-source capture)"""
+    trace = None
     try:
+        if not result_id:
+            result_id = str(uuid.uuid4())
+        trace = latency_metrics.registry.begin(result_id, captured_at)
+
+
         # Check if theater mode is enabled
         theater_mode_enabled = config.get('theater_mode', False)
         
@@ -1433,6 +2048,7 @@ def process_combined_audio(
         filepath = os.path.join(OUTPUT_DIR, filename)
 
         sf.write(filepath, combined_audio, SAMPLE_RATE)
+        trace.mark(latency_metrics.FILE_WRITTEN)
 
         if recorded_at is None:
             recorded_at = datetime.now()
@@ -1448,8 +2064,6 @@ def process_combined_audio(
         except Exception:
             pass
 
-        if not result_id:
-            result_id = str(uuid.uuid4())
         context_label = "voice_input" if current_recording_context == 'voice_input' else None
         collected_transcription = []
 
@@ -1457,6 +2071,7 @@ def process_combined_audio(
             safe_delta = _sanitize_utf8_text(delta_text)
             if not safe_delta:
                 return
+            trace.mark_once(latency_metrics.FIRST_DELTA)
             collected_transcription.append(safe_delta)
             combined = _sanitize_utf8_text(''.join(collected_transcription))
             payload = {
@@ -1472,6 +2087,8 @@ def process_combined_audio(
             }
             if context_label:
                 payload["context"] = context_label
+            if source:
+                payload["source"] = source
             send_message(payload)
 
         try:
@@ -1486,6 +2103,8 @@ def process_combined_audio(
             }
             if context_label:
                 pending_payload["context"] = context_label
+            if source:
+                pending_payload["source"] = source
             send_message(pending_payload)
         except Exception:
             pass
@@ -1496,7 +2115,9 @@ def process_combined_audio(
             if override_transcribe_language:
                 try: config['transcribe_language'] = override_transcribe_language
                 except Exception: pass
-            transcription = transcribe_audio_file(filepath, stream_callback=emit_transcription_delta)
+            with latency_metrics.activate(trace):
+                transcription = transcribe_audio_file(filepath, stream_callback=emit_transcription_delta)
+            trace.mark(latency_metrics.FINAL)
         finally:
             try:
                 if original_source is not None:
@@ -1516,6 +2137,7 @@ def process_combined_audio(
             final_transcription = aggregated
 
         if final_transcription:
+            filter_reason = check_transcript_filter(final_transcription)
             # Use existing result_id/order if provided (placeholder flow)
             # Send transcription update to fill the placeholder
             try:
@@ -1532,12 +2154,19 @@ def process_combined_audio(
                 }
                 if context_label:
                     payload["context"] = context_label
+                if filter_reason:
+                    payload["filtered"] = filter_reason
+                if source:
+                    payload["source"] = source
                 send_message(payload)
             except Exception:
                 pass
 
             # Translation policy
-            if current_recording_context == 'voice_input':
+            if filter_reason:
+                # Likely hallucination or repeat of an earlier segment; don't pay to translate it
+                log_message("info", f"Transcription flagged as {filter_reason}, translation skipped for result {result_id}")
+            elif current_recording_context == 'voice_input':
                 # Only translate when explicitly requested for voice input
                 if override_translate:
                     target_language = override_translate_language or config.get('translate_language', 'Chinese')
@@ -1601,16 +2230,30 @@ def process_combined_audio(
                 pass  # Ignore silent deletion failure
     except Exception as e:
         log_message("error", f"Error saving/transcribing audio file: {e}")
+    finally:
+        if trace is not None:
+            # A queued translation keeps the trace open; the worker closes it
+            latency_metrics.registry.finish_unless_translating(trace.key)
+
+def check_transcript_filter(text):
+    """Return a reason string when ASR output looks like a hallucination or repeat, else None."""
+    try:
+        if isinstance(config, dict) and not config.get('asr_filter_enabled', True):
+            return None
+        return transcript_filter.check(text)
+    except Exception as e:
+        log_message("warning", f"Transcript filter failed: {e}")
+        return None
 
 def determine_smart_translation_target(text, language1, language2):
-    """Return translation target using character encoding heuristics."""
+    """Return translation target using script detection, with a trigram tie-break for same-script pairs."""
     lang1 = language1 or 'Chinese'
     lang2 = language2 or 'English'
 
-    detected = detect_language_by_charset(text, lang1, lang2)
-    if detected == normalize_language_name(lang1):
+    detected = language_id.detect_language_by_charset(text, lang1, lang2)
+    if detected == language_id.normalize_language_name(lang1):
         return lang2
-    if detected == normalize_language_name(lang2):
+    if detected == language_id.normalize_language_name(lang2):
         return lang1
 
     return lang2
@@ -1619,30 +2262,92 @@ def translate_text(text, target_language="Chinese"):
     """Translate text via configured translation engine (override)."""
     return _translate_text_dispatch(text, target_language)
 
-def transcribe_audio_file(filepath, stream_callback=None):
-    """Transcribe audio file using selected source."""
-    source = (config.get('transcribe_source') if isinstance(config, dict) else None) or 'openai'
+def _transcribe_credentials_available(source):
+    """Return True when credentials are available for the given transcription source."""
     if source == 'soniox':
-        log_message("info", "Transcribing via Soniox backend")
-        result = transcribe_with_soniox(filepath)
-        if stream_callback and result:
-            try:
-                stream_callback(result)
-            except Exception:
-                pass
-        return result
-    if source in ('qwen3-asr', 'qwen', 'dashscope'):
-        log_message("info", "Transcribing via Qwen3-ASR (DashScope)")
-        result = transcribe_with_qwen3_asr(filepath)
-        if stream_callback and result:
-            try:
-                stream_callback(result)
-            except Exception:
-                pass
-        return result
+        key = config.get('soniox_api_key') if isinstance(config, dict) else None
+        return bool((isinstance(key, str) and key.strip()) or os.environ.get('SONIOX_API_KEY'))
+    if source == 'qwen3-asr':
+        key = config.get('dashscope_api_key') if isinstance(config, dict) else None
+        return bool((isinstance(key, str) and key.strip()) or os.environ.get('DASHSCOPE_API_KEY'))
+    key = config.get('openai_api_key') if isinstance(config, dict) else None
+    return bool((isinstance(key, str) and key.strip()) or os.environ.get('OPENAI_API_KEY'))
+
+
+def _get_failover_sources(primary):
+    """Sources to fail over to when the primary's circuit breaker is open."""
+    try:
+        if isinstance(config, dict) and not config.get('transcribe_failover_enabled', True):
+            return []
+        configured = config.get('transcribe_failover_sources') if isinstance(config, dict) else None
+        if isinstance(configured, list) and configured:
+            names = [provider_routing.normalize_transcribe_source(item) for item in configured if isinstance(item, str) and item.strip()]
+        else:
+            names = list(provider_routing.TRANSCRIBE_SOURCES)
+        return [name for name in names if name != primary and _transcribe_credentials_available(name)]
+    except Exception:
+        return []
+
 
-    # Default: OpenAI via models module
+def _get_hedge_source(primary):
+    """Return the backup source for hedged transcription, or None when hedging is off."""
     try:
+        if not isinstance(config, dict) or not config.get('transcribe_hedge_enabled', False):
+            return None
+        raw = config.get('transcribe_hedge_source')
+        if not isinstance(raw, str) or not raw.strip():
+            return None
+        secondary = provider_routing.normalize_transcribe_source(raw)
+        if secondary == primary or not provider_routing.health_registry.is_available(secondary):
+            return None
+        if not _transcribe_credentials_available(secondary):
+            log_message("warning", f"Hedged transcription skipped: {secondary} credentials missing")
+            return None
+        return secondary
+    except Exception:
+        return None
+
+
+def _get_hedge_delay(primary):
+    """Hedge delay in seconds, derived from the primary provider's latency percentile."""
+    percentile = provider_routing.DEFAULT_HEDGE_PERCENTILE
+    default_delay = provider_routing.DEFAULT_HEDGE_DELAY_SECONDS
+    try:
+        if isinstance(config, dict):
+            if isinstance(config.get('transcribe_hedge_percentile'), (int, float)):
+                percentile = float(config.get('transcribe_hedge_percentile'))
+            if isinstance(config.get('transcribe_hedge_delay_ms'), (int, float)):
+                default_delay = float(config.get('transcribe_hedge_delay_ms')) / 1000.0
+    except Exception:
+        pass
+    return provider_routing.hedge_delay(primary, percentile=percentile, default=default_delay)
+
+
+def _request_transcription(source, filepath, stream_callback=None):
+    """Transcribe audio file with one specific source; raises on provider errors."""
+    with modles.request_priority(modles.PRIORITY_LIVE):
+        if source == 'soniox':
+            latency_metrics.label_current(latency_metrics.GROUP_TRANSCRIBE, source)
+            log_message("info", "Transcribing via Soniox backend")
+            result = transcribe_with_soniox(filepath)
+            if stream_callback and result:
+                try:
+                    stream_callback(result)
+                except Exception:
+                    pass
+            return result
+        if source == 'qwen3-asr':
+            latency_metrics.label_current(latency_metrics.GROUP_TRANSCRIBE, source, config.get('qwen3_asr_model') or 'qwen3-asr-flash')
+            log_message("info", "Transcribing via Qwen3-ASR (DashScope)")
+            result = transcribe_with_qwen3_asr(filepath)
+            if stream_callback and result:
+                try:
+                    stream_callback(result)
+                except Exception:
+                    pass
+            return result
+
+        # Default: OpenAI via models module
         transcribe_language = config.get('transcribe_language', 'auto')
         api_key = (config.get('openai_api_key') if isinstance(config, dict) else None) or os.environ.get('OPENAI_API_KEY')
         base_url = (config.get('openai_base_url') if isinstance(config, dict) else None) or os.environ.get('OPENAI_BASE_URL')
@@ -1652,6 +2357,7 @@ def transcribe_audio_file(filepath, stream_callback=None):
                 model = config.get('openai_transcribe_model') or OPENAI_TRANSCRIBE_MODEL
         except Exception:
             model = OPENAI_TRANSCRIBE_MODEL
+        latency_metrics.label_current(latency_metrics.GROUP_TRANSCRIBE, source, model)
         return modles.transcribe_openai(
             filepath,
             transcribe_language,
@@ -1660,9 +2366,184 @@ def transcribe_audio_file(filepath, stream_callback=None):
             model=model,
             stream_callback=stream_callback,
         )
+
+
+def _attempt_transcription(source, filepath, stream_callback=None):
+    """Run one transcription attempt and record the outcome in the shared health tracker.
+
+    Returns (ok, text); ok is False only for provider errors, not for empty (silent) audio.
+    """
+    started = time.monotonic()
+    try:
+        result = _request_transcription(source, filepath, stream_callback=stream_callback)
     except Exception as e:
-        log_message("error", f"Transcription failed: {e}")
-        return None
+        log_message("error", f"Transcription failed ({source}): {e}")
+        provider_routing.health_registry.record_failure(source, e)
+        return False, None
+    provider_routing.health_registry.record_success(source, time.monotonic() - started)
+    return True, result
+
+
+def _transcribe_hedged(primary, secondary, filepath, stream_callback=None):
+    """Race a backup source against the primary once the primary exceeds its tail latency.
+
+    Returns (ok, result) like _attempt_transcription; ok is False only when both sources failed.
+    """
+    delay = _get_hedge_delay(primary)
+    stream_owner = {'source': None}
+    owner_lock = threading.Lock()
+    # Each racer marks its own trace; the winner's stages are copied to the segment's
+    segment_trace = latency_metrics.current()
+    racer_traces = {}
+
+    def make_runner(source):
+        def runner(cancel_event):
+            racer_trace = racer_traces[source] = latency_metrics.SegmentTrace(source)
+            def on_delta(delta_text):
+                # Only the first provider to stream may update the UI; losers go quiet
+                if cancel_event.is_set():
+                    return
+                with owner_lock:
+                    if stream_owner['source'] is None:
+                        stream_owner['source'] = source
+                    if stream_owner['source'] != source:
+                        return
+                stream_callback(delta_text)
+            with latency_metrics.activate(racer_trace):
+                ok, result = _attempt_transcription(source, filepath, stream_callback=on_delta if stream_callback else None)
+            if not ok:
+                raise RuntimeError(f"{source} transcription failed")
+            return result
+        return runner
+
+    winner, ok, result = provider_routing.hedged_call(
+        (primary, make_runner(primary)),
+        (secondary, make_runner(secondary)),
+        delay,
+    )
+    if winner and winner != primary:
+        log_message("info", f"Hedged transcription: {winner} answered before {primary} (hedge delay {delay:.2f}s)")
+    if segment_trace is not None and winner in racer_traces:
+        won = racer_traces[winner]
+        for stage in (latency_metrics.REQUEST_SENT, latency_metrics.FIRST_BYTE):
+            if stage in won.stages:
+                segment_trace.mark(stage, won.stages[stage])
+        segment_trace.labels.update(won.labels)
+    return ok, result
+
+
+def _probe_transcription_source(source, filepath):
+    """Background circuit-breaker probe: re-run this segment on a source that was failing."""
+    def probe():
+        if not os.path.exists(filepath):
+            raise RuntimeError('probe audio no longer available')
+        return _request_transcription(source, filepath)
+    if provider_routing.health_registry.maybe_probe(source, probe):
+        log_message("info", f"Probing {source} in background before closing its circuit breaker")
+
+
+def _emit_provider_health(snapshot):
+    """Forward circuit breaker state changes to Electron."""
+    try:
+        log_message("warning" if snapshot.get('state') != 'closed' else "info", f"Provider {snapshot.get('provider')} circuit {snapshot.get('state')}")
+        payload = {"type": "provider_health", "timestamp": datetime.now().isoformat()}
+        payload.update(snapshot)
+        send_message(payload)
+    except Exception:
+        pass
+
+
+provider_routing.health_registry.add_listener(_emit_provider_health)
+
+
+def _emit_warmup_status(snapshot):
+    """Forward provider warm-up state changes to Electron."""
+    try:
+        send_message({"type": "provider_warmup", "providers": snapshot, "timestamp": datetime.now().isoformat()})
+    except Exception:
+        pass
+
+
+connection_warmup = provider_warmup.ProviderWarmup(
+    warm_fn=lambda target: modles.warm_provider(target.provider, target.api_key, target.base_url),
+    preload_fn=lambda providers: modles.preload_provider_sdks(providers),
+    idle_fn=lambda provider: modles.provider_idle_seconds(provider),
+    on_status=_emit_warmup_status,
+    log=log_message,
+)
+
+
+def _warmup_targets():
+    """Providers the next recording will call: the transcription sources (recording and voice input) and the translation engine"""
+    targets = []
+
+    def add(provider):
+        if any(target.provider == provider for target in targets):
+            return
+        if provider == 'openai':
+            targets.append(provider_warmup.WarmupTarget(
+                provider,
+                config.get('openai_api_key') or os.environ.get('OPENAI_API_KEY'),
+                config.get('openai_base_url') or os.environ.get('OPENAI_BASE_URL'),
+            ))
+        elif provider == 'gemini':
+            targets.append(provider_warmup.WarmupTarget(provider, config.get('gemini_api_key')))
+        else:
+            targets.append(provider_warmup.WarmupTarget(provider))
+
+    sources = [provider_routing.normalize_transcribe_source(config.get('transcribe_source'))]
+    voice_engine = config.get('voice_input_engine')
+    if isinstance(voice_engine, str) and voice_engine.strip():
+        # Sent as override_source by start_voice_input
+        sources.append(provider_routing.normalize_transcribe_source(voice_engine))
+    for source in sources:
+        if _transcribe_credentials_available(source):
+            add(source)
+    engine = _get_translation_engine()
+    if config.get('enable_translation', True) and _translation_credentials_available(engine):
+        add(engine)
+    return targets
+
+
+def apply_provider_warmup():
+    """(Re)start connection warm-up for the configured providers; no-op when they are unchanged"""
+    if not config.get('provider_warmup', True):
+        connection_warmup.stop()
+        return
+    connection_warmup.configure(
+        ping_interval=config.get('provider_ping_interval_seconds'),
+        keepalive_seconds=config.get('provider_keepalive_seconds'),
+    )
+    targets = _warmup_targets()
+    if connection_warmup.apply(targets):
+        log_message("info", f"Provider warm-up started: {', '.join(t.provider for t in targets) or 'none'}")
+
+
+def transcribe_audio_file(filepath, stream_callback=None):
+    """Transcribe audio file using selected source, with health-based failover and optional hedging."""
+    primary = provider_routing.normalize_transcribe_source(config.get('transcribe_source') if isinstance(config, dict) else None)
+    configured = [primary] + _get_failover_sources(primary)
+    for source in configured:
+        _probe_transcription_source(source, filepath)
+    candidates = provider_routing.health_registry.order(configured)
+    if candidates and candidates[0] != primary:
+        log_message("warning", f"{primary} circuit open; failing over to {candidates[0]}")
+
+    remaining = list(candidates)
+    if remaining:
+        hedge_source = _get_hedge_source(remaining[0])
+        if hedge_source:
+            ok, result = _transcribe_hedged(remaining[0], hedge_source, filepath, stream_callback=stream_callback)
+            if ok:
+                # An empty transcript (silence) is an answer; only fail over when both racers failed
+                return result
+            remaining = [name for name in remaining[1:] if name != hedge_source]
+
+    for source in remaining:
+        ok, result = _attempt_transcription(source, filepath, stream_callback=stream_callback)
+        if ok:
+            return result
+    return None
 
 def handle_message(message):
     """Handle messages from Electron"""
@@ -1678,7 +2559,7 @@ def handle_message(message):
             global simple_recording_mode, current_recording_context
             simple_recording_mode = False
             current_recording_context = 'default'
-            start_recording()
+            start_recording(replay=message.get('replay'))
         elif msg_type == "stop_recording":
             log_message("info", "Executing stop recording command")
             stop_recording()
@@ -1691,7 +2572,7 @@ def handle_message(message):
             override_transcribe_language = message.get('transcribe_language')
             override_translate = bool(message.get('translate', False))
             override_translate_language = message.get('translate_language')
-            start_recording()
+            start_recording(replay=message.get('replay'))
         elif msg_type == "stop_voice_input":
             log_message("info", "Stop simple voice input recording")
             stop_recording()
@@ -1986,6 +2867,16 @@ def handle_message(message):
                 })
             send_message(payload)
             return
+        elif msg_type == "get_metrics":
+            send_latency_metrics()
+        elif msg_type == "get_audio_stats":
+            send_audio_stats(force=True, reset=False)
+        elif msg_type == "volume_meter":
+            set_volume_meter_subscription(bool(message.get('subscribed', True)), message.get('rate_hz'))
+        elif msg_type == "profile_start":
+            start_profiler(message.get('interval_ms'), message.get('max_seconds'))
+        elif msg_type == "profile_stop":
+            stop_profiler(message.get('formats'))
         elif msg_type == "shutdown":
             # Graceful exit: if recording, stop first; then stop translation thread and exit
             log_message("info", "Received service shutdown command, preparing graceful exit")
@@ -2060,11 +2951,39 @@ def handle_message(message):
             # No model client pre-initialization needed after refactor
             success = True
 
+            # Shared retry/backoff policy for all provider calls
+            try:
+                modles.configure_retries(
+                    max_attempts=config.get('api_max_attempts'),
+                    base_delay=config.get('api_retry_base_delay'),
+                    max_delay=config.get('api_retry_max_delay'),
+                )
+            except Exception as _e:
+                log_message("warning", f"Failed applying retry policy: {_e}")
+
+            # Per-provider concurrency / RPM / TPM limits for the request governor
+            try:
+                modles.configure_governor(config.get('provider_rate_limits'))
+            except Exception as _e:
+                log_message("warning", f"Failed applying provider rate limits: {_e}")
+
+            # Endpoint overrides, then warm the connections the next request will use
+            try:
+                modles.configure_base_urls({
+                    'gemini': config.get('gemini_base_url'),
+                    'dashscope': config.get('dashscope_base_url'),
+                    'soniox': config.get('soniox_base_url'),
+                })
+                apply_provider_warmup()
+            except Exception as _e:
+                log_message("warning", f"Failed starting provider warm-up: {_e}")
+
             # Apply recording detection thresholds (initial)
             global SILENCE_RMS_THRESHOLD, MIN_SILENCE_SEC_FOR_SPLIT
             try:
                 if 'silence_rms_threshold' in config and isinstance(config.get('silence_rms_threshold'), (int, float)):
                     SILENCE_RMS_THRESHOLD = float(config.get('silence_rms_threshold'))
+                    volume_meter.set_silence_threshold(SILENCE_RMS_THRESHOLD)
                     log_message("info", f"Applied silence threshold: {SILENCE_RMS_THRESHOLD}")
                 if 'min_silence_seconds' in config and isinstance(config.get('min_silence_seconds'), (int, float)):
                     MIN_SILENCE_SEC_FOR_SPLIT = float(config.get('min_silence_seconds'))
@@ -2072,6 +2991,16 @@ def handle_message(message):
             except Exception as _e:
                 log_message("warning", f"Failed applying recording thresholds: {_e}")
 
+            if config.get('volume_meter_rate_hz') is not None:
+                volume_meter.set_rate(config.get('volume_meter_rate_hz'))
+
+            # Hot mic standby for voice input (keeps the input stream open between recordings)
+            try:
+                if not is_recording:
+                    apply_hot_mic_standby()
+            except Exception as _e:
+                log_message("warning", f"Failed applying hot mic standby: {_e}")
+
             # Manage translation worker based on config (initial)
             enable_tr = config.get('enable_translation', True)
             engine = _get_translation_engine()
@@ -2095,11 +3024,28 @@ def handle_message(message):
         import traceback
         log_message("error", f"Traceback: {traceback.format_exc()}")
 
+def apply_cli_args(argv=None):
+    """Command line options for headless runs (Electron passes none)"""
+    global replay_cli_spec, replay_cli_options
+    import argparse
+    parser = argparse.ArgumentParser(description="Voice transcription service (JSON lines on stdin/stdout)")
+    parser.add_argument('--replay', metavar='SPEC',
+                        help='Replay a WAV file or synthetic:<bursts|continuous|noise|silence>:<seconds> instead of the microphone')
+    parser.add_argument('--replay-speed', type=float, default=1.0,
+                        help='Replay speed as a multiple of real time (0 = as fast as possible)')
+    parser.add_argument('--replay-loop', action='store_true', help='Loop the replay until stop_recording')
+    args, unknown = parser.parse_known_args(argv)
+    if unknown:
+        log_message("warning", f"Ignoring unknown arguments: {' '.join(unknown)}")
+    replay_cli_spec = args.replay
+    replay_cli_options = {'speed': args.replay_speed, 'loop': args.replay_loop}
+
 def main():
     """Main function"""
     import traceback
     global is_recording, recording_thread
     
+    apply_cli_args()
     # Encoding already set on module import, only check debug mode here
     debug_mode = os.environ.get('ELECTRON_DEBUG') == '1'
     if debug_mode:
@@ -2108,13 +3054,18 @@ def main():
     try:
         ensure_output_dir()
         
-        log_message("info", "Service is starting...")
+        # Notify Electron that service is ready as early as possible; heavy imports happen afterwards
+        startup_ms = (time.perf_counter() - SERVICE_IMPORT_STARTED) * 1000
+        log_message("info", f"Service started, waiting for commands... (ready in {startup_ms:.0f} ms)")
         log_message("info", f"Python version: {sys.version}")
         log_message("info", f"Working directory: {os.getcwd()}")
-        # Notify Electron that service is ready
-        log_message("info", "Service started, waiting for commands...")
         
-        # Skip startup audio device enumeration and dependency check, changed to check when recording starts
+        # Audio libraries, device probe, provider layer and SDKs load off the main loop
+        start_background_preload()
+        start_metrics_publisher()
+        start_callback_event_consumer()
+        # Metered until Electron reports whether a window shows it
+        set_volume_meter_subscription(True)
         
         # Read stdin messages
         line_count = 0
@@ -2146,10 +3097,15 @@ def main():
         if is_recording:
             try:
                 is_recording = False
+                segment_handoff.put(None)
                 if recording_thread and recording_thread.is_alive():
                     recording_thread.join(timeout=2)
             except:
                 pass
+        try:
+            _close_standby_stream()
+        except:
+            pass
         # Stop translation worker thread
         try:
             stop_translation_worker()
@@ -2179,6 +3135,10 @@ def main():
             stop_translation_worker()
         except:
             pass
+        try:
+            connection_warmup.stop()
+        except:
+            pass
         try:
             log_message("info", "Transcription service stopped")
         except: